@@ -0,0 +1 @@
+"""Offline benchmarks for scraper parsing and the data pipeline"""
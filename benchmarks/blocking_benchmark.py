@@ -0,0 +1,245 @@
+"""
+A/B benchmark of resource blocking profiles against the live sites
+
+Loads the same product pages with blocking off (A) and with a profile (B) on
+one driver, alternating the arms in random order per URL pair so drift in
+site or network speed hits both equally. Per arm it reports page load latency
+(driver.get until the load event), transferred bytes and request count (from
+the Resource Timing API), and the Cloudflare challenge rate. Blocking is only
+switched on after clearance, like in production (see scrapers/resource_blocking.py).
+
+Usage:
+    python -m benchmarks.blocking_benchmark honda                       # site's profile (or 'lean') on 10 products
+    python -m benchmarks.blocking_benchmark honda --profile aggressive -n 20
+    python -m benchmarks.blocking_benchmark honda --url https://... --url https://... --rounds 3
+    python -m benchmarks.blocking_benchmark honda kia --json logs/blocking_ab.json
+"""
+import argparse
+import json
+import logging
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scrapers.cloudflare_detector import is_challenge
+from scrapers.registry import create_scraper, get_site_config
+from scrapers.resource_blocking import ResourceBlocker
+
+DEFAULT_PROFILE = 'lean'
+ARMS = ('A', 'B')
+
+# Resource Timing: cross-origin entries without Timing-Allow-Origin report transferSize 0,
+# so bytes are a lower bound (blocked requests never appear at all)
+WEIGHT_SCRIPT = '''/* resource-weight */
+const entries = performance.getEntriesByType('navigation').concat(performance.getEntriesByType('resource'));
+return {requests: entries.length, transfer_bytes: entries.reduce((total, e) => total + (e.transferSize || 0), 0)};
+'''
+
+
+def setup_logging(verbose=False):
+    """Setup logging"""
+    logging.basicConfig(
+        level=logging.INFO if verbose else logging.WARNING,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[logging.StreamHandler()]
+    )
+    return logging.getLogger('blocking_benchmark')
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile (None for no values)"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, int(round(pct / 100.0 * len(ordered))) - 1))]
+
+
+def obtain_clearance(scraper, url):
+    """Load url through the scraper's normal Cloudflare handling (blocking off)"""
+    scraper.driver_get(url)
+    if scraper.has_cloudflare_challenge():
+        return scraper.wait_for_cloudflare(timeout=60, target_url=url, max_retries=2)
+    return True
+
+
+def load_page(scraper, url, blocker, arm):
+    """
+    Load one page in one arm
+
+    Returns:
+        dict: {arm, url, seconds, challenge, requests, transfer_bytes}
+    """
+    driver = scraper.driver
+    if arm == 'B':
+        blocker.apply(driver)
+    else:
+        blocker.lift(driver)
+
+    start = time.perf_counter()
+    scraper.driver_get(url)
+    seconds = time.perf_counter() - start
+
+    sample = {'arm': arm, 'url': url, 'seconds': round(seconds, 3), 'challenge': is_challenge(scraper.probe_cloudflare()),
+              'requests': None, 'transfer_bytes': None}
+    try:
+        weight = driver.execute_script(WEIGHT_SCRIPT)
+        sample['requests'] = weight.get('requests')
+        sample['transfer_bytes'] = weight.get('transfer_bytes')
+    except Exception:
+        pass
+    return sample
+
+
+def run_site(site_name, profile=None, urls=None, count=10, rounds=1, seed=None, logger=None):
+    """
+    A/B benchmark one site
+
+    Args:
+        site_name: Config site name
+        profile: Blocking profile for arm B (default: the site's "resource_blocking" setting, else 'lean')
+        urls: Product URLs (default: the first `count` from get_product_urls())
+        count: Product URLs to take from the search when urls is empty
+        rounds: Passes over the URLs (each pass loads every URL once per arm)
+        seed: Random seed for the arm order
+
+    Returns:
+        dict: Site, profile, per-arm summary and raw samples
+    """
+    logger = logger or logging.getLogger('blocking_benchmark')
+    site_config = get_site_config(site_name) or {'name': site_name}
+    blocker = ResourceBlocker.from_config(site_config, profile) if profile else \
+        ResourceBlocker.from_config(site_config) or ResourceBlocker.from_config(site_config, DEFAULT_PROFILE)
+    if blocker is None:
+        raise ValueError(f"Profile '{profile}' blocks nothing")
+
+    rng = random.Random(seed)
+    samples = []
+    scraper = create_scraper(site_config)
+    try:
+        if not scraper.driver:
+            scraper.setup_selenium()
+        urls = list(urls or [])
+        if not urls:
+            urls = (scraper.get_product_urls() or [])[:count]
+        if not urls:
+            raise ValueError(f"No product URLs for {site_name}")
+
+        if not obtain_clearance(scraper, urls[0]):
+            logger.warning(f"{site_name}: no Cloudflare clearance before the benchmark, challenge rates will be high")
+
+        for round_index in range(rounds):
+            for url in urls:
+                for arm in rng.sample(ARMS, len(ARMS)):
+                    sample = load_page(scraper, url, blocker, arm)
+                    sample['round'] = round_index
+                    samples.append(sample)
+                    logger.info(f"{site_name} [{arm}] {sample['seconds']:.2f}s "
+                                f"{'CHALLENGE ' if sample['challenge'] else ''}{url}")
+                    if sample['challenge']:
+                        # Regain clearance with everything unblocked so the next sample starts clean
+                        blocker.lift(scraper.driver)
+                        obtain_clearance(scraper, url)
+    finally:
+        scraper.close()
+
+    return {'site': site_name, 'profile': blocker.profile, 'patterns': blocker.patterns, 'urls': len(urls),
+            'rounds': rounds, 'arms': {arm: summarize([s for s in samples if s['arm'] == arm]) for arm in ARMS},
+            'samples': samples}
+
+
+def summarize(samples):
+    """Per-arm latency, weight and challenge rate"""
+    latencies = [sample['seconds'] for sample in samples if not sample['challenge']]
+    weights = [sample['transfer_bytes'] for sample in samples if sample['transfer_bytes'] is not None]
+    requests = [sample['requests'] for sample in samples if sample['requests'] is not None]
+    return {
+        'pages': len(samples),
+        'challenges': sum(1 for sample in samples if sample['challenge']),
+        'challenge_rate': round(sum(1 for sample in samples if sample['challenge']) / len(samples), 3) if samples else None,
+        'median_s': round(statistics.median(latencies), 3) if latencies else None,
+        'p90_s': percentile(latencies, 90),
+        'mean_kb': round(statistics.mean(weights) / 1024.0, 1) if weights else None,
+        'mean_requests': round(statistics.mean(requests), 1) if requests else None,
+    }
+
+
+def change_pct(before, after):
+    if before in (None, 0) or after is None:
+        return None
+    return (after - before) / before * 100.0
+
+
+def print_report(results):
+    """Print the A/B table and the B-vs-A change per site"""
+    print()
+    header = f"{'site':<20}{'arm':<5}{'pages':>7}{'challenges':>12}{'median':>9}{'p90':>9}{'KB':>10}{'requests':>10}"
+    print(header)
+    print('-' * len(header))
+    for result in results:
+        for arm in ARMS:
+            summary = result['arms'][arm]
+            label = 'off' if arm == 'A' else result['profile']
+            print(f"{result['site']:<20}{arm:<5}{summary['pages']:>7}"
+                  f"{summary['challenges']:>5} ({(summary['challenge_rate'] or 0) * 100:>3.0f}%)"
+                  f"{_fmt(summary['median_s'], 's'):>9}{_fmt(summary['p90_s'], 's'):>9}"
+                  f"{_fmt(summary['mean_kb'], ''):>10}{_fmt(summary['mean_requests'], ''):>10}  {label}")
+    print()
+    for result in results:
+        a, b = result['arms']['A'], result['arms']['B']
+        latency = change_pct(a['median_s'], b['median_s'])
+        weight = change_pct(a['mean_kb'], b['mean_kb'])
+        print(f"  {result['site']}: '{result['profile']}' median latency "
+              f"{'n/a' if latency is None else f'{latency:+.0f}%'}, transfer "
+              f"{'n/a' if weight is None else f'{weight:+.0f}%'}, challenges {a['challenges']} -> {b['challenges']}")
+    print()
+
+
+def _fmt(value, unit):
+    return '-' if value is None else f"{value:.2f}{unit}" if unit else f"{value:,.0f}"
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='A/B benchmark of resource blocking profiles (needs Chrome)')
+    parser.add_argument('sites', nargs='+', help='Config site names')
+    parser.add_argument('--profile', default=None,
+                        help=f"Blocking profile for arm B (default: the site's resource_blocking, else '{DEFAULT_PROFILE}')")
+    parser.add_argument('--url', action='append', default=[], help='Product URL to load (repeatable; default: search)')
+    parser.add_argument('-n', '--count', type=int, default=10, help='Product URLs taken from the search (default: 10)')
+    parser.add_argument('--rounds', type=int, default=1, help='Passes over the URLs (default: 1)')
+    parser.add_argument('--seed', type=int, default=None, help='Random seed for the arm order')
+    parser.add_argument('--json', metavar='FILE', help='Also write results (with raw samples) as JSON')
+    parser.add_argument('--verbose', action='store_true', help='Log every page load')
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    logger = setup_logging(args.verbose)
+
+    results = []
+    for site_name in args.sites:
+        try:
+            results.append(run_site(site_name, args.profile, args.url, args.count, args.rounds, args.seed, logger))
+        except Exception as e:
+            logger.error(f"Error benchmarking {site_name}: {str(e)}")
+
+    if results:
+        print_report(results)
+
+    if args.json:
+        output_dir = os.path.dirname(args.json)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'generated_at': datetime.now().isoformat(timespec='seconds'), 'results': results},
+                      f, indent=2, ensure_ascii=False)
+    return 0 if results else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,548 @@
+"""
+Local stand-in dealer site for end-to-end throughput testing
+
+Serves a synthetic SimplePart/RevolutionParts-style parts store: paginated search
+(/search?search_str=wheel&page=N), product pages with a script#product_data JSON
+blob and a whatThisFits fitment panel, an optional Cloudflare-like interstitial,
+configurable latency, and 429 responses (random and/or above a request rate).
+
+Usage:
+    python -m benchmarks.dealer_site_server --port 8765 --products 500
+    python -m benchmarks.dealer_site_server --load-test --products 100 --latency 0.05 0.3 --error-rate 0.02
+    python -m benchmarks.dealer_site_server --load-test --target http://127.0.0.1:8765 --workers 4
+"""
+import argparse
+import html
+import json
+import logging
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+CHALLENGE_COOKIE = 'cf_clearance'
+
+MAKES = {
+    'Honda': ['Accord', 'Civic', 'CR-V', 'Pilot', 'Odyssey'],
+    'Toyota': ['Camry', 'Corolla', 'RAV4', 'Highlander', 'Tacoma'],
+    'Nissan': ['Altima', 'Maxima', 'Rogue', 'Pathfinder', 'Frontier'],
+    'Ford': ['F-150', 'Mustang', 'Explorer', 'Escape', 'Edge'],
+    'Kia': ['Optima', 'Sorento', 'Sportage', 'Soul', 'Telluride'],
+}
+
+# (title template, is a wheel product per BaseScraper.is_wheel_product)
+PRODUCT_TYPES = [
+    ('{size}" Aluminum Wheel, {finish}', True),
+    ('{size}" Alloy Wheel - {finish}', True),
+    ('Steel Wheel, {size}"', True),
+    ('Wheel Cap, {finish}', True),
+    ('Center Cap - {finish}', True),
+    ('Wheel Bearing, Front', False),
+    ('Wheel Nut, Chrome', False),
+]
+
+FINISHES = ['Silver', 'Machined', 'Gloss Black', 'Dark Gray', 'Chrome', 'Painted']
+
+
+class SyntheticCatalog:
+    """Deterministic catalog of synthetic parts"""
+
+    def __init__(self, products=200, seed=42, max_fitments=40):
+        """
+        Args:
+            products: Number of parts in the catalog
+            seed: Random seed (same seed -> same catalog)
+            max_fitments: Upper bound of fitment rows per part
+        """
+        rng = random.Random(seed)
+        self.products = []
+        self.by_slug = {}
+
+        for index in range(products):
+            make = rng.choice(list(MAKES))
+            template, is_wheel = rng.choice(PRODUCT_TYPES)
+            title = template.format(size=rng.choice([15, 16, 17, 18, 19, 20]), finish=rng.choice(FINISHES))
+            pn = f"{rng.randint(10000, 99999)}-{rng.choice('ABCDEFGHJK')}{rng.randint(100, 999)}"
+            slug = f"{make.lower()}-wheel-{pn.lower()}"
+            msrp = round(rng.uniform(40, 900), 2)
+
+            fitments = []
+            for _ in range(rng.randint(1, max_fitments)):
+                fitments.append({
+                    'year': rng.randint(2005, 2025),
+                    'make': make,
+                    'model': rng.choice(MAKES[make]),
+                    'trims': rng.sample(['Base', 'LX', 'EX', 'Sport', 'Touring', 'Limited'], rng.randint(1, 3)),
+                    'engines': [rng.choice(['1.5L L4', '2.0L L4', '2.5L L4', '3.5L V6'])],
+                })
+
+            product = {
+                'slug': slug,
+                'pn': pn,
+                'title': title,
+                'is_wheel': is_wheel,
+                'make': make,
+                'msrp': msrp,
+                'price': round(msrp * rng.uniform(0.6, 0.95), 2),
+                'description': f"Genuine OEM {title.lower()} for {make}. Part number {pn}. " * rng.randint(1, 4),
+                'fitments': fitments,
+            }
+            self.products.append(product)
+            self.by_slug[slug] = product
+
+    def __len__(self):
+        return len(self.products)
+
+
+def render_search_page(catalog, page, per_page, search_term):
+    """Render a search results page"""
+    total_pages = max(1, (len(catalog) + per_page - 1) // per_page)
+    start = (page - 1) * per_page
+    items = []
+    for product in catalog.products[start:start + per_page]:
+        items.append(
+            f'<div class="catalog-product">'
+            f'<a class="product-title" href="/oem-parts/{product["slug"]}">{html.escape(product["title"])}</a>'
+            f'<span class="sale-price-value">${product["price"]:.2f}</span></div>'
+        )
+
+    pages = []
+    if page > 1:
+        pages.append(f'<a class="prev" href="/search?search_str={search_term}&page={page - 1}">Prev</a>')
+    if page < total_pages:
+        pages.append(f'<a class="next" href="/search?search_str={search_term}&page={page + 1}">Next</a>')
+
+    return (
+        f'<html><head><title>Search results for {html.escape(search_term)} | Local Dealer Parts</title></head>'
+        f'<body><h1>Search results</h1><div class="search-results">{"".join(items)}</div>'
+        f'<div class="pagination" data-page="{page}" data-pages="{total_pages}">{"".join(pages)}</div>'
+        f'{"<p>" + "Lorem ipsum dolor sit amet. " * 200 + "</p>"}</body></html>'
+    )
+
+
+def render_product_page(product):
+    """Render a product page (JSON blob plus whatThisFits fitment panel)"""
+    product_data = {
+        'sku': product['pn'],
+        'name': product['title'],
+        'price': product['price'],
+        'msrp': product['msrp'],
+        'fitment': product['fitments'],
+    }
+    rows = ''.join(
+        f'<tr><td>{fitment["year"]}</td><td>{fitment["make"]}</td><td>{fitment["model"]}</td>'
+        f'<td>{", ".join(fitment["trims"])}</td><td>{", ".join(fitment["engines"])}</td></tr>'
+        for fitment in product['fitments']
+    )
+    return (
+        f'<html><head><title>{html.escape(product["title"])} | Local Dealer Parts</title></head><body>'
+        f'<h1 class="product-title">{html.escape(product["title"])}</h1>'
+        f'<img class="product-main-image" src="//images.local/{product["slug"]}.jpg">'
+        f'<div class="part-number"><span class="sku">{product["pn"]}</span></div>'
+        f'<strong class="sale-price">${product["price"]:.2f}</strong>'
+        f'<span class="list-price">${product["msrp"]:.2f}</span>'
+        f'<div class="product-description">{html.escape(product["description"])}</div>'
+        f'<script id="product_data" type="application/json">{json.dumps(product_data)}</script>'
+        f'<div class="whatThisFits"><h2>What This Fits</h2><table class="fitment-table">'
+        f'<tr><th>Year</th><th>Make</th><th>Model</th><th>Trim</th><th>Engine</th></tr>{rows}</table></div>'
+        f'{"<p>" + "Lorem ipsum dolor sit amet. " * 300 + "</p>"}</body></html>'
+    )
+
+
+CHALLENGE_PAGE = (
+    '<html><head><title>Just a moment...</title><meta http-equiv="refresh" content="{delay}"></head>'
+    '<body><div class="cf-browser-verification">Checking your browser before accessing the site. '
+    'This may take a few seconds.</div><form id="challenge-form" action="/cdn-cgi/challenge-platform" method="POST">'
+    '</form></body></html>'
+)
+
+
+class DealerSiteServer:
+    """Synthetic dealer site served from a daemon thread"""
+
+    def __init__(self, catalog, host='127.0.0.1', port=0, per_page=24, latency=(0.0, 0.0),
+                 error_rate=0.0, rate_limit=None, cloudflare=False, challenge_delay=3.0, seed=42):
+        """
+        Args:
+            catalog: SyntheticCatalog to serve
+            host: Interface to bind
+            port: Port (0 picks a free port)
+            per_page: Search results per page
+            latency: (min, max) seconds added to every response
+            error_rate: Probability of a random 429 response
+            rate_limit: Requests/second above which 429 is returned (None = unlimited)
+            cloudflare: Serve a challenge interstitial to clients without a clearance cookie
+            challenge_delay: Seconds before the interstitial refreshes into the real page
+            seed: Random seed for latency and errors
+        """
+        self.logger = logging.getLogger('dealer_site_server')
+        self.catalog = catalog
+        self.host = host
+        self.port = port
+        self.per_page = per_page
+        self.latency = latency
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit
+        self.cloudflare = cloudflare
+        self.challenge_delay = challenge_delay
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._window = []
+        self.stats = Counter()
+        self._server = None
+        self._thread = None
+
+    @property
+    def base_url(self):
+        return f"http://{self.host}:{self.port}"
+
+    def _rate_limited(self):
+        """True if the request rate over the last second exceeds rate_limit"""
+        now = time.monotonic()
+        with self._lock:
+            self._window = [t for t in self._window if now - t < 1.0]
+            self._window.append(now)
+            if self.rate_limit and len(self._window) > self.rate_limit:
+                return True
+            return self._rng.random() < self.error_rate
+
+    def _delay(self):
+        with self._lock:
+            return self._rng.uniform(*self.latency) if self.latency[1] > 0 else 0.0
+
+    def handle(self, path, cookies):
+        """
+        Route a request
+
+        Returns:
+            tuple: (status, body, extra headers)
+        """
+        parsed = urlparse(path)
+        query = parse_qs(parsed.query)
+
+        if self._rate_limited():
+            return 429, '<html><head><title>429 Too Many Requests</title></head><body>Rate limited</body></html>', \
+                {'Retry-After': '5'}
+
+        if self.cloudflare and CHALLENGE_COOKIE not in cookies:
+            return 503, CHALLENGE_PAGE.format(delay=int(self.challenge_delay)), \
+                {'Set-Cookie': f'{CHALLENGE_COOKIE}=local; Path=/'}
+
+        if parsed.path == '/search':
+            search_term = (query.get('search_str') or query.get('q') or ['wheel'])[0]
+            try:
+                page = max(1, int((query.get('page') or ['1'])[0]))
+            except ValueError:
+                page = 1
+            return 200, render_search_page(self.catalog, page, self.per_page, search_term), {}
+
+        if parsed.path.startswith('/oem-parts/'):
+            product = self.catalog.by_slug.get(parsed.path[len('/oem-parts/'):].rstrip('/'))
+            if product:
+                return 200, render_product_page(product), {}
+
+        if parsed.path in ('', '/'):
+            return 200, '<html><head><title>Local Dealer Parts</title></head><body><h1>Local Dealer Parts</h1></body></html>', {}
+
+        return 404, '<html><head><title>404 Not Found</title></head><body>Not Found</body></html>', {}
+
+    def start(self):
+        """Start serving in a background thread"""
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                cookies = {}
+                for part in (self.headers.get('Cookie') or '').split(';'):
+                    if '=' in part:
+                        key, value = part.strip().split('=', 1)
+                        cookies[key] = value
+
+                delay = site._delay()
+                if delay:
+                    time.sleep(delay)
+                status, body, headers = site.handle(self.path, cookies)
+                with site._lock:
+                    site.stats[status] += 1
+                    site.stats['requests'] += 1
+
+                data = body.encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(data)))
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name='dealer-site', daemon=True)
+        self._thread.start()
+        self.logger.info(f"Local dealer site: {self.base_url} ({len(self.catalog)} products)")
+
+    def stop(self):
+        """Stop the server"""
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+class LiveSiteStore:
+    """
+    Page source for the fixture driver that fetches from a live (local) site
+
+    Keeps cookies like a browser and records per-request latency.
+    """
+
+    def __init__(self):
+        import requests
+        self.session = requests.Session()
+        self.latencies = []
+        self.statuses = Counter()
+        self.misses = []
+        self._lock = threading.Lock()
+
+    def page_html(self, url):
+        start = time.monotonic()
+        try:
+            response = self.session.get(url, timeout=30)
+            text, status = response.text, response.status_code
+        except Exception as e:
+            text, status = f'<html><head><title>Error</title></head><body>{html.escape(str(e))}</body></html>', 0
+        with self._lock:
+            self.latencies.append(time.monotonic() - start)
+            self.statuses[status] += 1
+        return text
+
+    def html_for(self, url):
+        return self.page_html(url)
+
+
+def _live_driver_class():
+    """FixtureDriver variant whose challenge pages clear themselves like the real interstitial"""
+    from benchmarks.fixture_driver import FixtureDriver
+    from scrapers.clock import get_clock
+
+    class LiveSiteDriver(FixtureDriver):
+        def __init__(self, store, challenge_delay=3.0, clock=None):
+            self._page_source = ''
+            self.challenge_delay = challenge_delay
+            self.clock = clock or get_clock()
+            self._loaded_at = 0.0
+            super().__init__(store)
+
+        @property
+        def page_source(self):
+            # The interstitial's meta refresh re-requests the page once the delay has passed
+            if 'challenge-form' in self._page_source and self.clock.monotonic() - self._loaded_at >= self.challenge_delay:
+                self.get(self.current_url)
+            return self._page_source
+
+        @page_source.setter
+        def page_source(self, value):
+            self._page_source = value
+            self._loaded_at = self.clock.monotonic()
+
+    return LiveSiteDriver
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of numbers"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))]
+
+
+def run_load_test(base_url, catalog, workers=1, delay_between_products=0.0, use_virtual_time=False,
+                  challenge_delay=3.0, tracer=None):
+    """
+    Drive GenericScraper through main.scrape_site() against the local site
+
+    Args:
+        base_url: Site base URL
+        catalog: SyntheticCatalog served by the site (for the parity check)
+        workers: Concurrent scrape_site() runs, each with its own scraper
+        delay_between_products: scrape_site() politeness delay
+        use_virtual_time: Skip scraper sleeps (measures work, not politeness)
+        challenge_delay: Interstitial refresh delay (seconds)
+        tracer: Optional TraceRecorder shared by all workers (one timeline, one row per worker thread)
+
+    Returns:
+        dict: Load test report
+    """
+    from contextlib import nullcontext
+    from benchmarks.fixture_driver import FixtureSession
+    from benchmarks.parser_benchmark import virtual_time
+    from scrapers.generic_scraper import GenericScraper
+    import main as orchestrator
+
+    logger = logging.getLogger('load_test')
+    driver_cls = _live_driver_class()
+    results = []
+    scrapers = []
+    lock = threading.Lock()
+
+    class LocalSiteScraper(GenericScraper):
+        def setup_selenium(self):
+            self.driver = driver_cls(self._live_store, challenge_delay=challenge_delay, clock=self.clock)
+
+    def worker(index):
+        store = LiveSiteStore()
+        site_config = {
+            'name': f'localdealer_{index}',
+            'base_url': base_url,
+            'brands': list(MAKES),
+            'search_strategy': 'search',
+            'search_term': 'wheel',
+            'use_selenium': True,
+        }
+        scraper_cls = type('LocalSiteScraper', (LocalSiteScraper,), {'_live_store': store})
+        scraper = scraper_cls(site_config, clock=clock)
+        scraper.session = FixtureSession(store)
+        scraper.logger.setLevel(logging.WARNING)
+        with lock:
+            scrapers.append((scraper, store))
+        products = orchestrator.scrape_site(site_config, logger, delay_between_products=delay_between_products,
+                                            scraper=scraper, tracer=tracer)
+        with lock:
+            results.extend(products)
+
+    with (virtual_time() if use_virtual_time else nullcontext()) as clock:
+        start = time.monotonic()
+        threads = [threading.Thread(target=worker, args=(index,), name=f'load-worker-{index}') for index in range(workers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.monotonic() - start
+
+    product_latencies = []
+    request_latencies = []
+    statuses = Counter()
+    for scraper, store in scrapers:
+        product_latencies.extend(record['total'] for record in scraper.phase_timer.url_records)
+        request_latencies.extend(store.latencies)
+        statuses.update(store.statuses)
+
+    expected = {product['pn'] for product in catalog.products if product['is_wheel']}
+    scraped = {product.get('sku') for product in results}
+    return {
+        'workers': workers,
+        'elapsed': elapsed,
+        'virtual_sleep': clock.slept if clock else 0.0,
+        'requests': sum(statuses.values()),
+        'statuses': dict(statuses),
+        'requests_per_sec': sum(statuses.values()) / elapsed if elapsed else 0.0,
+        'products_scraped': len(results),
+        'products_per_min': len(results) * 60.0 / elapsed if elapsed else 0.0,
+        'expected_wheels': len(expected),
+        'missing_wheels': len(expected - scraped),
+        'request_latency': {pct: round(percentile(request_latencies, pct), 3) for pct in (50, 95, 99)},
+        'product_latency': {pct: round(percentile(product_latencies, pct), 3) for pct in (50, 95, 99)},
+    }
+
+
+def print_report(report, server_stats=None):
+    """Print the load test report"""
+    print()
+    print(f"Workers:            {report['workers']}")
+    print(f"Elapsed:            {report['elapsed']:.1f}s (virtual sleep skipped: {report['virtual_sleep']:.1f}s)")
+    print(f"Requests:           {report['requests']} ({report['requests_per_sec']:.1f}/s) {report['statuses']}")
+    print(f"Products scraped:   {report['products_scraped']} ({report['products_per_min']:.1f}/min)")
+    print(f"Wheels missing:     {report['missing_wheels']} of {report['expected_wheels']}")
+    print(f"Request latency:    p50={report['request_latency'][50]}s p95={report['request_latency'][95]}s "
+          f"p99={report['request_latency'][99]}s")
+    print(f"Product latency:    p50={report['product_latency'][50]}s p95={report['product_latency'][95]}s "
+          f"p99={report['product_latency'][99]}s")
+    if server_stats:
+        print(f"Server responses:   {dict(server_stats)}")
+    print()
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Local stand-in dealer site for throughput testing')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765, help='Port to serve on (0 = any free port)')
+    parser.add_argument('--products', type=int, default=200, help='Catalog size')
+    parser.add_argument('--per-page', type=int, default=None,
+                        help='Search results per page (default: 24; load test: whole catalog, since '
+                             'GenericScraper reads only the first results page)')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--latency', type=float, nargs=2, default=[0.0, 0.0], metavar=('MIN', 'MAX'),
+                        help='Response latency range in seconds')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Probability of a random 429')
+    parser.add_argument('--rate-limit', type=float, default=None, help='429 above this many requests/second')
+    parser.add_argument('--cloudflare', action='store_true', help='Serve a challenge interstitial before clearance')
+    parser.add_argument('--challenge-delay', type=float, default=3.0, help='Interstitial refresh delay (seconds)')
+    parser.add_argument('--load-test', action='store_true', help='Run GenericScraper/scrape_site against the site')
+    parser.add_argument('--target', default=None, help='Load test an already running site at this base URL')
+    parser.add_argument('--workers', type=int, default=1, help='Concurrent scrape_site() runs')
+    parser.add_argument('--delay', type=float, default=0.0, help='Delay between products in scrape_site()')
+    parser.add_argument('--virtual-time', action='store_true', help='Skip scraper sleeps during the load test')
+    parser.add_argument('--json', metavar='FILE', help='Write the load test report as JSON')
+    parser.add_argument('--trace', action='store_true',
+                        help='Write a Chrome trace-event timeline of all workers under logs/')
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+                        handlers=[logging.StreamHandler()])
+    logger = logging.getLogger('dealer_site_server')
+
+    catalog = SyntheticCatalog(args.products, seed=args.seed)
+    per_page = args.per_page or (len(catalog) if args.load_test else 24)
+
+    server = None
+    if not args.target:
+        server = DealerSiteServer(
+            catalog, host=args.host, port=0 if args.load_test else args.port, per_page=per_page,
+            latency=tuple(args.latency), error_rate=args.error_rate, rate_limit=args.rate_limit,
+            cloudflare=args.cloudflare, challenge_delay=args.challenge_delay, seed=args.seed
+        )
+        server.start()
+
+    try:
+        if not args.load_test:
+            logger.info("Serving until interrupted (Ctrl+C)")
+            while True:
+                time.sleep(3600)
+
+        tracer = None
+        if args.trace:
+            from scrapers.trace_recorder import TraceRecorder
+            tracer = TraceRecorder(f'load_test x{args.workers}')
+        report = run_load_test(args.target or server.base_url, catalog, workers=args.workers,
+                               delay_between_products=args.delay, use_virtual_time=args.virtual_time,
+                               challenge_delay=args.challenge_delay, tracer=tracer)
+        print_report(report, server.stats if server else None)
+        if tracer:
+            trace_file = tracer.dump(f'logs/trace_loadtest_{time.strftime("%Y%m%d_%H%M%S")}.json')
+            print(f"Trace saved: {trace_file}")
+        if args.json:
+            with open(args.json, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if server:
+            server.stop()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
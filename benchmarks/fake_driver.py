@@ -0,0 +1,246 @@
+"""Fake WebDriver with scripted DOM mutations for exercising scraper control flow without Chrome"""
+import copy
+import os
+from contextlib import contextmanager
+
+from bs4 import BeautifulSoup
+from lxml import html as lxml_html
+
+from benchmarks.fixture_driver import FixtureDriver, FixtureElement
+from scrapers.clock import get_clock
+
+SCROLL_SCRIPTS = ('scrollTo', 'scrollBy', 'scrollIntoView')
+
+
+class FakeDriver(FixtureDriver):
+    """
+    Fixture driver whose DOM changes in response to the scraper
+
+    Mutation rules are attached to a page URL (the 'mutations' list of a manifest
+    page, or the scenarios argument) and fire on:
+        click   - an element matching 'selector' is clicked (element.click() or a
+                  'arguments[0].click()' script)
+        scroll  - a scrollTo/scrollBy/scrollIntoView script runs
+        script  - a script containing 'match' runs ('result' is returned)
+        after   - 'seconds' have passed on the clock since the page was loaded
+
+    Actions: append/prepend/replace/remove on the 'target' CSS selector with 'html'
+    (or the fixture 'file'), set_attribute ('attribute', 'value') and load (swap
+    the whole page). 'times' limits how often a rule fires (default 1, 0 = always).
+
+    Example (a "show more" button revealing 20 more fitment rows, twice):
+        {"on": "click", "selector": "button.show-more", "times": 2, "action": "append",
+         "target": "table.fitment-table tbody", "file": "fitment_rows.html"}
+    """
+
+    def __init__(self, store, clock=None, scenarios=None):
+        """
+        Args:
+            store: FixtureStore to serve pages from
+            clock: Clock for 'after' rules (use the scraper's clock so sleeps advance it)
+            scenarios: Optional {url: [rule, ...]} merged with the manifest 'mutations'
+        """
+        self.clock = clock or get_clock()
+        self._source = ''
+        self._dirty = False
+        self._rules = []
+        self._loaded_at = 0.0
+        self.mutations_applied = 0
+        self.scripts = 0
+
+        self._scenarios = {}
+        for page in store.pages:
+            if page.get('mutations'):
+                self._scenarios[store.normalize_url(page['url'])] = page['mutations']
+        for url, rules in (scenarios or {}).items():
+            self._scenarios[store.normalize_url(url)] = rules
+
+        super().__init__(store)
+
+    @property
+    def page_source(self):
+        self._apply_timed()
+        return self._render()
+
+    @page_source.setter
+    def page_source(self, value):
+        self._source = value
+        self._dirty = False
+        self._soup = None
+        self._tree = None
+
+    @property
+    def dom_version(self):
+        self._apply_timed()
+        return self.mutations_applied
+
+    def get(self, url):
+        super().get(url)
+        self._loaded_at = self.clock.monotonic()
+        self._rules = [dict(copy.deepcopy(rule), fired=0)
+                       for rule in self._scenarios.get(self.store.normalize_url(url), [])]
+
+    def _render(self):
+        if self._dirty:
+            self._source = str(self._soup)
+            self._dirty = False
+        return self._source
+
+    def _get_soup(self):
+        if self._soup is None:
+            self._soup = BeautifulSoup(self._source, 'lxml')
+        return self._soup
+
+    def _get_tree(self):
+        if self._tree is None:
+            self._tree = lxml_html.fromstring(self._render() or '<html></html>')
+        return self._tree
+
+    def _fragment(self, rule):
+        """Parse the HTML a rule inserts (fresh nodes every time it fires)"""
+        markup = self._read_fixture_file(rule['file']) if rule.get('file') else rule.get('html', '')
+        return list(BeautifulSoup(markup, 'html.parser').contents)
+
+    def _read_fixture_file(self, filename):
+        with open(os.path.join(self.store.fixture_dir, filename), 'r', encoding='utf-8') as f:
+            return f.read()
+
+    def _fire(self, rule):
+        """Apply a rule if it may still fire; returns True if it did"""
+        times = rule.get('times', 1)
+        if times and rule['fired'] >= times:
+            return False
+        rule['fired'] += 1
+        action = rule.get('action', 'append')
+
+        if action == 'load':
+            self.page_source = self._read_fixture_file(rule['file']) if rule.get('file') else rule.get('html', '')
+            self.mutations_applied += 1
+            return True
+
+        soup = self._get_soup()
+        targets = soup.select(rule['target']) if rule.get('target') else [soup.body or soup]
+        if not targets:
+            return False
+
+        if action == 'append':
+            for node in self._fragment(rule):
+                targets[0].append(node)
+        elif action == 'prepend':
+            for index, node in enumerate(self._fragment(rule)):
+                targets[0].insert(index, node)
+        elif action == 'replace':
+            targets[0].replace_with(*self._fragment(rule))
+        elif action == 'remove':
+            for node in targets:
+                node.decompose()
+        elif action == 'set_attribute':
+            for node in targets:
+                if rule.get('value') is None:
+                    node.attrs.pop(rule['attribute'], None)
+                else:
+                    node[rule['attribute']] = rule['value']
+
+        self._dirty = True
+        self._tree = None
+        self.mutations_applied += 1
+        return True
+
+    def _apply_timed(self):
+        if not self._rules:
+            return
+        elapsed = self.clock.monotonic() - self._loaded_at
+        for rule in self._rules:
+            if rule.get('on') == 'after' and elapsed >= rule.get('seconds', 0):
+                self._fire(rule)
+
+    def _find(self, by, value, root=None):
+        self._apply_timed()
+        if by == 'xpath' and root is None:
+            # Resolve XPath on lxml, then map hits back to the live soup nodes (same document order)
+            try:
+                tree = self._get_tree()
+                hits = [node for node in tree.xpath(value) if hasattr(node, 'tag')]
+            except Exception:
+                return []
+            if not hits:
+                return []
+            lxml_nodes = [node for node in tree.iter() if isinstance(node.tag, str)]
+            soup_nodes = self._get_soup().find_all(True)
+            if len(lxml_nodes) == len(soup_nodes):
+                positions = {node: index for index, node in enumerate(lxml_nodes)}
+                return [FixtureElement(soup_nodes[positions[node]], self) for node in hits if node in positions]
+            return [FixtureElement(node, self) for node in hits]
+        return super()._find(by, value, root)
+
+    def on_click(self, element):
+        super().on_click(element)
+        for rule in self._rules:
+            if rule.get('on') != 'click':
+                continue
+            try:
+                matches = self._get_soup().select(rule.get('selector', ''))
+            except Exception:
+                continue
+            if any(node is element._node for node in matches):
+                self._fire(rule)
+
+    def execute_script(self, script, *args):
+        self.scripts += 1
+        self._apply_timed()
+
+        for rule in self._rules:
+            if rule.get('on') == 'script' and rule.get('match', '') in script:
+                if rule.get('action'):
+                    self._fire(rule)
+                if 'result' in rule:
+                    return rule['result']
+
+        if any(marker in script for marker in SCROLL_SCRIPTS):
+            for rule in self._rules:
+                if rule.get('on') == 'scroll':
+                    self._fire(rule)
+            return None
+
+        if 'scrollHeight' in script:
+            # Grows as content is appended, so scroll-until-stable loops terminate
+            return max(self.SCROLL_HEIGHT, len(self._render()) // 20)
+
+        return super().execute_script(script, *args)
+
+
+class _ClockTime:
+    """Stand-in for the time module backed by a clock (for selenium's WebDriverWait)"""
+
+    def __init__(self, clock):
+        self._clock = clock
+
+    def monotonic(self):
+        return self._clock.monotonic()
+
+    def time(self):
+        return self._clock.time()
+
+    def sleep(self, seconds):
+        self._clock.sleep(seconds, reason='webdriver_wait')
+
+    def __getattr__(self, name):
+        import time
+        return getattr(time, name)
+
+
+@contextmanager
+def selenium_waits_on(clock):
+    """
+    Make WebDriverWait poll and time out on the given clock
+
+    With a VirtualClock, waits for elements that never appear time out instantly.
+    """
+    from selenium.webdriver.support import wait as selenium_wait
+
+    original = selenium_wait.time
+    selenium_wait.time = _ClockTime(clock)
+    try:
+        yield clock
+    finally:
+        selenium_wait.time = original
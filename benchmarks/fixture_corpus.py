@@ -0,0 +1,462 @@
+"""
+Synthetic fixture corpus for the offline parser benchmark
+
+Live captures (parser_benchmark --capture) need Chrome, the network and a site
+that isn't challenging the session, so they can't be refreshed on CI and can't
+be committed unsanitized. This module builds a sanitized stand-in for every
+configured site instead. Parts come from the dealer site server's
+SyntheticCatalog; each product page and search page is rendered in the markup
+of the site's parts platform (RevolutionParts, SimplePart, ...) with the URL
+patterns the site's scraper looks for.
+
+The search page is saved under the first listing URL the site's own
+get_product_urls() requests, so the replay walks the same path as a live run.
+Every other page the walk requests (further result pages, category pages, the
+homepage) is saved too, as a listing without results, so the replay never hits
+a 404 that the scraper would retry. Sites that page their results with a "Load
+more" button get the listed products behind it (a click mutation).
+After building, the benchmark's current output is written as the parity
+baseline (product_N.expected.json, search.expected.json).
+
+Usage:
+    python -m benchmarks.fixture_corpus                 # every configured site
+    python -m benchmarks.fixture_corpus honda ford      # selected sites
+    python -m benchmarks.fixture_corpus --no-baseline   # pages only, keep expected results
+"""
+import argparse
+import html
+import json
+import logging
+import os
+import random
+import re
+import shutil
+import sys
+import zlib
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.dealer_site_server import SyntheticCatalog
+from benchmarks.fixture_driver import FixtureStore
+from benchmarks.parser_benchmark import (FIXTURES_DIR, create_offline_scraper, release_scraper, run_site,
+                                         virtual_time)
+from scrapers.registry import get_site_config, load_site_configs
+
+PRODUCTS_PER_SITE = 2       # Wheel product pages per site (plus one non-wheel page)
+SEARCH_RESULTS = 12         # Products listed on the search page
+LOAD_MORE_SITES = {'scuderiacarparts'}  # Results beyond the first page come from "Load more" clicks
+MARKER = 'synthetic'        # manifest "source" of generated corpora (captured ones are left alone)
+
+MODELS = {
+    'Acura': ['MDX', 'RDX', 'TLX', 'ILX'], 'Audi': ['A4', 'A6', 'Q5', 'Q7'], 'BMW': ['X3', 'X5', '330i', '540i'],
+    'Chevrolet': ['Silverado', 'Tahoe', 'Equinox', 'Malibu'], 'Ford': ['Mustang', 'Explorer', 'Escape', 'Edge'],
+    'Honda': ['Accord', 'Civic', 'Pilot', 'Odyssey'], 'Hyundai': ['Sonata', 'Elantra', 'Tucson', 'Palisade'],
+    'Infiniti': ['Q50', 'QX50', 'QX60', 'QX80'], 'Jaguar': ['F-PACE', 'XF', 'XE', 'E-PACE'],
+    'Kia': ['Optima', 'Sorento', 'Sportage', 'Telluride'], 'Land Rover': ['Defender', 'Discovery', 'LR4'],
+    'Lexus': ['RX350', 'ES350', 'NX300', 'GX460'], 'Mazda': ['CX-5', 'CX-9', 'Mazda3', 'Mazda6'],
+    'Mercedes-Benz': ['C300', 'E350', 'GLC300', 'GLE350'], 'Mitsubishi': ['Outlander', 'Eclipse', 'Mirage'],
+    'Nissan': ['Altima', 'Maxima', 'Rogue', 'Pathfinder'], 'Porsche': ['Cayenne', 'Macan', 'Panamera', '911'],
+    'Subaru': ['Outback', 'Forester', 'Crosstrek', 'Ascent'], 'Toyota': ['Camry', 'Corolla', 'RAV4', 'Tacoma'],
+    'Volkswagen': ['Jetta', 'Passat', 'Tiguan', 'Atlas'], 'Volvo': ['XC60', 'XC90', 'S60', 'V60'],
+    'Jeep': ['Wrangler', 'Cherokee', 'Compass'], 'Ferrari': ['Roma', 'Portofino', 'F8'],
+}
+TRIMS = ['Base', 'Sport', 'Touring', 'Limited', 'Premium']
+ENGINES = ['2.0L I4', '2.5L I4', '3.0L V6', '3.5L V6', '5.0L V8']
+CATEGORIES = ['Accessories', 'Body', 'Brakes', 'Electrical', 'Engine', 'Interior', 'Suspension', 'Wheels & Tires']
+
+# Page platform and product URL pattern per site (fields from build_catalog(); RevolutionParts by default)
+REVOLUTION_PATH = '/oem-parts/{brand_slug}-wheel-{pn_slug}'
+SIMPLEPART_PATH = '/p/{brand}__/{slug}/{id}/{pn_plain}.html'
+SITE_LAYOUTS = {
+    'audiusa': ('simplepart', SIMPLEPART_PATH),
+    'ford': ('simplepart', SIMPLEPART_PATH),
+    'jaguar': ('simplepart', SIMPLEPART_PATH),
+    'mazda': ('simplepart', '/products/{brand}/{slug}/{id}/{pn_plain}.html'),
+    'subaru': ('simplepart', SIMPLEPART_PATH),
+    'volkswagen': ('simplepart', SIMPLEPART_PATH),
+    'volvo': ('simplepart', SIMPLEPART_PATH),
+    'porsche': ('simplepart', SIMPLEPART_PATH),
+    'acuraparts': ('catalog', '/oem/acura~{slug_lower}~{pn_plain_lower}.html'),
+    'kia': ('catalog', '/genuine/kia-{slug_lower}~{pn_plain_lower}.html'),
+    'infiniti': ('catalog', '/parts/infiniti-{slug_lower}~{pn_plain_lower}.html'),
+    'toyota': ('revolution', '/product/{slug_lower}-{pn_slug}'),
+    'scuderiacarparts': ('revolution', '/product/{slug_lower}-{pn_slug}'),
+}
+
+
+def _slug(text):
+    return re.sub(r'[^A-Za-z0-9]+', '-', text).strip('-')
+
+
+def site_brand(site_name):
+    site_config = get_site_config(site_name) or {}
+    brands = list(site_config.get('brands') or [site_name.title()])
+    # tascaparts/gm_oemparts list 'GM' first; fitments use the vehicle brand
+    return next((brand for brand in brands if brand in MODELS), brands[0])
+
+
+def build_catalog(site_name):
+    """
+    Synthetic parts for a site: the dealer server catalog, re-branded
+
+    Returns:
+        list: Product dicts (dealer server fields plus brand, url path, fitments)
+    """
+    seed = zlib.crc32(site_name.encode('utf-8'))
+    catalog = SyntheticCatalog(products=40, seed=seed, max_fitments=6)
+    rng = random.Random(seed)
+    brand = site_brand(site_name)
+    models = MODELS.get(brand, ['Model'])
+    platform, path = SITE_LAYOUTS.get(site_name, ('revolution', REVOLUTION_PATH))
+
+    products = []
+    for index, product in enumerate(catalog.products):
+        pn = product['pn']
+        fitments = []
+        for fitment in product['fitments']:
+            fitments.append({'year': fitment['year'], 'make': brand, 'model': rng.choice(models),
+                             'trims': [rng.choice(TRIMS)], 'engines': [rng.choice(ENGINES)]})
+        fields = {'brand': brand, 'brand_slug': _slug(brand).lower(), 'slug': _slug(product['title']),
+                  'pn': pn, 'pn_slug': pn.lower(), 'pn_plain': pn.replace('-', ''), 'id': 100000 + index}
+        fields['slug_lower'] = fields['slug'].lower()
+        fields['pn_plain_lower'] = fields['pn_plain'].lower()
+        products.append(dict(product, brand=brand, fitments=fitments, platform=platform,
+                             description=product['description'].replace(product['make'], brand),
+                             path=path.format(**fields), id=fields['id']))
+    return products
+
+
+def _fitment_rows(product):
+    """(model, trim, engine, [years]) groups, the way SimplePart lists them"""
+    groups = {}
+    for fitment in product['fitments']:
+        key = (fitment['model'], fitment['trims'][0], fitment['engines'][0])
+        groups.setdefault(key, set()).add(str(fitment['year']))
+    return [(model, trim, engine, sorted(years)) for (model, trim, engine), years in sorted(groups.items())]
+
+
+def _json_ld(product, image):
+    """schema.org Product block both platforms embed"""
+    data = {'@context': 'https://schema.org', '@type': 'Product', 'name': product['title'], 'sku': product['pn'],
+            'mpn': product['pn'].replace('-', ''), 'image': [image], 'description': product['description'].strip(),
+            'brand': {'@type': 'Brand', 'name': product['brand']},
+            'offers': {'@type': 'Offer', 'price': f"{product['price']:.2f}", 'priceCurrency': 'USD'}}
+    return f'<script type="application/ld+json">{json.dumps(data)}</script>'
+
+
+def render_revolution_product(product, dealer):
+    """RevolutionParts product page: details list, product_data JSON and a whatThisFits table"""
+    title = html.escape(product['title'])
+    product_data = {'sku': product['pn'], 'name': product['title'], 'price': product['price'],
+                    'msrp': product['msrp'], 'fitment': product['fitments']}
+    rows = ''.join(
+        f'<tr><td class="fitment-year">{fitment["year"]}</td><td class="fitment-make">{fitment["make"]}</td>'
+        f'<td class="fitment-model">{fitment["model"]}</td><td class="fitment-trim">{", ".join(fitment["trims"])}</td>'
+        f'<td class="fitment-engine">{", ".join(fitment["engines"])}</td></tr>'
+        for fitment in product['fitments']
+    )
+    image = f'https://cdn.example-parts.com/images/{product["pn_image"]}.jpg'
+    return (
+        f'<!DOCTYPE html><html><head><title>{title} | {dealer}</title>'
+        f'<meta property="og:title" content="{title}"><meta property="og:image" content="{image}">'
+        f'<meta property="og:description" content="{html.escape(product["description"].strip())}">'
+        f'<meta name="description" content="{html.escape(product["description"].strip())}">{_json_ld(product, image)}'
+        f'</head><body>'
+        f'<div class="product-details-container"><h1 class="product-title">{title}</h1>'
+        f'<div class="product-main-image-container"><img class="product-main-image" itemprop="image" src="{image}"></div>'
+        f'<div class="product-pricing"><strong id="product_price" class="sale-price-value">${product["price"]:.2f}</strong>'
+        f'<span id="product_price2" class="list-price-value">${product["msrp"]:.2f}</span></div>'
+        f'<ul class="product-details-list">'
+        f'<li class="sku"><span class="list-label">Part Number:</span><span class="sku-display">{product["pn"]}</span></li>'
+        f'<li class="also_known_as"><span class="list-label">Other Names:</span><h2 class="list-value">{title} Assembly</h2></li>'
+        f'<li class="product-superseded-list"><span class="list-label">Replaces:</span><h2 class="list-value">{product["replaces"]}</h2></li>'
+        f'<li class="positions"><span class="list-label">Positions:</span><span class="list-value">Front, Rear</span></li>'
+        f'<li class="description" itemprop="description"><span class="list-label">Description:</span>'
+        f'<span class="list-value description_body"><p>{html.escape(product["description"].strip())}</p></span></li></ul></div>'
+        f'<script id="product_data" type="application/json">{json.dumps(product_data)}</script>'
+        f'<div class="whatThisFits fitment-container"><h2>What This Fits</h2><table class="fitment-table">'
+        f'<thead><tr><th>Year</th><th>Make</th><th>Model</th><th>Trim</th><th>Engine</th></tr></thead>'
+        f'<tbody>{rows}</tbody></table></div></body></html>'
+    )
+
+
+def render_simplepart_product(product, dealer):
+    """SimplePart product page: header, pricing and a What This Fits tab panel"""
+    title = html.escape(product['title'])
+    brand = product['brand']
+    rows = []
+    for model, trim, engine, years in _fitment_rows(product):
+        links = ''.join(f'<a href="/p/{brand}_{year}_{_slug(model)}/{_slug(product["title"])}/{product["id"]}/'
+                        f'{product["pn"].replace("-", "")}.html">{year}</a> ' for year in years)
+        rows.append(f'<div class="row"><div class="col-lg-12"><div class="whatThisFitsFitment">'
+                    f'<span>{brand} {model} {engine} {trim}</span></div>'
+                    f'<div class="whatThisFitsYears">{links}</div></div></div>')
+    image = f'https://cdn.example-parts.com/images/{product["pn_image"]}.jpg'
+    return (
+        f'<!DOCTYPE html><html><head><title>{title} - {product["pn"]} | {dealer}</title>'
+        f'<meta property="og:title" content="{title}"><meta property="og:image" content="{image}">'
+        f'<meta name="description" content="{html.escape(product["description"].strip())}">{_json_ld(product, image)}'
+        f'</head><body>'
+        f'<div class="productDetailsPage"><h1 class="productTitle">{title}</h1>'
+        f'<div class="productImage"><img class="product-main-image" itemprop="image" src="{image}"></div>'
+        f'<div class="partNumberContainer"><span class="partNumber" itemprop="sku">{product["pn"]}</span>'
+        f'<span itemprop="value" class="body-3 stock-code-text"><strong>{product["pn"].replace("-", "")}</strong></span>'
+        f'<span class="body-3 alt-stock-code-text"><strong>{product["pn"]}; ; {product["replaces"]}</strong></span></div>'
+        f'<div class="productPricing"><div class="price-header-title"><div class="price-header-heading">MSRP</div>'
+        f'<div class="price-header-price">${product["msrp"]:.2f}</div></div>'
+        f'<div class="msrpRow">MSRP: ${product["msrp"]:.2f}</div>'
+        f'<span id="product_price" class="sale-price productPriceSpan money-3">${product["price"]:.2f}</span></div>'
+        f'<div class="item-desc productDescription description"><p>{html.escape(product["description"].strip())}</p></div>'
+        f'<div class="productReplaces"><span class="replaces">Replaces: {product["replaces"]}</span></div></div>'
+        f'<ul class="nav nav-tabs"><li id="WhatThisFitsTabComponent" class="active">'
+        f'<a id="WhatThisFitsTabComponent_TAB" href="#fitments">What This Fits</a></li></ul>'
+        f'<div class="tab-content"><div id="WhatThisFitsTabComponent_TABPANEL" class="tab-pane active" role="tabpanel">'
+        f'<div id="fitments" class="tab-pane active whatThisFitsContainer">{"".join(rows)}</div></div></div></body></html>'
+    )
+
+
+def _site_navigation(brand):
+    """Header category menu and footer, so listing pages are about the size scrapers sanity-check for"""
+    models = MODELS.get(brand, ['Model'])
+    links = ''.join(
+        f'<li class="nav-link"><a href="/vehicles/{_slug(brand).lower()}/{_slug(model).lower()}/{_slug(category).lower()}">'
+        f'{brand} {model} {html.escape(category)}</a></li>'
+        for model in models for category in CATEGORIES
+    )
+    return (
+        f'<header class="site-header"><nav class="site-nav"><ul class="nav-menu">{links}</ul></nav></header>',
+        f'<footer class="site-footer"><p>Genuine {brand} parts and accessories shipped from our dealership. '
+        f'Prices shown are online prices and may differ from in-store prices.</p>'
+        f'<p>&copy; {brand} Parts. All rights reserved.</p></footer>',
+    )
+
+
+def render_catalog_product(product, dealer):
+    """OEM catalog product page (pn-detail layout): detail list, price section and a fit-vehicle-list table"""
+    title = html.escape(product['title'])
+    description = html.escape(product['description'].strip())
+    rows = ''.join(
+        f'<tr><td>{years[0]}{"-" + years[-1] if len(years) > 1 else ""} {product["brand"]} {model}</td>'
+        f'<td>{trim} | {engine}</td><td></td></tr>'
+        for model, trim, engine, years in _fitment_rows(product)
+    )
+    image = f'https://cdn.example-parts.com/resources/encry/actual-picture/{product["pn_image"]}.jpg'
+    return (
+        f'<!DOCTYPE html><html><head><title>{title} {product["pn"]} | {dealer}</title>'
+        f'<meta property="og:title" content="{title}"><meta name="description" content="{description}">'
+        f'{_json_ld(product, image)}</head><body>'
+        f'<div class="pn-detail"><div class="pn-img-img"><img src="{image}" alt="{title}"></div>'
+        f'<h1 class="pn-detail-h1">{title}</h1><p class="pn-detail-sub-desc">Part Number: {product["pn"]}</p>'
+        f'<div class="price-section"><span class="price-section-price">${product["price"]:.2f}</span>'
+        f'<span class="price-section-retail">MSRP: <span>${product["msrp"]:.2f}</span></span></div>'
+        f'<ul class="pn-detail-list"><li><span>Part Description</span><div>{description}</div></li>'
+        f'<li><span>Replaced By</span><div>{product["replaces"]}</div></li>'
+        f'<li><span>Also Known As</span><div>{title} Assembly</div></li></ul>'
+        f'<div class="acc-pn-detail-marketing"><ul class="description-list"><li>{description}</li></ul></div>'
+        f'<table class="pn-spec-list"><tr><td>Manufacturer Part Number</td><td>{product["pn"]}</td></tr>'
+        f'<tr><td>Part Description</td><td>{description}</td></tr></table></div>'
+        f'<div class="fit-vehicle-list"><table class="fit-vehicle-list-table"><thead><tr><th>Year Make Model</th>'
+        f'<th>Trim &amp; Engine</th><th>Important vehicle option details</th></tr></thead>'
+        f'<tbody>{rows}</tbody></table></div></body></html>'
+    )
+
+
+def render_search_rows(products):
+    """Result rows of a search page (markup covering both platforms' result lists)"""
+    return ''.join(
+        f'<div class="catalog-product productRow searchresultbox">'
+        f'<a class="title-link product-title productTitle" href="{product["path"]}">'
+        f'<div class="mt-md"><strong>{html.escape(product["title"])}</strong></div></a>'
+        f'<span class="part-number">{product["pn"]}</span>'
+        f'<span class="sale-price-value">${product["price"]:.2f}</span>'
+        f'<a class="btn btn-primary" href="{product["path"]}">View Product</a></div>'
+        for product in products
+    )
+
+
+def render_search_page(products, dealer, brand, search_term='wheel', load_more=False):
+    """Search/listing page linking to products, optionally with a "Load more results" button"""
+    button = '<button id="load_more_results" class="btn load-more">Load more results</button>' if load_more else ''
+    header, footer = _site_navigation(brand)
+    return (
+        f'<!DOCTYPE html><html><head><title>Search results for {search_term} | {dealer}</title></head><body>{header}'
+        f'<h1>Search results for "{search_term}"</h1>'
+        f'<div class="search-results productSearchResults">{render_search_rows(products)}</div>{button}'
+        f'{footer}</body></html>'
+    )
+
+
+def load_more_mutations(fragment_file):
+    """Manifest mutations: the first "Load more" click appends the fragment's rows and removes the button"""
+    return [
+        {'on': 'click', 'selector': '#load_more_results', 'action': 'append',
+         'target': 'div.search-results', 'file': fragment_file},
+        {'on': 'click', 'selector': '#load_more_results', 'action': 'remove', 'target': '#load_more_results'},
+    ]
+
+
+RENDERERS = {
+    'revolution': render_revolution_product,
+    'simplepart': render_simplepart_product,
+    'catalog': render_catalog_product,
+}
+
+
+HOME_HTML = '<!DOCTYPE html><html><head><title>Parts</title></head><body><h1>Parts</h1></body></html>'
+
+
+class DiscoveryStore(FixtureStore):
+    """
+    Fixture store answering the first listing URL a scraper requests with the
+    search page, product URLs with their pages, the homepage with a stub and
+    any other URL with a listing page without results (recorded in other_urls)
+    """
+
+    def __init__(self, fixture_dir, base_url, search_html, listing_html, product_pages):
+        super().__init__(fixture_dir)
+        self.base_url = base_url.rstrip('/')
+        self.search_html = search_html
+        self.listing_html = listing_html
+        self.product_pages = {self.normalize_url(url): page for url, page in product_pages.items()}
+        self.search_url = None
+        self.other_urls = []
+
+    def html_for(self, url):
+        key = self.normalize_url(url)
+        if key in self.product_pages:
+            return self.product_pages[key]
+        if self.search_url is not None and key == self.normalize_url(self.search_url):
+            return self.search_html
+        if key in ('', self.base_url):
+            page = HOME_HTML
+        elif self.search_url is None:
+            self.search_url = url
+            return self.search_html
+        else:
+            page = self.listing_html
+        if key not in (self.normalize_url(other) for other in self.other_urls):
+            self.other_urls.append(url)
+        return page
+
+
+def discover_listing_urls(site_name, fixtures_dir, base_url, search_html, listing_html, product_pages):
+    """
+    Run the site's get_product_urls() offline
+
+    Returns:
+        tuple: (first listing URL it requested or None, other non-product URLs it requested)
+    """
+    store = DiscoveryStore(os.path.join(fixtures_dir, site_name), base_url, search_html, listing_html, product_pages)
+    with virtual_time() as clock:
+        scraper = create_offline_scraper(site_name, store, clock=clock)
+        try:
+            scraper.get_product_urls()
+        finally:
+            release_scraper(scraper)
+    return store.search_url, store.other_urls
+
+
+def build_site(site_name, fixtures_dir=FIXTURES_DIR):
+    """
+    Write the synthetic corpus for one site (replaces an earlier synthetic corpus)
+
+    Returns:
+        str: Site fixture directory, or None if the site has a captured corpus
+    """
+    site_dir = os.path.join(fixtures_dir, site_name)
+    manifest_path = os.path.join(site_dir, 'manifest.json')
+    if os.path.exists(manifest_path):
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            if json.load(f).get('source') != MARKER:
+                logging.getLogger('fixture_corpus').warning(f"{site_name}: keeping captured fixtures")
+                return None
+        shutil.rmtree(site_dir)
+    os.makedirs(site_dir)
+
+    site_config = get_site_config(site_name) or {}
+    base_url = site_config.get('base_url', f'https://{site_name}.example.com').rstrip('/')
+    dealer = f"{site_config.get('brands', [site_name])[0]} Parts"
+    products = build_catalog(site_name)
+    for product in products:
+        product['pn_image'] = product['pn'].replace('-', '').lower()
+        product['replaces'] = product['pn'][:-1] + 'Z'
+    renderer = RENDERERS[products[0]['platform']]
+
+    wheels = [product for product in products if product['is_wheel']][:PRODUCTS_PER_SITE]
+    other = next(product for product in products if not product['is_wheel'])
+    listed = products[:SEARCH_RESULTS]
+    for product in wheels + [other]:
+        if product not in listed:
+            listed.append(product)
+
+    brand = products[0]['brand']
+    load_more = site_name in LOAD_MORE_SITES
+    if load_more:
+        # The scraped pages are the ones behind the button (the scraper skips results already shown)
+        behind = wheels + [other]
+        search_html = render_search_page([product for product in listed if product not in behind], dealer, brand,
+                                         load_more=True)
+    else:
+        search_html = render_search_page(listed, dealer, brand)
+    listing_html = render_search_page([], dealer, brand)
+    product_pages = {f"{base_url}{product['path']}": renderer(product, dealer) for product in wheels + [other]}
+    search_url, other_urls = discover_listing_urls(site_name, fixtures_dir, base_url, search_html, listing_html,
+                                                   product_pages)
+
+    def write(filename, content):
+        with open(os.path.join(site_dir, filename), 'w', encoding='utf-8') as f:
+            f.write(content)
+
+    pages = []
+    if search_url:
+        write('search_1.html', search_html)
+        page = {'url': search_url, 'file': 'search_1.html', 'kind': 'search'}
+        if load_more:
+            write('search_1_more.html', render_search_rows(behind))
+            page['mutations'] = load_more_mutations('search_1_more.html')
+        pages.append(page)
+    for url in other_urls:
+        home = FixtureStore.normalize_url(url) in ('', base_url)
+        pages.append({'url': url, 'file': 'home.html' if home else 'listing_empty.html', 'kind': 'listing'})
+    for filename, content in (('home.html', HOME_HTML), ('listing_empty.html', listing_html)):
+        if any(page['file'] == filename for page in pages):
+            write(filename, content)
+    for index, (url, page_html) in enumerate(product_pages.items(), 1):
+        filename = f'product_{index}.html'
+        write(filename, page_html)
+        pages.append({'url': url, 'file': filename, 'kind': 'product'})
+
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump({'site': site_name, 'source': MARKER, 'pages': pages}, f, indent=2, ensure_ascii=False)
+    return site_dir
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Build the synthetic parser benchmark fixture corpus')
+    parser.add_argument('sites', nargs='*', help='Config site names (default: every configured site)')
+    parser.add_argument('--fixtures', default=FIXTURES_DIR, help='Fixture root directory')
+    parser.add_argument('--no-baseline', action='store_true',
+                        help="Don't write the parity baseline (expected results) after building")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    sites = args.sites or [site['name'] for site in load_site_configs()]
+
+    for site_name in sites:
+        if build_site(site_name, args.fixtures) is None:
+            continue
+        if args.no_baseline:
+            print(f"✓ {site_name}: pages written")
+            continue
+        result = run_site(site_name, args.fixtures, iterations=1, accept=True)
+        search = result['search'] or {}
+        print(f"✓ {site_name}: {result['products']['pages']} product pages, "
+              f"{search.get('urls_found', 0)} URLs from the search page, baseline written")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,416 @@
+"""Fixture-backed stand-ins for the WebDriver and requests session (no browser, no network)"""
+import json
+import logging
+import os
+from urllib.parse import urldefrag
+
+from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
+from selenium.common.exceptions import NoSuchElementException
+
+from scrapers.cloudflare_detector import detect_challenge_html
+
+NOT_FOUND_HTML = '<html><head><title>404 Not Found</title></head><body><h1>Not Found</h1></body></html>'
+
+
+class FixtureStore:
+    """
+    Saved pages for one site, loaded from benchmarks/fixtures/<site>/manifest.json
+
+    Manifest format:
+        {"site": "honda",
+         "pages": [{"url": "...", "file": "product_1.html", "kind": "product",
+                    "expected": "product_1.expected.json"}, ...]}
+
+    'kind' is 'product' (replayed through scrape_product), 'search' (served to
+    get_product_urls) or 'listing' (other pages the search walk requests, served
+    only); 'expected' is optional. Pages may share a file.
+    """
+
+    def __init__(self, fixture_dir):
+        """
+        Args:
+            fixture_dir: Directory holding manifest.json and the saved pages
+        """
+        self.logger = logging.getLogger('fixture_store')
+        self.fixture_dir = fixture_dir
+        self.pages = []
+        self._html = {}
+        self.misses = []
+
+        manifest_path = os.path.join(fixture_dir, 'manifest.json')
+        if os.path.exists(manifest_path):
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                self.pages = json.load(f).get('pages', [])
+
+    @staticmethod
+    def normalize_url(url):
+        """Normalize URL for fixture lookup (no fragment, no trailing slash)"""
+        return urldefrag(url or '')[0].rstrip('/')
+
+    def html_for(self, url):
+        """Return saved HTML for url, or None if the page is not in the corpus"""
+        key = self.normalize_url(url)
+        if key not in self._html:
+            self._html[key] = None
+            for page in self.pages:
+                if self.normalize_url(page.get('url')) == key:
+                    with open(os.path.join(self.fixture_dir, page['file']), 'r', encoding='utf-8') as f:
+                        self._html[key] = f.read()
+                    break
+        return self._html[key]
+
+    def page_html(self, url):
+        """Return saved HTML for url, or a 404 page (recorded in misses)"""
+        html = self.html_for(url)
+        if html is None:
+            self.misses.append(url)
+            return NOT_FOUND_HTML
+        return html
+
+    def expected_for(self, page):
+        """Return the expected extraction result for a manifest page, or None"""
+        if not page.get('expected'):
+            return None
+        path = os.path.join(self.fixture_dir, page['expected'])
+        if not os.path.exists(path):
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def pages_of_kind(self, kind):
+        return [page for page in self.pages if page.get('kind', 'product') == kind]
+
+
+class FixtureElement:
+    """Minimal WebElement over a parsed fixture node (BeautifulSoup Tag or lxml element)"""
+
+    def __init__(self, node, driver):
+        self._node = node
+        self._driver = driver
+        # (not hasattr(node, 'xpath'): a bs4 Tag answers any attribute with a child lookup)
+        self._is_soup = not isinstance(node, etree._Element)
+
+    @property
+    def id(self):
+        return str(id(self._node))
+
+    @property
+    def tag_name(self):
+        return self._node.name if self._is_soup else str(self._node.tag)
+
+    @property
+    def text(self):
+        if self._is_soup:
+            return self._node.get_text(' ', strip=True)
+        return ' '.join(' '.join(self._node.itertext()).split())
+
+    def get_attribute(self, name):
+        if name in ('innerText', 'textContent'):
+            return self.text
+        if name == 'outerHTML':
+            return self._outer_html()
+        if name == 'innerHTML':
+            if self._is_soup:
+                return self._node.decode_contents()
+            return ''.join(lxml_html.tostring(child, encoding='unicode') for child in self._node)
+        value = self._node.get(name)
+        if isinstance(value, list):
+            value = ' '.join(value)
+        return value
+
+    get_dom_attribute = get_attribute
+    get_property = get_attribute
+
+    def _outer_html(self):
+        return str(self._node) if self._is_soup else lxml_html.tostring(self._node, encoding='unicode')
+
+    def is_displayed(self):
+        style = (self.get_attribute('style') or '').replace(' ', '').lower()
+        hidden = self._node.get('hidden') is not None or self.get_attribute('type') == 'hidden'
+        return not hidden and 'display:none' not in style and 'visibility:hidden' not in style
+
+    def is_enabled(self):
+        return self._node.get('disabled') is None
+
+    def is_selected(self):
+        return self._node.get('checked') is not None or self._node.get('selected') is not None
+
+    def click(self):
+        self._driver.on_click(self)
+
+    def send_keys(self, *values):
+        pass
+
+    def clear(self):
+        pass
+
+    def value_of_css_property(self, name):
+        return ''
+
+    @property
+    def location(self):
+        return {'x': 0, 'y': 0}
+
+    @property
+    def location_once_scrolled_into_view(self):
+        return {'x': 0, 'y': 0}
+
+    @property
+    def size(self):
+        return {'width': 100, 'height': 20}
+
+    @property
+    def rect(self):
+        return {'x': 0, 'y': 0, 'width': 100, 'height': 20}
+
+    def find_elements(self, by='css selector', value=None):
+        return self._driver._find(by, value, self._node)
+
+    def find_element(self, by='css selector', value=None):
+        elements = self.find_elements(by, value)
+        if not elements:
+            raise NoSuchElementException(f"No element matching {by}={value}")
+        return elements[0]
+
+
+class _SwitchTo:
+    def __init__(self, driver):
+        self._driver = driver
+
+    def window(self, handle):
+        pass
+
+    def new_window(self, type_hint=None):
+        pass
+
+    def frame(self, frame_reference):
+        pass
+
+    def default_content(self):
+        pass
+
+    @property
+    def alert(self):
+        raise NoSuchElementException("No alert present")
+
+
+class FixtureDriver:
+    """
+    Static stand-in for the Selenium driver serving pages from a FixtureStore
+
+    Implements the subset of the WebDriver API the scrapers use; pages are static
+    (clicks and scrolls don't change the DOM) and unknown URLs get a 404 page.
+    """
+
+    SCROLL_HEIGHT = 2000
+
+    def __init__(self, store):
+        """
+        Args:
+            store: FixtureStore to serve pages from
+        """
+        self.store = store
+        self.current_url = 'about:blank'
+        self.page_source = '<html><head></head><body></body></html>'
+        self.window_handles = ['fixture-0']
+        self.current_window_handle = 'fixture-0'
+        self.switch_to = _SwitchTo(self)
+        self.navigations = 0
+        self.clicks = 0
+        self.html_transfers = 0
+        self._soup = None
+        self._tree = None
+
+    def get(self, url):
+        self.navigations += 1
+        self.current_url = url
+        self.page_source = self.store.page_html(url)
+        self._soup = None
+        self._tree = None
+
+    @property
+    def title(self):
+        soup = self._get_soup()
+        return soup.title.get_text(strip=True) if soup.title else ''
+
+    def _get_soup(self):
+        if self._soup is None:
+            self._soup = BeautifulSoup(self.page_source, 'lxml')
+        return self._soup
+
+    def _get_tree(self):
+        if self._tree is None:
+            self._tree = lxml_html.fromstring(self.page_source or '<html></html>')
+        return self._tree
+
+    def _find(self, by, value, root=None):
+        """Resolve a locator against the current page (or an element subtree)"""
+        try:
+            if by == 'xpath':
+                if root is None or isinstance(root, etree._Element):
+                    nodes = (root if root is not None else self._get_tree()).xpath(value)
+                else:
+                    nodes = lxml_html.fromstring(str(root)).xpath(value)
+                return [FixtureElement(node, self) for node in nodes if isinstance(node, etree._Element)]
+
+            if root is not None and isinstance(root, etree._Element):
+                root = BeautifulSoup(lxml_html.tostring(root, encoding='unicode'), 'lxml')
+            scope = root if root is not None else self._get_soup()
+
+            if by == 'css selector':
+                nodes = scope.select(value)
+            elif by == 'id':
+                nodes = scope.select(f'[id="{value}"]')
+            elif by == 'name':
+                nodes = scope.select(f'[name="{value}"]')
+            elif by == 'class name':
+                nodes = scope.select(f'.{value}')
+            elif by == 'tag name':
+                nodes = scope.find_all(value)
+            elif by == 'link text':
+                nodes = [a for a in scope.find_all('a') if a.get_text(strip=True) == value]
+            elif by == 'partial link text':
+                nodes = [a for a in scope.find_all('a') if value in a.get_text(strip=True)]
+            else:
+                nodes = []
+            return [FixtureElement(node, self) for node in nodes]
+        except Exception:
+            # Unsupported selector syntax behaves like "not found"
+            return []
+
+    def find_elements(self, by='css selector', value=None):
+        return self._find(by, value)
+
+    def find_element(self, by='css selector', value=None):
+        elements = self._find(by, value)
+        if not elements:
+            raise NoSuchElementException(f"No element matching {by}={value}")
+        return elements[0]
+
+    def on_click(self, element):
+        """Called for element.click() and 'arguments[0].click()' scripts"""
+        self.clicks += 1
+
+    def execute_script(self, script, *args):
+        """Answer the page-state queries scrapers make; other scripts are no-ops"""
+        if '.click()' in script and args and isinstance(args[0], FixtureElement):
+            self.on_click(args[0])
+            return None
+        if 'readyState' in script:
+            return 'complete'
+        if 'scrollHeight' in script or 'innerHeight' in script:
+            return self.SCROLL_HEIGHT
+        if 'pageYOffset' in script or 'scrollY' in script:
+            return 0
+        if 'page-snapshot' in script:
+            return self.snapshot_state(include_html=bool(args and args[0]))
+        if 'cloudflare-probe' in script:
+            return detect_challenge_html(self.page_source, self.current_url)
+        if 'outerHTML' in script:
+            return self.page_source
+        return None
+
+    @property
+    def dom_version(self):
+        """DOM change counter for the page snapshot state (static pages never change)"""
+        return 0
+
+    def snapshot_state(self, include_html):
+        """Answer the page snapshot script (scrapers.page_snapshot)"""
+        state = {'url': self.current_url, 'ready_state': 'complete',
+                 'version': f'{self.navigations}:{self.dom_version}'}
+        if include_html:
+            self.html_transfers += 1
+            state['html'] = self.page_source
+        return state
+
+    def execute_async_script(self, script, *args):
+        return None
+
+    def execute(self, command, params=None):
+        # ActionChains.perform() and other raw commands
+        return {'value': None}
+
+    def execute_cdp_cmd(self, cmd, params=None):
+        return {}
+
+    def set_page_load_timeout(self, seconds):
+        pass
+
+    def implicitly_wait(self, seconds):
+        pass
+
+    def set_script_timeout(self, seconds):
+        pass
+
+    def maximize_window(self):
+        pass
+
+    def refresh(self):
+        self.get(self.current_url)
+
+    def back(self):
+        pass
+
+    def forward(self):
+        pass
+
+    def get_cookies(self):
+        return []
+
+    def get_cookie(self, name):
+        return None
+
+    def add_cookie(self, cookie):
+        pass
+
+    def delete_all_cookies(self):
+        pass
+
+    def save_screenshot(self, filename):
+        return False
+
+    def close(self):
+        pass
+
+    def quit(self):
+        pass
+
+
+class FixtureResponse:
+    """requests.Response stand-in for the HTTP path of get_page()"""
+
+    def __init__(self, url, text, status_code):
+        self.url = url
+        self.text = text
+        self.content = text.encode('utf-8')
+        self.status_code = status_code
+        self.ok = status_code < 400
+        self.headers = {'Content-Type': 'text/html; charset=utf-8'}
+        self.encoding = 'utf-8'
+
+    def raise_for_status(self):
+        if not self.ok:
+            from requests.exceptions import HTTPError
+            raise HTTPError(f"{self.status_code} Client Error for url: {self.url}", response=self)
+
+
+class FixtureSession:
+    """requests.Session stand-in serving pages from a FixtureStore"""
+
+    def __init__(self, store):
+        self.store = store
+        self.requests = 0
+
+    def get(self, url, **kwargs):
+        self.requests += 1
+        html = self.store.html_for(url)
+        if html is None:
+            self.store.misses.append(url)
+            return FixtureResponse(url, NOT_FOUND_HTML, 404)
+        return FixtureResponse(url, html, 200)
+
+    def close(self):
+        pass
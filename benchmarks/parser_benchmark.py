@@ -0,0 +1,496 @@
+"""
+Offline parser benchmark over saved HTML fixtures
+
+Replays each site's scrape_product() (and optionally get_product_urls()) against
+saved pages with a fake driver and a virtual clock, so no browser, network or
+politeness sleeps are involved. Reports pages/sec, memory allocated per page
+and extracted-field parity against the expected results saved with the fixtures.
+Pages can carry scripted DOM mutations (see benchmarks/fake_driver.py) so the
+click/scroll/wait paths run too; --profile shows where the CPU time goes.
+
+Usage:
+    python -m benchmarks.parser_benchmark                     # all sites with fixtures
+    python -m benchmarks.parser_benchmark honda toyota -n 20  # selected sites, 20 iterations
+    python -m benchmarks.parser_benchmark --update-expected   # accept current output as expected
+    python -m benchmarks.parser_benchmark honda --profile 30  # cProfile the replay, top 30 functions
+    python -m benchmarks.parser_benchmark --capture honda --url https://... [--url ...]
+    python -m benchmarks.parser_benchmark --capture honda --search
+"""
+import argparse
+import cProfile
+import json
+import logging
+import os
+import pstats
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scrapers.clock import VirtualClock, set_clock
+from scrapers.registry import get_site_config, scraper_class, takes_site_config
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+# Fields that legitimately differ between runs
+VOLATILE_FIELDS = ('date',)
+FITMENT_FIELDS = ('year', 'make', 'model', 'trim', 'engine')
+
+
+def setup_logging(verbose=False):
+    """Setup logging"""
+    logging.basicConfig(
+        level=logging.INFO if verbose else logging.WARNING,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[logging.StreamHandler()]
+    )
+    return logging.getLogger('parser_benchmark')
+
+
+@contextmanager
+def virtual_time():
+    """
+    Run with a VirtualClock as the default clock
+
+    Scrapers created inside the block (and scrape_site() calls) sleep on it, and
+    WebDriverWait polls on it, so back-offs and wait timeouts complete instantly.
+    time.perf_counter is left alone for measurements.
+
+    Yields:
+        VirtualClock: slept/sleep_calls/slept_by_reason hold the skipped sleeps
+    """
+    from benchmarks.fake_driver import selenium_waits_on
+
+    clock = VirtualClock()
+    previous = set_clock(clock)
+    try:
+        with selenium_waits_on(clock):
+            yield clock
+    finally:
+        set_clock(previous)
+
+
+def load_site_config(site_name):
+    """Load the sites_config.json entry for a site (used by GenericScraper)"""
+    return get_site_config(site_name) or {'name': site_name}
+
+
+def create_offline_scraper(site_name, store, verbose=False, clock=None):
+    """
+    Create a site scraper whose driver and HTTP session serve fixture pages
+
+    Create it inside virtual_time() (passing its clock) so its sleeps and the
+    driver's timed mutations run on the virtual clock.
+
+    Args:
+        site_name: Config site name
+        store: FixtureStore for the site
+        verbose: Keep the scraper's INFO logging (off by default to keep output readable)
+        clock: Clock for the scraper (default: process-wide clock)
+
+    Returns:
+        Scraper instance
+    """
+    from benchmarks.fake_driver import FakeDriver
+    from benchmarks.fixture_driver import FixtureSession
+
+    cls = scraper_class(site_name)
+
+    class OfflineMixin:
+        def setup_selenium(self):
+            self.driver = FakeDriver(store, clock=self.clock)
+
+    offline_cls = type(f'Offline{cls.__name__}', (OfflineMixin, cls), {})
+    if takes_site_config(cls):
+        scraper = offline_cls(load_site_config(site_name), clock=clock)
+    else:
+        scraper = offline_cls(clock=clock)
+
+    scraper.session = FixtureSession(store)
+    if hasattr(scraper, 'batch_output_dir'):
+        # Scrapers exporting batches during the search walk write them to a scratch directory
+        scraper.batch_output_dir = scraper.scratch_dir = tempfile.mkdtemp(prefix=f'{site_name}_batches_')
+    if scraper.driver is None:
+        scraper.setup_selenium()
+    if not verbose:
+        scraper.logger.setLevel(logging.WARNING)
+    return scraper
+
+
+def release_scraper(scraper):
+    """Close the scraper's log handlers and delete its scratch batch directory (the fixture driver holds no resources)"""
+    from scrapers.log_pipeline import get_log_pipeline
+    get_log_pipeline().detach(scraper.logger)
+    if getattr(scraper, 'scratch_dir', None):
+        shutil.rmtree(scraper.scratch_dir, ignore_errors=True)
+
+
+def normalize_result(result):
+    """
+    Normalize a scrape_product() result for comparison
+
+    Handles both the dict-with-fitments and the flattened list-of-rows formats.
+    """
+    if not result:
+        return None
+    rows = result if isinstance(result, list) else [result]
+    first = rows[0]
+
+    fields = {key: value for key, value in first.items()
+              if key not in VOLATILE_FIELDS and key not in FITMENT_FIELDS and key != 'fitments'}
+
+    fitments = []
+    for row in rows:
+        for fitment in (row.get('fitments') or ([row] if isinstance(result, list) else [])):
+            fitments.append([str(fitment.get(field, '') or '') for field in FITMENT_FIELDS])
+    fields['fitments'] = sorted(fitments)
+    return json.loads(json.dumps(fields, default=str))
+
+
+def compare_results(expected, actual):
+    """
+    Compare normalized results field by field
+
+    Returns:
+        list: Names of fields that differ (empty when the results match)
+    """
+    if expected is None or actual is None:
+        return [] if expected == actual else ['<result>']
+    keys = set(expected) | set(actual)
+    return sorted(key for key in keys if expected.get(key) != actual.get(key))
+
+
+def benchmark_products(scraper, store, iterations, profile_rows=0):
+    """
+    Replay product fixtures through scrape_product()
+
+    Args:
+        scraper: Offline scraper (see create_offline_scraper)
+        store: FixtureStore for the site
+        iterations: Replays per product fixture
+        profile_rows: If set, cProfile the timing passes and print the top functions
+
+    Returns:
+        dict: Per-site product benchmark results
+    """
+    pages = store.pages_of_kind('product')
+    results = {'pages': len(pages), 'iterations': iterations, 'seconds': 0.0,
+               'virtual_sleep': 0.0, 'peak_kib_per_page': 0.0, 'retained_kib': 0.0,
+               'parity_ok': 0, 'parity_mismatch': 0, 'no_expected': 0, 'mismatches': [],
+               'outputs': {}}
+    if not pages:
+        return results
+
+    # Timing passes (without tracemalloc overhead)
+    profiler = cProfile.Profile() if profile_rows else None
+    slept_before = scraper.clock.slept
+    start = time.perf_counter()
+    if profiler:
+        profiler.enable()
+    for _ in range(iterations):
+        for page in pages:
+            results['outputs'][page['url']] = scraper.scrape_product(page['url'])
+    if profiler:
+        profiler.disable()
+    results['seconds'] = time.perf_counter() - start
+    results['virtual_sleep'] = scraper.clock.slept - slept_before
+
+    if profiler:
+        print(f"\n=== Profile: {scraper.__class__.__name__} ({len(pages)} pages x {iterations}) ===")
+        pstats.Stats(profiler, stream=sys.stdout).sort_stats('cumulative').print_stats(profile_rows)
+
+    # One allocation pass
+    tracemalloc.start()
+    try:
+        peaks = []
+        baseline = tracemalloc.get_traced_memory()[0]
+        for page in pages:
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            scraper.scrape_product(page['url'])
+            peaks.append(tracemalloc.get_traced_memory()[1] - before)
+        results['peak_kib_per_page'] = sum(peaks) / len(peaks) / 1024.0
+        results['retained_kib'] = (tracemalloc.get_traced_memory()[0] - baseline) / 1024.0
+    finally:
+        tracemalloc.stop()
+
+    # Field parity
+    for page in pages:
+        expected = store.expected_for(page)
+        if expected is None:
+            results['no_expected'] += 1
+            continue
+        actual = normalize_result(results['outputs'][page['url']])
+        diff = compare_results(normalize_result(expected), actual)
+        if diff:
+            results['parity_mismatch'] += 1
+            results['mismatches'].append({'url': page['url'], 'fields': diff})
+        else:
+            results['parity_ok'] += 1
+    return results
+
+
+def benchmark_search(scraper, store):
+    """
+    Replay search fixtures through get_product_urls()
+
+    Returns:
+        dict: Search benchmark results, or None if the site has no search fixtures
+    """
+    if not store.pages_of_kind('search'):
+        return None
+
+    slept_before = scraper.clock.slept
+    start = time.perf_counter()
+    urls = scraper.get_product_urls() or []
+    seconds = time.perf_counter() - start
+
+    results = {'pages': len(store.pages_of_kind('search')), 'seconds': seconds,
+               'virtual_sleep': scraper.clock.slept - slept_before, 'urls_found': len(urls), 'urls': list(urls)}
+
+    expected_path = os.path.join(store.fixture_dir, 'search.expected.json')
+    if os.path.exists(expected_path):
+        with open(expected_path, 'r', encoding='utf-8') as f:
+            expected = set(json.load(f))
+        results['missing_urls'] = len(expected - set(urls))
+        results['extra_urls'] = len(set(urls) - expected)
+    return results
+
+
+def update_expected(store, product_results, search_results):
+    """Write the current outputs as the expected results for the fixtures"""
+    manifest_path = os.path.join(store.fixture_dir, 'manifest.json')
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+
+    for page in manifest.get('pages', []):
+        if page.get('kind', 'product') != 'product' or page['url'] not in product_results['outputs']:
+            continue
+        page['expected'] = page.get('expected') or f"{os.path.splitext(page['file'])[0]}.expected.json"
+        with open(os.path.join(store.fixture_dir, page['expected']), 'w', encoding='utf-8') as f:
+            json.dump(product_results['outputs'][page['url']], f, indent=2, ensure_ascii=False, default=str)
+
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+
+    if search_results is not None:
+        with open(os.path.join(store.fixture_dir, 'search.expected.json'), 'w', encoding='utf-8') as f:
+            json.dump(sorted(search_results['urls']), f, indent=2, ensure_ascii=False)
+
+
+def run_site(site_name, fixtures_dir, iterations, search=True, accept=False, verbose=False, profile_rows=0):
+    """
+    Benchmark one site
+
+    Returns:
+        dict: Site results
+    """
+    from benchmarks.fixture_driver import FixtureStore
+
+    store = FixtureStore(os.path.join(fixtures_dir, site_name))
+    with virtual_time() as clock:
+        scraper = create_offline_scraper(site_name, store, verbose=verbose, clock=clock)
+        try:
+            products = benchmark_products(scraper, store, iterations, profile_rows=profile_rows)
+            search_results = benchmark_search(scraper, store) if search else None
+            if accept:
+                update_expected(store, products, search_results)
+            phases = scraper.phase_timer.get_breakdown()
+            driver = scraper.driver
+            driver_stats = {'navigations': driver.navigations, 'clicks': driver.clicks,
+                            'scripts': getattr(driver, 'scripts', 0),
+                            'mutations': getattr(driver, 'mutations_applied', 0),
+                            'html_transfers': getattr(driver, 'html_transfers', 0)}
+        finally:
+            release_scraper(scraper)
+
+    products.pop('outputs', None)
+    if search_results:
+        search_results.pop('urls', None)
+    return {
+        'site': site_name,
+        'products': products,
+        'search': search_results,
+        'phases': {phase: phases[phase] for phase in ('soup', 'extraction', 'wheel_check', 'page_source', 'snapshot_check')
+                   if phase in phases},
+        'fixture_misses': len(store.misses),
+        'driver': driver_stats,
+        'sleeps_by_reason': {reason: round(seconds, 3) for reason, seconds in clock.slept_by_reason.items()},
+    }
+
+
+def print_report(results):
+    """Print the benchmark table"""
+    print()
+    print(f"{'site':<18}{'pages':>6}{'pages/s':>10}{'ms/page':>10}{'KiB/page':>10}{'parity':>12}{'misses':>8}")
+    print('-' * 74)
+    for result in results:
+        products = result['products']
+        runs = products['pages'] * products['iterations']
+        pages_per_sec = runs / products['seconds'] if products['seconds'] > 0 else 0.0
+        ms_per_page = products['seconds'] * 1000.0 / runs if runs else 0.0
+        checked = products['parity_ok'] + products['parity_mismatch']
+        parity = f"{products['parity_ok']}/{checked}" if checked else 'n/a'
+        print(f"{result['site']:<18}{products['pages']:>6}{pages_per_sec:>10.1f}{ms_per_page:>10.1f}"
+              f"{products['peak_kib_per_page']:>10.0f}{parity:>12}{result['fixture_misses']:>8}")
+        for mismatch in products['mismatches']:
+            print(f"    ✗ {mismatch['url']}: {', '.join(mismatch['fields'])}")
+        if result['search']:
+            search = result['search']
+            line = f"    search: {search['urls_found']} URLs from {search['pages']} pages in {search['seconds']:.2f}s"
+            if 'missing_urls' in search:
+                line += f" (missing {search['missing_urls']}, extra {search['extra_urls']})"
+            print(line)
+    print()
+
+
+def capture(site_name, urls, fixtures_dir, search=False):
+    """
+    Capture fixtures from the live site with the real scraper
+
+    Every page the scraper reads (via get_page_source) is saved, so the replay
+    sees the same DOM state the live run parsed.
+
+    Args:
+        site_name: Config site name
+        urls: Product URLs to capture
+        fixtures_dir: Fixture root directory
+        search: Also capture the search/listing pages walked by get_product_urls()
+    """
+    site_dir = os.path.join(fixtures_dir, site_name)
+    os.makedirs(site_dir, exist_ok=True)
+    manifest_path = os.path.join(site_dir, 'manifest.json')
+    manifest = {'site': site_name, 'pages': []}
+    if os.path.exists(manifest_path):
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    known = {page['url']: page for page in manifest['pages']}
+
+    cls = scraper_class(site_name)
+    scraper = cls(load_site_config(site_name)) if takes_site_config(cls) else cls()
+    seen = {}
+    original_get_page_source = scraper.get_page_source
+
+    def recording_get_page_source():
+        html = original_get_page_source()
+        seen[scraper.driver.current_url] = html
+        return html
+
+    scraper.get_page_source = recording_get_page_source
+
+    def save(url, html, kind, expected=None):
+        page = known.get(url)
+        if page is None:
+            page = {'url': url, 'file': f"{kind}_{len(manifest['pages']) + 1}.html", 'kind': kind}
+            manifest['pages'].append(page)
+            known[url] = page
+        elif kind == 'product':
+            page['kind'] = kind
+        with open(os.path.join(site_dir, page['file']), 'w', encoding='utf-8') as f:
+            f.write(html)
+        if expected is not None:
+            page['expected'] = f"{os.path.splitext(page['file'])[0]}.expected.json"
+            with open(os.path.join(site_dir, page['expected']), 'w', encoding='utf-8') as f:
+                json.dump(expected, f, indent=2, ensure_ascii=False, default=str)
+
+    try:
+        if search:
+            product_urls = scraper.get_product_urls() or []
+            for url, html in seen.items():
+                save(url, html, 'search')
+            with open(os.path.join(site_dir, 'search.expected.json'), 'w', encoding='utf-8') as f:
+                json.dump(sorted(product_urls), f, indent=2, ensure_ascii=False)
+            print(f"✓ Captured {len(seen)} search pages ({len(product_urls)} product URLs)")
+
+        for url in urls:
+            seen.clear()
+            result = scraper.scrape_product(url)
+            for page_url, html in seen.items():
+                if page_url != url:
+                    save(page_url, html, 'page')
+            html = seen.get(url) or (list(seen.values())[-1] if seen else None)
+            if html:
+                save(url, html, 'product', expected=result)
+                print(f"✓ Captured {url}")
+            else:
+                print(f"✗ Nothing captured for {url}")
+    finally:
+        with open(manifest_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, ensure_ascii=False)
+        scraper.close()
+
+
+def parity_failed(result):
+    """True if a site's product output or search URLs differ from its expected results"""
+    search = result['search'] or {}
+    return bool(result['products']['parity_mismatch'] or search.get('missing_urls') or search.get('extra_urls'))
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Offline parser benchmark over saved HTML fixtures')
+    parser.add_argument('sites', nargs='*', help='Config site names (default: every site with fixtures)')
+    parser.add_argument('-n', '--iterations', type=int, default=5, help='Replays per product fixture (default: 5)')
+    parser.add_argument('--fixtures', default=FIXTURES_DIR, help='Fixture root directory')
+    parser.add_argument('--no-search', action='store_true', help='Skip get_product_urls() replay')
+    parser.add_argument('--update-expected', action='store_true', help='Save current outputs as the expected results')
+    parser.add_argument('--json', metavar='FILE', help='Also write results as JSON')
+    parser.add_argument('--capture', metavar='SITE', help='Capture fixtures for SITE from the live site (needs Chrome)')
+    parser.add_argument('--url', action='append', default=[], help='Product URL to capture (repeatable)')
+    parser.add_argument('--search', action='store_true', help='With --capture: also capture search pages')
+    parser.add_argument('--profile', type=int, nargs='?', const=25, default=0, metavar='N',
+                        help='cProfile the product replay and print the top N functions (default: 25)')
+    parser.add_argument('--verbose', action='store_true', help='Keep scraper INFO logging')
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    logger = setup_logging(args.verbose)
+
+    if args.capture:
+        capture(args.capture, args.url, args.fixtures, search=args.search)
+        return 0
+
+    sites = args.sites
+    if not sites and os.path.isdir(args.fixtures):
+        sites = sorted(name for name in os.listdir(args.fixtures)
+                       if os.path.exists(os.path.join(args.fixtures, name, 'manifest.json')))
+
+    if not sites:
+        logger.warning(f"No fixtures found in {args.fixtures} (capture some with --capture SITE --url URL)")
+        return 0
+
+    results = []
+    errors = 0
+    for site_name in sites:
+        try:
+            results.append(run_site(site_name, args.fixtures, args.iterations,
+                                    search=not args.no_search, accept=args.update_expected,
+                                    verbose=args.verbose, profile_rows=args.profile))
+        except Exception as e:
+            errors += 1
+            logger.error(f"Error benchmarking {site_name}: {str(e)}")
+
+    print_report(results)
+
+    if args.json:
+        output_dir = os.path.dirname(args.json)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'generated_at': datetime.now().isoformat(timespec='seconds'), 'results': results},
+                      f, indent=2, ensure_ascii=False)
+
+    # Non-zero exit on parity regressions (unless the new output was just accepted) and on sites that failed to run
+    if not args.update_expected and any(parity_failed(result) for result in results):
+        return 1
+    return 1 if errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
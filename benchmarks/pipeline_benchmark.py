@@ -0,0 +1,161 @@
+"""
+Data pipeline benchmark over synthetic datasets
+
+Times DataProcessor.process_products, clean_data, validate_data and
+ExcelExporter.export_to_excel / split_by_site at several dataset sizes, using
+the deterministic generator from create_sample_excel.py, so pipeline changes
+can be compared against a reproducible baseline.
+
+Usage:
+    python -m benchmarks.pipeline_benchmark                              # 1k, 5k, 20k part numbers
+    python -m benchmarks.pipeline_benchmark --scales 40000 --fitments 1 300 --json logs/pipeline_40k.json
+    python -m benchmarks.pipeline_benchmark --scales 2000 --memory       # also peak traced memory per step
+"""
+import argparse
+import json
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from create_sample_excel import EXCEL_MAX_ROWS, flatten_results, generate_products
+from utils.data_processor import DataProcessor
+from utils.excel_exporter import ExcelExporter
+
+DEFAULT_SCALES = [1000, 5000, 20000]
+STEPS = ('generate', 'process_products', 'clean_data', 'validate_data', 'export_to_excel', 'split_by_site')
+
+
+def timed_step(results, step, func, memory=False):
+    """Run func, recording seconds (and peak traced KiB) under results[step]"""
+    if memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        value = func()
+    finally:
+        results[step] = {'seconds': round(time.perf_counter() - start, 3)}
+        if memory:
+            results[step]['peak_mib'] = round(tracemalloc.get_traced_memory()[1] / (1024.0 * 1024.0), 1)
+            tracemalloc.stop()
+    return value
+
+
+def run_scale(num_parts, fitments, mean_fitments, seed, output_dir, skip_excel=False, memory=False):
+    """
+    Benchmark the pipeline at one dataset size
+
+    Returns:
+        dict: Rows, per-step timings and skipped steps
+    """
+    steps = {}
+    result = {'parts': num_parts, 'steps': steps, 'skipped': []}
+
+    products = timed_step(steps, 'generate', lambda: flatten_results(
+        generate_products(num_parts, fitments[0], fitments[1], mean_fitments, seed=seed)), memory)
+    result['products'] = len(products)
+
+    processor = DataProcessor()
+    df = timed_step(steps, 'process_products', lambda: processor.process_products(products), memory)
+    result['rows'] = len(df)
+    df = timed_step(steps, 'clean_data', lambda: processor.clean_data(df), memory)
+    timed_step(steps, 'validate_data', lambda: processor.validate_data(df), memory)
+
+    exporter = ExcelExporter()
+    scale_dir = os.path.join(output_dir, f'scale_{num_parts}')
+    os.makedirs(scale_dir, exist_ok=True)
+    if skip_excel:
+        result['skipped'].extend(['export_to_excel', 'split_by_site'])
+    elif len(df) > EXCEL_MAX_ROWS:
+        # split_by_site still runs: per-site sheets are smaller
+        result['skipped'].append('export_to_excel')
+    else:
+        output_file = os.path.join(scale_dir, 'wheels.xlsx')
+        timed_step(steps, 'export_to_excel', lambda: exporter.export_to_excel(df, output_file), memory)
+        result['excel_mib'] = round(os.path.getsize(output_file) / (1024.0 * 1024.0), 2) \
+            if os.path.exists(output_file) else None
+    if not skip_excel:
+        timed_step(steps, 'split_by_site', lambda: exporter.split_by_site(df.copy(), os.path.join(scale_dir, 'by_site')),
+                   memory)
+    return result
+
+
+def print_report(results):
+    """Print the per-scale timing table"""
+    print()
+    header = f"{'parts':>8}{'rows':>11}" + ''.join(f"{step:>18}" for step in STEPS)
+    print(header)
+    print('-' * len(header))
+    for result in results:
+        line = f"{result['parts']:>8}{result['rows']:>11}"
+        for step in STEPS:
+            if step in result['steps']:
+                cell = f"{result['steps'][step]['seconds']:.2f}s"
+                if 'peak_mib' in result['steps'][step]:
+                    cell += f" {result['steps'][step]['peak_mib']:.0f}M"
+            else:
+                cell = 'skipped'
+            line += f"{cell:>18}"
+        print(line)
+    print()
+    for result in results:
+        if result['rows'] and 'process_products' in result['steps']:
+            seconds = result['steps']['process_products']['seconds']
+            print(f"  {result['parts']:>6} parts: process_products {result['rows'] / seconds if seconds else 0:,.0f} rows/s"
+                  + (f", export {result['rows'] / result['steps']['export_to_excel']['seconds']:,.0f} rows/s"
+                     if result['steps'].get('export_to_excel', {}).get('seconds') else ''))
+    print()
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Data pipeline benchmark over synthetic datasets')
+    parser.add_argument('--scales', type=int, nargs='+', default=DEFAULT_SCALES,
+                        help=f"Part-number counts to benchmark (default: {' '.join(map(str, DEFAULT_SCALES))})")
+    parser.add_argument('--fitments', type=int, nargs=2, default=[1, 300], metavar=('MIN', 'MAX'),
+                        help='Fitments per part (default: 1 300)')
+    parser.add_argument('--mean-fitments', type=int, default=20, help='Mean fitments per part (default: 20)')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--skip-excel', action='store_true', help='Skip export_to_excel and split_by_site')
+    parser.add_argument('--memory', action='store_true', help='Also record peak traced memory per step (slower)')
+    parser.add_argument('--output-dir', default=None, help='Keep exported files here (default: temp dir, removed)')
+    parser.add_argument('--json', metavar='FILE', help='Also write results as JSON')
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+                        handlers=[logging.StreamHandler()])
+
+    output_dir = args.output_dir or tempfile.mkdtemp(prefix='pipeline_benchmark_')
+    results = []
+    try:
+        for num_parts in args.scales:
+            print(f"Benchmarking {num_parts:,} part numbers...")
+            results.append(run_scale(num_parts, args.fitments, args.mean_fitments, args.seed, output_dir,
+                                     skip_excel=args.skip_excel, memory=args.memory))
+    finally:
+        if not args.output_dir:
+            shutil.rmtree(output_dir, ignore_errors=True)
+
+    print_report(results)
+
+    if args.json:
+        json_dir = os.path.dirname(args.json)
+        if json_dir:
+            os.makedirs(json_dir, exist_ok=True)
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'generated_at': datetime.now().isoformat(timespec='seconds'),
+                       'fitments': args.fitments, 'mean_fitments': args.mean_fitments, 'seed': args.seed,
+                       'results': results}, f, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
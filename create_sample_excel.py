@@ -1,7 +1,18 @@
 # -*- coding: utf-8 -*-
-"""Create a sample Excel file with scraped products"""
+"""
+Create a sample Excel file with scraped products, or a synthetic dataset at scale
+
+Usage:
+    python create_sample_excel.py                                   # scrape 3 known products
+    python create_sample_excel.py --synthetic 1000                  # 1,000 synthetic part numbers
+    python create_sample_excel.py --synthetic 40000 --fitments 1 300 --json data/synthetic_40k.json
+"""
+import argparse
+import json
+import random
 import sys
 import os
+from datetime import datetime, timedelta
 
 # Set UTF-8 encoding for Windows console
 if sys.platform == 'win32':
@@ -9,12 +20,182 @@ if sys.platform == 'win32':
     sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'strict')
     sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer, 'strict')
 
-from scrapers.tascaparts_scraper import TascaPartsScraper
 from utils.data_processor import DataProcessor
 from utils.excel_exporter import ExcelExporter
 
-def main():
+# Excel's sheet limit is 1,048,576 rows including the header
+EXCEL_MAX_ROWS = 1048575
+
+SITE_DOMAINS = [
+    'www.tascaparts.com', 'www.acurapartswarehouse.com', 'www.moparonlineparts.com', 'www.hondapartsnow.com',
+    'parts.toyota.com', 'www.nissanpartsdeal.com', 'www.gmpartsdirect.com', 'www.fordpartsgiant.com',
+    'www.kiapartsnow.com', 'www.subarupartsdeal.com', 'www.mbpartsource.com', 'www.bmwpartsdeal.com',
+]
+
+MAKE_MODELS = {
+    'Honda': ['Accord', 'Civic', 'CR-V', 'HR-V', 'Pilot', 'Odyssey', 'Ridgeline', 'Passport'],
+    'Toyota': ['Camry', 'Corolla', 'RAV4', 'Highlander', 'Tacoma', 'Tundra', '4Runner', 'Sienna'],
+    'Nissan': ['Altima', 'Maxima', 'Rogue', 'Pathfinder', 'Frontier', 'Titan', 'Sentra', 'Murano'],
+    'Ford': ['F-150', 'Mustang', 'Explorer', 'Escape', 'Edge', 'Bronco', 'Expedition', 'Ranger'],
+    'Chevrolet': ['Silverado 1500', 'Tahoe', 'Suburban', 'Equinox', 'Malibu', 'Camaro', 'Traverse'],
+    'Kia': ['Optima', 'Sorento', 'Sportage', 'Soul', 'Telluride', 'Forte', 'K5'],
+    'Subaru': ['Outback', 'Forester', 'Crosstrek', 'Impreza', 'Legacy', 'Ascent', 'WRX'],
+    'Mercedes-Benz': ['C300', 'E350', 'GLC300', 'GLE350', 'S580', 'Sprinter 2500'],
+    'BMW': ['330i', '540i', 'X3', 'X5', 'M3', 'i4'],
+    'Mazda': ['CX-5', 'CX-9', 'CX-30', 'Mazda3', 'Mazda6', 'MX-5 Miata'],
+}
+TRIMS = ['Base', 'LX', 'EX', 'EX-L', 'Sport', 'Touring', 'Limited', 'Platinum', 'SE', 'XLE', 'Premium',
+         'Lariat', 'King Ranch', 'AMG® Line', 'M Sport', 'Grand Touring']
+ENGINES = ['1.5L L4 - Gas', '2.0L L4 - Gas', '2.5L L4 - Gas', '2.0L L4 Turbo - Gas', '3.5L V6 - Gas',
+           '5.0L V8 - Gas', '2.5L L4 - Hybrid', 'Electric', '3.0L L6 Turbo - Diesel']
+TITLE_TEMPLATES = [
+    '{size}" Aluminum Wheel, {finish}',
+    'Wheel, Alloy - {size} x {width} {finish}',
+    '{size}x{width} 5-Spoke Wheel – {finish}',
+    'Steel Wheel, {size}" (Spare)',
+    'Wheel Cap, {finish}',
+    'Center Cap – {finish} w/ Logo',
+    'Hub Cap, {size}" {finish}',
+]
+FINISHES = ['Silver', 'Machined', 'Gloss Black', 'Dark Gray', 'Chrome', 'Painted', 'Bright Silver',
+            'Hyper Black', 'Polished']
+# Unicode that shows up in real listings (dimensions, trademarks, dashes, accents, CJK notes, emoji)
+UNICODE_SNIPPETS = ['Ø 17″', '17 × 7.5', 'OEM™', 'Genuine® Part', 'Felge – Leichtmetall', 'Jante alliage',
+                    'Llanta de aleación', 'ホイール', '轮毂', 'Größe', '✓ Fits', '🚗']
+DESCRIPTION_WORDS = ('genuine oem factory original equipment replacement wheel rim alloy aluminum finish '
+                     'spoke design tpms compatible center bore lug pattern offset load rating corrosion '
+                     'resistant clear coat premium quality direct fit dealer warranty installation').split()
+
+
+def generate_products(num_parts, min_fitments=1, max_fitments=300, mean_fitments=20, description_words=(40, 400),
+                      unicode_ratio=0.2, seed=42, flattened_ratio=0.0):
+    """
+    Generate synthetic product dicts in the shape scrape_product() returns
+
+    Fitment counts follow a long-tailed distribution (most parts fit a handful of
+    vehicles, a few fit hundreds), clamped to [min_fitments, max_fitments].
+
+    Args:
+        num_parts: Number of part numbers
+        min_fitments: Minimum fitments per part
+        max_fitments: Maximum fitments per part
+        mean_fitments: Mean of the fitment count distribution
+        description_words: (min, max) words per description
+        unicode_ratio: Share of products with non-ASCII text in title/description
+        seed: Random seed (same arguments -> same dataset)
+        flattened_ratio: Share of products returned as flattened rows (one dict per fitment)
+
+    Yields:
+        dict or list: Product dict (with 'fitments'), or a list of flattened rows
+    """
+    rng = random.Random(seed)
+    base_date = datetime(2025, 1, 1)
+    makes = list(MAKE_MODELS)
+
+    for index in range(num_parts):
+        make = rng.choice(makes)
+        domain = rng.choice(SITE_DOMAINS)
+        finish = rng.choice(FINISHES)
+        title = rng.choice(TITLE_TEMPLATES).format(size=rng.choice([15, 16, 17, 18, 19, 20, 22]),
+                                                   width=rng.choice([6.5, 7, 7.5, 8, 8.5, 9]), finish=finish)
+        sku = f"{rng.randint(10000, 99999)}-{rng.choice('ABCDEFGHJK')}{rng.randint(100, 999)}-{index:05d}"
+        pn = ''.join(c for c in sku if c.isalnum())
+        msrp = round(rng.uniform(25, 1500), 2)
+
+        words = rng.choices(DESCRIPTION_WORDS, k=rng.randint(*description_words))
+        if rng.random() < unicode_ratio:
+            title = f"{title} {rng.choice(UNICODE_SNIPPETS)}"
+            for _ in range(rng.randint(1, 5)):
+                words.insert(rng.randrange(len(words) + 1), rng.choice(UNICODE_SNIPPETS))
+        description = ' '.join(words).capitalize() + '.'
+
+        count = min_fitments + int(rng.expovariate(1.0 / max(mean_fitments - min_fitments, 1)))
+        count = max(min_fitments, min(max_fitments, count))
+        models = MAKE_MODELS[make]
+        fitments = []
+        for _ in range(count):
+            fitments.append({
+                'year': str(rng.randint(1998, 2026)),
+                'make': make,
+                'model': rng.choice(models),
+                'trim': ', '.join(rng.sample(TRIMS, rng.randint(1, 3))),
+                'engine': ', '.join(rng.sample(ENGINES, rng.randint(1, 2))),
+            })
+
+        product = {
+            'url': f"https://{domain}/oem-parts/{make.lower().replace(' ', '-')}-wheel-{pn.lower()}",
+            'image_url': f"https://{domain}/resources/images/{pn.lower()}.jpg",
+            'date': (base_date + timedelta(minutes=index)).strftime('%Y-%m-%d %H:%M:%S'),
+            'sku': sku,
+            'pn': pn,
+            'actual_price': f"{msrp * rng.uniform(0.6, 0.95):.2f}",
+            'msrp': f"{msrp:.2f}",
+            'title': title,
+            'also_known_as': f"{finish} Wheel; Rim" if rng.random() < 0.5 else '',
+            'positions': rng.choice(['', 'Front', 'Rear', 'Front, Rear', 'Spare']),
+            'description': description,
+            'applications': f"{make} {rng.choice(models)}" if rng.random() < 0.3 else '',
+            'replaces': f"{rng.randint(10000, 99999)}-{rng.choice('ABCDEFGHJK')}{rng.randint(100, 999)}"
+                        if rng.random() < 0.25 else '',
+            'fitments': fitments,
+        }
+
+        if flattened_ratio and rng.random() < flattened_ratio:
+            base = {key: value for key, value in product.items() if key != 'fitments'}
+            yield [dict(base, **fitment) for fitment in fitments]
+        else:
+            yield product
+
+
+def flatten_results(results):
+    """Flatten generate_products() output (dicts and lists of rows) into a products list"""
+    products = []
+    for result in results:
+        if isinstance(result, list):
+            products.extend(result)
+        else:
+            products.append(result)
+    return products
+
+
+def create_synthetic(num_parts, min_fitments, max_fitments, mean_fitments, seed, json_file=None, excel=True):
+    """Generate a synthetic dataset and export it (Excel and/or JSON)"""
+    print("\n" + "="*70)
+    print(f"CREATING SYNTHETIC DATASET ({num_parts:,} part numbers)")
+    print("="*70)
+
+    products = flatten_results(generate_products(num_parts, min_fitments, max_fitments, mean_fitments, seed=seed))
+    fitment_rows = sum(len(product.get('fitments', [])) or 1 for product in products)
+    print(f"\n✓ Generated {len(products):,} products ({fitment_rows:,} fitment rows)")
+
+    if json_file:
+        output_dir = os.path.dirname(json_file)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+        with open(json_file, 'w', encoding='utf-8') as f:
+            json.dump(products, f, ensure_ascii=False)
+        print(f"✓ Products JSON: {json_file}")
+
+    if not excel:
+        return
+    if fitment_rows > EXCEL_MAX_ROWS:
+        print(f"✗ {fitment_rows:,} rows exceed Excel's sheet limit ({EXCEL_MAX_ROWS:,}); skipping Excel export "
+              f"(lower --synthetic or --fitments, or use --json)")
+        return
+
+    processor = DataProcessor()
+    df = processor.process_products(products)
+    os.makedirs('data/processed', exist_ok=True)
+    output_file = f"data/processed/synthetic_wheels_{num_parts}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
+    print(f"\nExporting to: {output_file}")
+    ExcelExporter().export_to_excel(df, output_file)
+    print(f"\n✓ SYNTHETIC EXCEL CREATED: {output_file} ({len(df):,} rows)\n")
+
+
+def create_sample():
     """Scrape a few known good products and create Excel"""
+    from scrapers.tascaparts_scraper import TascaPartsScraper
+    
     print("\n" + "="*70)
     print("CREATING SAMPLE EXCEL FILE")
     print("="*70)
@@ -64,7 +245,6 @@ def main():
     os.makedirs('data/processed', exist_ok=True)
     
     # Export to Excel
-    from datetime import datetime
     output_file = f"data/processed/sample_wheels_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
     
     print(f"\nExporting to: {output_file}")
@@ -78,6 +258,28 @@ def main():
     print(f"✓ Total rows: {len(df)}")
     print(f"{'='*70}\n")
 
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Create a sample Excel file (scraped or synthetic)')
+    parser.add_argument('--synthetic', type=int, metavar='PARTS', help='Generate PARTS synthetic part numbers')
+    parser.add_argument('--fitments', type=int, nargs=2, default=[1, 300], metavar=('MIN', 'MAX'),
+                        help='Fitments per part (default: 1 300)')
+    parser.add_argument('--mean-fitments', type=int, default=20, help='Mean fitments per part (default: 20)')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--json', metavar='FILE', help='Also write the synthetic products as JSON')
+    parser.add_argument('--no-excel', action='store_true', help='Skip the Excel export (with --synthetic)')
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    if args.synthetic:
+        create_synthetic(args.synthetic, args.fitments[0], args.fitments[1], args.mean_fitments, args.seed,
+                         json_file=args.json, excel=not args.no_excel)
+    else:
+        create_sample()
+
+
 if __name__ == "__main__":
     main()
 
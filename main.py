@@ -1,19 +1,30 @@
 """Main execution script for automotive wheels scraping project"""
+import argparse
 import os
-import json
 import logging
+from contextlib import nullcontext
 from datetime import datetime
 from tqdm import tqdm
-import time
 
-# Import scrapers
-from scrapers.tascaparts_scraper import TascaPartsScraper
-from scrapers.acurapartswarehouse_scraper import AcuraPartsWarehouseScraper
-from scrapers.generic_scraper import GenericScraper
+# Scrapers are imported on demand by the registry (config/sites_config.json "scraper" field)
+from scrapers.registry import create_scraper, load_site_configs
+from scrapers.clock import get_clock
+from scrapers.recycle_policy import DriverRecyclePolicy
+from scrapers.resource_blocking import ResourceBlocker, resolve_patterns
+from scrapers.trace_recorder import TraceRecorder
 
 # Import utilities
 from utils.data_processor import DataProcessor
 from utils.excel_exporter import ExcelExporter
+from utils.columnar_exporter import ColumnarExporter
+from utils.result_store import ResultStore
+from utils.scrape_journal import ScrapeJournal
+from utils.stats_aggregator import StatsAggregator
+from utils.metrics_server import ScrapeMetrics, MetricsServer
+from utils.memory_watchdog import MemoryWatchdog
+
+
+LIVE_STATS_FILE = 'logs/live_stats.json'
 
 
 def setup_logging():
@@ -31,41 +42,9 @@ def setup_logging():
     return logging.getLogger('main')
 
 
-def load_site_configs():
-    """Load site configurations from JSON file"""
-    try:
-        with open('config/sites_config.json', 'r') as f:
-            config = json.load(f)
-            return config.get('sites', [])
-    except Exception as e:
-        logging.error(f"Error loading site configs: {str(e)}")
-        return []
-
-
-def create_scraper(site_config):
-    """
-    Create appropriate scraper for the site
-    
-    Args:
-        site_config: Site configuration dictionary
-    
-    Returns:
-        Scraper instance
-    """
-    site_name = site_config.get('name', '')
-    
-    # Use specific scrapers if available
-    if site_name == 'tascaparts':
-        return TascaPartsScraper()
-    # Add more specific scrapers here as implemented
-    elif site_name == 'acuraparts':
-        return AcuraPartsWarehouseScraper()
-    else:
-        # Use generic scraper for most sites
-        return GenericScraper(site_config)
-
-
-def scrape_site(site_config, logger, delay_between_products=3):
+def scrape_site(site_config, logger, delay_between_products=3, store=None, journal=None, skip_urls=None,
+                live_stats=None, metrics=None, scraper=None, clock=None, memory=None, tracer=None,
+                browser_pool=0, recycle_defaults=None, resource_blocking=None, tab_depth=0):
     """
     Scrape a single site
     
@@ -73,43 +52,87 @@ def scrape_site(site_config, logger, delay_between_products=3):
         site_config: Site configuration dictionary
         logger: Logger instance
         delay_between_products: Delay in seconds between scraping products
+        store: Optional ResultStore - each product is upserted as soon as it is scraped
+        journal: Optional ScrapeJournal - each product is journaled as soon as it is scraped
+        skip_urls: Optional set of URLs already done in a previous (resumed) run
+        live_stats: Optional StatsAggregator updated as products are scraped (partial report)
+        metrics: Optional ScrapeMetrics exported on the live metrics endpoint
+        scraper: Optional pre-built scraper to use instead of create_scraper() (e.g. for load tests)
+        clock: Optional clock for the scraper and the delay between products (default: process-wide clock)
+        memory: Optional MemoryWatchdog checked after every product (snapshots every N products)
+        tracer: Optional TraceRecorder receiving the scraper's phase spans (the caller writes it)
+        browser_pool: Spare drivers kept warm for fast driver recycling (0 = cold restarts)
+        recycle_defaults: Optional driver recycle settings for sites without a "driver_recycle" block
+        resource_blocking: Optional blocking profile replacing the site's "resource_blocking" setting ('none' = off)
+        tab_depth: Background tabs preloading the next product pages (0 = off; a site's "tab_depth" takes precedence)
     
     Returns:
         list: List of product data dictionaries
     """
     site_name = site_config.get('name', 'unknown')
     products = []
+    clock = clock or get_clock()
+    clock_start = clock.snapshot() if hasattr(clock, 'snapshot') else None
     
     logger.info(f"\n{'='*70}")
     logger.info(f"Starting scrape of {site_name}")
     logger.info(f"{'='*70}")
     
-    scraper = None
-    
     try:
         # Create scraper
-        scraper = create_scraper(site_config)
+        if scraper is None:
+            scraper = create_scraper(site_config, clock=clock)
         logger.info(f"Scraper initialized for {site_name}")
+        if metrics:
+            metrics.register_scraper(site_name, scraper)
+        if memory:
+            memory.begin_site(site_name)
+        if tracer:
+            scraper.phase_timer.tracer = tracer
+        if browser_pool and scraper.use_selenium:
+            scraper.enable_browser_pool(browser_pool)
+        if scraper.use_selenium:
+            recycle_policy = DriverRecyclePolicy.from_config(site_config, recycle_defaults)
+            if recycle_policy.enabled:
+                scraper.recycle_policy = recycle_policy
+            scraper.resource_blocker = ResourceBlocker.from_config(site_config, resource_blocking)
+            # Product page loads are paced per host instead of by the sleep between products
+            tab_depth = site_config.get('tab_depth', tab_depth)
+            if tab_depth:
+                scraper.enable_tab_pipeline(tab_depth, host_interval=delay_between_products)
         
         # Get product URLs
         logger.info("Fetching product URLs...")
-        product_urls = scraper.get_product_urls()
+        with tracer.span('get_product_urls', cat='search', site=site_name) if tracer else nullcontext():
+            product_urls = scraper.get_product_urls()
         logger.info(f"Found {len(product_urls)} product URLs")
         
         if not product_urls:
             logger.warning(f"No product URLs found for {site_name}")
             return products
         
+        # Skip URLs already completed before the previous run stopped
+        if skip_urls:
+            remaining_urls = [url for url in product_urls if url not in skip_urls]
+            logger.info(f"Resuming: skipping {len(product_urls) - len(remaining_urls)} already scraped URLs")
+            product_urls = remaining_urls
+        
         # Limit for testing (remove in production)
         # Uncomment the line below to test with fewer products
         # product_urls = product_urls[:5]  # Test with first 5 products
         
         # Scrape each product
         logger.info(f"Scraping {len(product_urls)} products...")
+        if metrics:
+            metrics.set_queue_depth(site_name, len(product_urls))
+        if scraper.tab_pipeline is not None:
+            scraper.tab_pipeline.extend(product_urls)
         
         for idx, url in enumerate(tqdm(product_urls, desc=f"Scraping {site_name}"), 1):
             try:
                 product_data = scraper.scrape_product(url)
+                if metrics:
+                    metrics.record_product(site_name, product_data)
                 
                 if product_data:
                     if isinstance(product_data, list):
@@ -118,46 +141,118 @@ def scrape_site(site_config, logger, delay_between_products=3):
                     else:
                         products.append(product_data)
                         title = product_data.get('title', 'Unknown')
+                    with tracer.span('store_product', cat='export') if tracer else nullcontext():
+                        if store:
+                            store.upsert_product(site_name, product_data)
+                            store.mark_url(site_name, url, 'done')
+                        if journal:
+                            journal.record_product(site_name, url, product_data, 'done')
+                    if live_stats:
+                        live_stats.add_products(product_data if isinstance(product_data, list) else [product_data])
                     logger.info(f"[{idx}/{len(product_urls)}] ✓ {title[:50]}")
                 else:
+                    if store:
+                        store.mark_url(site_name, url, 'skipped')
+                    if journal:
+                        journal.record_product(site_name, url, None, 'skipped')
                     logger.info(f"[{idx}/{len(product_urls)}] ✗ Skipped (not a wheel or error)")
                 
+                if live_stats and idx % 25 == 0:
+                    live_stats.write_report(LIVE_STATS_FILE)
+                if memory:
+                    memory.check(site_name, scraper, idx)
+                
                 # Delay between requests to be polite
                 if idx < len(product_urls):
-                    time.sleep(delay_between_products)
+                    # Proactive driver replacement only happens between products
+                    if scraper.recycle_policy is not None:
+                        scraper.maybe_recycle_driver()
+                    if scraper.tab_pipeline is None:
+                        with tracer.span('between_products', cat='sleep') if tracer else nullcontext():
+                            clock.sleep(delay_between_products, reason='between_products')
+                    else:
+                        scraper.refill_tab_pipeline()
                 
             except Exception as e:
                 logger.error(f"Error scraping {url}: {str(e)}")
+                if store:
+                    store.mark_url(site_name, url, 'error')
+                if journal:
+                    journal.record_product(site_name, url, None, 'error')
+                if metrics:
+                    metrics.record_error(site_name)
                 continue
         
         logger.info(f"✓ Completed {site_name}: {len(products)} wheel products scraped")
+        if scraper.recycle_policy is not None and scraper.recycle_policy.recycles:
+            logger.info(f"Driver recycled {scraper.recycle_policy.recycles} times: "
+                        f"{'; '.join(scraper.recycle_policy.reasons[-5:])}")
+        if journal:
+            journal.record_site_done(site_name)
         
     except Exception as e:
         logger.error(f"Error scraping site {site_name}: {str(e)}")
     
     finally:
+        if store:
+            store.commit()
+        if journal:
+            journal.sync()
+        if live_stats:
+            live_stats.write_report(LIVE_STATS_FILE)
+        if clock_start is not None:
+            clock.log_report(logger, label=site_name, since=clock_start)
+        if memory:
+            memory.end_site(site_name, scraper, len(products))
         if scraper:
             scraper.close()
     
     return products
 
 
-def save_checkpoint(products, filename):
-    """Save checkpoint of scraped data"""
-    try:
-        os.makedirs('data/checkpoints', exist_ok=True)
-        checkpoint_file = f'data/checkpoints/{filename}'
-        
-        with open(checkpoint_file, 'w', encoding='utf-8') as f:
-            json.dump(products, f, indent=2, ensure_ascii=False)
-        
-        logging.info(f"Checkpoint saved: {checkpoint_file}")
-    except Exception as e:
-        logging.error(f"Error saving checkpoint: {str(e)}")
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description='Scrape automotive wheel products from all configured sites')
+    parser.add_argument('--resume', action='store_true',
+                        help='Replay the scrape journal and continue from where the previous run stopped')
+    parser.add_argument('--journal', default='data/journal/scrape_journal.jsonl',
+                        help='Journal path (use a .jsonl.gz suffix for a compressed journal)')
+    parser.add_argument('--dedupe', action='store_true',
+                        help='Merge part numbers found on several sites into one product '
+                             '(adds source_sites/source_urls columns)')
+    parser.add_argument('--merge-price', choices=['cheapest', 'first', 'latest'], default='cheapest',
+                        help='With --dedupe: which record to keep when a part number is found on several sites')
+    parser.add_argument('--metrics-port', type=int, default=None,
+                        help='Serve live Prometheus metrics on http://127.0.0.1:<port>/metrics')
+    parser.add_argument('--memory-profile', type=int, default=None, metavar='N',
+                        help='Snapshot memory (tracemalloc, process and Chrome RSS) every N products')
+    parser.add_argument('--memory-growth-limit', type=float, default=None, metavar='MB',
+                        help='With --memory-profile: warn when Python memory grows by more than MB per site')
+    parser.add_argument('--chrome-rss-limit', type=float, default=None, metavar='MB',
+                        help='With --memory-profile: warn when Chrome RSS exceeds MB')
+    parser.add_argument('--recycle-on-memory', action='store_true',
+                        help='With --chrome-rss-limit: restart the driver when Chrome RSS exceeds the limit')
+    parser.add_argument('--trace', action='store_true',
+                        help='Write a Chrome trace-event timeline per site (and for the export) under logs/')
+    parser.add_argument('--browser-pool', type=int, default=0, metavar='N',
+                        help='Keep N spare browsers warm so a failed or recycled driver is swapped instantly')
+    parser.add_argument('--recycle-pages', type=int, default=None, metavar='N',
+                        help='Replace the driver after N page loads (sites without a driver_recycle config)')
+    parser.add_argument('--recycle-renderer-mb', type=float, default=None, metavar='MB',
+                        help='Replace the driver when Chrome renderer RSS exceeds MB (Linux)')
+    parser.add_argument('--recycle-latency-pct', type=float, default=None, metavar='PCT',
+                        help='Replace the driver when moving-average page load time degrades by PCT%%')
+    parser.add_argument('--tab-depth', type=int, default=0, metavar='N',
+                        help='Preload the next N product pages in background tabs of the same browser '
+                             '(page loads are then paced per host instead of sleeping between products)')
+    parser.add_argument('--resource-blocking', default=None, metavar='PROFILE',
+                        help="Resource blocking profile for every site, overriding sites_config.json ('none' = off)")
+    return parser.parse_args()
 
 
 def main():
     """Main execution function"""
+    args = parse_args()
     
     # Setup
     logger = setup_logging()
@@ -179,6 +274,48 @@ def main():
         logger.error("No site configurations found. Exiting.")
         return
     
+    if args.resource_blocking:
+        try:
+            resolve_patterns(args.resource_blocking)
+        except ValueError as e:
+            logger.error(f"{str(e)}. Exiting.")
+            return
+    
+    # Result store - products are upserted as they are scraped (replaces JSON checkpoints)
+    store = ResultStore('data/results.db')
+    logger.info(f"Result store: {store.db_path}")
+    
+    # Append-only journal - written after every product so a crash loses (almost) nothing
+    journal = ScrapeJournal(args.journal)
+    resume_state = {}
+    if args.resume:
+        logger.info(f"Resuming from journal: {journal.path}")
+        resume_state = journal.replay()
+    else:
+        journal.archive()
+    
+    # Live metrics endpoint (optional)
+    metrics = ScrapeMetrics()
+    metrics_server = None
+    if args.metrics_port:
+        metrics_server = MetricsServer(metrics, args.metrics_port)
+        metrics_server.start()
+    
+    # Live partial report - updated as products are scraped
+    live_stats = StatsAggregator()
+    logger.info(f"Live statistics report: {LIVE_STATS_FILE}")
+    
+    # Memory profiling / leak watchdog (optional)
+    memory = None
+    if args.memory_profile:
+        memory = MemoryWatchdog(snapshot_every=args.memory_profile, growth_limit_mb=args.memory_growth_limit,
+                                chrome_rss_limit_mb=args.chrome_rss_limit, recycle=args.recycle_on_memory)
+        memory.start()
+    
+    # Proactive driver recycling defaults (a site's "driver_recycle" config takes precedence)
+    recycle_defaults = {'max_pages': args.recycle_pages, 'renderer_rss_mb': args.recycle_renderer_mb,
+                        'latency_degradation_pct': args.recycle_latency_pct}
+    
     # Scrape all sites
     all_products = []
     successful_sites = 0
@@ -190,15 +327,31 @@ def main():
         logger.info(f"\n[{idx}/{len(site_configs)}] Processing {site_name}...")
         
         try:
-            products = scrape_site(site_config, logger, delay_between_products=2)
+            site_state = resume_state.get(site_name)
+            if site_state and site_state['completed']:
+                logger.info(f"Resuming: {site_name} already completed ({len(site_state['products'])} products from journal)")
+                products = site_state['products']
+                live_stats.add_products(products)
+            else:
+                tracer = TraceRecorder(site_name) if args.trace else None
+                products = scrape_site(
+                    site_config, logger, delay_between_products=2, store=store, journal=journal,
+                    skip_urls=site_state['done_urls'] if site_state else None, live_stats=live_stats,
+                    metrics=metrics, memory=memory, tracer=tracer, browser_pool=args.browser_pool,
+                    recycle_defaults=recycle_defaults, resource_blocking=args.resource_blocking,
+                    tab_depth=args.tab_depth
+                )
+                if tracer:
+                    trace_file = tracer.dump(f'logs/trace_{site_name}_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json')
+                    logger.info(f"Trace saved: {trace_file}")
+                if site_state:
+                    live_stats.add_products(site_state['products'])
+                    products = site_state['products'] + products
             
             if products:
                 all_products.extend(products)
                 successful_sites += 1
-                
-                # Save checkpoint after each site
-                checkpoint_name = f'{site_name}_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json'
-                save_checkpoint(products, checkpoint_name)
+                logger.info(f"Stored {store.count_products(site_name)} products for {site_name} in {store.db_path}")
             else:
                 failed_sites.append(site_name)
             
@@ -217,25 +370,47 @@ def main():
     if failed_sites:
         logger.warning(f"Failed sites: {', '.join(failed_sites)}")
     
+    store.close()
+    journal.close()
+    if metrics_server:
+        metrics_server.stop()
+    if memory:
+        memory.log_summary(logger)
+        memory.stop()
+    
     if not all_products:
         logger.error("No products scraped. Exiting.")
         return
     
     # Process data
+    # Validation and summary statistics are aggregated while rows are built (no extra DataFrame passes)
     processor = DataProcessor()
+    aggregator = StatsAggregator()
+    export_tracer = TraceRecorder('export') if args.trace else None
+    
+    def traced(name):
+        return export_tracer.span(name, cat='export') if export_tracer else nullcontext()
+    
     logger.info("\nProcessing scraped data...")
-    df = processor.process_products(all_products)
+    with traced('process_products'):
+        df = processor.process_products(
+            all_products,
+            deduplicate=args.dedupe,
+            merge_policy={'price': args.merge_price, 'fitments': 'union'},
+            aggregator=aggregator
+        )
     
     # Clean data
-    df = processor.clean_data(df)
+    with traced('clean_data'):
+        df = processor.clean_data(df)
     
     # Validate data
     logger.info("\nValidating data...")
-    validation_report = processor.validate_data(df)
+    aggregator.log_report(logger)
     
     # Get summary statistics
     logger.info("\nGenerating summary statistics...")
-    stats = processor.get_summary_statistics(df)
+    stats = aggregator.get_summary_statistics()
     
     logger.info("\nSummary Statistics:")
     logger.info(f"  Total rows: {stats['total_rows']}")
@@ -255,11 +430,27 @@ def main():
     output_file = f"data/processed/wheels_data_{timestamp}.xlsx"
     
     logger.info(f"\nExporting to Excel: {output_file}")
-    exporter.export_to_excel(df, output_file, apply_formatting=True)
+    with traced('export_to_excel'):
+        exporter.export_to_excel(df, output_file, apply_formatting=True)
     
     # Export summary
     summary_file = f"data/processed/summary_{timestamp}.xlsx"
-    exporter.export_summary(stats, summary_file)
+    with traced('export_summary'):
+        exporter.export_summary(stats, summary_file)
+    
+    # Export columnar copies (gzip CSV + Parquet partitioned by site/make) for analytics jobs
+    columnar_exporter = ColumnarExporter()
+    logger.info("\nExporting columnar copies (CSV.gz / Parquet)...")
+    try:
+        with traced('columnar_export'):
+            columnar_outputs = columnar_exporter.export_all(df, f"data/processed/wheels_data_{timestamp}")
+        for kind, path in columnar_outputs.items():
+            logger.info(f"  {kind}: {path}")
+    except Exception as e:
+        logger.error(f"Columnar export failed: {str(e)}")
+    
+    if export_tracer:
+        logger.info(f"Trace saved: {export_tracer.dump(f'logs/trace_export_{timestamp}.json')}")
     
     # Optionally split by site
     # split_dir = f"data/processed/by_site_{timestamp}"
@@ -272,9 +463,12 @@ def main():
     logger.info(f"{'='*70}")
     logger.info(f"✓ Total products scraped: {len(all_products)}")
     logger.info(f"✓ Total rows in Excel: {len(df)}")
-    logger.info(f"✓ Unique part numbers: {df['PN'].nunique()}")  # Using Excel header 'PN'
+    logger.info(f"✓ Unique part numbers: {stats['unique_parts']}")
     logger.info(f"✓ Output file: {output_file}")
     logger.info(f"✓ File size: {os.path.getsize(output_file) / (1024*1024):.2f} MB")
+    clock = get_clock()
+    if hasattr(clock, 'log_report'):
+        clock.log_report(logger, label='✓ Total run')
     logger.info(f"{'='*70}")
 
 
@@ -1,37 +1,16 @@
 """Run scraper for a single site (for testing)"""
 import sys
-import json
 import logging
 import atexit
 import gc
 from datetime import datetime
 
-from scrapers.acurapartswarehouse_scraper import AcuraPartsWarehouseScraper
-from scrapers.audiusa_scraper import AudiUSAScraper
-from scrapers.bmw_scraper import BMWScraper
-from scrapers.gm_oemparts_scraper import GMOemPartsScraper
-from scrapers.ford_scraper import FordScraper
-from scrapers.honda_scraper import HondaScraper
-from scrapers.hyundai_scraper import HyundaiScraper
-from scrapers.infiniti_scraper import InfinitiScraper
-from scrapers.jaguar_scraper import JaguarScraper
-from scrapers.kia_scraper import KiaScraper
-from scrapers.landrover_scraper import LandRoverScraper
-from scrapers.lexus_scraper import LexusScraper
-from scrapers.mazda_scraper import MazdaScraper
-from scrapers.mbpartsource_scraper import MercedesScraper
-from scrapers.mitsubishi_scraper import MitsubishiScraper
-from scrapers.moparonlineparts_scraper import MoparOnlinePartsScraper
-from scrapers.nissan_scraper import NissanScraper
-from scrapers.porsche_scraper import PorscheScraper
-from scrapers.scuderiacarparts_scraper import ScuderiaCarPartsScraper
-from scrapers.subaru_scraper import SubaruScraper
-from scrapers.toyota_scraper import ToyotaScraper
-from scrapers.volkswagen_scraper import VolkswagenScraper
-from scrapers.volvo_scraper import VolvoScraper
-from scrapers.generic_scraper import GenericScraper
+from scrapers.registry import create_scraper, get_site_config, registered_sites
 from utils.data_processor import DataProcessor
 from utils.excel_exporter import ExcelExporter
+from utils.stats_aggregator import StatsAggregator
+from utils.metrics_server import ScrapeMetrics, MetricsServer
+from scrapers.trace_recorder import TraceRecorder
 
 # Global scraper reference for cleanup
 _global_scraper = None
@@ -65,109 +44,36 @@ def setup_logging():
 
 def load_site_config(site_name):
     """Load configuration for a specific site"""
-    try:
-        with open('config/sites_config.json', 'r') as f:
-            config = json.load(f)
-            sites = config.get('sites', [])
-            
-            for site in sites:
-                if site.get('name') == site_name:
-                    return site
-            
-            return None
-    except Exception as e:
-        print(f"Error loading config: {str(e)}")
-        return None
-
-
-def create_scraper(site_config):
-    """Create scraper for the site"""
-    site_name = site_config.get('name', '')
-    
-    if site_name == 'tascaparts':
-        return TascaPartsScraper()  # pyright: ignore[reportUndefinedVariable]
-    elif site_name == 'acuraparts':
-        return AcuraPartsWarehouseScraper()
-    elif site_name == 'moparonline':
-        return MoparOnlinePartsScraper()
-    elif site_name == 'scuderiacarparts':
-        return ScuderiaCarPartsScraper()
-    elif site_name == 'audiusa':
-        return AudiUSAScraper()
-    elif site_name == 'bmw':
-        return BMWScraper()
-    elif site_name == 'gm_oemparts':
-        return GMOemPartsScraper()
-    elif site_name == 'ford':
-        return FordScraper()
-    elif site_name == 'honda':
-        return HondaScraper()
-    elif site_name == 'hyundai':
-        return HyundaiScraper()
-    elif site_name == 'infiniti':
-        return InfinitiScraper()
-    elif site_name == 'jaguar':
-        return JaguarScraper()
-    elif site_name == 'kia':
-        return KiaScraper()
-    elif site_name == 'landrover':
-        return LandRoverScraper()
-    elif site_name == 'lexus':
-        return LexusScraper()
-    elif site_name == 'mazda':
-        return MazdaScraper()
-    elif site_name == 'mercedes':
-        return MercedesScraper()
-    elif site_name == 'mitsubishi':
-        return MitsubishiScraper()
-    elif site_name == 'nissan':
-        return NissanScraper()
-    elif site_name == 'porsche':
-        return PorscheScraper()
-    elif site_name == 'subaru':
-        return SubaruScraper()
-    elif site_name == 'toyota':
-        return ToyotaScraper()
-    elif site_name == 'volkswagen':
-        return VolkswagenScraper()
-    elif site_name == 'volvo':
-        return VolvoScraper()
-    else:
-        return GenericScraper(site_config)
+    return get_site_config(site_name)
 
 
 def main():
     logger = setup_logging()
     
+    # Optional live metrics endpoint: --metrics-port <port>
+    metrics = ScrapeMetrics()
+    metrics_server = None
+    if '--metrics-port' in sys.argv:
+        flag_idx = sys.argv.index('--metrics-port')
+        try:
+            metrics_server = MetricsServer(metrics, int(sys.argv[flag_idx + 1]))
+            metrics_server.start()
+        except (IndexError, ValueError):
+            logger.warning("--metrics-port requires a port number")
+        del sys.argv[flag_idx:flag_idx + 2]
+    
+    # Optional Chrome trace-event timeline: --trace (written to logs/trace_<site>_<timestamp>.json)
+    tracer = None
+    if '--trace' in sys.argv:
+        sys.argv.remove('--trace')
+        tracer = TraceRecorder('single_site')
+    
     # Get site name from command line
     if len(sys.argv) < 2:
-        print("\nUsage: python run_single_site.py <site_name>")
+        print("\nUsage: python run_single_site.py <site_name> [limit] [--metrics-port PORT] [--trace]")
         print("\nAvailable sites:")
-        print("  - tascaparts")
-        print("  - acuraparts")
-        print("  - moparonline")
-        print("  - scuderiacarparts")
-        print("  - audiusa")
-        print("  - bmw")
-        print("  - gm_oemparts")
-        print("  - ford")
-        print("  - honda")
-        print("  - hyundai")
-        print("  - infiniti")
-        print("  - jaguar")
-        print("  - kia")
-        print("  - landrover")
-        print("  - lexus")
-        print("  - mazda")
-        print("  - mercedes")
-        print("  - mitsubishi")
-        print("  - nissan")
-        print("  - porsche")
-        print("  - subaru")
-        print("  - toyota")
-        print("  - volkswagen")
-        print("  - volvo")
-        print("  - etc. (see config/sites_config.json)")
+        for name in registered_sites():
+            print(f"  - {name}")
         print("\nExample:")
         print("  python run_single_site.py tascaparts")
         print("  python run_single_site.py acuraparts")
@@ -211,6 +117,10 @@ def main():
         # Register for cleanup on exit
         global _global_scraper
         _global_scraper = scraper
+        metrics.register_scraper(site_name, scraper)
+        if tracer:
+            tracer.name = site_name
+            scraper.phase_timer.tracer = tracer
         logger.info("Scraper initialized")
         
         # Get product URLs
@@ -229,13 +139,14 @@ def main():
         
         # Scrape products
         logger.info(f"Scraping {len(product_urls)} products...")
+        metrics.set_queue_depth(site_name, len(product_urls))
         
         from tqdm import tqdm
-        import time
         
         for idx, url in enumerate(tqdm(product_urls, desc=f"Scraping {site_name}"), start=1):
             try:
                 product_data = scraper.scrape_product(url)
+                metrics.record_product(site_name, product_data)
                 
                 if product_data:
                     if isinstance(product_data, list):
@@ -252,23 +163,27 @@ def main():
                 if idx < len(product_urls):
                     import random
                     delay = random.uniform(3, 5)  # Increased to 3-5 seconds for more human-like behavior
-                    time.sleep(delay)
+                    scraper.clock.sleep(delay, reason='between_products')
                 
             except Exception as e:
                 logger.error(f"Error scraping {url}: {str(e)}")
+                metrics.record_error(site_name)
                 continue
         
         logger.info(f"✓ Scraped {len(products)} wheel products from {site_name}")
+        if hasattr(scraper.clock, 'log_report'):
+            scraper.clock.log_report(logger, label=site_name)
         
         # Process and export
         if products:
             logger.info("\nProcessing data...")
             processor = DataProcessor()
-            df = processor.process_products(products)
+            aggregator = StatsAggregator()
+            df = processor.process_products(products, aggregator=aggregator)
             df = processor.clean_data(df)
             
             # Validate
-            validation = processor.validate_data(df)
+            validation = aggregator.get_validation_report()
             logger.info(f"\nValidation:")
             logger.info(f"  Total rows: {validation['total_rows']}")
             logger.info(f"  Unique parts: {validation['unique_parts']}")
@@ -279,7 +194,11 @@ def main():
             
             logger.info(f"\nExporting to: {output_file}")
             exporter = ExcelExporter()
-            exporter.export_to_excel(df, output_file, apply_formatting=True)
+            if tracer:
+                with tracer.span('export_to_excel', cat='export'):
+                    exporter.export_to_excel(df, output_file, apply_formatting=True)
+            else:
+                exporter.export_to_excel(df, output_file, apply_formatting=True)
             
             logger.info("\n" + "="*70)
             logger.info("COMPLETE!")
@@ -298,6 +217,11 @@ def main():
     finally:
         if scraper:
             scraper.close()
+        if metrics_server:
+            metrics_server.stop()
+        if tracer:
+            trace_file = tracer.dump(f'logs/trace_{site_name}_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json')
+            logger.info(f"Trace saved: {trace_file} (open in chrome://tracing or ui.perfetto.dev)")
 
 
 if __name__ == "__main__":
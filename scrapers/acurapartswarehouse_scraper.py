@@ -1,12 +1,9 @@
 """Scraper for acurapartswarehouse.com (Acura parts)"""
 from scrapers.base_scraper import BaseScraper
-from bs4 import BeautifulSoup
 import json
 import re
 from datetime import datetime
-import time
 import traceback
-import random
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -16,8 +13,8 @@ from selenium.webdriver.common.action_chains import ActionChains
 class AcuraPartsWarehouseScraper(BaseScraper):
     """Scraper for acurapartswarehouse.com"""
     
-    def __init__(self):
-        super().__init__('acurapartswarehouse', use_selenium=True)
+    def __init__(self, clock=None):
+        super().__init__('acurapartswarehouse', use_selenium=True, clock=clock)
         self.base_url = 'https://www.acurapartswarehouse.com'
         
     def get_product_urls(self):
@@ -115,7 +112,6 @@ class AcuraPartsWarehouseScraper(BaseScraper):
             
         except Exception as e:
             self.logger.error(f"Error getting product URLs: {str(e)}")
-            import traceback
             self.logger.debug(f"Traceback: {traceback.format_exc()}")
         
         return product_urls
@@ -195,7 +191,7 @@ class AcuraPartsWarehouseScraper(BaseScraper):
                     if not html:
                         continue
                     
-                    soup = BeautifulSoup(html, 'lxml')
+                    soup = self.make_soup(html, 'lxml')
                     
                     # Scroll to load all products on the first page (if lazy loading)
                     try:
@@ -203,7 +199,7 @@ class AcuraPartsWarehouseScraper(BaseScraper):
                         scroll_attempts = 0
                         while scroll_attempts < 30:
                             self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                            time.sleep(1)
+                            self.clock.sleep(1)
                             new_height = self.driver.execute_script("return document.body.scrollHeight")
                             if new_height == last_height:
                                 break
@@ -211,8 +207,8 @@ class AcuraPartsWarehouseScraper(BaseScraper):
                             scroll_attempts += 1
                         
                         # Get updated HTML after scrolling
-                        html = self.driver.page_source
-                        soup = BeautifulSoup(html, 'lxml')
+                        html = self.get_page_source()
+                        soup = self.make_soup(html, 'lxml')
                     except:
                         pass
                     
@@ -339,7 +335,7 @@ class AcuraPartsWarehouseScraper(BaseScraper):
                                     if not pag_html or len(pag_html) < 5000:
                                         continue
                                     
-                                    pag_soup = BeautifulSoup(pag_html, 'lxml')
+                                    pag_soup = self.make_soup(pag_html, 'lxml')
                                     
                                     # Scroll to load all products on this page (if lazy loading)
                                     try:
@@ -347,7 +343,7 @@ class AcuraPartsWarehouseScraper(BaseScraper):
                                         scroll_attempts = 0
                                         while scroll_attempts < 20:
                                             self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                                            time.sleep(1)
+                                            self.clock.sleep(1)
                                             new_height = self.driver.execute_script("return document.body.scrollHeight")
                                             if new_height == last_height:
                                                 break
@@ -355,8 +351,8 @@ class AcuraPartsWarehouseScraper(BaseScraper):
                                             scroll_attempts += 1
                                         
                                         # Get updated HTML after scrolling
-                                        pag_html = self.driver.page_source
-                                        pag_soup = BeautifulSoup(pag_html, 'lxml')
+                                        pag_html = self.get_page_source()
+                                        pag_soup = self.make_soup(pag_html, 'lxml')
                                     except:
                                         pass
                                     
@@ -428,9 +424,9 @@ class AcuraPartsWarehouseScraper(BaseScraper):
                             
                             # Delay between pages
                             if page_num < total_pages:
-                                time.sleep(random.uniform(1, 2))
+                                self.polite_sleep(1, 2)
                     
-                    time.sleep(random.uniform(1, 2))  # Delay between category pages
+                    self.polite_sleep(1, 2)  # Delay between category pages
                     
                 except Exception as e:
                     self.logger.warning(f"Error discovering from {category_page}: {str(e)}")
@@ -438,7 +434,6 @@ class AcuraPartsWarehouseScraper(BaseScraper):
             
         except Exception as e:
             self.logger.error(f"Error discovering wheel category pages: {str(e)}")
-            import traceback
             self.logger.debug(f"Traceback: {traceback.format_exc()}")
         
         return product_urls
@@ -467,7 +462,7 @@ class AcuraPartsWarehouseScraper(BaseScraper):
                     if not html:
                         continue
                     
-                    soup = BeautifulSoup(html, 'lxml')
+                    soup = self.make_soup(html, 'lxml')
                     
                     # Find all /oem/ product links
                     oem_links = soup.find_all('a', href=re.compile(r'/oem/acura~'))
@@ -491,7 +486,7 @@ class AcuraPartsWarehouseScraper(BaseScraper):
                                 if full_url not in product_urls:
                                     product_urls.append(full_url)
                     
-                    time.sleep(random.uniform(1, 2))
+                    self.polite_sleep(1, 2)
                     
                 except Exception as e:
                     self.logger.warning(f"Error searching for /oem/ products with '{search_term}': {str(e)}")
@@ -499,7 +494,6 @@ class AcuraPartsWarehouseScraper(BaseScraper):
             
         except Exception as e:
             self.logger.error(f"Error discovering /oem/ product pages: {str(e)}")
-            import traceback
             self.logger.debug(f"Traceback: {traceback.format_exc()}")
         
         return product_urls
@@ -535,7 +529,7 @@ class AcuraPartsWarehouseScraper(BaseScraper):
                     if not html:
                         continue
                     
-                    soup = BeautifulSoup(html, 'lxml')
+                    soup = self.make_soup(html, 'lxml')
                     
                     # Find /parts-list/ wheel pages
                     parts_list_links = soup.find_all('a', href=re.compile(r'/parts-list/.*wheels'))
@@ -549,7 +543,7 @@ class AcuraPartsWarehouseScraper(BaseScraper):
                             try:
                                 parts_html = self.get_page(parts_list_url, use_selenium=True, wait_time=1)
                                 if parts_html:
-                                    parts_soup = BeautifulSoup(parts_html, 'lxml')
+                                    parts_soup = self.make_soup(parts_html, 'lxml')
                                     product_links = parts_soup.find_all('a', href=re.compile(r'/oem/acura~|/oem-acura-'))
                                     
                                     for prod_link in product_links:
@@ -571,14 +565,13 @@ class AcuraPartsWarehouseScraper(BaseScraper):
                             except:
                                 continue
                     
-                    time.sleep(random.uniform(0.5, 1.0))
+                    self.polite_sleep(0.5, 1.0)
                     
                 except Exception as e:
                     continue
             
         except Exception as e:
             self.logger.error(f"Error discovering model wheel pages: {str(e)}")
-            import traceback
             self.logger.debug(f"Traceback: {traceback.format_exc()}")
         
         return product_urls
@@ -613,7 +606,7 @@ class AcuraPartsWarehouseScraper(BaseScraper):
                     if not html:
                         continue
                     
-                    soup = BeautifulSoup(html, 'lxml')
+                    soup = self.make_soup(html, 'lxml')
                     
                     # Find product links
                     product_links = soup.find_all('a', href=re.compile(r'/oem/acura~|/oem-acura-|/accessories/acura-'))
@@ -635,7 +628,7 @@ class AcuraPartsWarehouseScraper(BaseScraper):
                                 if full_url not in product_urls:
                                     product_urls.append(full_url)
                     
-                    time.sleep(random.uniform(1, 2))
+                    self.polite_sleep(1, 2)
                     
                 except Exception as e:
                     self.logger.warning(f"Error discovering from {accessory_page}: {str(e)}")
@@ -643,7 +636,6 @@ class AcuraPartsWarehouseScraper(BaseScraper):
             
         except Exception as e:
             self.logger.error(f"Error discovering accessory pages: {str(e)}")
-            import traceback
             self.logger.debug(f"Traceback: {traceback.format_exc()}")
         
         return product_urls
@@ -703,7 +695,7 @@ class AcuraPartsWarehouseScraper(BaseScraper):
                 while scroll_attempts < max_scrolls:
                     try:
                         self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                        time.sleep(1.5)
+                        self.clock.sleep(1.5)
                         
                         try:
                             new_height = self.driver.execute_script("return document.body.scrollHeight")
@@ -727,7 +719,7 @@ class AcuraPartsWarehouseScraper(BaseScraper):
             
             # Get page source after scrolling
             try:
-                html = self.driver.page_source
+                html = self.get_page_source()
             except Exception as page_source_error:
                 self.logger.error(f"Error accessing page_source: {str(page_source_error)}")
                 html = self.get_page(category_url, use_selenium=True, wait_time=1)
@@ -735,7 +727,7 @@ class AcuraPartsWarehouseScraper(BaseScraper):
                     self.logger.error("Could not retrieve page source")
                     return product_urls
             
-            soup = BeautifulSoup(html, 'lxml')
+            soup = self.make_soup(html, 'lxml')
             
             # Find ALL product links - multiple patterns
             # Pattern 1: /oem-acura-*.html (category/listing pages)
@@ -800,8 +792,8 @@ class AcuraPartsWarehouseScraper(BaseScraper):
                                 self.page_load_timeout = 60
                                 self.driver.set_page_load_timeout(60)
                                 
-                                self.driver.get(pag_url)
-                                time.sleep(2)
+                                self.driver_get(pag_url)
+                                self.clock.sleep(2)
                                 
                                 try:
                                     WebDriverWait(self.driver, 10).until(
@@ -848,7 +840,7 @@ class AcuraPartsWarehouseScraper(BaseScraper):
                         while scroll_attempts < 30:
                             try:
                                 self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                                time.sleep(1)
+                                self.clock.sleep(1)
                                 new_height = self.driver.execute_script("return document.body.scrollHeight")
                                 
                                 if new_height == last_height:
@@ -867,7 +859,7 @@ class AcuraPartsWarehouseScraper(BaseScraper):
                     
                     # Extract product links from this page
                     try:
-                        html = self.driver.page_source
+                        html = self.get_page_source()
                     except Exception as page_source_error:
                         self.logger.warning(f"Error accessing page_source on page {page_num}: {str(page_source_error)}")
                         html = self.get_page(pag_url_used, use_selenium=True, wait_time=1)
@@ -876,7 +868,7 @@ class AcuraPartsWarehouseScraper(BaseScraper):
                             page_num += 1
                             continue
                     
-                    soup = BeautifulSoup(html, 'lxml')
+                    soup = self.make_soup(html, 'lxml')
                     # Find all product links - multiple patterns
                     page_links = soup.find_all('a', href=re.compile(r'/oem-acura-|/oem/acura~|/parts-list/.*wheels|/accessories/acura-'))
                     
@@ -914,7 +906,7 @@ class AcuraPartsWarehouseScraper(BaseScraper):
                         consecutive_empty_pages = 0
                     
                     page_num += 1
-                    time.sleep(random.uniform(2, 4))
+                    self.polite_sleep(2, 4)
                     
                 except Exception as e:
                     self.logger.error(f"Error processing page {page_num}: {str(e)}")
@@ -929,7 +921,6 @@ class AcuraPartsWarehouseScraper(BaseScraper):
             
         except Exception as e:
             self.logger.error(f"Error browsing category: {str(e)}")
-            import traceback
             self.logger.debug(f"Traceback: {traceback.format_exc()}")
         
         return product_urls
@@ -941,7 +932,7 @@ class AcuraPartsWarehouseScraper(BaseScraper):
         """
         try:
             # Wait a moment for modal to appear
-            time.sleep(2)
+            self.clock.sleep(2)
             
             # Try multiple strategies to handle the modal
             # Strategy 1: Try to close the modal with X button
@@ -961,7 +952,7 @@ class AcuraPartsWarehouseScraper(BaseScraper):
                     if close_btn.is_displayed():
                         close_btn.click()
                         self.logger.info(f"Closed vehicle selection modal using selector: {selector}")
-                        time.sleep(1)
+                        self.clock.sleep(1)
                         return True
                 except:
                     continue
@@ -973,7 +964,7 @@ class AcuraPartsWarehouseScraper(BaseScraper):
                     # Click on overlay to close modal
                     ActionChains(self.driver).move_to_element(overlay).click().perform()
                     self.logger.info("Closed modal by clicking overlay")
-                    time.sleep(1)
+                    self.clock.sleep(1)
                     return True
             except:
                 pass
@@ -983,7 +974,7 @@ class AcuraPartsWarehouseScraper(BaseScraper):
                 from selenium.webdriver.common.keys import Keys
                 ActionChains(self.driver).send_keys(Keys.ESCAPE).perform()
                 self.logger.info("Pressed Escape key to close modal")
-                time.sleep(1)
+                self.clock.sleep(1)
                 return True
             except:
                 pass
@@ -1005,30 +996,30 @@ class AcuraPartsWarehouseScraper(BaseScraper):
                         if model_dropdown.is_displayed():
                             # Click to open dropdown
                             model_dropdown.click()
-                            time.sleep(0.5)
+                            self.clock.sleep(0.5)
                             
                             # Try to select first available model
                             first_option = self.driver.find_element(By.CSS_SELECTOR, ".ab-select-col > li:first-child, .av-ipt-drop li:first-child")
                             if first_option:
                                 first_option.click()
-                                time.sleep(0.5)
+                                self.clock.sleep(0.5)
                                 
                                 # Try to select year
                                 year_dropdown = self.driver.find_element(By.CSS_SELECTOR, ".v-base-model-content .av-ipt:last-child, select[name*='year']")
                                 if year_dropdown:
                                     year_dropdown.click()
-                                    time.sleep(0.5)
+                                    self.clock.sleep(0.5)
                                     first_year = self.driver.find_element(By.CSS_SELECTOR, ".ab-select-col > li:first-child, option:not([value=''])")
                                     if first_year:
                                         first_year.click()
-                                        time.sleep(0.5)
+                                        self.clock.sleep(0.5)
                                 
                                 # Click Go button
                                 go_btn = self.driver.find_element(By.CSS_SELECTOR, ".av-btn-red, button[type='submit'], .v-base-model-content .av-btn")
                                 if go_btn:
                                     go_btn.click()
                                     self.logger.info("Selected default vehicle and clicked Go")
-                                    time.sleep(2)
+                                    self.clock.sleep(2)
                                     return True
                     except:
                                     continue
@@ -1062,7 +1053,7 @@ class AcuraPartsWarehouseScraper(BaseScraper):
                     }
                 """)
                 self.logger.info("Attempted to close modal using JavaScript")
-                time.sleep(1)
+                self.clock.sleep(1)
                 return True
             except:
                 pass
@@ -1107,7 +1098,7 @@ class AcuraPartsWarehouseScraper(BaseScraper):
                     self.logger.info(f"Trying direct category URL: {category_url}")
                     html = self.get_page(category_url, use_selenium=True, wait_time=2)
                     if html and len(html) > 5000:  # Valid page content
-                        soup = BeautifulSoup(html, 'lxml')
+                        soup = self.make_soup(html, 'lxml')
                         product_links = soup.find_all('a', href=re.compile(r'/oem-acura-|/oem/acura~|/parts-list/.*wheels|/accessories/acura-'))
                         
                         for link in product_links:
@@ -1190,7 +1181,7 @@ class AcuraPartsWarehouseScraper(BaseScraper):
                         while scroll_attempts < max_scrolls:
                             try:
                                 self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                                time.sleep(1.5)
+                                self.clock.sleep(1.5)
                                 
                                 try:
                                     new_height = self.driver.execute_script("return document.body.scrollHeight")
@@ -1214,7 +1205,7 @@ class AcuraPartsWarehouseScraper(BaseScraper):
                     
                     # Get page source after scrolling
                     try:
-                        html = self.driver.page_source
+                        html = self.get_page_source()
                     except Exception as page_source_error:
                         self.logger.error(f"Error accessing page_source: {str(page_source_error)}")
                         html = self.get_page(search_url, use_selenium=True, wait_time=1)
@@ -1222,7 +1213,7 @@ class AcuraPartsWarehouseScraper(BaseScraper):
                             self.logger.warning("Could not retrieve page source, trying next search pattern...")
                             continue
                     
-                    soup = BeautifulSoup(html, 'lxml')
+                    soup = self.make_soup(html, 'lxml')
                     
                     # Find ALL product links - multiple patterns
                     # Pattern 1: /oem-acura-*.html (category/listing pages)
@@ -1266,7 +1257,6 @@ class AcuraPartsWarehouseScraper(BaseScraper):
             
         except Exception as e:
             self.logger.error(f"Error searching for wheels: {str(e)}")
-            import traceback
             self.logger.debug(f"Traceback: {traceback.format_exc()}")
         
         return product_urls
@@ -1277,12 +1267,6 @@ class AcuraPartsWarehouseScraper(BaseScraper):
         Scrape single product from AcuraPartsWarehouse with refined extraction logic
         Returns a LIST of dictionaries (one for each fitment/trim combination)
         """
-        import random
-        import json
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
-        from selenium.webdriver.common.by import By
-        
         # Import TimeoutException - try to import it
         try:
             from selenium.common.exceptions import TimeoutException
@@ -1306,25 +1290,25 @@ class AcuraPartsWarehouseScraper(BaseScraper):
                 except Exception as driver_error:
                     recovery = self.error_handler.handle_error(driver_error, retry_count)
                     if recovery['should_retry'] and retry_count < max_retries - 1:
-                        time.sleep(random.uniform(recovery['wait_time'][0], recovery['wait_time'][1]))
+                        self.polite_sleep(recovery['wait_time'][0], recovery['wait_time'][1], phase='retry_backoff')
                         retry_count += 1
                         continue
                     else:
                         return []
                 
                 try:
-                    self.driver.get(url)
-                    time.sleep(random.uniform(1.0, 2.0))
+                    self.driver_get(url)
+                    self.polite_sleep(1.0, 2.0)
                     
                     # Cloudflare check
-                    if ('challenges.cloudflare.com' in self.driver.current_url.lower() or len(self.driver.page_source) < 5000) and self.has_cloudflare_challenge():
+                    if self.has_cloudflare_challenge():
                         self.logger.info("🛡️ Cloudflare challenge detected...")
                         if not self.wait_for_cloudflare(timeout=30, target_url=url, max_retries=1):
-                            if len(self.driver.page_source) <= 5000:
+                            if len(self.page_snapshot()) <= 5000:
                                 retry_count += 1
-                                time.sleep(random.uniform(10, 15))
+                                self.polite_sleep(10, 15, phase='retry_backoff')
                                 continue
-                        time.sleep(1)
+                        self.clock.sleep(1)
                     
                     self.simulate_human_behavior()
                     
@@ -1355,13 +1339,13 @@ class AcuraPartsWarehouseScraper(BaseScraper):
                         if view_more_btn and view_more_btn.is_displayed():
                             self.logger.info("Found 'View More' button for fitment, clicking...")
                             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", view_more_btn)
-                            time.sleep(0.5)
+                            self.clock.sleep(0.5)
                             self.driver.execute_script("arguments[0].click();", view_more_btn)
-                            time.sleep(1.5)
+                            self.clock.sleep(1.5)
                     except Exception as e:
                         self.logger.debug(f"Note: Could not click 'View More' (might not exist): {e}")
                     
-                    html = self.driver.page_source
+                    html = self.get_page_source()
                     if not html or len(html) < 1000: raise Exception("Page content too small")
                     break
                     
@@ -1371,7 +1355,7 @@ class AcuraPartsWarehouseScraper(BaseScraper):
                 except Exception as e:
                     self.logger.warning(f"⚠️ Error loading page: {e}")
                     retry_count += 1
-                    time.sleep(random.uniform(5, 10))
+                    self.polite_sleep(5, 10, phase='retry_backoff')
                     continue
             except Exception as e:
                 self.logger.error(f"❌ Critical error: {e}")
@@ -1379,7 +1363,7 @@ class AcuraPartsWarehouseScraper(BaseScraper):
 
         if not html: return []
         
-        soup = BeautifulSoup(html, 'lxml')
+        soup = self.make_soup(html, 'lxml')
         
         base_data = {
             'url': url, 'image_url': '', 'date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
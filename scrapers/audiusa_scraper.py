@@ -1,10 +1,8 @@
 """Scraper for parts.audiusa.com (Audi parts)"""
 from scrapers.base_scraper_with_extension import BaseScraperWithExtension
-from bs4 import BeautifulSoup
 import json
 import re
 from datetime import datetime
-import time
 import traceback
 import random
 from selenium.webdriver.common.by import By
@@ -15,8 +13,8 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException
 class AudiUSAScraper(BaseScraperWithExtension):
     """Scraper for parts.audiusa.com"""
     
-    def __init__(self):
-        super().__init__('audiusa', use_selenium=True)
+    def __init__(self, clock=None):
+        super().__init__('audiusa', use_selenium=True, clock=clock)
         self.base_url = 'https://parts.audiusa.com'
         
     def get_product_urls(self):
@@ -150,8 +148,8 @@ class AudiUSAScraper(BaseScraperWithExtension):
             if not self.driver:
                 self.logger.error("Driver not initialized")
                 return product_urls
-            html = self.driver.page_source
-            soup = BeautifulSoup(html, 'lxml')
+            html = self.get_page_source()
+            soup = self.make_soup(html, 'lxml')
             
             # Find product links - pattern: /p/Audi__/Product-Name/ID/PartNumber.html
             product_links = soup.find_all('a', href=re.compile(r'/p/Audi__/'))
@@ -227,8 +225,8 @@ class AudiUSAScraper(BaseScraperWithExtension):
             if not self.driver:
                 self.logger.error("Driver not initialized after get_page()")
                 return product_urls
-            html = self.driver.page_source
-            soup = BeautifulSoup(html, 'lxml')
+            html = self.get_page_source()
+            soup = self.make_soup(html, 'lxml')
             
             # Extract product links
             product_links = soup.find_all('a', href=re.compile(r'/p/Audi__/'))
@@ -271,7 +269,7 @@ class AudiUSAScraper(BaseScraperWithExtension):
                                 
                                 html = self.get_page(pag_url, use_selenium=True, wait_time=1)
                                 if html and len(html) > 5000:
-                                    soup_check = BeautifulSoup(html, 'lxml')
+                                    soup_check = self.make_soup(html, 'lxml')
                                     if soup_check.find_all('a', href=re.compile(r'/p/Audi__/')):
                                         page_loaded = True
                                         break
@@ -300,8 +298,8 @@ class AudiUSAScraper(BaseScraperWithExtension):
                     if not self.driver:
                         self.logger.error("Driver not initialized after pagination in category browse")
                         break
-                    html = self.driver.page_source
-                    soup = BeautifulSoup(html, 'lxml')
+                    html = self.get_page_source()
+                    soup = self.make_soup(html, 'lxml')
                     page_links = soup.find_all('a', href=re.compile(r'/p/Audi__/'))
                     
                     new_count = 0
@@ -327,7 +325,7 @@ class AudiUSAScraper(BaseScraperWithExtension):
                         consecutive_empty = 0
                     
                     page_num += 1
-                    time.sleep(random.uniform(1, 2))
+                    self.polite_sleep(1, 2)
                     
                 except Exception as e:
                     self.logger.debug(f"Error on category page {page_num}: {str(e)}")
@@ -370,7 +368,7 @@ class AudiUSAScraper(BaseScraperWithExtension):
                     pass
             
             # Look for "Wheels" link or section
-            soup = BeautifulSoup(html, 'lxml')
+            soup = self.make_soup(html, 'lxml')
             
             # Find links containing "wheel" in text or href
             wheel_links = soup.find_all('a', href=True, string=re.compile(r'wheel', re.I))
@@ -444,8 +442,8 @@ class AudiUSAScraper(BaseScraperWithExtension):
             if not self.driver:
                 self.logger.error("Driver not initialized after get_page()")
                 return product_urls
-            html = self.driver.page_source
-            soup = BeautifulSoup(html, 'lxml')
+            html = self.get_page_source()
+            soup = self.make_soup(html, 'lxml')
             
             product_links = soup.find_all('a', href=re.compile(r'/p/Audi__/'))
             for link in product_links:
@@ -480,7 +478,7 @@ class AudiUSAScraper(BaseScraperWithExtension):
             while scroll_attempts < max_scrolls:
                 try:
                     self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                    time.sleep(1.5)
+                    self.clock.sleep(1.5)
                     
                     new_height = self.driver.execute_script("return document.body.scrollHeight")
                     if new_height == last_height:
@@ -523,7 +521,7 @@ class AudiUSAScraper(BaseScraperWithExtension):
                 # Step 2: Wait for loading indicators to disappear
                 self.logger.debug("Waiting for loading indicators to disappear...")
                 for _ in range(20):  # Wait up to 4 seconds for loading to complete
-                    time.sleep(0.2)
+                    self.clock.sleep(0.2)
                     try:
                         # Check for common loading indicators
                         loading_indicators = self.driver.find_elements(By.CSS_SELECTOR, 
@@ -542,7 +540,7 @@ class AudiUSAScraper(BaseScraperWithExtension):
                 last_content_length = 0
                 
                 for check_round in range(15):  # Check for up to 3 seconds
-                    time.sleep(0.2)
+                    self.clock.sleep(0.2)
                     try:
                         current_inner_html = element.get_attribute('innerHTML') or ''
                         current_length = len(current_inner_html.strip())
@@ -615,7 +613,7 @@ class AudiUSAScraper(BaseScraperWithExtension):
                     pass
                 
                 # Step 6: Final wait for any remaining async operations
-                time.sleep(1)
+                self.clock.sleep(1)
                 
                 # Step 7: Final verification - check content is still there and stable
                 final_inner_html = element.get_attribute('innerHTML') or ''
@@ -655,7 +653,7 @@ class AudiUSAScraper(BaseScraperWithExtension):
             try:
                 # Wait a bit before each attempt to let page settle
                 if attempt > 0:
-                    time.sleep(wait_between_attempts)
+                    self.clock.sleep(wait_between_attempts)
                 
                 # Try JavaScript to find button first (more reliable)
                 try:
@@ -695,7 +693,7 @@ class AudiUSAScraper(BaseScraperWithExtension):
                                 
                                 # Scroll into view
                                 self.driver.execute_script("arguments[0].scrollIntoView({block: 'center', behavior: 'smooth'});", element)
-                                time.sleep(0.5)
+                                self.clock.sleep(0.5)
                                 
                                 # Wait for element to be clickable
                                 element = wait.until(EC.element_to_be_clickable((selector_type, selector_value)))
@@ -705,7 +703,7 @@ class AudiUSAScraper(BaseScraperWithExtension):
                                 self.logger.info(f"✓ Clicked 'Show More' button (attempt {attempt + 1})")
                                 
                                 # Wait a bit after clicking
-                                time.sleep(1)
+                                self.clock.sleep(1)
                                 return True
                             except Exception as e:
                                 continue
@@ -738,7 +736,7 @@ class AudiUSAScraper(BaseScraperWithExtension):
         for check_round in range(5):
             try:
                 if check_round > 0:
-                    time.sleep(2)
+                    self.clock.sleep(2)
                 
                 for selector in selectors:
                     try:
@@ -758,7 +756,7 @@ class AudiUSAScraper(BaseScraperWithExtension):
                             
                             if valid_count > 0:
                                 self.logger.info(f"✓ Fitment data loaded: found {len(elements)} elements ({valid_count} with content) via {selector}")
-                                time.sleep(2)
+                                self.clock.sleep(2)
                                 return True
                     except Exception as e:
                         continue
@@ -782,7 +780,7 @@ class AudiUSAScraper(BaseScraperWithExtension):
                     
                     if row_count >= min_rows:
                         self.logger.info(f"✓ Fitment data loaded: found {row_count} rows via JavaScript")
-                        time.sleep(2)
+                        self.clock.sleep(2)
                         return True
                 except:
                     pass
@@ -805,7 +803,7 @@ class AudiUSAScraper(BaseScraperWithExtension):
         if retry_count == 0:  # Only delay on first attempt, not retries
             delay = random.uniform(3, 6)  # 3-6 seconds between product pages
             self.logger.debug(f"Waiting {delay:.1f}s before loading product page...")
-            time.sleep(delay)
+            self.polite_sleep(delay)
         
         while retry_count < max_retries:
             try:
@@ -825,7 +823,7 @@ class AudiUSAScraper(BaseScraperWithExtension):
                         wait_time = recovery['wait_time']
                         delay = random.uniform(wait_time[0], wait_time[1])
                         self.logger.warning(f"Driver error, retrying in {delay:.1f}s...")
-                        time.sleep(delay)
+                        self.polite_sleep(delay, phase='retry_backoff')
                         retry_count += 1
                         continue
                     else:
@@ -836,8 +834,8 @@ class AudiUSAScraper(BaseScraperWithExtension):
                     self.page_load_timeout = 60
                     self.driver.set_page_load_timeout(60)
                     
-                    self.driver.get(url)
-                    time.sleep(random.uniform(0.5, 1.5))
+                    self.driver_get(url)
+                    self.polite_sleep(0.5, 1.5)
                     
                     # Cloudflare check
                     if not self.driver:
@@ -845,14 +843,12 @@ class AudiUSAScraper(BaseScraperWithExtension):
                         retry_count += 1
                         if retry_count < max_retries:
                             wait_time = random.uniform(10, 15)
-                            time.sleep(wait_time)
+                            self.polite_sleep(wait_time, phase='retry_backoff')
                             continue
                         else:
                             return None
-                    current_url_check = self.driver.current_url.lower()
-                    page_preview = self.driver.page_source[:6000]
-                    
-                    if ('challenges.cloudflare.com' in current_url_check or '/cdn-cgi/challenge' in current_url_check or len(page_preview) < 5000) and self.has_cloudflare_challenge():
+                    # Quick Cloudflare check (one script call: challenge URL or small page with challenge markers)
+                    if self.has_cloudflare_challenge():
                         self.logger.info("🛡️ Cloudflare challenge detected - waiting for bypass...")
                         cloudflare_bypassed = self.wait_for_cloudflare(timeout=30, target_url=url, max_retries=1)
                         if not cloudflare_bypassed:
@@ -862,30 +858,31 @@ class AudiUSAScraper(BaseScraperWithExtension):
                                 if retry_count < max_retries:
                                     wait_time = random.uniform(10, 15)
                                     self.logger.warning(f"Retrying page load in {wait_time:.1f}s...")
-                                    time.sleep(wait_time)
+                                    self.polite_sleep(wait_time, phase='retry_backoff')
                                     continue
                                 else:
                                     return None
-                            if len(self.driver.page_source) > 5000 and 'challenges.cloudflare.com' not in self.driver.current_url.lower():
+                            snapshot = self.page_snapshot()
+                            if len(snapshot) > 5000 and 'challenges.cloudflare.com' not in snapshot.url.lower():
                                 self.logger.info("✓ Page accessible despite Cloudflare warning - continuing...")
                             else:
                                 retry_count += 1
                                 if retry_count < max_retries:
                                     wait_time = random.uniform(10, 15)
                                     self.logger.warning(f"Retrying page load in {wait_time:.1f}s...")
-                                    time.sleep(wait_time)
+                                    self.polite_sleep(wait_time, phase='retry_backoff')
                                     continue
                                 else:
                                     return None
-                        time.sleep(1)
+                        self.clock.sleep(1)
                     
-                    time.sleep(random.uniform(0.5, 1.0))
+                    self.polite_sleep(0.5, 1.0)
                     self.simulate_human_behavior()
-                    time.sleep(random.uniform(0.5, 1.0))
-                    time.sleep(random.uniform(1.5, 3.0))
-                    time.sleep(random.uniform(0.5, 1.0))
-                    html = self.driver.page_source
-                    soup = BeautifulSoup(html, 'lxml')
+                    self.polite_sleep(0.5, 1.0)
+                    self.polite_sleep(1.5, 3.0)
+                    self.polite_sleep(0.5, 1.0)
+                    html = self.get_page_source()
+                    soup = self.make_soup(html, 'lxml')
                     
                     # Extract title
                     title_text = ''
@@ -926,7 +923,7 @@ class AudiUSAScraper(BaseScraperWithExtension):
                         retry_count += 1
                         if retry_count < max_retries:
                             wait_time = random.uniform(10, 15)
-                            time.sleep(wait_time)
+                            self.polite_sleep(wait_time, phase='retry_backoff')
                             continue
                         else:
                             return None
@@ -936,7 +933,7 @@ class AudiUSAScraper(BaseScraperWithExtension):
                         retry_count += 1
                         if retry_count < max_retries:
                             wait_time = random.uniform(10, 15)
-                            time.sleep(wait_time)
+                            self.polite_sleep(wait_time, phase='retry_backoff')
                             continue
                         else:
                             return None
@@ -1027,7 +1024,7 @@ class AudiUSAScraper(BaseScraperWithExtension):
                                         if self.driver:
                                             self.driver.quit()
                                         self.driver = None
-                                        time.sleep(random.uniform(5, 10))
+                                        self.polite_sleep(5, 10)
                                         self.ensure_driver()
                                         self.logger.info("✓ Browser session restarted")
                                     except Exception as restart_error:
@@ -1037,12 +1034,12 @@ class AudiUSAScraper(BaseScraperWithExtension):
                                 wait_time = random.uniform(10, 15)
                                 self.logger.info(f"Waiting {wait_time:.1f} seconds before retry...")
                             
-                            time.sleep(wait_time)
+                            self.polite_sleep(wait_time, phase='retry_backoff')
                             
                             # If blocked multiple times, add extra human-like behavior
                             if error_type == "blocked" and retry_count >= 2:
                                 self.logger.info("Simulating extended human behavior after blocking...")
-                                time.sleep(random.uniform(10, 20))
+                                self.polite_sleep(10, 20, phase='retry_backoff')
                                 self.simulate_human_behavior()
                             
                             continue
@@ -1057,7 +1054,7 @@ class AudiUSAScraper(BaseScraperWithExtension):
                         retry_count += 1
                         if retry_count < max_retries:
                             wait_time = random.uniform(10, 15)
-                            time.sleep(wait_time)
+                            self.polite_sleep(wait_time, phase='retry_backoff')
                             continue
                         else:
                             return None
@@ -1068,11 +1065,11 @@ class AudiUSAScraper(BaseScraperWithExtension):
                         retry_count += 1
                         if retry_count < max_retries:
                             wait_time = random.uniform(10, 15)
-                            time.sleep(wait_time)
+                            self.polite_sleep(wait_time, phase='retry_backoff')
                             continue
                         else:
                             return None
-                    html = self.driver.page_source
+                    html = self.get_page_source()
                     self.logger.info(f"✓ Page loaded successfully, title: {title_text[:50]}")
                     self.page_load_timeout = original_timeout
                     self.driver.set_page_load_timeout(original_timeout)
@@ -1090,14 +1087,14 @@ class AudiUSAScraper(BaseScraperWithExtension):
                             if not self.driver:
                                 self.logger.error("Driver not initialized during timeout recovery")
                                 raise Exception("Driver not initialized")
-                            html = self.driver.page_source
+                            html = self.get_page_source()
                             current_url = self.driver.current_url.lower()
                             
                             if any(err in current_url for err in ['chrome-error://', 'err_', 'dns_probe']):
                                 raise Exception(f"Connection error: {current_url}")
                             
                             if html and len(html) > 8000:
-                                soup = BeautifulSoup(html, 'lxml')
+                                soup = self.make_soup(html, 'lxml')
                                 has_title = soup.find('h1')
                                 has_body = soup.find('body')
                                 body_text = has_body.get_text(strip=True) if has_body else ''
@@ -1107,7 +1104,7 @@ class AudiUSAScraper(BaseScraperWithExtension):
                                     self.logger.info(f"✓ Full content loaded after {waited}s")
                                     break
                             
-                            time.sleep(0.5)
+                            self.clock.sleep(0.5)
                             waited += 0.5
                         
                         if not content_ready:
@@ -1120,7 +1117,7 @@ class AudiUSAScraper(BaseScraperWithExtension):
                         retry_count += 1
                         if retry_count < max_retries:
                             wait_time = random.uniform(5, 8)
-                            time.sleep(wait_time)
+                            self.polite_sleep(wait_time, phase='retry_backoff')
                             continue
                         else:
                             self.page_load_timeout = original_timeout
@@ -1137,7 +1134,7 @@ class AudiUSAScraper(BaseScraperWithExtension):
                         retry_count += 1
                         if retry_count < max_retries:
                             wait_time = random.uniform(5, 8)
-                            time.sleep(wait_time)
+                            self.polite_sleep(wait_time, phase='retry_backoff')
                             continue
                         else:
                             return None
@@ -1162,7 +1159,7 @@ class AudiUSAScraper(BaseScraperWithExtension):
                     wait_time = recovery['wait_time']
                     delay = random.uniform(wait_time[0], wait_time[1])
                     self.logger.warning(f"Retrying in {delay:.1f}s...")
-                    time.sleep(delay)
+                    self.polite_sleep(delay, phase='retry_backoff')
                     retry_count += 1
                     continue
                 else:
@@ -1171,7 +1168,7 @@ class AudiUSAScraper(BaseScraperWithExtension):
         if not html:
             return None
         
-        soup = BeautifulSoup(html, 'lxml')
+        soup = self.make_soup(html, 'lxml')
         
         # Initialize product data
         product_data = {
@@ -1533,7 +1530,7 @@ class AudiUSAScraper(BaseScraperWithExtension):
                         try:
                             tab_element = wait.until(EC.element_to_be_clickable((selector_type, selector_value)))
                             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", tab_element)
-                            time.sleep(0.5)
+                            self.clock.sleep(0.5)
                             tab_element.click()
                             tab_clicked = True
                             self.logger.info("✓ Clicked 'What This Fits' tab")
@@ -1564,11 +1561,11 @@ class AudiUSAScraper(BaseScraperWithExtension):
                         if not fitment_loaded:
                             # Try one more time after additional wait
                             self.logger.info("🔍 Retrying fitment data load check after additional wait...")
-                            time.sleep(5)
+                            self.clock.sleep(5)
                             fitment_loaded = self._wait_for_fitment_data_loaded(timeout=20, min_rows=1)
                         
                         # Additional wait to ensure everything is stable
-                        time.sleep(1)
+                        self.clock.sleep(1)
                             
                         # Step 5: Extract fitment data directly using Selenium (more reliable for dynamic content)
                         # Use Selenium to find elements directly instead of BeautifulSoup
@@ -1639,7 +1636,7 @@ class AudiUSAScraper(BaseScraperWithExtension):
                         if not row_html:
                             continue
                         
-                        row_soup = BeautifulSoup(row_html, 'lxml')
+                        row_soup = self.make_soup(row_html, 'lxml')
                         
                         # Handle both table rows (tr) and div structures
                         vehicle_text = ''
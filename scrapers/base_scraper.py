@@ -15,8 +15,19 @@ from urllib.parse import urlparse
 import traceback
 import sys
 import atexit
+import functools
 from typing import Callable, Any
 from scrapers.error_handler import ErrorHandler, ErrorType
+from scrapers.phase_timer import PhaseTimer, timed_scrape, timed_phase
+from scrapers.browser_pool import BrowserPool, export_cookies, import_cookies
+from scrapers.clock import get_clock
+from scrapers.cloudflare_detector import (probe_driver, detect_challenge_html, is_challenge, challenge_pending,
+                                         challenge_cleared, on_challenge_url, STRICT_CHALLENGE_MARKERS)
+from scrapers.driver_env import get_driver_env
+from scrapers.log_pipeline import SafeUnicodeHandler, get_log_pipeline
+from scrapers.page_snapshot import PageSnapshot
+from scrapers.rate_limiter import HostRateLimiter
+from scrapers.tab_pipeline import TabPipeline
 from selenium.webdriver.common.action_chains import ActionChains
 
 # Suppress harmless undetected_chromedriver cleanup errors during shutdown
@@ -44,17 +55,91 @@ def _suppress_chromedriver_cleanup_errors():
 # Register the error suppression
 _suppress_chromedriver_cleanup_errors()
 
+# Additional anti-detection script injected into every new document (per tab)
+ANTI_DETECTION_SCRIPT = '''
+// Remove webdriver property
+Object.defineProperty(navigator, 'webdriver', {
+    get: () => undefined
+});
+
+// Fake plugins
+Object.defineProperty(navigator, 'plugins', {
+    get: () => [1, 2, 3, 4, 5]
+});
+
+// Set languages
+Object.defineProperty(navigator, 'languages', {
+    get: () => ['en-US', 'en']
+});
+
+// Add chrome object
+window.chrome = {
+    runtime: {},
+    loadTimes: function() {},
+    csi: function() {},
+    app: {}
+};
+
+// Override permissions
+const originalQuery = window.navigator.permissions.query;
+window.navigator.permissions.query = (parameters) => (
+    parameters.name === 'notifications' ?
+        Promise.resolve({ state: Notification.permission }) :
+        originalQuery(parameters)
+);
+
+// Override getBattery
+if (navigator.getBattery) {
+    navigator.getBattery = () => Promise.resolve({
+        charging: true,
+        chargingTime: 0,
+        dischargingTime: Infinity,
+        level: 1
+    });
+}
+'''
+
 
 class BaseScraper(ABC):
     """Base scraper class for all site scrapers"""
     
-    def __init__(self, site_name, use_selenium=False, headless=False):
+    # Site scraper helper methods timed automatically as phases (see PhaseTimer)
+    PHASE_METHODS = {
+        '_wait_for_tab_panel_loaded': 'fitment_tab',
+        '_wait_for_fitment_data_loaded': 'fitment_wait',
+        '_find_and_click_show_more': 'fitment_show_more',
+        '_wait_for_element_fully_loaded': 'element_wait',
+        '_scroll_to_load_content': 'scroll',
+        '_extract_fitment': 'extraction',
+    }
+    
+    # Page load timeout every new driver is started with (None keeps Chrome's default)
+    driver_page_load_timeout = 60
+    
+    def __init_subclass__(cls, **kwargs):
+        """Wrap scrape_product() and known phase methods of site scrapers with timing spans"""
+        super().__init_subclass__(**kwargs)
+        if 'scrape_product' in cls.__dict__:
+            cls.scrape_product = timed_scrape(cls.__dict__['scrape_product'])
+        for method_name, phase in BaseScraper.PHASE_METHODS.items():
+            if method_name in cls.__dict__:
+                setattr(cls, method_name, timed_phase(phase)(cls.__dict__[method_name]))
+    
+    def __init__(self, site_name, use_selenium=False, headless=False, clock=None):
+        # Clock used for every deliberate sleep and timeout (virtual in tests, accounting in production)
+        self.clock = clock or get_clock()
         self.site_name = site_name
         self.use_selenium = use_selenium
         self.headless = headless  # Initialize headless attribute
         self.session = requests.Session()
         self.ua = UserAgent()
         self.driver = None
+        self.browser_pool = None  # Optional warm spare drivers (enable_browser_pool)
+        self.recycle_policy = None  # Optional DriverRecyclePolicy (maybe_recycle_driver)
+        self.resource_blocker = None  # Optional ResourceBlocker (applied once Cloudflare clearance is obtained)
+        self.rate_limiter = None  # Optional HostRateLimiter for every driver_get (and prefetch tab)
+        self.tab_pipeline = None  # Optional TabPipeline preloading queued URLs (enable_tab_pipeline)
+        self._snapshot = None  # Last PageSnapshot of the driver's page (page_snapshot)
         self.page_load_timeout = 30  # Store timeout value for later use
         
         # Create logs directory if it doesn't exist
@@ -67,73 +152,27 @@ class BaseScraper(ABC):
         self.logger = logging.getLogger(site_name)
         self.logger.setLevel(logging.INFO)
         
-        # Remove existing handlers to avoid duplicates
-        self.logger.handlers = []
-        
         # File handler with UTF-8 encoding
         file_handler = logging.FileHandler(log_file, encoding='utf-8')
         file_handler.setLevel(logging.INFO)
         file_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
         file_handler.setFormatter(file_formatter)
-        self.logger.addHandler(file_handler)
         
         # Console handler with safe Unicode handling
-        # Define SafeUnicodeHandler class outside to avoid redefinition issues
-        class SafeUnicodeHandler(logging.StreamHandler):
-            """StreamHandler that safely handles Unicode encoding errors"""
-            def emit(self, record):
-                try:
-                    # Try normal emit first
-                    msg = self.format(record)
-                    stream = self.stream
-                    # Try to write directly
-                    try:
-                        stream.write(msg + self.terminator)
-                        self.flush()
-                    except UnicodeEncodeError:
-                        # Replace emojis with plain text alternatives
-                        safe_msg = msg
-                        safe_msg = safe_msg.replace('🔍', '[SEARCH]')
-                        safe_msg = safe_msg.replace('✅', '[OK]')
-                        safe_msg = safe_msg.replace('❌', '[X]')
-                        safe_msg = safe_msg.replace('💰', '[PRICE]')
-                        safe_msg = safe_msg.replace('🛡️', '[SHIELD]')
-                        safe_msg = safe_msg.replace('⏳', '[WAIT]')
-                        safe_msg = safe_msg.replace('🔄', '[RETRY]')
-                        safe_msg = safe_msg.replace('📝', '[NOTE]')
-                        safe_msg = safe_msg.replace('📦', '[BOX]')
-                        safe_msg = safe_msg.replace('⚠️', '[WARN]')
-                        safe_msg = safe_msg.replace('✓', '[OK]')
-                        safe_msg = safe_msg.replace('⏭️', '[SKIP]')
-                        try:
-                            stream.write(safe_msg + self.terminator)
-                            self.flush()
-                        except UnicodeEncodeError:
-                            # Last resort: encode with errors='replace'
-                            encoding = getattr(stream, 'encoding', 'utf-8') or 'utf-8'
-                            try:
-                                safe_bytes = safe_msg.encode(encoding, errors='replace')
-                                stream.write(safe_bytes.decode(encoding, errors='replace') + self.terminator)
-                            except:
-                                # Ultimate fallback: remove all non-ASCII
-                                ascii_msg = ''.join(c if ord(c) < 128 else '?' for c in safe_msg)
-                                stream.write(ascii_msg + self.terminator)
-                            self.flush()
-                except Exception:
-                    # Silently ignore logging errors to prevent crashes
-                    self.handleError(record)
-        
         safe_console_handler = SafeUnicodeHandler(sys.stdout)
         safe_console_handler.setLevel(logging.INFO)
         console_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
         safe_console_handler.setFormatter(console_formatter)
-        self.logger.addHandler(safe_console_handler)
+        
+        # Records are queued and written by a background thread, so logging in hot
+        # loops doesn't block on disk or console flushes (replaces existing handlers)
+        get_log_pipeline().attach(self.logger, [file_handler, safe_console_handler])
         
         # Prevent propagation to root logger to avoid duplicate messages
         self.logger.propagate = False
         
         # Initialize error handler
-        self.error_handler = ErrorHandler(self.logger)
+        self.error_handler = ErrorHandler(self.logger, clock=self.clock)
         
         # Health monitoring
         self.health_status = {
@@ -141,9 +180,14 @@ class BaseScraper(ABC):
             'total_requests': 0,
             'successful_requests': 0,
             'last_success_time': None,
-            'last_failure_time': None
+            'last_failure_time': None,
+            'driver_restarts': 0,
+            'phase_timings': {}
         }
         
+        # Per-phase timing spans (driver.get, Cloudflare wait, sleeps, page_source, parsing, ...)
+        self.phase_timer = PhaseTimer(site_name)
+        
         # Headers for requests
         self.headers = {
             'User-Agent': self.ua.random,
@@ -160,75 +204,12 @@ class BaseScraper(ABC):
         """
         Detect the installed Chrome browser version
         Returns the major version number (e.g., 142) or None if detection fails
+
+        The probe (PowerShell / chrome --version) runs once per machine; the
+        result is cached with the Chrome binary's mtime (see scrapers/driver_env.py).
         """
         try:
-            import subprocess
-            import platform
-            
-            if platform.system() == 'Windows':
-                # Windows: Check registry or chrome.exe version
-                chrome_paths = [
-                    r"C:\Program Files\Google\Chrome\Application\chrome.exe",
-                    r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
-                    os.path.expanduser(r"~\AppData\Local\Google\Chrome\Application\chrome.exe"),
-                ]
-                
-                for chrome_path in chrome_paths:
-                    if os.path.exists(chrome_path):
-                        try:
-                            # Get version using PowerShell
-                            result = subprocess.run(
-                                ['powershell', '-Command', 
-                                 f'(Get-Item "{chrome_path}").VersionInfo.FileVersion'],
-                                capture_output=True,
-                                text=True,
-                                timeout=5
-                            )
-                            if result.returncode == 0:
-                                version_str = result.stdout.strip()
-                                # Extract major version (e.g., "142.0.7444.176" -> 142)
-                                version_match = re.search(r'^(\d+)\.', version_str)
-                                if version_match:
-                                    version = int(version_match.group(1))
-                                    self.logger.info(f"Detected Chrome version: {version} (from {version_str})")
-                                    return version
-                        except Exception as e:
-                            self.logger.debug(f"Error detecting Chrome version from {chrome_path}: {str(e)}")
-                            continue
-                
-                # Fallback: Try to get version from Chrome's version file
-                try:
-                    version_file = os.path.expanduser(r"~\AppData\Local\Google\Chrome\User Data\Last Version")
-                    if os.path.exists(version_file):
-                        with open(version_file, 'r') as f:
-                            version_str = f.read().strip()
-                            version_match = re.search(r'^(\d+)\.', version_str)
-                            if version_match:
-                                version = int(version_match.group(1))
-                                self.logger.info(f"Detected Chrome version: {version} (from version file)")
-                                return version
-                except Exception as e:
-                    self.logger.debug(f"Error reading Chrome version file: {str(e)}")
-            
-            # Fallback: Try to run Chrome with --version flag
-            try:
-                chrome_cmd = 'chrome' if platform.system() != 'Windows' else 'chrome.exe'
-                result = subprocess.run(
-                    [chrome_cmd, '--version'],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                if result.returncode == 0:
-                    version_str = result.stdout.strip()
-                    version_match = re.search(r'(\d+)\.', version_str)
-                    if version_match:
-                        version = int(version_match.group(1))
-                        self.logger.info(f"Detected Chrome version: {version} (from --version)")
-                        return version
-            except Exception as e:
-                self.logger.debug(f"Error running Chrome --version: {str(e)}")
-            
+            return get_driver_env().chrome_version()
         except Exception as e:
             self.logger.debug(f"Error detecting Chrome version: {str(e)}")
         
@@ -295,6 +276,30 @@ class BaseScraper(ABC):
             self.logger.info("Browser already initialized, skipping...")
             return
         
+        self.driver = self._start_driver()
+        self._adopt_driver_timeouts()
+    
+    def _adopt_driver_timeouts(self):
+        """Record the page load timeout a new driver was started with (main thread only)"""
+        if self.driver_page_load_timeout:
+            self.page_load_timeout = self.driver_page_load_timeout
+    
+    def _start_driver(self, clock=None, page_load_timeout=None):
+        """
+        Launch and initialize a new undetected ChromeDriver (options, version, timeouts,
+        anti-detection scripts) without touching self.driver or other scraper state
+
+        Args:
+            clock: Clock for the start-up sleeps (default: self.clock; the browser
+                   pool passes its own, so warming isn't counted as the site's sleep)
+            page_load_timeout: Page load timeout set on the driver (default: driver_page_load_timeout)
+
+        Returns:
+            The ready driver (setup_selenium assigns it; the browser pool keeps spares)
+        """
+        clock = clock or self.clock
+        page_load_timeout = page_load_timeout or self.driver_page_load_timeout
+        driver = None
         try:
             # Detect Chrome version to ensure ChromeDriver compatibility
             chrome_version = self._detect_chrome_version()
@@ -302,6 +307,9 @@ class BaseScraper(ABC):
             # Try to use local ChromeDriver first to avoid network timeout
             chromedriver_path = os.path.join(os.getcwd(), 'chromedriver-win32', 'chromedriver.exe')
             driver_executable_path = chromedriver_path if os.path.exists(chromedriver_path) else None
+            # Otherwise reuse the chromedriver undetected_chromedriver patched on an earlier start
+            if driver_executable_path is None:
+                driver_executable_path = get_driver_env().patched_driver(chrome_version)
             
             # Create undetected ChromeDriver with stealth settings
             # IMPORTANT: Using uc.Chrome() from undetected_chromedriver, NOT selenium.webdriver.Chrome()
@@ -321,7 +329,7 @@ class BaseScraper(ABC):
                         self.logger.info(f"Using local ChromeDriver with undetected_chromedriver: {driver_executable_path}")
                         # uc.Chrome() automatically bypasses Cloudflare - let it handle challenges naturally
                         # Use detected Chrome version to ensure compatibility
-                        self.driver = uc.Chrome(
+                        driver = uc.Chrome(
                             options=options, 
                             version_main=chrome_version,  # Use detected Chrome version for compatibility
                             use_subprocess=True,  # Run in subprocess to avoid detection
@@ -333,7 +341,7 @@ class BaseScraper(ABC):
                         self.logger.info("No local ChromeDriver found, attempting auto-download with undetected_chromedriver...")
                         # uc.Chrome() automatically bypasses Cloudflare - let it handle challenges naturally
                         # Use detected Chrome version to ensure compatibility
-                        self.driver = uc.Chrome(
+                        driver = uc.Chrome(
                             options=options, 
                             version_main=chrome_version,  # Use detected Chrome version for compatibility
                             use_subprocess=True,  # Run in subprocess to avoid detection
@@ -343,9 +351,9 @@ class BaseScraper(ABC):
                     
                     # Maximize window if not headless
                     try:
-                        self.driver.maximize_window()
+                        driver.maximize_window()
                         # Verify window is still open after maximization
-                        if not self.driver.window_handles:
+                        if not driver.window_handles:
                             raise Exception("Window closed immediately after maximization")
                     except Exception as window_error:
                         error_msg = str(window_error).lower()
@@ -353,7 +361,7 @@ class BaseScraper(ABC):
                             self.logger.warning(f"Window closed during maximization: {str(window_error)}")
                             # Try to create a new window
                             try:
-                                self.driver.switch_to.new_window('tab')
+                                driver.switch_to.new_window('tab')
                                 self.logger.info("Created new window after closure")
                             except:
                                 raise Exception(f"Failed to recover from window closure: {str(window_error)}")
@@ -362,10 +370,10 @@ class BaseScraper(ABC):
                             self.logger.debug(f"Window maximization failed (non-critical): {str(window_error)}")
                     
                     # Wait a moment for window to stabilize
-                    time.sleep(1)
+                    clock.sleep(1)
                     
                     # Final verification that driver and window are valid
-                    if not self.driver:
+                    if not driver:
                         raise Exception("Driver is None after initialization")
                     
                     # Check window handles multiple times to ensure stability
@@ -373,13 +381,13 @@ class BaseScraper(ABC):
                     window_stable = False
                     for attempt in range(window_check_attempts):
                         try:
-                            handles = self.driver.window_handles
+                            handles = driver.window_handles
                             if handles:
                                 window_stable = True
                                 break
                         except Exception as check_error:
                             if attempt < window_check_attempts - 1:
-                                time.sleep(0.5)  # Wait before retry
+                                clock.sleep(0.5)  # Wait before retry
                                 continue
                             else:
                                 raise Exception(f"No window handles available after initialization: {str(check_error)}")
@@ -388,6 +396,7 @@ class BaseScraper(ABC):
                         raise Exception("Window is not stable after initialization")
                     
                     driver_initialized = True
+                    get_driver_env().record_driver(driver, chrome_version)
                     self.logger.info(f"Browser initialized successfully for {self.site_name}")
                     
                 except (urllib.error.URLError, TimeoutError, OSError, Exception) as e:
@@ -396,6 +405,7 @@ class BaseScraper(ABC):
                     # Check if it's a version mismatch error
                     if 'version' in error_msg and ('chromedriver' in error_msg or 'chrome version' in error_msg):
                         self.logger.warning(f"ChromeDriver version mismatch detected: {str(e)}")
+                        get_driver_env().forget_driver()
                         
                         retry_count += 1
                         if retry_count < max_retries:
@@ -404,19 +414,19 @@ class BaseScraper(ABC):
                                 self.logger.info(f"Local ChromeDriver version mismatch, retrying with auto-download (attempt {retry_count}/{max_retries})...")
                                 driver_executable_path = None  # Force auto-download
                                 chrome_version = None  # Let undetected_chromedriver auto-detect
-                                time.sleep(2)
+                                clock.sleep(2)
                                 continue
                             # Strategy 2: If we specified a version and it failed, try auto-detection instead
                             elif chrome_version is not None:
                                 self.logger.info(f"Retrying with auto-detection (attempt {retry_count}/{max_retries})...")
                                 chrome_version = None  # Let undetected_chromedriver auto-detect
-                                time.sleep(2)
+                                clock.sleep(2)
                                 continue
                             # Strategy 3: Try without any version specification
                             else:
                                 self.logger.info(f"Retrying without version specification (attempt {retry_count}/{max_retries})...")
                                 chrome_version = None
-                                time.sleep(2)
+                                clock.sleep(2)
                                 continue
                         else:
                             self.logger.error(f"Failed to initialize ChromeDriver after version mismatch retries: {str(e)}")
@@ -431,13 +441,13 @@ class BaseScraper(ABC):
                             self.logger.warning(f"Network/window error during initialization (attempt {retry_count}/{max_retries}): {str(e)}")
                             # Clean up any partial driver instance
                             try:
-                                if self.driver:
-                                    self.driver.quit()
-                                    self.driver = None
+                                if driver:
+                                    driver.quit()
+                                    driver = None
                             except:
                                 pass
                             self.logger.info("Retrying with fresh ChromeOptions...")
-                            time.sleep(2)  # Brief wait before retry
+                            clock.sleep(2)  # Brief wait before retry
                             continue
                         else:
                             self.logger.error(f"Failed to initialize ChromeDriver after {retry_count} attempts: {str(e)}")
@@ -451,13 +461,13 @@ class BaseScraper(ABC):
                             self.logger.warning(f"ChromeOptions reuse error (attempt {retry_count}/{max_retries}): {str(e)}")
                             # Clean up any partial driver instance
                             try:
-                                if self.driver:
-                                    self.driver.quit()
-                                    self.driver = None
+                                if driver:
+                                    driver.quit()
+                                    driver = None
                             except:
                                 pass
                             self.logger.info("Retrying with fresh ChromeOptions...")
-                            time.sleep(2)  # Brief wait before retry
+                            clock.sleep(2)  # Brief wait before retry
                             continue
                         else:
                             self.logger.error(f"Failed to initialize ChromeDriver after {retry_count} attempts: {str(e)}")
@@ -468,13 +478,13 @@ class BaseScraper(ABC):
                         raise
             
             # Verify driver is still valid before proceeding
-            if not self.driver:
+            if not driver:
                 raise Exception("Driver initialization failed - driver is None")
             
             # Check if window is still open
             try:
                 # Try to get window handles to verify window is open
-                window_handles = self.driver.window_handles
+                window_handles = driver.window_handles
                 if not window_handles:
                     raise Exception("No window handles found - window may have closed")
             except Exception as window_check_error:
@@ -482,15 +492,14 @@ class BaseScraper(ABC):
                 raise Exception(f"Browser window is not available: {str(window_check_error)}")
             
             # Small delay to ensure window is fully ready
-            time.sleep(0.5)
+            clock.sleep(0.5)
             
             # Set timeouts - increased to allow undetected_chromedriver to handle Cloudflare
             # undetected_chromedriver needs more time to automatically bypass Cloudflare challenges
             try:
-                self.page_load_timeout = 60  # Increased from 30 to 60 seconds for Cloudflare bypass
-                self.driver.set_page_load_timeout(60)  # Increased to allow Cloudflare challenge completion
-                self.driver.implicitly_wait(5)  # Increased from 2 to 5 seconds for element finding
-                self.driver.set_script_timeout(30)  # Increased from 10 to 30 seconds for JavaScript execution (Cloudflare uses JS)
+                driver.set_page_load_timeout(page_load_timeout)  # Long enough for Cloudflare challenge completion
+                driver.implicitly_wait(5)  # Increased from 2 to 5 seconds for element finding
+                driver.set_script_timeout(30)  # Increased from 10 to 30 seconds for JavaScript execution (Cloudflare uses JS)
             except Exception as timeout_error:
                 self.logger.warning(f"Error setting timeouts (may be non-critical): {str(timeout_error)}")
                 # Continue anyway - timeouts might already be set
@@ -499,51 +508,8 @@ class BaseScraper(ABC):
             # Wrap in try-except to handle cases where window closes during execution
             try:
                 # Verify window is still open before executing CDP command
-                if self.driver and self.driver.window_handles:
-                    self.driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
-                        'source': '''
-                            // Remove webdriver property
-                            Object.defineProperty(navigator, 'webdriver', {
-                                get: () => undefined
-                            });
-                            
-                            // Fake plugins
-                            Object.defineProperty(navigator, 'plugins', {
-                                get: () => [1, 2, 3, 4, 5]
-                            });
-                            
-                            // Set languages
-                            Object.defineProperty(navigator, 'languages', {
-                                get: () => ['en-US', 'en']
-                            });
-                            
-                            // Add chrome object
-                            window.chrome = {
-                                runtime: {},
-                                loadTimes: function() {},
-                                csi: function() {},
-                                app: {}
-                            };
-                            
-                            // Override permissions
-                            const originalQuery = window.navigator.permissions.query;
-                            window.navigator.permissions.query = (parameters) => (
-                                parameters.name === 'notifications' ?
-                                    Promise.resolve({ state: Notification.permission }) :
-                                    originalQuery(parameters)
-                            );
-                            
-                            // Override getBattery
-                            if (navigator.getBattery) {
-                                navigator.getBattery = () => Promise.resolve({
-                                    charging: true,
-                                    chargingTime: 0,
-                                    dischargingTime: Infinity,
-                                    level: 1
-                                });
-                            }
-                        '''
-                    })
+                if driver and driver.window_handles:
+                    driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': ANTI_DETECTION_SCRIPT})
                 else:
                     self.logger.warning("Window closed before CDP command execution - skipping anti-detection scripts")
             except Exception as cdp_error:
@@ -564,8 +530,14 @@ class BaseScraper(ABC):
             # Note: undetected_chromedriver handles most stealth features automatically
             
             self.logger.info(f"Undetected ChromeDriver initialized with anti-detection measures for {self.site_name}")
+            return driver
         except Exception as e:
             self.logger.error(f"Error setting up ChromeDriver: {str(e)}")
+            if driver:
+                try:
+                    driver.quit()
+                except Exception:
+                    pass
             raise
     
     def simulate_human_behavior(self):
@@ -579,12 +551,12 @@ class BaseScraper(ABC):
             # Random scroll to simulate reading
             scroll_amount = random.randint(200, 400)
             self.driver.execute_script(f"window.scrollBy(0, {scroll_amount});")
-            time.sleep(random.uniform(0.5, 1.5))  # Increased to 0.5-1.5s for more human-like timing
+            self.polite_sleep(0.5, 1.5)  # Increased to 0.5-1.5s for more human-like timing
             
             # Random scroll back up a bit (like humans do)
             scroll_back = random.randint(50, 100)
             self.driver.execute_script(f"window.scrollBy(0, -{scroll_back});")
-            time.sleep(random.uniform(0.3, 0.8))  # Increased to 0.3-0.8s for more human-like timing
+            self.polite_sleep(0.3, 0.8)  # Increased to 0.3-0.8s for more human-like timing
             
             # Skip mouse movement for speed (optional, can be re-enabled if needed)
             # Mouse simulation removed for speed optimization
@@ -615,24 +587,7 @@ class BaseScraper(ABC):
         while attempt < max_reinit_attempts:
             self.logger.warning(f"Driver session invalid or missing, reinitializing (attempt {attempt + 1}/{max_reinit_attempts})...")
             try:
-                if self.driver:
-                    old_driver = self.driver  # Keep reference
-                    self.driver = None  # Clear reference FIRST
-                    try:
-                        old_driver.quit()
-                    except (OSError, AttributeError):
-                        # Handle already invalid - harmless
-                        pass
-                    except Exception:
-                        pass
-                    finally:
-                        # Explicitly delete the reference to help garbage collection
-                        try:
-                            del old_driver
-                        except:
-                            pass
-                
-                self.setup_selenium()
+                self._replace_driver()
                 self.logger.info("✓ Driver reinitialized successfully")
                 return True
                     
@@ -641,10 +596,137 @@ class BaseScraper(ABC):
                 if attempt >= max_reinit_attempts:
                     self.logger.error(f"Failed to reinitialize driver after {max_reinit_attempts} attempts: {str(e)}")
                     raise
-                time.sleep(2 * attempt)  # Progressive backoff
+                self.clock.sleep(2 * attempt)  # Progressive backoff
         
         return False
-    
+
+    def restart_driver(self, reason=''):
+        """
+        Quit the current driver and start a fresh one (e.g. when Chrome memory grows too large)
+
+        Args:
+            reason: Why the driver is restarted (logged)
+        """
+        self.logger.info(f"🔄 Restarting driver{f' ({reason})' if reason else ''}")
+        if self.phase_timer.tracer is not None:
+            self.phase_timer.tracer.instant('restart_driver', args={'reason': reason})
+        self._replace_driver()
+
+    def _replace_driver(self):
+        """
+        Quit the current driver and install a new one: a warm spare from the
+        browser pool when one is ready (cookies carried over, old driver quit in
+        the background), otherwise a cold setup_selenium()
+        """
+        old_driver = self.driver
+        self.driver = None  # Clear reference FIRST
+        self._snapshot = None
+        # Session and Cloudflare clearance cookies survive the swap
+        cookies = export_cookies(old_driver)
+        spare = self.browser_pool.acquire() if self.browser_pool else None
+
+        if spare is not None:
+            self.browser_pool.retire(old_driver)
+            self.driver = spare
+            self._adopt_driver_timeouts()
+            self.logger.info(f"Swapped in warm driver from browser pool ({import_cookies(spare, cookies)} cookies carried over)")
+        else:
+            if old_driver:
+                try:
+                    old_driver.quit()
+                except Exception:
+                    # Handle already invalid - harmless
+                    pass
+                del old_driver
+            self.setup_selenium()
+            if cookies:
+                self.logger.info(f"{import_cookies(self.driver, cookies)} cookies carried over to the new driver")
+        self.health_status['driver_restarts'] += 1
+        if self.recycle_policy is not None:
+            self.recycle_policy.reset()
+        if self.resource_blocker is not None:
+            self.resource_blocker.reset()
+        if self.tab_pipeline is not None:
+            self.tab_pipeline.reset()
+
+    def enable_browser_pool(self, size=1):
+        """
+        Keep `size` spare drivers warm in the background so ensure_driver() and
+        restart_driver() swap instead of cold-starting Chrome
+
+        Args:
+            size: Number of spare drivers (each is a full Chrome instance)
+        """
+        if self.browser_pool is None and size > 0:
+            factory = functools.partial(self._start_driver, page_load_timeout=self.driver_page_load_timeout)
+            self.browser_pool = BrowserPool(factory, size=size, name=self.site_name).start()
+        return self.browser_pool
+
+    def enable_tab_pipeline(self, depth=2, host_interval=None):
+        """
+        Preload queued URLs in up to `depth` background tabs of the same Chrome
+        (queue them with self.tab_pipeline.extend(urls)); driver_get() then
+        switches to the preloaded tab instead of loading the page
+
+        Args:
+            depth: Prefetch tabs kept open besides the current one
+            host_interval: Minimum seconds between page loads on one host (foreground and prefetch)
+        """
+        if host_interval and self.rate_limiter is None:
+            self.rate_limiter = HostRateLimiter(host_interval, clock=self.clock)
+        if self.tab_pipeline is None and depth > 0:
+            self.tab_pipeline = TabPipeline(depth, rate_limiter=self.rate_limiter, prepare_tab=self._prepare_tab,
+                                            clock=self.clock, load_timeout=self.page_load_timeout)
+        return self.tab_pipeline
+
+    def refill_tab_pipeline(self):
+        """
+        Top the prefetch tabs up, waiting for the host's next slot first if
+        one is missing (call between products: the load that just finished
+        took the slot, so the fill after driver_get() rarely opens a tab)
+
+        Returns:
+            int: Tabs opened
+        """
+        pipeline = self.tab_pipeline
+        if pipeline is None or not self.driver:
+            return 0
+        delay = pipeline.next_slot_delay()
+        if delay is None:
+            return 0
+        if delay > 0:
+            with self.phase_timer.span('host_rate_limit'):
+                self.clock.sleep(delay, reason='host_rate_limit')
+        return pipeline.fill(self.driver)
+
+    def _prepare_tab(self, driver):
+        """Set up a new prefetch tab before it navigates (CDP scripts and blocking are per tab)"""
+        try:
+            driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': ANTI_DETECTION_SCRIPT})
+        except Exception as e:
+            self.logger.debug(f"Error injecting anti-detection script into tab: {str(e)}")
+        if self.resource_blocker is not None:
+            self.resource_blocker.block_tab(driver)
+
+    def maybe_recycle_driver(self):
+        """
+        Replace the driver proactively if the recycle policy says it is due
+        (call between products, never mid-scrape)
+
+        Returns:
+            str: The recycle reason, or None if the driver was kept
+        """
+        if self.recycle_policy is None or not self.driver:
+            return None
+        reason = self.recycle_policy.check(self.driver)
+        if reason:
+            self.recycle_policy.recycled(reason)
+            try:
+                self.restart_driver(reason=f"recycle policy: {reason}")
+            except Exception as e:
+                self.logger.error(f"Error recycling driver: {str(e)}")
+        return reason
+
     def safe_driver_get(self, property_name, default=None):
         """Safely get a driver property, handling invalid session errors"""
         try:
@@ -655,7 +737,7 @@ class BaseScraper(ABC):
             elif property_name == 'title':
                 return self.driver.title
             elif property_name == 'page_source':
-                return self.driver.page_source
+                return self.page_snapshot().html
             else:
                 return getattr(self.driver, property_name, default)
         except Exception as e:
@@ -668,7 +750,7 @@ class BaseScraper(ABC):
                     elif property_name == 'title':
                         return self.driver.title
                     elif property_name == 'page_source':
-                        return self.driver.page_source
+                        return self.page_snapshot().html
                     else:
                         return getattr(self.driver, property_name, default)
                 except:
@@ -676,129 +758,143 @@ class BaseScraper(ABC):
             else:
                 return default
     
+    def driver_get(self, url):
+        """
+        Navigate the driver to url (timed as the 'driver_get' phase)
+
+        With a tab pipeline, a URL preloaded in a background tab is served by
+        switching to that tab, and after a queued (product) URL the next queued
+        URLs start loading before this returns; category, search and retry
+        loads leave the prefetch tabs alone. With a rate limiter, loads wait for
+        the host's next slot.
+        """
+        self._snapshot = None
+        pipeline = self.tab_pipeline
+        queued = pipeline is not None and pipeline.is_queued(url)
+        try:
+            if pipeline is not None:
+                with self.phase_timer.span('driver_get'):
+                    if pipeline.take(self.driver, url):
+                        # Later navigations happen in this tab: make sure it blocks too
+                        if self.resource_blocker is not None:
+                            self.resource_blocker.block_tab(self.driver)
+                        # The page loaded in its tab: the recycle policy still counts it
+                        if self.recycle_policy is not None:
+                            self.recycle_policy.record_page(pipeline.last_load_seconds)
+                        return None
+            if self.rate_limiter is not None:
+                with self.phase_timer.span('host_rate_limit'):
+                    self.rate_limiter.acquire(url)
+            with self.phase_timer.span('driver_get'):
+                start = time.perf_counter()
+                try:
+                    return self.driver.get(url)
+                finally:
+                    if self.recycle_policy is not None:
+                        self.recycle_policy.record_page(time.perf_counter() - start)
+        finally:
+            if queued:
+                pipeline.fill(self.driver)
+    
+    def page_snapshot(self, refresh=False):
+        """
+        Snapshot of the current page (url, readyState, HTML)
+
+        The HTML is only transferred again when the page changed since the last
+        snapshot (navigation or a DOM mutation); otherwise the cached snapshot,
+        with its already parsed views, is returned after a cheap state check.
+        New transfers are timed as the 'page_source' phase.
+
+        Args:
+            refresh: Capture a new snapshot without checking the cached one
+
+        Returns:
+            PageSnapshot
+        """
+        if self._snapshot is not None and not refresh:
+            with self.phase_timer.span('snapshot_check'):
+                state = PageSnapshot.read_state(self.driver)
+            if self._snapshot.matches(state):
+                return self._snapshot
+        with self.phase_timer.span('page_source'):
+            self._snapshot = PageSnapshot.capture(self.driver)
+        return self._snapshot
+    
+    def get_page_source(self):
+        """Get the current page HTML (from the page snapshot - see page_snapshot())"""
+        return self.page_snapshot().html
+    
+    def make_soup(self, markup, features='lxml'):
+        """
+        Build a BeautifulSoup tree (timed as the 'soup' phase)
+
+        A PageSnapshot, or the HTML string of the current snapshot, is parsed
+        once and the cached tree is returned on later calls.
+        """
+        snapshot = markup if isinstance(markup, PageSnapshot) else self._snapshot
+        if snapshot is not None and (markup is snapshot or markup is snapshot.html):
+            return snapshot.soup(features, timer=self.phase_timer)
+        with self.phase_timer.span('soup'):
+            return BeautifulSoup(markup, features)
+    
+    def polite_sleep(self, min_seconds, max_seconds=None, phase='politeness_sleep'):
+        """Sleep for a (random) politeness delay, timed as the given phase"""
+        import random
+        delay = min_seconds if max_seconds is None else random.uniform(min_seconds, max_seconds)
+        with self.phase_timer.span(phase):
+            self.clock.sleep(delay, reason=phase)
+        return delay
+    
+    def probe_cloudflare(self):
+        """
+        Probe the current page for Cloudflare challenge signals in one script call
+        (see scrapers/cloudflare_detector.py)
+
+        Returns:
+            dict: {url, html_length, challenge_markers, visible_challenge_form, ...} or None
+        """
+        if not self.driver:
+            return None
+        return probe_driver(self.driver)
+    
+    @timed_phase('cloudflare_check')
     def has_cloudflare_challenge(self):
         """
         Check if the current page has a Cloudflare challenge - STRICT DETECTION
         
         Only returns True if we're ACTUALLY on a Cloudflare challenge page.
         Many sites use Cloudflare CDN but don't show challenges - this avoids false positives.
+        One injected script gathers URL, page size, challenge text and visible
+        challenge elements, instead of a WebDriver round trip per check.
         """
         try:
-            if not self.driver:
-                return False
-            
-            try:
-                current_url = self.driver.current_url.lower()
-                
-                # PRIMARY CHECK: URL-based (MOST RELIABLE - only this is definitive)
-                # If we're on challenges.cloudflare.com or /cdn-cgi/challenge, definitely a challenge
-                if 'challenges.cloudflare.com' in current_url or '/cdn-cgi/challenge' in current_url:
-                    return True
-                
-                # SECONDARY CHECK: Only check for challenge if page is SMALL (<5KB)
-                # Challenge pages are typically very small, normal pages are much larger
-                page_source = self.driver.page_source
-                
-                # If page has substantial content (>5KB), it's NOT a challenge page
-                # Even if Cloudflare is mentioned (which is common in CDN links)
-                if len(page_source) > 5000:
-                    return False  # Definitely not a challenge page
-                
-                # Only check for challenge indicators if page is small (<5KB)
-                # This is the only case where we might have a challenge
-                page_lower = page_source.lower()
-                
-                # STRICT indicators - only these mean actual challenge page
-                strict_challenge_indicators = [
-                    "just a moment",  # Must be exact match
-                    "checking your browser",  # Must be exact match
-                    "verifying you are human",  # New indicator from image
-                    "review the security of your connection",  # New indicator from image
-                    "verifying...",  # Loading state indicator
-                    "this may take a few seconds",  # Time indicator
-                ]
-                
-                # Check for strict indicators
-                has_strict_indicator = False
-                for indicator in strict_challenge_indicators:
-                    if indicator in page_lower:
-                        has_strict_indicator = True
-                        break
-                
-                # Only return True if BOTH conditions: small page AND strict indicator
-                if has_strict_indicator and len(page_source) < 5000:
-                    # Additional verification: Check for challenge-specific DOM elements
-                    try:
-                        from selenium.webdriver.common.by import By
-                        # Look for actual challenge form elements
-                        challenge_form = self.driver.find_elements(By.CSS_SELECTOR, "#challenge-form, form[action*='challenge']")
-                        if challenge_form:
-                            for form in challenge_form:
-                                try:
-                                    if form.is_displayed():
-                                        return True  # Found visible challenge form
-                                except:
-                                    continue
-                    except:
-                        pass
-                    
-                    # If we have strict indicator but no form, still might be challenge
-                    # But be more cautious - only return True if page is very small (<2KB)
-                    if len(page_source) < 2000:
-                        return True
-                
-                # TERTIARY CHECK: Check for challenge-specific visible elements (only if page is small)
-                if len(page_source) < 5000:
-                    try:
-                        from selenium.webdriver.common.by import By
-                        # Check for multiple Cloudflare challenge selectors
-                        challenge_selectors = [
-                            ".cf-browser-verification",
-                            ".challenge-container",
-                            "#challenge-form",
-                            "form[action*='challenge']",
-                            "[data-ray]",
-                            ".cf-im-under-attack",
-                            ".cf-wrapper",
-                            "div:contains('Verifying')",
-                            "div:contains('verifying')"
-                        ]
-                        
-                        for selector in challenge_selectors:
-                            try:
-                                challenge_elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                                if challenge_elements:
-                                    # Check if any are visible AND page is small
-                                    for elem in challenge_elements:
-                                        try:
-                                            if elem.is_displayed() and len(page_source) < 3000:
-                                                return True
-                                        except:
-                                            continue
-                            except:
-                                continue
-                        
-                        # Also check for text content that indicates verification
-                        try:
-                            page_text = self.driver.find_element(By.TAG_NAME, "body").text.lower()
-                            if any(indicator in page_text for indicator in ["verifying", "review the security", "this may take"]):
-                                if len(page_source) < 5000:
-                                    return True
-                        except:
-                            pass
-                    except:
-                        pass
-                
-                # If we get here, no challenge detected
-                return False
-                
-            except Exception:
-                # If we can't check, assume no challenge to avoid false positives
-                return False
-            
+            # If we can't check, assume no challenge to avoid false positives
+            challenge = is_challenge(self.probe_cloudflare())
         except Exception as e:
             self.logger.debug(f"Error checking for Cloudflare: {str(e)}")
             return False
+        self.update_resource_blocking(challenge)
+        return challenge
+    
+    def update_resource_blocking(self, challenge=False):
+        """
+        Apply the site's resource blocking once the page is past Cloudflare, and
+        lift it while a challenge is shown (challenge pages load everything)
+
+        Args:
+            challenge: True if the current page is a Cloudflare challenge
+        """
+        blocker = self.resource_blocker
+        if blocker is None or not self.driver:
+            return
+        if challenge:
+            if blocker.is_active(self.driver) or blocker.is_enabled(self.driver):
+                blocker.lift(self.driver)
+                self.logger.info("Resource blocking lifted while the Cloudflare challenge is solved")
+        elif not blocker.is_active(self.driver):
+            enabled = blocker.is_enabled(self.driver)
+            if blocker.apply(self.driver) and not enabled:
+                self.logger.info(f"Resource blocking on (profile '{blocker.profile}', {len(blocker.patterns)} patterns)")
     
     def wait_for_cloudflare(self, timeout=30, target_url=None, max_retries=1):
         """
@@ -818,7 +914,7 @@ class BaseScraper(ABC):
             return False
         
         self.logger.info(f"⏳ Cloudflare challenge detected - waiting up to {timeout}s per attempt (max {max_retries + 1} attempts)...")
-        start_time = time.time()
+        start_time = self.clock.time()
         check_interval = 2.0  # Check every 2 seconds (more human-like)
         retry_count = 0
         import random
@@ -827,7 +923,7 @@ class BaseScraper(ABC):
         # For "Verifying you are human" challenges, they can take longer
         initial_wait = random.uniform(5, 8)  # Increased from 3-5s to 5-8s
         self.logger.info(f"⏳ Initial wait: {initial_wait:.1f}s for Cloudflare to start...")
-        time.sleep(initial_wait)
+        self.clock.sleep(initial_wait)
         
         # Simulate human behavior during initial wait
         try:
@@ -835,131 +931,67 @@ class BaseScraper(ABC):
         except:
             pass
         
+        was_verifying = False
         while retry_count <= max_retries:
-            attempt_start = time.time()
+            attempt_start = self.clock.time()
             
-            while time.time() - attempt_start < timeout:
+            while self.clock.time() - attempt_start < timeout:
                 try:
                     # Simulate human behavior while waiting (helps bypass detection)
                     if random.random() < 0.4:  # 40% chance to simulate activity (increased from 30%)
                         try:
                             # Small random scroll
                             self.driver.execute_script(f"window.scrollBy(0, {random.randint(10, 50)});")
-                            time.sleep(random.uniform(0.3, 0.8))
+                            self.clock.sleep(random.uniform(0.3, 0.8))
                         except:
                             pass
                     
-                    # Check for "Verifying..." element disappearing (specific to this challenge type)
-                    try:
-                        from selenium.webdriver.common.by import By
-                        verifying_elements = self.driver.find_elements(By.XPATH, 
-                            "//*[contains(text(), 'Verifying') or contains(text(), 'verifying')]")
-                        if verifying_elements:
-                            # Check if any are still visible
-                            still_verifying = False
-                            for elem in verifying_elements:
-                                try:
-                                    if elem.is_displayed():
-                                        still_verifying = True
-                                        break
-                                except:
-                                    continue
-                            
-                            # If "Verifying..." is gone, challenge might be complete
-                            if not still_verifying:
-                                self.logger.info("✓ 'Verifying...' element disappeared - challenge may be complete")
-                                time.sleep(2)  # Wait a bit more for page to load
-                    except:
-                        pass
-                    
-                    # Check page source and URL
-                    page_source = self.driver.page_source
-                    current_url = self.driver.current_url.lower()
+                    # One probe per check: URL, page size, challenge text and visible
+                    # challenge elements / "Verifying..." text in a single script call
+                    probe = self.probe_cloudflare()
+                    verifying = bool(probe) and 'verifying' in probe.get('verifying_text', [])
+                    if was_verifying and probe and not verifying:
+                        # "Verifying..." is gone (specific to this challenge type), challenge may be complete
+                        self.logger.info("✓ 'Verifying...' element disappeared - challenge may be complete")
+                        self.clock.sleep(2)  # Wait a bit more for page to load
+                        probe = self.probe_cloudflare()
+                    was_verifying = verifying
+                    current_url = probe.get('url', '').lower() if probe else ''
                     
-                    # Check if we're still on Cloudflare challenge URL
-                    if 'challenges.cloudflare.com' in current_url or '/cdn-cgi/challenge' in current_url:
-                        # Still on challenge page, continue waiting
-                        pass
-                    else:
-                        # Not on challenge URL - check if challenge indicators are gone
-                        page_preview = page_source[:10000].lower()  # Check more content (increased from 5000)
-                        has_challenge_text = (
-                            "just a moment" in page_preview or 
-                            "checking your browser" in page_preview or
-                            "verifying you are human" in page_preview or
-                            "review the security of your connection" in page_preview or
-                            "verifying..." in page_preview or
-                            "this may take a few seconds" in page_preview or
-                            "ddos protection" in page_preview or
-                            "ray id" in page_preview or
-                            "cf-browser-verification" in page_preview
-                        )
-                        
-                        # Also check for challenge elements in DOM
-                        try:
-                            from selenium.webdriver.common.by import By
-                            challenge_elements = self.driver.find_elements(By.CSS_SELECTOR, 
-                                ".cf-browser-verification, .challenge-container, #challenge-form, [data-ray]")
-                            if challenge_elements:
-                                for elem in challenge_elements:
-                                    try:
-                                        if elem.is_displayed():
-                                            has_challenge_text = True
-                                            break
-                                    except:
-                                        continue
-                        except:
-                            pass
-                        
-                        # Enhanced check: If no challenge text AND we have substantial content, we're good
-                        # Also check that "Verifying..." elements are gone
-                        verifying_gone = True
-                        try:
-                            from selenium.webdriver.common.by import By
-                            verifying_elements_check = self.driver.find_elements(By.XPATH, 
-                                "//*[contains(text(), 'Verifying') or contains(text(), 'verifying')]")
-                            for elem in verifying_elements_check:
+                    # Not on challenge URL, challenge indicators gone and substantial content
+                    if challenge_cleared(probe):
+                        # Domain check if target URL provided
+                        on_target = True
+                        if target_url:
+                            try:
+                                target_domain = urlparse(target_url).netloc.split(':')[0].lower().replace('www.', '')
+                                current_domain = urlparse(current_url if '//' in current_url else 'http://' + current_url).netloc.split(':')[0].lower().replace('www.', '')
+                                on_target = target_domain == current_domain or target_domain in current_domain
+                            except:
+                                # Simple fallback check
                                 try:
-                                    if elem.is_displayed():
-                                        verifying_gone = False
-                                        break
+                                    target_domain = target_url.split('//')[1].split('/')[0].split(':')[0].lower().replace('www.', '')
+                                    on_target = target_domain in current_url.replace('www.', '')
                                 except:
-                                    continue
-                        except:
-                            pass
+                                    on_target = True  # If we can't parse, assume we're on target
                         
-                        if not has_challenge_text and len(page_source) > 8000 and verifying_gone:  # Increased threshold
-                            # Domain check if target URL provided
-                            on_target = True
-                            if target_url:
-                                try:
-                                    target_domain = urlparse(target_url).netloc.split(':')[0].lower().replace('www.', '')
-                                    current_domain = urlparse(current_url if '//' in current_url else 'http://' + current_url).netloc.split(':')[0].lower().replace('www.', '')
-                                    on_target = target_domain == current_domain or target_domain in current_domain
-                                except:
-                                    # Simple fallback check
-                                    try:
-                                        target_domain = target_url.split('//')[1].split('/')[0].split(':')[0].lower().replace('www.', '')
-                                        on_target = target_domain in current_url.replace('www.', '')
-                                    except:
-                                        on_target = True  # If we can't parse, assume we're on target
-                            
-                            if on_target:
-                                elapsed = time.time() - start_time
-                                self.logger.info(f"✅ Cloudflare bypassed successfully! (took {elapsed:.1f}s)")
-                                # Additional wait for page to fully stabilize
-                                time.sleep(random.uniform(2, 3))  # Increased from 1-2s to 2-3s
-                                return True
-                    
+                        if on_target:
+                            elapsed = self.clock.time() - start_time
+                            self.logger.info(f"✅ Cloudflare bypassed successfully! (took {elapsed:.1f}s)")
+                            # Additional wait for page to fully stabilize
+                            self.clock.sleep(random.uniform(2, 3))  # Increased from 1-2s to 2-3s
+                            self.update_resource_blocking()
+                            return True
+                
                     # Wait before next check (with some randomness)
-                    time.sleep(check_interval + random.uniform(-0.3, 0.3))
+                    self.clock.sleep(check_interval + random.uniform(-0.3, 0.3))
                     
                 except Exception as e:
                     self.logger.debug(f"Error while waiting for Cloudflare: {str(e)}")
-                    time.sleep(check_interval)
+                    self.clock.sleep(check_interval)
             
             # Timeout reached for this attempt
-            elapsed = time.time() - attempt_start
+            elapsed = self.clock.time() - attempt_start
             retry_count += 1
             
             if retry_count <= max_retries:
@@ -970,62 +1002,42 @@ class BaseScraper(ABC):
                     if target_url:
                         self.logger.info(f"🔄 Retrying: Navigating to {target_url}...")
                         # Try navigating to target URL again (sometimes works better than refresh)
-                        self.driver.get(target_url)
-                        time.sleep(random.uniform(3, 5))  # Wait after navigation
+                        self.driver_get(target_url)
+                        self.clock.sleep(random.uniform(3, 5))  # Wait after navigation
                         
                         # Simulate human behavior
                         self.simulate_human_behavior()
-                        time.sleep(random.uniform(1, 2))
+                        self.clock.sleep(random.uniform(1, 2))
                     else:
                         self.logger.info("🔄 Refreshing page...")
                         self.driver.refresh()
-                        time.sleep(random.uniform(3, 5))
+                        self.clock.sleep(random.uniform(3, 5))
                 except Exception as retry_error:
                     self.logger.debug(f"Retry navigation error: {str(retry_error)}")
                     # Fallback to refresh
                     try:
                         self.driver.refresh()
-                        time.sleep(random.uniform(3, 5))
+                        self.clock.sleep(random.uniform(3, 5))
                     except:
                         pass
             else:
                 # All retries exhausted - final comprehensive check
-                total_elapsed = time.time() - start_time
+                total_elapsed = self.clock.time() - start_time
                 try:
-                    page_source_final = self.driver.page_source
-                    current_url_final = self.driver.current_url.lower()
+                    probe_final = self.probe_cloudflare()
                     
                     # Comprehensive final check - include all challenge indicators
-                    page_preview_final = page_source_final[:10000].lower()  # Check more content
                     has_challenge_final = (
-                        'challenges.cloudflare.com' in current_url_final or
-                        "just a moment" in page_preview_final or
-                        "checking your browser" in page_preview_final or
-                        "verifying you are human" in page_preview_final or
-                        "review the security of your connection" in page_preview_final or
-                        "verifying..." in page_preview_final or
-                        "this may take a few seconds" in page_preview_final
+                        not probe_final or
+                        on_challenge_url(probe_final) or
+                        any(marker in STRICT_CHALLENGE_MARKERS for marker in probe_final.get('challenge_markers', [])) or
+                        probe_final.get('visible_challenge_element')
                     )
                     
-                    # Also check for challenge elements in DOM
-                    try:
-                        from selenium.webdriver.common.by import By
-                        challenge_elements_final = self.driver.find_elements(By.CSS_SELECTOR, 
-                            ".cf-browser-verification, .challenge-container, #challenge-form, [data-ray]")
-                        if challenge_elements_final:
-                            for elem in challenge_elements_final:
-                                try:
-                                    if elem.is_displayed():
-                                        has_challenge_final = True
-                                        break
-                                except:
-                                    continue
-                    except:
-                        pass
-                    
                     # If page has substantial content and no challenge indicators, consider accessible
-                    if len(page_source_final) > 8000 and not has_challenge_final:
+                    if not has_challenge_final and probe_final.get('html_length', 0) > 8000:
                         self.logger.info(f"✅ Page accessible (final check) - continuing... (took {total_elapsed:.1f}s)")
+                        self.update_resource_blocking()
                         return True
                 except:
                     pass
@@ -1050,7 +1062,7 @@ class BaseScraper(ABC):
                     
                     try:
                         # Load page with timeout protection (30s timeout set in setup_selenium, optimized for speed)
-                        self.driver.get(url)
+                        self.driver_get(url)
                         
                         # Quick error check - only for critical connection errors
                         current_url = self.driver.current_url.lower()
@@ -1059,29 +1071,19 @@ class BaseScraper(ABC):
                         
                         # Wait for page to start loading (increased for more human-like behavior)
                         import random
-                        time.sleep(random.uniform(0.5, 1.5))  # Increased delay before accessing page_source
-                        
-                        # Quick Cloudflare check - only if on challenge URL or page is very small
-                        current_url_check = current_url
-                        page_preview = self.driver.page_source[:6000]
+                        self.polite_sleep(0.5, 1.5)  # Increased delay before accessing page_source
                         
                         # undetected_chromedriver handles Cloudflare automatically
                         # Wait a bit longer to let it complete the challenge
-                        time.sleep(random.uniform(2, 4))  # Initial wait for page to start loading
-                        
-                        # Check if we're on a Cloudflare challenge page
-                        current_url_after_wait = self.driver.current_url.lower()
-                        page_preview_after_wait = self.driver.page_source[:10000] if len(self.driver.page_source) > 10000 else self.driver.page_source
+                        self.polite_sleep(2, 4)  # Initial wait for page to start loading
                         
-                        # Only check for Cloudflare if we're definitely on a challenge page
-                        is_challenge_page = (
-                            'challenges.cloudflare.com' in current_url_after_wait or 
-                            '/cdn-cgi/challenge' in current_url_after_wait or
-                            (len(page_preview_after_wait) < 5000 and self.has_cloudflare_challenge())
-                        )
+                        # Check if we're on a Cloudflare challenge page (challenge URL, or small
+                        # page with challenge markers) - one script call, no page_source transfer
+                        is_challenge_page = self.has_cloudflare_challenge()
                         
                         if is_challenge_page:
                             self.logger.info("🛡️ Cloudflare challenge detected - waiting for undetected_chromedriver to handle it...")
+                            cloudflare_wait_start = time.perf_counter()
                             
                             # undetected_chromedriver should handle this automatically, but we need to wait
                             # Give it plenty of time (up to 60 seconds total)
@@ -1090,55 +1092,42 @@ class BaseScraper(ABC):
                             check_interval = 3
                             
                             while waited < max_wait_time:
-                                time.sleep(check_interval)
+                                self.clock.sleep(check_interval)
                                 waited += check_interval
                                 
                                 # Check current state
-                                current_url_check = self.driver.current_url.lower()
-                                page_source_check = self.driver.page_source
-                                page_preview_check = page_source_check[:10000].lower() if len(page_source_check) > 10000 else page_source_check.lower()
+                                with self.phase_timer.span('cloudflare_check'):
+                                    probe = self.probe_cloudflare()
                                 
                                 # Check if challenge is gone
-                                still_on_challenge = (
-                                    'challenges.cloudflare.com' in current_url_check or
-                                    '/cdn-cgi/challenge' in current_url_check or
-                                    "verifying you are human" in page_preview_check or
-                                    "review the security of your connection" in page_preview_check or
-                                    "verifying..." in page_preview_check or
-                                    (len(page_source_check) < 5000 and self.has_cloudflare_challenge())
-                                )
-                                
-                                if not still_on_challenge and len(page_source_check) > 8000:
+                                if not challenge_pending(probe) and probe.get('html_length', 0) > 8000:
                                     # Challenge passed!
                                     self.logger.info(f"✅ Cloudflare bypassed by undetected_chromedriver! (waited {waited}s)")
-                                    time.sleep(random.uniform(1, 2))  # Brief stabilization
+                                    self.polite_sleep(1, 2)  # Brief stabilization
                                     break
                                 
                                 if waited % 10 == 0:  # Log every 10 seconds
                                     self.logger.info(f"⏳ Still waiting for Cloudflare bypass... ({waited}s/{max_wait_time}s)")
                             
                             # Final check - if still on challenge, use manual bypass
-                            final_url = self.driver.current_url.lower()
-                            final_page = self.driver.page_source
-                            still_challenged = (
-                                'challenges.cloudflare.com' in final_url or
-                                '/cdn-cgi/challenge' in final_url or
-                                (len(final_page) < 5000 and self.has_cloudflare_challenge())
-                            )
+                            still_challenged = self.has_cloudflare_challenge()
                             
                             if still_challenged:
                                 self.logger.warning("⚠️ Cloudflare still present after wait - using manual bypass...")
                                 cloudflare_bypassed = self.wait_for_cloudflare(timeout=60, target_url=url, max_retries=2)
+                                self.phase_timer.record('cloudflare_wait', time.perf_counter() - cloudflare_wait_start)
                                 if not cloudflare_bypassed:
                                     retry_count += 1
                                     if retry_count < max_retries:
                                         delay = random.uniform(10, 15)
                                         self.logger.warning(f"Retrying page load in {delay:.1f}s...")
-                                        time.sleep(delay)
+                                        self.polite_sleep(delay, phase='retry_backoff')
                                         continue
                                     else:
+                                        self.phase_timer.set_outcome('cloudflare_blocked')
                                         return None
                             else:
+                                self.phase_timer.record('cloudflare_wait', time.perf_counter() - cloudflare_wait_start)
                                 self.logger.info("✓ Cloudflare bypassed successfully!")
                         else:
                             # Not on challenge page, continue normally
@@ -1147,17 +1136,17 @@ class BaseScraper(ABC):
                         # Wait time for page to stabilize (increased for more human-like behavior)
                         import random
                         if wait_time > 0:
-                            time.sleep(random.uniform(1.0, 2.0))  # Increased to 1-2s for more realistic timing
+                            self.polite_sleep(1.0, 2.0)  # Increased to 1-2s for more realistic timing
                         else:
-                            time.sleep(random.uniform(1.0, 2.0))  # Increased to 1-2s
+                            self.polite_sleep(1.0, 2.0)  # Increased to 1-2s
                         
                         # REMOVED: Second Cloudflare check after page load
                         # If page already loaded successfully with content, there's no Cloudflare challenge
                         # This was causing false positives and unnecessary delays
                         
                         # Add delay before accessing page_source (more human-like)
-                        time.sleep(random.uniform(0.5, 1.0))
-                        html = self.driver.page_source
+                        self.polite_sleep(0.5, 1.0)
+                        html = self.get_page_source()
                         
                         # Basic content check - only fail if completely empty
                         if not html or len(html) < 100:
@@ -1175,18 +1164,16 @@ class BaseScraper(ABC):
                         
                         # IMPORTANT: Check for Cloudflare when timeout occurs (Cloudflare might be causing the timeout)
                         try:
-                            current_url_check = self.driver.current_url.lower()
-                            page_preview = self.driver.page_source[:6000] if self.driver.page_source else ''
-                            
                             # Check if we're on Cloudflare challenge page
-                            if ('challenges.cloudflare.com' in current_url_check or '/cdn-cgi/challenge' in current_url_check or len(page_preview) < 5000) and self.has_cloudflare_challenge():
+                            if self.has_cloudflare_challenge():
                                 self.logger.info("🛡️ Cloudflare challenge detected during timeout - waiting for bypass...")
                                 # Increased timeout to 60s for "Verifying you are human" challenges
-                                cloudflare_bypassed = self.wait_for_cloudflare(timeout=60, target_url=url, max_retries=2)
+                                with self.phase_timer.span('cloudflare_wait'):
+                                    cloudflare_bypassed = self.wait_for_cloudflare(timeout=60, target_url=url, max_retries=2)
                                 if cloudflare_bypassed:
                                     # Cloudflare bypassed, now get the page content
-                                    time.sleep(random.uniform(1, 2))
-                                    html = self.driver.page_source
+                                    self.polite_sleep(1, 2)
+                                    html = self.get_page_source()
                                     if html and len(html) > 5000:
                                         self.health_status['successful_requests'] += 1
                                         self.health_status['consecutive_failures'] = 0
@@ -1210,12 +1197,12 @@ class BaseScraper(ABC):
                             content_ready = False
                             
                             while waited < wait_for_content:
-                                html = self.driver.page_source
+                                html = self.get_page_source()
                                 
                                 # Require substantial content (not just partial)
                                 if html and len(html) > 8000:  # Reduced from 10KB to 8KB for faster detection
                                     # Check if page seems complete
-                                    soup = BeautifulSoup(html, 'lxml')
+                                    soup = self.make_soup(html, 'lxml')
                                     has_body = soup.find('body')
                                     body_text = has_body.get_text(strip=True) if has_body else ''
                                     
@@ -1228,11 +1215,11 @@ class BaseScraper(ABC):
                                 if waited % 3 == 0:  # Log every 3s instead of 5s
                                     self.logger.info(f"Waiting for full content... ({waited}s/{wait_for_content}s)")
                                 
-                                time.sleep(0.5)  # Check every 0.5s instead of 1s for faster response
+                                self.clock.sleep(0.5)  # Check every 0.5s instead of 1s for faster response
                                 waited += 0.5
                             
                             if content_ready:
-                                html = self.driver.page_source
+                                html = self.get_page_source()
                                 self.page_load_timeout = original_timeout
                                 self.driver.set_page_load_timeout(original_timeout)
                                 return html
@@ -1250,12 +1237,13 @@ class BaseScraper(ABC):
                                 import random
                                 delay = random.uniform(wait_time[0], wait_time[1])
                                 self.logger.warning(f"Timeout error, retrying with longer timeout in {delay:.1f}s...")
-                                time.sleep(delay)
+                                self.polite_sleep(delay, phase='retry_backoff')
                                 retry_count += 1
                                 continue
                             else:
                                 self.health_status['consecutive_failures'] += 1
                                 self.health_status['last_failure_time'] = datetime.now()
+                                self.phase_timer.set_outcome('fetch_failed')
                                 return None
                             
                     except Exception as e:
@@ -1267,6 +1255,7 @@ class BaseScraper(ABC):
                             self.logger.error(f"Unrecoverable error: {error_msg}")
                             self.health_status['consecutive_failures'] += 1
                             self.health_status['last_failure_time'] = datetime.now()
+                            self.phase_timer.set_outcome('fetch_failed')
                             return None
                         
                         # Handle recovery actions
@@ -1286,20 +1275,30 @@ class BaseScraper(ABC):
                             delay = random.uniform(wait_time[0], wait_time[1])
                             error_msg = recovery.get('message', recovery.get('reason', 'Unknown error'))
                             self.logger.warning(f"{error_msg}, retrying in {delay:.1f}s...")
-                            time.sleep(delay)
+                            self.polite_sleep(delay, phase='retry_backoff')
                             retry_count += 1
                             continue
                         else:
                             self.health_status['consecutive_failures'] += 1
                             self.health_status['last_failure_time'] = datetime.now()
+                            self.phase_timer.set_outcome('fetch_failed')
                             self.logger.error(f"Failed after {max_retries} attempts: {recovery['message']}")
                             return None
                 else:
                     # Use requests for non-Selenium fetching
                     try:
-                        response = self.session.get(url, headers=self.headers, timeout=15)  # Optimized: reduced from 60 to 15 seconds
+                        with self.phase_timer.span('http_get'):
+                            response = self.session.get(url, headers=self.headers, timeout=15)  # Optimized: reduced from 60 to 15 seconds
                         response.raise_for_status()
                         
+                        # A challenge page served with 200 isn't content; retrying plain HTTP won't pass it
+                        if is_challenge(detect_challenge_html(response.text, response.url)):
+                            self.logger.warning(f"🛡️ Cloudflare challenge returned for {url} (HTTP fetch cannot solve it)")
+                            self.health_status['consecutive_failures'] += 1
+                            self.health_status['last_failure_time'] = datetime.now()
+                            self.phase_timer.set_outcome('cloudflare_blocked')
+                            return None
+                        
                         # Success
                         self.health_status['successful_requests'] += 1
                         self.health_status['consecutive_failures'] = 0
@@ -1314,12 +1313,13 @@ class BaseScraper(ABC):
                             import random
                             delay = random.uniform(wait_time[0], wait_time[1])
                             self.logger.warning(f"Request error, retrying in {delay:.1f}s...")
-                            time.sleep(delay)
+                            self.polite_sleep(delay, phase='retry_backoff')
                             retry_count += 1
                             continue
                         else:
                             self.health_status['consecutive_failures'] += 1
                             self.health_status['last_failure_time'] = datetime.now()
+                            self.phase_timer.set_outcome('fetch_failed')
                             return None
                             
             except Exception as e:
@@ -1328,10 +1328,12 @@ class BaseScraper(ABC):
                 self.logger.debug(traceback.format_exc())
                 self.health_status['consecutive_failures'] += 1
                 self.health_status['last_failure_time'] = datetime.now()
+                self.phase_timer.set_outcome('fetch_failed')
                 return None
         
         # All retries exhausted
         self.logger.error(f"Failed to fetch {url} after {max_retries} attempts")
+        self.phase_timer.set_outcome('fetch_failed')
         return None
     
     # Wheel-related keywords - shared across all scrapers
@@ -1432,6 +1434,7 @@ class BaseScraper(ABC):
             'wheel mounting kit'
     ]
     
+    @timed_phase('wheel_check')
     def is_wheel_product(self, title, description=''):
         """
         Check if product is a wheel or wheel cap (not other wheel parts)
@@ -1452,15 +1455,13 @@ class BaseScraper(ABC):
         # Normalize hyphens and underscores to spaces for better matching
         text = re.sub(r'[-_]', ' ', text)
 
-        # DEBUG INFO
-        self.logger.info(f"🔍 DEBUG: title='{title}'")
-        self.logger.info(f"🔍 DEBUG: lowercased='{text}'")
-        self.logger.info(f"🔍 DEBUG: 'wheel cap' in text? {('wheel cap' in text)}")
-        self.logger.info(f"🔍 DEBUG: 'hub cap' in text? {('hub cap' in text)}")
-
-        # DEBUG: Print what we're checking
-        self.logger.info(f"🔍 Analyzing: '{title}'")
-        self.logger.info(f"   Lowercased text: '{text}'")
+        # Keyword-matching trace and verdict (DEBUG, sampled per 'wheel_check' category; skipped entirely at INFO)
+        trace = {'category': 'wheel_check'}
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"🔍 Analyzing: '{title}'", extra=trace)
+            self.logger.debug(f"   Lowercased text: '{text}'", extra=trace)
+            self.logger.debug(f"   'wheel cap' in text? {('wheel cap' in text)}, 'hub cap' in text? {('hub cap' in text)}",
+                              extra=trace)
         
         # Sort keywords by length (longest first) to check more specific matches first
         sorted_wheel_keywords = sorted(wheel_keywords, key=lambda k: (-len(k), k))
@@ -1502,21 +1503,23 @@ class BaseScraper(ABC):
         if longest_wheel_length > 0 and longest_exclude_length > 0:
             # Both matched - longer one wins
             if longest_wheel_length >= longest_exclude_length:
-                self.logger.info(f"✅ INCLUDED '{title[:50]}' - matched '{longest_wheel_match}' (overrides '{longest_exclude_match}')")
+                self.logger.debug("✅ INCLUDED '%s' - matched '%s' (overrides '%s')", title[:50], longest_wheel_match,
+                                  longest_exclude_match, extra=trace)
                 return True
             else:
-                self.logger.info(f"❌ EXCLUDED '{title[:50]}' - matched '{longest_exclude_match}' (overrides '{longest_wheel_match}')")
+                self.logger.debug("❌ EXCLUDED '%s' - matched '%s' (overrides '%s')", title[:50], longest_exclude_match,
+                                  longest_wheel_match, extra=trace)
                 return False
         elif longest_wheel_length > 0:
             # Only wheel keyword matched
-            self.logger.info(f"✅ INCLUDED '{title[:50]}' - matched '{longest_wheel_match}'")
+            self.logger.debug("✅ INCLUDED '%s' - matched '%s'", title[:50], longest_wheel_match, extra=trace)
             return True
         elif longest_exclude_length > 0:
             # Only exclude keyword matched
-            self.logger.info(f"❌ EXCLUDED '{title[:50]}' - matched '{longest_exclude_match}'")
+            self.logger.debug("❌ EXCLUDED '%s' - matched '%s'", title[:50], longest_exclude_match, extra=trace)
             return False
         
-        self.logger.info(f"⚠️ NO MATCH '{title[:50]}' - no wheel keywords found")
+        self.logger.debug("⚠️ NO MATCH '%s' - no wheel keywords found", title[:50], extra=trace)
         return False
     
     def clean_sku(self, sku):
@@ -1689,6 +1692,7 @@ class BaseScraper(ABC):
     
     def get_health_status(self) -> dict:
         """Get current health status of the scraper"""
+        self.health_status['phase_timings'] = self.phase_timer.get_totals()
         success_rate = 0
         if self.health_status['total_requests'] > 0:
             success_rate = (self.health_status['successful_requests'] / self.health_status['total_requests']) * 100
@@ -1739,7 +1743,7 @@ class BaseScraper(ABC):
                 import random
                 delay = random.uniform(wait_time[0], wait_time[1])
                 self.logger.debug(f"Retrying {func.__name__} in {delay:.1f}s...")
-                time.sleep(delay)
+                self.polite_sleep(delay, phase='retry_backoff')
                 retry_count += 1
         
         return default
@@ -1750,6 +1754,20 @@ class BaseScraper(ABC):
         
         cleanup_errors = []
         
+        if self.resource_blocker is not None:
+            self.logger.info(f"Resource blocking: {self.resource_blocker.summary()}")
+        if self.tab_pipeline is not None:
+            self.logger.info(f"Tab pipeline: {self.tab_pipeline.summary()}")
+        
+        # Stop the browser pool first so no spare Chrome outlives the scraper
+        if self.browser_pool is not None:
+            try:
+                self.logger.info(f"Browser pool: {self.browser_pool.summary()}")
+                self.browser_pool.stop()
+            except Exception as e:
+                cleanup_errors.append(f"Error stopping browser pool: {str(e)}")
+            self.browser_pool = None
+        
         # Close driver
         if self.driver:
             driver_ref = self.driver  # Keep reference to avoid issues
@@ -1798,7 +1816,7 @@ class BaseScraper(ABC):
                     gc.collect()
                 
                 # Small delay to allow cleanup to complete
-                time.sleep(0.1)
+                self.clock.sleep(0.1)
         
         # Close session
         if self.session:
@@ -1816,4 +1834,17 @@ class BaseScraper(ABC):
             health = self.get_health_status()
             self.logger.info(f"Final health status: {health['success_rate']} success rate, {health['consecutive_failures']} consecutive failures")
         except:
-            pass
\ No newline at end of file
+            pass
+        
+        # Per-site latency breakdown (p50/p95 per phase)
+        try:
+            self.phase_timer.log_breakdown(self.logger)
+            if self.phase_timer.url_records:
+                timing_file = f'logs/{self.site_name}_latency_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json'
+                self.phase_timer.dump(timing_file)
+                self.logger.info(f"Latency breakdown saved: {timing_file}")
+        except Exception as e:
+            self.logger.debug(f"Could not write latency breakdown: {str(e)}")
+        
+        # Make sure the queued log records for this scraper are written
+        get_log_pipeline().flush()
@@ -1,9 +1,11 @@
 """Base scraper class with browser extension support for sites that require anti-detection extensions"""
 from scrapers.base_scraper import BaseScraper
 import undetected_chromedriver as uc
+from scrapers.driver_env import get_driver_env
+from scrapers.site_config import get_config, default_extension_paths
+from scrapers.profile_cache import get_profile_cache, profile_key, wait_for_exit
+import logging
 import os
-import json
-import time
 
 
 class BaseScraperWithExtension(BaseScraper):
@@ -15,7 +17,10 @@ class BaseScraperWithExtension(BaseScraper):
     - audiusa, ford, jaguar, mazda, subaru, volkswagen, volvo, porsche
     """
     
-    def __init__(self, site_name, use_selenium=False, headless=False, extension_paths=None):
+    # Extension drivers keep Chrome's default page load timeout
+    driver_page_load_timeout = None
+    
+    def __init__(self, site_name, use_selenium=False, headless=False, extension_paths=None, clock=None):
         """
         Initialize the scraper with extension support.
         
@@ -25,6 +30,7 @@ class BaseScraperWithExtension(BaseScraper):
             headless: Whether to run in headless mode
             extension_paths: List of paths to unpacked Chrome extension directories (optional)
                            If None, will try to load from config or auto-detect from extensions folder
+            clock: Optional clock for sleeps and timeouts (default: process-wide clock)
         """
         # Initialize extension_paths BEFORE calling super().__init__()
         # because BaseScraper.__init__() calls setup_selenium() which needs extension_paths
@@ -41,7 +47,7 @@ class BaseScraperWithExtension(BaseScraper):
         
         # Now call parent __init__ which may call setup_selenium()
         # setup_selenium() will use self.extension_paths which is now set
-        super().__init__(site_name, use_selenium=use_selenium, headless=headless)
+        super().__init__(site_name, use_selenium=use_selenium, headless=headless, clock=clock)
         
         # Log extension status after initialization
         if self.extension_paths:
@@ -54,102 +60,17 @@ class BaseScraperWithExtension(BaseScraper):
     def _get_extension_paths(self):
         """
         Get extension paths from config file, environment variable, or auto-detect from extensions folder.
+        Resolved once per config load and shared by every scraper in the process (see scrapers/site_config.py).
         
         Returns:
             list: List of paths to extension directories, or empty list if none found
         """
-        extension_paths = []
-        
-        # Helper function to safely log (logger might not be initialized yet)
-        def safe_log(level, message):
-            if hasattr(self, 'logger') and self.logger:
-                if level == 'info':
-                    self.logger.info(message)
-                elif level == 'warning':
-                    self.logger.warning(message)
-                elif level == 'debug':
-                    self.logger.debug(message)
-        
-        # First, try to get from config file
         try:
-            config_path = os.path.join(os.getcwd(), 'config', 'sites_config.json')
-            if os.path.exists(config_path):
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
-                    for site in config.get('sites', []):
-                        if site.get('name') == self.site_name:
-                            # Support both single path (string) and multiple paths (list)
-                            ext_config = site.get('extension_path') or site.get('extension_paths')
-                            if ext_config:
-                                if isinstance(ext_config, str):
-                                    # Single path
-                                    ext_paths = [ext_config]
-                                elif isinstance(ext_config, list):
-                                    # Multiple paths
-                                    ext_paths = ext_config
-                                else:
-                                    ext_paths = []
-                                
-                                # Resolve relative paths and validate
-                                for ext_path in ext_paths:
-                                    if not os.path.isabs(ext_path):
-                                        ext_path = os.path.join(os.getcwd(), ext_path)
-                                    if os.path.exists(ext_path):
-                                        manifest_path = os.path.join(ext_path, 'manifest.json')
-                                        if os.path.exists(manifest_path):
-                                            extension_paths.append(ext_path)
-                                        else:
-                                            safe_log('warning', f"Extension path does not contain manifest.json: {ext_path}")
-                                    else:
-                                        safe_log('warning', f"Extension path not found: {ext_path}")
-                                
-                                if extension_paths:
-                                    return extension_paths
+            return list(get_config().extension_paths(self.site_name))
         except Exception as e:
-            safe_log('debug', f"Error reading extension paths from config: {str(e)}")
-        
-        # Fallback to environment variable
-        env_path = os.getenv('CHROME_EXTENSION_PATH', None)
-        if env_path:
-            # Support comma-separated paths
-            env_paths = [p.strip() for p in env_path.split(',')]
-            for ext_path in env_paths:
-                if not os.path.isabs(ext_path):
-                    ext_path = os.path.join(os.getcwd(), ext_path)
-                if os.path.exists(ext_path):
-                    manifest_path = os.path.join(ext_path, 'manifest.json')
-                    if os.path.exists(manifest_path):
-                        extension_paths.append(ext_path)
-                    else:
-                        safe_log('warning', f"Extension path does not contain manifest.json: {ext_path}")
-                else:
-                    safe_log('warning', f"Extension path from environment variable not found: {ext_path}")
-            
-            if extension_paths:
-                return extension_paths
-        
-        # Auto-detect: Look for all folders in extensions/ directory
-        extensions_dir = os.path.join(os.getcwd(), 'extensions')
-        if os.path.exists(extensions_dir):
-            # Only log if logger is available (after super().__init__())
-            if hasattr(self, 'logger') and self.logger:
-                self.logger.info(f"Auto-detecting extensions from: {extensions_dir}")
-            for item in os.listdir(extensions_dir):
-                ext_path = os.path.join(extensions_dir, item)
-                if os.path.isdir(ext_path):
-                    manifest_path = os.path.join(ext_path, 'manifest.json')
-                    if os.path.exists(manifest_path):
-                        extension_paths.append(ext_path)
-                        if hasattr(self, 'logger') and self.logger:
-                            self.logger.info(f"  Found extension: {item}")
-                    else:
-                        if hasattr(self, 'logger') and self.logger:
-                            self.logger.debug(f"  Skipping {item} (no manifest.json)")
-            
-            if extension_paths:
-                return extension_paths
-        
-        return []
+            # Config missing or invalid: environment variable or extensions folder only
+            logging.getLogger(self.site_name).debug(f"Error reading extension paths from config: {str(e)}")
+            return default_extension_paths()
     
     def _create_chrome_options(self):
         """
@@ -181,16 +102,21 @@ class BaseScraperWithExtension(BaseScraper):
         
         return options
     
-    def setup_selenium(self):
+    def _start_driver(self, clock=None, page_load_timeout=None):
         """
-        Setup undetected ChromeDriver with extension support.
-        Overrides the base class method to ensure extensions are loaded.
+        Launch a new driver with extensions loaded, without touching self.driver.
+        Overrides the base class method so pooled spares load extensions too.
+
+        Args:
+            clock: Clock for the start-up sleeps (default: self.clock)
+            page_load_timeout: Page load timeout set on the driver (default: driver_page_load_timeout)
+
+        Returns:
+            The ready driver
         """
-        # Don't start if browser already exists
-        if self.driver is not None:
-            self.logger.info("Browser already initialized, skipping...")
-            return
-        
+        clock = clock or self.clock
+        page_load_timeout = page_load_timeout or self.driver_page_load_timeout
+        driver = None
         try:
             # Detect Chrome version to ensure ChromeDriver compatibility
             chrome_version = self._detect_chrome_version()
@@ -198,6 +124,13 @@ class BaseScraperWithExtension(BaseScraper):
             # Try to use local ChromeDriver first to avoid network timeout
             chromedriver_path = os.path.join(os.getcwd(), 'chromedriver-win32', 'chromedriver.exe')
             driver_executable_path = chromedriver_path if os.path.exists(chromedriver_path) else None
+            # Otherwise reuse the chromedriver undetected_chromedriver patched on an earlier start
+            if driver_executable_path is None:
+                driver_executable_path = get_driver_env().patched_driver(chrome_version)
+            
+            # Start from a cached profile with the extensions already installed and initialized
+            profile_cache = get_profile_cache() if self.extension_paths else None
+            cache_key = profile_key(self.extension_paths, chrome_version) if profile_cache else None
             
             # Create undetected ChromeDriver with stealth settings and extensions
             max_retries = 2
@@ -209,11 +142,21 @@ class BaseScraperWithExtension(BaseScraper):
                     # Create fresh ChromeOptions for each retry attempt
                     # This will include all extensions if configured
                     options = self._create_chrome_options()
+                    profile_dir = None
+                    warm_profile = False
+                    if profile_cache is not None:
+                        warm_profile = profile_cache.has_template(cache_key)
+                        profile_dir = profile_cache.checkout(cache_key)
+                        options.add_argument(f'--user-data-dir={profile_dir}')
+                        if warm_profile:
+                            self.logger.info(f"Starting Chrome from cached extension profile {cache_key}")
+                        else:
+                            self.logger.info(f"No cached extension profile {cache_key} yet, it will be saved when this browser closes")
                     
                     if driver_executable_path and os.path.exists(driver_executable_path):
                         # Use local ChromeDriver to avoid network timeout
                         self.logger.info(f"Using local ChromeDriver with undetected_chromedriver: {driver_executable_path}")
-                        self.driver = uc.Chrome(
+                        driver = uc.Chrome(
                             options=options, 
                             version_main=chrome_version,
                             use_subprocess=True,
@@ -223,7 +166,7 @@ class BaseScraperWithExtension(BaseScraper):
                     else:
                         # No local ChromeDriver, try auto-download
                         self.logger.info("No local ChromeDriver found, attempting auto-download with undetected_chromedriver...")
-                        self.driver = uc.Chrome(
+                        driver = uc.Chrome(
                             options=options, 
                             version_main=chrome_version,
                             use_subprocess=True,
@@ -233,15 +176,15 @@ class BaseScraperWithExtension(BaseScraper):
                     
                     # Maximize window if not headless
                     try:
-                        self.driver.maximize_window()
-                        if not self.driver.window_handles:
+                        driver.maximize_window()
+                        if not driver.window_handles:
                             raise Exception("Window closed immediately after maximization")
                     except Exception as window_error:
                         error_msg = str(window_error).lower()
                         if 'no such window' in error_msg or 'target window already closed' in error_msg:
                             self.logger.warning(f"Window closed during maximization: {str(window_error)}")
                             try:
-                                self.driver.switch_to.new_window('tab')
+                                driver.switch_to.new_window('tab')
                                 self.logger.info("Created new window after closure")
                             except:
                                 raise Exception(f"Failed to recover from window closure: {str(window_error)}")
@@ -249,10 +192,11 @@ class BaseScraperWithExtension(BaseScraper):
                             self.logger.debug(f"Window maximization failed (non-critical): {str(window_error)}")
                     
                     # Wait a moment for window and extensions to stabilize
-                    time.sleep(2)  # Give extensions time to load
+                    # (a cached profile has them installed and their rule sets built already)
+                    clock.sleep(0.5 if warm_profile else 2)  # Give extensions time to load
                     
                     # Final verification that driver and window are valid
-                    if not self.driver:
+                    if not driver:
                         raise Exception("Driver is None after initialization")
                     
                     # Check window handles multiple times to ensure stability
@@ -260,13 +204,13 @@ class BaseScraperWithExtension(BaseScraper):
                     window_stable = False
                     for attempt in range(window_check_attempts):
                         try:
-                            handles = self.driver.window_handles
+                            handles = driver.window_handles
                             if handles:
                                 window_stable = True
                                 break
                         except Exception as check_error:
                             if attempt < window_check_attempts - 1:
-                                time.sleep(0.5)
+                                clock.sleep(0.5)
                                 continue
                             else:
                                 raise Exception(f"No window handles available after initialization: {str(check_error)}")
@@ -275,13 +219,17 @@ class BaseScraperWithExtension(BaseScraper):
                         raise Exception("Window is not stable after initialization")
                     
                     driver_initialized = True
+                    get_driver_env().record_driver(driver, chrome_version)
+                    if profile_dir is not None:
+                        # quit() saves the profile as the template (first driver only) and deletes the copy
+                        profile_cache.attach(driver, cache_key, profile_dir)
                     if self.extension_paths:
                         extension_status = f"with {len(self.extension_paths)} extension(s)"
                         self.logger.info(f"Browser initialized successfully for {self.site_name} {extension_status}")
                         # Verify extensions are loaded by checking Chrome's extension list
                         try:
                             # Give extensions a moment to fully initialize
-                            time.sleep(1)
+                            clock.sleep(1)
                             # Log extension names for verification
                             ext_names = [os.path.basename(ext) for ext in self.extension_paths]
                             self.logger.info(f"✓ Extensions loaded: {', '.join(ext_names)}")
@@ -292,27 +240,38 @@ class BaseScraperWithExtension(BaseScraper):
                     
                 except Exception as e:
                     error_msg = str(e).lower()
+                    if profile_dir is not None:
+                        # A driver that failed to start never seeds the template
+                        if driver:
+                            try:
+                                driver.quit()
+                            except Exception:
+                                pass
+                            wait_for_exit(getattr(driver, 'browser_pid', None))
+                            driver = None
+                        profile_cache.release(profile_dir)
                     
                     # Handle version mismatch errors
                     if 'version' in error_msg and ('chromedriver' in error_msg or 'chrome version' in error_msg):
                         self.logger.warning(f"ChromeDriver version mismatch detected: {str(e)}")
+                        get_driver_env().forget_driver()
                         retry_count += 1
                         if retry_count < max_retries:
                             if driver_executable_path and os.path.exists(driver_executable_path):
                                 self.logger.info(f"Local ChromeDriver version mismatch, retrying with auto-download (attempt {retry_count}/{max_retries})...")
                                 driver_executable_path = None
                                 chrome_version = None
-                                time.sleep(2)
+                                clock.sleep(2)
                                 continue
                             elif chrome_version is not None:
                                 self.logger.info(f"Retrying with auto-detection (attempt {retry_count}/{max_retries})...")
                                 chrome_version = None
-                                time.sleep(2)
+                                clock.sleep(2)
                                 continue
                             else:
                                 self.logger.info(f"Retrying without version specification (attempt {retry_count}/{max_retries})...")
                                 chrome_version = None
-                                time.sleep(2)
+                                clock.sleep(2)
                                 continue
                         else:
                             self.logger.error(f"Failed to initialize ChromeDriver after version mismatch retries: {str(e)}")
@@ -324,12 +283,12 @@ class BaseScraperWithExtension(BaseScraper):
                         if retry_count < max_retries:
                             self.logger.warning(f"Network/window error during initialization (attempt {retry_count}/{max_retries}): {str(e)}")
                             try:
-                                if self.driver:
-                                    self.driver.quit()
-                                    self.driver = None
+                                if driver:
+                                    driver.quit()
+                                    driver = None
                             except:
                                 pass
-                            time.sleep(2 * retry_count)
+                            clock.sleep(2 * retry_count)
                             continue
                         else:
                             self.logger.error(f"Failed to initialize browser after {max_retries} attempts: {str(e)}")
@@ -338,11 +297,28 @@ class BaseScraperWithExtension(BaseScraper):
                         # Other errors - re-raise
                         self.logger.error(f"Unexpected error during browser initialization: {str(e)}")
                         raise
-                        
+            if page_load_timeout:
+                driver.set_page_load_timeout(page_load_timeout)
+            return driver
         except Exception as e:
             self.logger.error(f"Failed to setup Selenium with extension support: {str(e)}")
+            if driver:
+                try:
+                    driver.quit()
+                except Exception:
+                    pass
             raise
     
+    def _prepare_tab(self, driver):
+        """
+        Set up a new prefetch tab. Overrides the base class method: drivers
+        started here never get the injected anti-detection script (the
+        extension's content scripts cover every tab), so only resource blocking
+        is applied.
+        """
+        if self.resource_blocker is not None:
+            self.resource_blocker.block_tab(driver)
+    
     def ensure_driver(self):
         """
         Ensure driver is initialized and valid, reinitialize if needed.
@@ -357,22 +333,7 @@ class BaseScraperWithExtension(BaseScraper):
         while attempt < max_reinit_attempts:
             self.logger.warning(f"Driver session invalid or missing, reinitializing with extension support (attempt {attempt + 1}/{max_reinit_attempts})...")
             try:
-                if self.driver:
-                    old_driver = self.driver
-                    self.driver = None
-                    try:
-                        old_driver.quit()
-                    except (OSError, AttributeError):
-                        pass
-                    except Exception:
-                        pass
-                    finally:
-                        try:
-                            del old_driver
-                        except:
-                            pass
-                
-                self.setup_selenium()
+                self._replace_driver()
                 self.logger.info("✓ Driver reinitialized successfully with extension support")
                 return True
                     
@@ -381,6 +342,6 @@ class BaseScraperWithExtension(BaseScraper):
                 if attempt >= max_reinit_attempts:
                     self.logger.error(f"Failed to reinitialize driver after {max_reinit_attempts} attempts: {str(e)}")
                     raise
-                time.sleep(2 * attempt)
+                self.clock.sleep(2 * attempt)
         
         return False
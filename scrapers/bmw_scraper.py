@@ -1,10 +1,8 @@
 """Scraper for parts.bmwofsouthatlanta.com (BMW parts)"""
 from scrapers.base_scraper import BaseScraper
-from bs4 import BeautifulSoup
 import json
 import re
 from datetime import datetime
-import time
 import traceback
 import random
 from selenium.webdriver.common.by import By
@@ -15,8 +13,8 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException
 class BMWScraper(BaseScraper):
     """Scraper for parts.bmwofsouthatlanta.com"""
     
-    def __init__(self):
-        super().__init__('bmw', use_selenium=True)
+    def __init__(self, clock=None):
+        super().__init__('bmw', use_selenium=True, clock=clock)
         self.base_url = 'https://parts.bmwofsouthatlanta.com'
         
     def get_product_urls(self):
@@ -100,7 +98,6 @@ class BMWScraper(BaseScraper):
             
         except Exception as e:
             self.logger.error(f"Error getting product URLs: {str(e)}")
-            import traceback
             self.logger.debug(f"Traceback: {traceback.format_exc()}")
         
         return product_urls
@@ -154,8 +151,8 @@ class BMWScraper(BaseScraper):
             self._scroll_to_load_content()
             
             # Get updated HTML after scrolling
-            html = self.driver.page_source
-            soup = BeautifulSoup(html, 'lxml')
+            html = self.get_page_source()
+            soup = self.make_soup(html, 'lxml')
             
             # Find product links - pattern: /oem-parts/bmw-product-name-partnumber
             product_links = soup.find_all('a', href=re.compile(r'/oem-parts/bmw-'))
@@ -204,7 +201,7 @@ class BMWScraper(BaseScraper):
                                 
                                 html = self.get_page(pag_url, use_selenium=True, wait_time=2)
                                 if html and len(html) > 5000:
-                                    soup_check = BeautifulSoup(html, 'lxml')
+                                    soup_check = self.make_soup(html, 'lxml')
                                     page_links = soup_check.find_all('a', href=re.compile(r'/oem-parts/bmw-'))
                                     if len(page_links) > 0:
                                         page_loaded = True
@@ -234,8 +231,8 @@ class BMWScraper(BaseScraper):
                     
                     # Scroll and extract products
                     self._scroll_to_load_content()
-                    html = self.driver.page_source
-                    soup = BeautifulSoup(html, 'lxml')
+                    html = self.get_page_source()
+                    soup = self.make_soup(html, 'lxml')
                     page_links = soup.find_all('a', href=re.compile(r'/oem-parts/bmw-'))
                     
                     page_urls_count = 0
@@ -263,7 +260,7 @@ class BMWScraper(BaseScraper):
                         consecutive_empty_pages = 0
                     
                     page_num += 1
-                    time.sleep(random.uniform(2, 4))
+                    self.polite_sleep(2, 4)
                     
                 except Exception as e:
                     self.logger.error(f"Error processing page {page_num}: {str(e)}")
@@ -275,7 +272,6 @@ class BMWScraper(BaseScraper):
             
         except Exception as e:
             self.logger.error(f"Error searching for wheels: {str(e)}")
-            import traceback
             self.logger.debug(f"Traceback: {traceback.format_exc()}")
         
         return product_urls
@@ -318,8 +314,8 @@ class BMWScraper(BaseScraper):
             self._scroll_to_load_content()
             
             # Get updated HTML
-            html = self.driver.page_source
-            soup = BeautifulSoup(html, 'lxml')
+            html = self.get_page_source()
+            soup = self.make_soup(html, 'lxml')
             
             # Extract product links
             product_links = soup.find_all('a', href=re.compile(r'/oem-parts/bmw-'))
@@ -362,7 +358,7 @@ class BMWScraper(BaseScraper):
                                 
                                 html = self.get_page(pag_url, use_selenium=True, wait_time=1)
                                 if html and len(html) > 5000:
-                                    soup_check = BeautifulSoup(html, 'lxml')
+                                    soup_check = self.make_soup(html, 'lxml')
                                     if soup_check.find_all('a', href=re.compile(r'/oem-parts/bmw-')):
                                         page_loaded = True
                                         break
@@ -388,8 +384,8 @@ class BMWScraper(BaseScraper):
                         continue
                     
                     self._scroll_to_load_content()
-                    html = self.driver.page_source
-                    soup = BeautifulSoup(html, 'lxml')
+                    html = self.get_page_source()
+                    soup = self.make_soup(html, 'lxml')
                     page_links = soup.find_all('a', href=re.compile(r'/oem-parts/bmw-'))
                     
                     new_count = 0
@@ -415,7 +411,7 @@ class BMWScraper(BaseScraper):
                         consecutive_empty = 0
                     
                     page_num += 1
-                    time.sleep(random.uniform(1, 2))
+                    self.polite_sleep(1, 2)
                     
                 except Exception as e:
                     self.logger.debug(f"Error on category page {page_num}: {str(e)}")
@@ -441,7 +437,7 @@ class BMWScraper(BaseScraper):
             while scroll_attempts < max_scrolls:
                 try:
                     self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                    time.sleep(1.5)
+                    self.clock.sleep(1.5)
                     
                     new_height = self.driver.execute_script("return document.body.scrollHeight")
                     if new_height == last_height:
@@ -483,7 +479,7 @@ class BMWScraper(BaseScraper):
                         wait_time = recovery['wait_time']
                         delay = random.uniform(wait_time[0], wait_time[1])
                         self.logger.warning(f"Driver error, retrying in {delay:.1f}s...")
-                        time.sleep(delay)
+                        self.polite_sleep(delay, phase='retry_backoff')
                         retry_count += 1
                         continue
                     else:
@@ -494,37 +490,35 @@ class BMWScraper(BaseScraper):
                     self.page_load_timeout = 60
                     self.driver.set_page_load_timeout(60)
                     
-                    self.driver.get(url)
-                    time.sleep(random.uniform(0.5, 1.5))
+                    self.driver_get(url)
+                    self.polite_sleep(0.5, 1.5)
                     
-                    # Cloudflare check
-                    current_url_check = self.driver.current_url.lower()
-                    page_preview = self.driver.page_source[:6000]
-                    
-                    if ('challenges.cloudflare.com' in current_url_check or '/cdn-cgi/challenge' in current_url_check or len(page_preview) < 5000) and self.has_cloudflare_challenge():
+                    # Cloudflare check (one script call: challenge URL or small page with challenge markers)
+                    if self.has_cloudflare_challenge():
                         self.logger.info("🛡️ Cloudflare challenge detected - waiting for bypass...")
                         cloudflare_bypassed = self.wait_for_cloudflare(timeout=30, target_url=url, max_retries=1)
                         if not cloudflare_bypassed:
-                            if len(self.driver.page_source) > 5000 and 'challenges.cloudflare.com' not in self.driver.current_url.lower():
+                            snapshot = self.page_snapshot()
+                            if len(snapshot) > 5000 and 'challenges.cloudflare.com' not in snapshot.url.lower():
                                 self.logger.info("✓ Page accessible despite Cloudflare warning - continuing...")
                             else:
                                 retry_count += 1
                                 if retry_count < max_retries:
                                     wait_time = random.uniform(10, 15)
                                     self.logger.warning(f"Retrying page load in {wait_time:.1f}s...")
-                                    time.sleep(wait_time)
+                                    self.polite_sleep(wait_time, phase='retry_backoff')
                                     continue
                                 else:
                                     return None
-                        time.sleep(1)
+                        self.clock.sleep(1)
                     
-                    time.sleep(random.uniform(0.5, 1.0))
+                    self.polite_sleep(0.5, 1.0)
                     self.simulate_human_behavior()
-                    time.sleep(random.uniform(0.5, 1.0))
-                    time.sleep(random.uniform(1.5, 3.0))
-                    time.sleep(random.uniform(0.5, 1.0))
-                    html = self.driver.page_source
-                    soup = BeautifulSoup(html, 'lxml')
+                    self.polite_sleep(0.5, 1.0)
+                    self.polite_sleep(1.5, 3.0)
+                    self.polite_sleep(0.5, 1.0)
+                    html = self.get_page_source()
+                    soup = self.make_soup(html, 'lxml')
                     
                     # Extract title
                     title_text = ''
@@ -566,7 +560,7 @@ class BMWScraper(BaseScraper):
                         retry_count += 1
                         if retry_count < max_retries:
                             wait_time = random.uniform(10, 15)
-                            time.sleep(wait_time)
+                            self.polite_sleep(wait_time, phase='retry_backoff')
                             continue
                         else:
                             return None
@@ -579,13 +573,13 @@ class BMWScraper(BaseScraper):
                         retry_count += 1
                         if retry_count < max_retries:
                             wait_time = random.uniform(10, 15)
-                            time.sleep(wait_time)
+                            self.polite_sleep(wait_time, phase='retry_backoff')
                             continue
                         else:
                             return None
                     
                     # Success
-                    html = self.driver.page_source
+                    html = self.get_page_source()
                     self.logger.info(f"✓ Page loaded successfully, title: {title_text[:50]}")
                     self.page_load_timeout = original_timeout
                     self.driver.set_page_load_timeout(original_timeout)
@@ -600,14 +594,14 @@ class BMWScraper(BaseScraper):
                         content_ready = False
                         
                         while waited < wait_for_content:
-                            html = self.driver.page_source
+                            html = self.get_page_source()
                             current_url = self.driver.current_url.lower()
                             
                             if any(err in current_url for err in ['chrome-error://', 'err_', 'dns_probe']):
                                 raise Exception(f"Connection error: {current_url}")
                             
                             if html and len(html) > 8000:
-                                soup = BeautifulSoup(html, 'lxml')
+                                soup = self.make_soup(html, 'lxml')
                                 has_title = soup.find('h1')
                                 has_body = soup.find('body')
                                 body_text = has_body.get_text(strip=True) if has_body else ''
@@ -617,7 +611,7 @@ class BMWScraper(BaseScraper):
                                     self.logger.info(f"✓ Full content loaded after {waited}s")
                                     break
                             
-                            time.sleep(0.5)
+                            self.clock.sleep(0.5)
                             waited += 0.5
                         
                         if not content_ready:
@@ -630,7 +624,7 @@ class BMWScraper(BaseScraper):
                         retry_count += 1
                         if retry_count < max_retries:
                             wait_time = random.uniform(5, 8)
-                            time.sleep(wait_time)
+                            self.polite_sleep(wait_time, phase='retry_backoff')
                             continue
                         else:
                             self.page_load_timeout = original_timeout
@@ -647,7 +641,7 @@ class BMWScraper(BaseScraper):
                         retry_count += 1
                         if retry_count < max_retries:
                             wait_time = random.uniform(5, 8)
-                            time.sleep(wait_time)
+                            self.polite_sleep(wait_time, phase='retry_backoff')
                             continue
                         else:
                             return None
@@ -672,7 +666,7 @@ class BMWScraper(BaseScraper):
                     wait_time = recovery['wait_time']
                     delay = random.uniform(wait_time[0], wait_time[1])
                     self.logger.warning(f"Retrying in {delay:.1f}s...")
-                    time.sleep(delay)
+                    self.polite_sleep(delay, phase='retry_backoff')
                     retry_count += 1
                     continue
                 else:
@@ -681,7 +675,7 @@ class BMWScraper(BaseScraper):
         if not html:
             return None
         
-        soup = BeautifulSoup(html, 'lxml')
+        soup = self.make_soup(html, 'lxml')
         
         # Initialize product data
         product_data = {
@@ -842,7 +836,7 @@ class BMWScraper(BaseScraper):
                             desc_html = product_json['description']
                             if desc_html:
                                 # Parse HTML description to extract text
-                                desc_soup = BeautifulSoup(desc_html, 'lxml')
+                                desc_soup = self.make_soup(desc_html, 'lxml')
                                 desc_text = desc_soup.get_text(strip=True, separator=' ')
                                 desc_text = re.sub(r'\s+', ' ', desc_text).strip()
                                 if desc_text:
@@ -1180,7 +1174,6 @@ class BMWScraper(BaseScraper):
         except Exception as e:
             safe_error = self.safe_str(e)
             self.logger.error(f"❌ Error scraping product {url}: {safe_error}")
-            import traceback
             try:
                 tb_str = traceback.format_exc()
                 safe_tb = self.safe_str(tb_str)
@@ -0,0 +1,219 @@
+"""
+Pre-warmed browser pool
+
+A cold driver start (options, uc.Chrome launch, maximize, settle sleeps,
+window-handle checks, timeouts, anti-detection scripts) takes several seconds,
+and ensure_driver()/restart_driver() used to pay it while the scrape waited.
+BrowserPool keeps spare drivers fully initialized on a background thread, so a
+broken or recycled driver is swapped for a warm one immediately; the old one
+is quit in the background too. Cookies are carried over on the swap.
+
+Spares are launched with the pool's own plain Clock (factory(clock=...)), so
+start-up sleeps on the warmer thread never land in the scraper's
+AccountingClock and the wall/sleeping/working report stays the scrape's own.
+"""
+import logging
+import threading
+import time
+from collections import deque
+
+from scrapers.clock import Clock
+
+
+def export_cookies(driver):
+    """Return the driver's cookies (empty list if the session is gone)"""
+    try:
+        return driver.get_cookies() if driver else []
+    except Exception:
+        return []
+
+
+def import_cookies(driver, cookies):
+    """
+    Seed cookies into a driver for every domain at once (CDP Network.setCookies,
+    so the driver doesn't have to be on each cookie's domain first)
+
+    Returns:
+        int: Number of cookies set
+    """
+    if not driver or not cookies:
+        return 0
+    params = []
+    for cookie in cookies:
+        param = {key: cookie[key] for key in ('name', 'value', 'domain', 'path', 'secure', 'httpOnly', 'sameSite')
+                 if cookie.get(key) is not None}
+        if cookie.get('expiry') is not None:
+            param['expires'] = cookie['expiry']
+        params.append(param)
+    try:
+        driver.execute_cdp_cmd('Network.setCookies', {'cookies': params})
+        return len(params)
+    except Exception:
+        # Fallback: WebDriver add_cookie only accepts cookies for the current domain
+        added = 0
+        for cookie in cookies:
+            try:
+                driver.add_cookie(cookie)
+                added += 1
+            except Exception:
+                continue
+        return added
+
+
+def driver_alive(driver):
+    """True if the driver session still answers"""
+    try:
+        return bool(driver.window_handles)
+    except Exception:
+        return False
+
+
+class BrowserPool:
+    """
+    Keep spare, fully initialized drivers warm for one scraper.
+
+    A daemon thread calls factory(clock=...) until `size` spares are ready, and quits
+    drivers handed to retire(). acquire() never blocks on a launch: it returns
+    a live spare or None (the caller then starts a driver itself).
+    """
+
+    def __init__(self, factory, size=1, name='browser_pool', max_failures=3, retry_delay=10, clock=None):
+        """
+        Args:
+            factory: Callable taking clock= and returning a ready driver (e.g. scraper._start_driver);
+                     it must not change scraper state, since it runs on the warmer thread
+            size: Spare drivers kept warm
+            name: Used in the warmer thread name and log messages
+            max_failures: Consecutive failed launches before warming stops
+            retry_delay: Seconds to wait after a failed launch
+            clock: Clock for the factory's sleeps (default: a plain Clock owned by the pool)
+        """
+        self.logger = logging.getLogger('browser_pool')
+        self.factory = factory
+        self.clock = clock or Clock()
+        self.size = max(1, size)
+        self.name = name
+        self.max_failures = max_failures
+        self.retry_delay = retry_delay
+        self.stats = {'warmed': 0, 'hits': 0, 'misses': 0, 'stale': 0, 'failures': 0, 'retired': 0,
+                      'warm_seconds': 0.0}
+        self._spares = deque()
+        self._retired = deque()
+        self._condition = threading.Condition()
+        self._stopped = False
+        self._failures = 0
+        self._thread = None
+
+    def start(self):
+        """Start warming spares in the background"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name=f'BrowserPool-{self.name}', daemon=True)
+            self._thread.start()
+            self.logger.info(f"Browser pool for {self.name}: keeping {self.size} warm driver(s)")
+        return self
+
+    def _needs_spare(self):
+        return len(self._spares) < self.size and self._failures < self.max_failures
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._stopped and not self._retired and not self._needs_spare():
+                    self._condition.wait()
+                if self._stopped:
+                    return
+                retired = self._retired.popleft() if self._retired else None
+
+            if retired is not None:
+                self._quit(retired)
+                continue
+
+            start = time.perf_counter()
+            try:
+                driver = self.factory(clock=self.clock)
+            except Exception as e:
+                self._failures += 1
+                self.stats['failures'] += 1
+                if self._failures >= self.max_failures:
+                    self.logger.error(f"Browser pool for {self.name}: {self._failures} failed launches, "
+                                      f"no longer warming spares ({str(e)})")
+                else:
+                    self.logger.warning(f"Browser pool for {self.name}: warm launch failed: {str(e)}")
+                    with self._condition:
+                        self._condition.wait(self.retry_delay)
+                continue
+
+            self._failures = 0
+            self.stats['warmed'] += 1
+            self.stats['warm_seconds'] += time.perf_counter() - start
+            with self._condition:
+                if self._stopped:
+                    stale = driver
+                else:
+                    self._spares.append(driver)
+                    stale = None
+            if stale is not None:
+                self._quit(stale)
+
+    def acquire(self):
+        """
+        Take a warm driver without waiting
+
+        Returns:
+            A live driver, or None if no spare is ready
+        """
+        while True:
+            with self._condition:
+                driver = self._spares.popleft() if self._spares else None
+                self._condition.notify_all()
+            if driver is None:
+                self.stats['misses'] += 1
+                return None
+            if driver_alive(driver):
+                self.stats['hits'] += 1
+                return driver
+            # A spare that died while idle is replaced like any other
+            self.stats['stale'] += 1
+            self.retire(driver)
+
+    def retire(self, driver):
+        """Hand a driver to the background thread to quit (returns immediately)"""
+        if driver is None:
+            return
+        with self._condition:
+            if self._thread is None or self._stopped:
+                retired_now = driver
+            else:
+                self._retired.append(driver)
+                self._condition.notify_all()
+                retired_now = None
+        if retired_now is not None:
+            self._quit(retired_now)
+
+    def _quit(self, driver):
+        self.stats['retired'] += 1
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def stop(self, timeout=30):
+        """Stop warming and quit every spare and retired driver"""
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        with self._condition:
+            leftovers = list(self._spares) + list(self._retired)
+            self._spares.clear()
+            self._retired.clear()
+        for driver in leftovers:
+            self._quit(driver)
+
+    def summary(self):
+        """One-line pool statistics"""
+        warmed = self.stats['warmed']
+        average = self.stats['warm_seconds'] / warmed if warmed else 0.0
+        return (f"{self.stats['hits']} warm swaps, {self.stats['misses']} cold starts, {warmed} drivers warmed "
+                f"(avg {average:.1f}s), {self.stats['stale']} stale, {self.stats['failures']} failed launches")
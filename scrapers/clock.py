@@ -0,0 +1,157 @@
+"""Injectable clock for scraper sleeps, waits and timeouts"""
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+
+
+class Clock:
+    """Real time: sleep() blocks, time()/monotonic() come from the time module"""
+
+    def time(self):
+        return time.time()
+
+    def monotonic(self):
+        return time.monotonic()
+
+    def now(self):
+        return datetime.fromtimestamp(self.time())
+
+    def sleep(self, seconds, reason=None):
+        """
+        Sleep deliberately (politeness delay, back-off, waiting for the page)
+
+        Args:
+            seconds: Seconds to sleep
+            reason: Optional label used by clocks that account for sleeps
+        """
+        if seconds > 0:
+            time.sleep(seconds)
+
+
+class AccountingClock(Clock):
+    """
+    Real clock that accounts for deliberate sleeps
+
+    Reports how much wall time was spent sleeping versus doing work, for the
+    whole run or since a snapshot (e.g. per site).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.started = time.monotonic()
+        self.slept = 0.0
+        self.sleep_calls = 0
+        self.slept_by_reason = Counter()
+
+    def sleep(self, seconds, reason=None):
+        if seconds <= 0:
+            return
+        start = time.monotonic()
+        try:
+            time.sleep(seconds)
+        finally:
+            elapsed = time.monotonic() - start
+            with self._lock:
+                self.slept += elapsed
+                self.sleep_calls += 1
+                self.slept_by_reason[reason or 'sleep'] += elapsed
+
+    def snapshot(self):
+        """Return a snapshot to pass to get_report(since=...)"""
+        with self._lock:
+            return {'monotonic': time.monotonic(), 'slept': self.slept, 'sleep_calls': self.sleep_calls}
+
+    def get_report(self, since=None):
+        """
+        Get sleep vs work accounting
+
+        Args:
+            since: Optional snapshot() to report from (default: clock creation)
+
+        Returns:
+            dict: wall_seconds, sleep_seconds, work_seconds, sleep_calls, sleep_share
+        """
+        snapshot = self.snapshot()
+        base = since or {'monotonic': self.started, 'slept': 0.0, 'sleep_calls': 0}
+        wall = snapshot['monotonic'] - base['monotonic']
+        slept = snapshot['slept'] - base['slept']
+        return {
+            'wall_seconds': round(wall, 3),
+            'sleep_seconds': round(slept, 3),
+            'work_seconds': round(max(wall - slept, 0.0), 3),
+            'sleep_calls': snapshot['sleep_calls'] - base['sleep_calls'],
+            'sleep_share': round(slept / wall, 3) if wall > 0 else 0.0,
+        }
+
+    def log_report(self, logger, label='Run', since=None):
+        """Log the sleep vs work accounting"""
+        report = self.get_report(since)
+        logger.info(f"{label} time: {report['wall_seconds']:.1f}s wall, "
+                    f"{report['sleep_seconds']:.1f}s sleeping ({report['sleep_share'] * 100:.0f}%, "
+                    f"{report['sleep_calls']} sleeps), {report['work_seconds']:.1f}s working")
+
+
+class VirtualClock(AccountingClock):
+    """
+    Virtual time for tests and benchmarks
+
+    sleep() returns immediately and advances the clock, so back-offs, polling
+    loops and timeouts written against the clock complete at CPU speed. The
+    accounting report is in virtual seconds.
+    """
+
+    def __init__(self, start=None):
+        """
+        Args:
+            start: Initial time() value (default: current wall time)
+        """
+        self._offset = 0.0
+        self._epoch = time.time() if start is None else start
+        super().__init__()
+        self.started = 0.0
+
+    def time(self):
+        return self._epoch + self._offset
+
+    def monotonic(self):
+        return self._offset
+
+    def advance(self, seconds):
+        """Move the clock forward without counting it as a sleep"""
+        with self._lock:
+            self._offset += max(seconds, 0.0)
+
+    def sleep(self, seconds, reason=None):
+        if seconds <= 0:
+            return
+        with self._lock:
+            self._offset += seconds
+            self.slept += seconds
+            self.sleep_calls += 1
+            self.slept_by_reason[reason or 'sleep'] += seconds
+
+    def snapshot(self):
+        with self._lock:
+            return {'monotonic': self._offset, 'slept': self.slept, 'sleep_calls': self.sleep_calls}
+
+
+_default_clock = AccountingClock()
+
+
+def get_clock():
+    """Return the process-wide default clock (used when none is injected)"""
+    return _default_clock
+
+
+def set_clock(clock):
+    """
+    Replace the process-wide default clock
+
+    Scrapers created afterwards (and ErrorHandler/scrape_site calls without an
+    explicit clock) use it. Returns the previous clock.
+    """
+    global _default_clock
+    previous = _default_clock
+    _default_clock = clock
+    return previous
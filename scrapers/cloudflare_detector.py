@@ -0,0 +1,184 @@
+"""
+Cloudflare challenge detection in one round trip
+
+probe_driver() runs a single injected script that returns everything the
+challenge checks need ({url, html_length, challenge_markers,
+visible_challenge_form, ...}); the page HTML never leaves the browser.
+detect_challenge_html() builds the same dict from raw HTML (HTTP path, saved
+pages, fixtures). is_challenge(), challenge_pending() and challenge_cleared()
+turn a probe into the decisions has_cloudflare_challenge() and the wait loops
+make.
+"""
+import re
+
+# URLs that are definitely a challenge
+CHALLENGE_URL_MARKERS = ('challenges.cloudflare.com', '/cdn-cgi/challenge')
+
+# Text that only appears on actual challenge pages (checked in the first 10KB)
+STRICT_CHALLENGE_MARKERS = (
+    'just a moment',
+    'checking your browser',
+    'verifying you are human',
+    'review the security of your connection',
+    'verifying...',
+    'this may take a few seconds',
+)
+# Also seen on interstitials; too common on normal pages to detect on, but must be gone before a page counts as clear
+EXTRA_CHALLENGE_MARKERS = ('ddos protection', 'ray id', 'cf-browser-verification')
+CHALLENGE_MARKERS = STRICT_CHALLENGE_MARKERS + EXTRA_CHALLENGE_MARKERS
+
+# Text meaning a challenge is still in progress while polling a page
+PENDING_CHALLENGE_MARKERS = ('verifying you are human', 'review the security of your connection', 'verifying...')
+
+# Visible body text that means verification is still running
+VERIFYING_TEXT_MARKERS = ('verifying', 'review the security', 'this may take')
+
+CHALLENGE_FORM_SELECTOR = "#challenge-form, form[action*='challenge']"
+CHALLENGE_ELEMENT_SELECTOR = ('.cf-browser-verification, .challenge-container, #challenge-form, '
+                              "form[action*='challenge'], [data-ray], .cf-im-under-attack, .cf-wrapper")
+
+MARKER_WINDOW = 10000
+
+# The leading comment lets test drivers recognise the probe
+PROBE_SCRIPT = '''/* cloudflare-probe */
+const markers = arguments[0], verifyingMarkers = arguments[1];
+const root = document.documentElement;
+const html = root ? root.outerHTML : '';
+const head = html.slice(0, arguments[4]).toLowerCase();
+const visible = (el) => {
+    if (!(el.offsetWidth || el.offsetHeight || el.getClientRects().length)) return false;
+    const style = window.getComputedStyle(el);
+    return style.visibility !== 'hidden' && style.display !== 'none';
+};
+const anyVisible = (selector) => {
+    try { return Array.from(document.querySelectorAll(selector)).some(visible); } catch (e) { return false; }
+};
+const text = ((document.body && document.body.innerText) || '').slice(0, 5000).toLowerCase();
+return {
+    url: location.href,
+    html_length: html.length,
+    challenge_markers: markers.filter((m) => head.indexOf(m) !== -1),
+    visible_challenge_form: anyVisible(arguments[2]),
+    visible_challenge_element: anyVisible(arguments[3]),
+    verifying_text: verifyingMarkers.filter((m) => text.indexOf(m) !== -1),
+};
+'''
+
+_FORM_RE = re.compile(r'''<form\b[^>]*(?:id\s*=\s*["']challenge-form["']|action\s*=\s*["'][^"']*challenge)''', re.I)
+_ELEMENT_RE = re.compile(
+    r'''<[a-z][^>]*(?:class\s*=\s*["'][^"']*\b(?:cf-browser-verification|challenge-container|cf-im-under-attack|cf-wrapper)\b'''
+    r'''|id\s*=\s*["']challenge-form["']|\sdata-ray\b)''', re.I)
+_HIDDEN_BLOCK_RE = re.compile(r'<(script|style|noscript|template)\b.*?</\1\s*>', re.I | re.S)
+_TAG_RE = re.compile(r'<[^>]+>')
+
+
+def detect_challenge_html(html, url=''):
+    """
+    Probe raw HTML (no browser) - same result shape as probe_driver()
+
+    Visibility can't be known without rendering, so challenge forms/elements
+    count as visible when present, and the text check uses the markup minus
+    scripts and styles.
+
+    Args:
+        html: Page HTML
+        url: Final URL of the page (if known)
+
+    Returns:
+        dict: {url, html_length, challenge_markers, visible_challenge_form,
+               visible_challenge_element, verifying_text}
+    """
+    html = html or ''
+    head = html[:MARKER_WINDOW].lower()
+    probe = {
+        'url': url or '',
+        'html_length': len(html),
+        'challenge_markers': [marker for marker in CHALLENGE_MARKERS if marker in head],
+        'visible_challenge_form': False,
+        'visible_challenge_element': False,
+        'verifying_text': [],
+    }
+    # Element and text checks only matter for small pages (see is_challenge)
+    if len(html) < 5000:
+        probe['visible_challenge_form'] = bool(_FORM_RE.search(html))
+        probe['visible_challenge_element'] = bool(_ELEMENT_RE.search(html))
+        text = _TAG_RE.sub(' ', _HIDDEN_BLOCK_RE.sub(' ', html)).lower()
+        probe['verifying_text'] = [marker for marker in VERIFYING_TEXT_MARKERS if marker in text]
+    return probe
+
+
+def probe_driver(driver):
+    """
+    Probe the current page of a WebDriver with one execute_script call
+
+    Falls back to detect_challenge_html() over current_url/page_source if the
+    script can't run.
+
+    Returns:
+        dict: Probe (see detect_challenge_html), or None if the driver is unusable
+    """
+    try:
+        probe = driver.execute_script(PROBE_SCRIPT, list(CHALLENGE_MARKERS), list(VERIFYING_TEXT_MARKERS),
+                                      CHALLENGE_FORM_SELECTOR, CHALLENGE_ELEMENT_SELECTOR, MARKER_WINDOW)
+        if isinstance(probe, dict) and 'html_length' in probe:
+            return probe
+    except Exception:
+        pass
+    try:
+        return detect_challenge_html(driver.page_source, driver.current_url)
+    except Exception:
+        return None
+
+
+def on_challenge_url(probe):
+    url = (probe or {}).get('url', '').lower()
+    return any(marker in url for marker in CHALLENGE_URL_MARKERS)
+
+
+def is_challenge(probe):
+    """
+    STRICT challenge detection (has_cloudflare_challenge semantics)
+
+    Only True on an actual challenge page: a challenge URL, or a small page
+    (<5KB) with strict challenge text, a visible challenge form/element or
+    visible verification text. Sites that merely use Cloudflare's CDN don't match.
+    """
+    if not probe:
+        return False
+    if on_challenge_url(probe):
+        return True
+
+    length = probe.get('html_length', 0)
+    if length > 5000:
+        return False
+
+    if any(marker in STRICT_CHALLENGE_MARKERS for marker in probe.get('challenge_markers', [])):
+        if probe.get('visible_challenge_form'):
+            return True
+        # Strict text without a form: only trust it on very small pages
+        if length < 2000:
+            return True
+
+    if probe.get('visible_challenge_element') and length < 3000:
+        return True
+    return bool(probe.get('verifying_text')) and length < 5000
+
+
+def challenge_pending(probe):
+    """True while a page being polled still shows a challenge (or can't be probed)"""
+    if not probe:
+        return True
+    return (any(marker in PENDING_CHALLENGE_MARKERS for marker in probe.get('challenge_markers', []))
+            or is_challenge(probe))
+
+
+def challenge_cleared(probe, min_length=8000):
+    """
+    True once a page waited on is past the challenge: off the challenge URL,
+    no challenge text or visible challenge elements, no visible verification
+    text, and substantial content
+    """
+    if not probe or on_challenge_url(probe):
+        return False
+    return (not probe.get('challenge_markers') and not probe.get('visible_challenge_element')
+            and 'verifying' not in probe.get('verifying_text', []) and probe.get('html_length', 0) > min_length)
@@ -0,0 +1,263 @@
+"""
+Cached Chrome / chromedriver environment probe
+
+Detecting the Chrome version spawns PowerShell or `chrome --version`, and
+undetected_chromedriver re-checks (and may re-download and re-patch)
+chromedriver every time a browser starts. Both answers only change when the
+binaries change, so they are probed once per machine and stored in a JSON
+cache keyed by the binaries' mtimes:
+
+    {"chrome": {"path", "mtime", "version", "major"},
+     "driver": {"path", "mtime", "major"}}
+
+Every scraper instance in a process shares one DriverEnvironment, and worker
+processes share the cache file (written atomically). An entry is re-probed
+when its binary's mtime changes or the file disappears (e.g. a Chrome update).
+"""
+import json
+import logging
+import os
+import platform
+import re
+import shutil
+import subprocess
+import tempfile
+import threading
+
+CACHE_FILE = 'logs/driver_env.json'
+
+WINDOWS_CHROME_PATHS = [
+    r"C:\Program Files\Google\Chrome\Application\chrome.exe",
+    r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
+    os.path.expanduser(r"~\AppData\Local\Google\Chrome\Application\chrome.exe"),
+]
+CHROME_COMMANDS = ['chrome', 'google-chrome', 'google-chrome-stable', 'chromium', 'chromium-browser']
+
+
+def _mtime(path):
+    try:
+        return os.path.getmtime(path)
+    except (OSError, TypeError):
+        return None
+
+
+def _major(version_str, anchored=True):
+    match = re.search(r'^(\d+)\.' if anchored else r'(\d+)\.', version_str or '')
+    return int(match.group(1)) if match else None
+
+
+def find_chrome():
+    """Return the path of the installed Chrome binary, or None"""
+    if platform.system() == 'Windows':
+        for chrome_path in WINDOWS_CHROME_PATHS:
+            if os.path.exists(chrome_path):
+                return chrome_path
+        return shutil.which('chrome.exe')
+    for command in CHROME_COMMANDS:
+        chrome_path = shutil.which(command)
+        if chrome_path:
+            return chrome_path
+    return None
+
+
+class DriverEnvironment:
+    """
+    Process-wide cache of the Chrome version and the patched chromedriver.
+
+    chrome_version() answers from memory, then from the cache file (if the
+    Chrome binary's mtime still matches), and only then runs the subprocess
+    probe. record_driver() stores the chromedriver undetected_chromedriver
+    patched for a started browser, so later starts pass it as
+    driver_executable_path instead of patching again.
+    """
+
+    def __init__(self, cache_file=CACHE_FILE):
+        """
+        Args:
+            cache_file: JSON cache shared by all scraper processes on the machine
+        """
+        self.logger = logging.getLogger('driver_env')
+        self.cache_file = cache_file
+        self.probes = 0
+        self._data = None
+        self._failed = set()
+        self._lock = threading.RLock()
+
+    def _load(self):
+        if self._data is None:
+            self._data = {}
+            try:
+                with open(self.cache_file, 'r', encoding='utf-8') as f:
+                    self._data = json.load(f)
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                self.logger.debug(f"Ignoring unreadable driver environment cache: {str(e)}")
+        return self._data
+
+    def _save(self):
+        """Write the cache atomically so concurrent workers never read a partial file"""
+        try:
+            cache_dir = os.path.dirname(self.cache_file) or '.'
+            os.makedirs(cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(prefix='.driver_env_', suffix='.json', dir=cache_dir)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(self._data, f, indent=2)
+            os.replace(tmp_path, self.cache_file)
+        except Exception as e:
+            self.logger.debug(f"Error writing driver environment cache: {str(e)}")
+
+    def _reload_if_changed(self):
+        """Re-read the cache file to pick up entries another process wrote since this one loaded it"""
+        self._data = None
+        return self._load()
+
+    @staticmethod
+    def _chrome_matches(cached, chrome_path, mtime):
+        return bool(cached) and mtime is not None and cached.get('path') == chrome_path and cached.get('mtime') == mtime
+
+    def chrome_version(self):
+        """
+        Return the installed Chrome major version
+
+        Returns:
+            int: Major version (e.g. 142), or None if it can't be detected
+        """
+        with self._lock:
+            chrome_path = find_chrome()
+            mtime = _mtime(chrome_path)
+            key = (chrome_path, mtime)
+            if key in self._failed:
+                return None
+            cached = self._load().get('chrome')
+            if not self._chrome_matches(cached, chrome_path, mtime):
+                cached = self._reload_if_changed().get('chrome')
+            if self._chrome_matches(cached, chrome_path, mtime):
+                return cached.get('major')
+
+            version_str, source = self.probe_chrome(chrome_path)
+            major = _major(version_str, anchored=source != '--version')
+            self.probes += 1
+            if major is None:
+                # Not cached on disk (Chrome may be installed later), but not re-probed by this process
+                self._failed.add(key)
+                self.logger.warning("Could not detect Chrome version, will use auto-detection")
+                return None
+
+            self.logger.info(f"Detected Chrome version: {major} (from {source})")
+            self._data['chrome'] = {'path': chrome_path, 'mtime': mtime, 'version': version_str, 'major': major}
+            # A driver patched for another Chrome major is useless now
+            if (self._data.get('driver') or {}).get('major') not in (None, major):
+                self._data.pop('driver', None)
+            self._save()
+            return major
+
+    def probe_chrome(self, chrome_path):
+        """
+        Run the (slow) Chrome version probe
+
+        Returns:
+            tuple: (version string or None, source description)
+        """
+        if platform.system() == 'Windows':
+            if chrome_path and os.path.exists(chrome_path):
+                try:
+                    # Get version using PowerShell
+                    result = subprocess.run(
+                        ['powershell', '-Command', f'(Get-Item "{chrome_path}").VersionInfo.FileVersion'],
+                        capture_output=True, text=True, timeout=5
+                    )
+                    if result.returncode == 0 and _major(result.stdout.strip()):
+                        return result.stdout.strip(), chrome_path
+                except Exception as e:
+                    self.logger.debug(f"Error detecting Chrome version from {chrome_path}: {str(e)}")
+
+            # Fallback: Chrome's version file
+            try:
+                version_file = os.path.expanduser(r"~\AppData\Local\Google\Chrome\User Data\Last Version")
+                if os.path.exists(version_file):
+                    with open(version_file, 'r') as f:
+                        version_str = f.read().strip()
+                    if _major(version_str):
+                        return version_str, 'version file'
+            except Exception as e:
+                self.logger.debug(f"Error reading Chrome version file: {str(e)}")
+
+        # Fallback: run Chrome with --version
+        try:
+            chrome_cmd = chrome_path or ('chrome' if platform.system() != 'Windows' else 'chrome.exe')
+            result = subprocess.run([chrome_cmd, '--version'], capture_output=True, text=True, timeout=5)
+            if result.returncode == 0:
+                return result.stdout.strip(), '--version'
+        except Exception as e:
+            self.logger.debug(f"Error running Chrome --version: {str(e)}")
+        return None, 'none'
+
+    def patched_driver(self, chrome_major=None):
+        """
+        Return the cached patched chromedriver path, if it is still valid
+
+        Args:
+            chrome_major: Chrome major version the driver must match (None = any)
+
+        Returns:
+            str: Path to pass as driver_executable_path, or None
+        """
+        with self._lock:
+            cached = self._load().get('driver') or self._reload_if_changed().get('driver')
+            if not cached:
+                return None
+            if _mtime(cached.get('path')) != cached.get('mtime'):
+                self.logger.info(f"Cached chromedriver changed or missing, will re-patch: {cached.get('path')}")
+                self.forget_driver()
+                return None
+            if chrome_major is not None and cached.get('major') not in (None, chrome_major):
+                return None
+            return cached['path']
+
+    def record_driver(self, driver, chrome_major=None):
+        """
+        Remember the chromedriver binary a started uc.Chrome is using
+
+        Args:
+            driver: Started undetected_chromedriver instance
+            chrome_major: Chrome major version it was started for
+        """
+        patcher = getattr(driver, 'patcher', None)
+        path = getattr(patcher, 'executable_path', None)
+        mtime = _mtime(path)
+        if mtime is None:
+            return
+        with self._lock:
+            cached = self._load().get('driver') or {}
+            if cached.get('path') == path and cached.get('mtime') == mtime:
+                return
+            self._data['driver'] = {'path': path, 'mtime': mtime, 'major': chrome_major}
+            self._save()
+            self.logger.info(f"Cached patched chromedriver for Chrome {chrome_major or '?'}: {path}")
+
+    def forget_driver(self):
+        """Drop the cached chromedriver (e.g. after a version mismatch)"""
+        with self._lock:
+            if self._load().pop('driver', None) is not None:
+                self._save()
+
+    def invalidate(self):
+        """Drop all cached entries so the next start probes again"""
+        with self._lock:
+            self._data = {}
+            self._failed.clear()
+            self._save()
+
+
+_driver_env = None
+_driver_env_lock = threading.Lock()
+
+
+def get_driver_env():
+    """Return the process-wide DriverEnvironment"""
+    global _driver_env
+    with _driver_env_lock:
+        if _driver_env is None:
+            _driver_env = DriverEnvironment()
+        return _driver_env
@@ -1,9 +1,8 @@
 """Comprehensive error handling and recovery system for scrapers"""
-import time
 import logging
 from enum import Enum
 from typing import Optional, Callable, Any
-from datetime import datetime, timedelta
+from scrapers.clock import get_clock
 
 
 class ErrorType(Enum):
@@ -27,8 +26,9 @@ class ErrorType(Enum):
 class ErrorHandler:
     """Smart error handler with classification and recovery strategies"""
     
-    def __init__(self, logger: logging.Logger):
+    def __init__(self, logger: logging.Logger, clock=None):
         self.logger = logger
+        self.clock = clock or get_clock()
         self.error_counts = {error_type: 0 for error_type in ErrorType}
         self.last_error_time = {}
         self.circuit_breaker_threshold = 20  # Increased from 5 to 20
@@ -156,7 +156,7 @@ class ErrorHandler:
         if self.error_counts[error_type] >= self.circuit_breaker_threshold:
             last_time = self.last_error_time.get(error_type)
             if last_time:
-                time_since = (datetime.now() - last_time).total_seconds()
+                time_since = self.clock.time() - last_time
                 if time_since < self.circuit_breaker_reset_time:
                     self.logger.error(f"Circuit breaker triggered for {error_type.value} - too many consecutive errors")
                     return False
@@ -170,12 +170,12 @@ class ErrorHandler:
     def record_error(self, error_type: ErrorType):
         """Record error occurrence"""
         self.error_counts[error_type] += 1
-        self.last_error_time[error_type] = datetime.now()
+        self.last_error_time[error_type] = self.clock.time()
         
         # Reset counter if enough time has passed
         last_time = self.last_error_time.get(error_type)
         if last_time:
-            time_since = (datetime.now() - last_time).total_seconds()
+            time_since = self.clock.time() - last_time
             if time_since > self.circuit_breaker_reset_time:
                 self.error_counts[error_type] = 0
     
@@ -1,10 +1,7 @@
 """Scraper for parts.lakelandford.com (Ford parts)"""
 from scrapers.base_scraper_with_extension import BaseScraperWithExtension
-from bs4 import BeautifulSoup
-import json
 import re
 from datetime import datetime
-import time
 import traceback
 import random
 from selenium.webdriver.common.by import By
@@ -15,8 +12,8 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException
 class FordScraper(BaseScraperWithExtension):
     """Scraper for parts.lakelandford.com"""
     
-    def __init__(self):
-        super().__init__('ford', use_selenium=True)
+    def __init__(self, clock=None):
+        super().__init__('ford', use_selenium=True, clock=clock)
         self.base_url = 'https://parts.lakelandford.com'
         
     def get_product_urls(self):
@@ -53,8 +50,8 @@ class FordScraper(BaseScraperWithExtension):
             try:
                 self.page_load_timeout = 60
                 self.driver.set_page_load_timeout(60)
-                self.driver.get(search_url)
-                time.sleep(3)
+                self.driver_get(search_url)
+                self.clock.sleep(3)
             except Exception as e:
                 self.logger.error(f"Error loading search page: {str(e)}")
                 return product_urls
@@ -78,7 +75,7 @@ class FordScraper(BaseScraperWithExtension):
             self._scroll_to_load_content()
             
             # Wait a bit more for any dynamic content
-            time.sleep(3)
+            self.clock.sleep(3)
             
             # Try to find product links using Selenium first (more reliable for dynamic content)
             try:
@@ -125,8 +122,8 @@ class FordScraper(BaseScraperWithExtension):
                 self.logger.debug(f"Error finding links via Selenium: {str(e)}")
             
             # Also try BeautifulSoup parsing as fallback
-            html = self.driver.page_source
-            soup = BeautifulSoup(html, 'lxml')
+            html = self.get_page_source()
+            soup = self.make_soup(html, 'lxml')
             
             # Try multiple patterns to find product links (SimplePart platform)
             # Pattern 1: /p/Ford__/Product-Name/ID/PartNumber.html
@@ -219,7 +216,7 @@ class FordScraper(BaseScraperWithExtension):
             while scroll_attempts < max_scrolls:
                 try:
                     self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                    time.sleep(1.5)
+                    self.clock.sleep(1.5)
                     new_height = self.driver.execute_script("return document.body.scrollHeight")
                     if new_height == last_height:
                         no_change_count += 1
@@ -261,7 +258,7 @@ class FordScraper(BaseScraperWithExtension):
                 # Step 2: Wait for loading indicators to disappear
                 self.logger.debug("Waiting for loading indicators to disappear...")
                 for _ in range(20):  # Wait up to 4 seconds for loading to complete
-                    time.sleep(0.2)
+                    self.clock.sleep(0.2)
                     try:
                         loading_indicators = self.driver.find_elements(By.CSS_SELECTOR, 
                             'div.loading, div.spinner, div[class*="loading"], div[class*="spinner"], '
@@ -279,7 +276,7 @@ class FordScraper(BaseScraperWithExtension):
                 last_content_length = 0
                 
                 for check_round in range(15):  # Check for up to 3 seconds
-                    time.sleep(0.2)
+                    self.clock.sleep(0.2)
                     try:
                         current_inner_html = element.get_attribute('innerHTML') or ''
                         current_length = len(current_inner_html.strip())
@@ -347,7 +344,7 @@ class FordScraper(BaseScraperWithExtension):
                     pass
                 
                 # Step 6: Final wait for any remaining async operations
-                time.sleep(1)
+                self.clock.sleep(1)
                 
                 # Step 7: Final verification
                 final_inner_html = element.get_attribute('innerHTML') or ''
@@ -386,7 +383,7 @@ class FordScraper(BaseScraperWithExtension):
         for attempt in range(max_attempts):
             try:
                 if attempt > 0:
-                    time.sleep(wait_between_attempts)
+                    self.clock.sleep(wait_between_attempts)
                 
                 try:
                     show_more_exists = self.driver.execute_script("""
@@ -421,12 +418,12 @@ class FordScraper(BaseScraperWithExtension):
                                     continue
                                 
                                 self.driver.execute_script("arguments[0].scrollIntoView({block: 'center', behavior: 'smooth'});", element)
-                                time.sleep(0.5)
+                                self.clock.sleep(0.5)
                                 
                                 element = wait.until(EC.element_to_be_clickable((selector_type, selector_value)))
                                 element.click()
                                 self.logger.info(f"✓ Clicked 'Show More' button (attempt {attempt + 1})")
-                                time.sleep(1)
+                                self.clock.sleep(1)
                                 return True
                             except Exception as e:
                                 continue
@@ -459,7 +456,7 @@ class FordScraper(BaseScraperWithExtension):
         for check_round in range(5):
             try:
                 if check_round > 0:
-                    time.sleep(2)
+                    self.clock.sleep(2)
                 
                 for selector in selectors:
                     try:
@@ -479,7 +476,7 @@ class FordScraper(BaseScraperWithExtension):
                             
                             if valid_count > 0:
                                 self.logger.info(f"✓ Fitment data loaded: found {len(elements)} elements ({valid_count} with content) via {selector}")
-                                time.sleep(2)
+                                self.clock.sleep(2)
                                 return True
                     except Exception as e:
                         continue
@@ -503,7 +500,7 @@ class FordScraper(BaseScraperWithExtension):
                     
                     if row_count >= min_rows:
                         self.logger.info(f"✓ Fitment data loaded: found {row_count} rows via JavaScript")
-                        time.sleep(2)
+                        self.clock.sleep(2)
                         return True
                 except:
                     pass
@@ -535,7 +532,7 @@ class FordScraper(BaseScraperWithExtension):
                     if recovery['should_retry'] and retry_count < max_retries - 1:
                         wait_time = recovery['wait_time']
                         delay = random.uniform(wait_time[0], wait_time[1])
-                        time.sleep(delay)
+                        self.polite_sleep(delay, phase='retry_backoff')
                         retry_count += 1
                         continue
                     else:
@@ -544,22 +541,22 @@ class FordScraper(BaseScraperWithExtension):
                 try:
                     self.page_load_timeout = 60
                     self.driver.set_page_load_timeout(60)
-                    self.driver.get(url)
-                    time.sleep(random.uniform(0.5, 1.5))
+                    self.driver_get(url)
+                    self.polite_sleep(0.5, 1.5)
                     
                     if self.has_cloudflare_challenge():
                         cloudflare_bypassed = self.wait_for_cloudflare(timeout=30, target_url=url, max_retries=1)
                         if not cloudflare_bypassed:
                             retry_count += 1
                             if retry_count < max_retries:
-                                time.sleep(random.uniform(10, 15))
+                                self.polite_sleep(10, 15, phase='retry_backoff')
                                 continue
                             else:
                                 return None
                     
-                    time.sleep(random.uniform(1.5, 3.0))
-                    html = self.driver.page_source
-                    soup = BeautifulSoup(html, 'lxml')
+                    self.polite_sleep(1.5, 3.0)
+                    html = self.get_page_source()
+                    soup = self.make_soup(html, 'lxml')
                     
                     title_text = ''
                     title_elem = soup.find('h1')
@@ -576,7 +573,7 @@ class FordScraper(BaseScraperWithExtension):
                     if not title_text or len(title_text) < 3:
                         retry_count += 1
                         if retry_count < max_retries:
-                            time.sleep(random.uniform(10, 15))
+                            self.polite_sleep(10, 15, phase='retry_backoff')
                             continue
                         else:
                             return None
@@ -590,7 +587,7 @@ class FordScraper(BaseScraperWithExtension):
                     self.driver.set_page_load_timeout(original_timeout)
                     retry_count += 1
                     if retry_count < max_retries:
-                        time.sleep(random.uniform(5, 8))
+                        self.polite_sleep(5, 8, phase='retry_backoff')
                         continue
                     else:
                         return None
@@ -601,7 +598,7 @@ class FordScraper(BaseScraperWithExtension):
                     if any(err in error_str for err in ['connection', 'network', 'dns', 'err_', 'timeout']):
                         retry_count += 1
                         if retry_count < max_retries:
-                            time.sleep(random.uniform(5, 8))
+                            self.polite_sleep(5, 8, phase='retry_backoff')
                             continue
                         else:
                             return None
@@ -620,7 +617,7 @@ class FordScraper(BaseScraperWithExtension):
                 if retry_count < max_retries - 1:
                     wait_time = recovery['wait_time']
                     delay = random.uniform(wait_time[0], wait_time[1])
-                    time.sleep(delay)
+                    self.polite_sleep(delay, phase='retry_backoff')
                     retry_count += 1
                     continue
                 else:
@@ -629,7 +626,7 @@ class FordScraper(BaseScraperWithExtension):
         if not html:
             return None
         
-        soup = BeautifulSoup(html, 'lxml')
+        soup = self.make_soup(html, 'lxml')
         
         product_data = {
             'url': url,
@@ -844,7 +841,7 @@ class FordScraper(BaseScraperWithExtension):
                         try:
                             tab_element = wait.until(EC.element_to_be_clickable((selector_type, selector_value)))
                             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", tab_element)
-                            time.sleep(0.5)
+                            self.clock.sleep(0.5)
                             tab_element.click()
                             tab_clicked = True
                             self.logger.info("✓ Clicked 'What This Fits' tab")
@@ -875,11 +872,11 @@ class FordScraper(BaseScraperWithExtension):
                         if not fitment_loaded:
                             # Try one more time after additional wait
                             self.logger.info("🔍 Retrying fitment data load check after additional wait...")
-                            time.sleep(5)
+                            self.clock.sleep(5)
                             fitment_loaded = self._wait_for_fitment_data_loaded(timeout=20, min_rows=1)
                         
                         # Additional wait to ensure everything is stable
-                        time.sleep(1)
+                        self.clock.sleep(1)
                         
                         # Step 5: Extract fitment data directly using Selenium (more reliable for dynamic content)
                         # Use Selenium to find elements directly instead of BeautifulSoup
@@ -950,7 +947,7 @@ class FordScraper(BaseScraperWithExtension):
                         if not row_html:
                             continue
                         
-                        row_soup = BeautifulSoup(row_html, 'lxml')
+                        row_soup = self.make_soup(row_html, 'lxml')
                         
                         # Find the vehicle description span
                         fitment_div = row_soup.find('div', class_=lambda x: x and ('whatThisFitsFitment' in str(x) if x else False))
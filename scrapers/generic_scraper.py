@@ -1,27 +1,26 @@
 """Generic scraper for sites with similar structure"""
 from scrapers.base_scraper import BaseScraper
-from bs4 import BeautifulSoup
 import json
 import re
 from datetime import datetime
-import time
 
 
 class GenericScraper(BaseScraper):
     """Generic scraper that can work with most automotive parts sites"""
     
-    def __init__(self, site_config):
+    def __init__(self, site_config, clock=None):
         """
         Initialize generic scraper with site configuration
         
         Args:
             site_config: Dictionary with site configuration
+            clock: Optional clock for sleeps and timeouts (default: process-wide clock)
         """
         self.config = site_config
         site_name = site_config.get('name', 'generic')
         use_selenium = site_config.get('use_selenium', True)
         
-        super().__init__(site_name, use_selenium=use_selenium)
+        super().__init__(site_name, use_selenium=use_selenium, clock=clock)
         
         self.base_url = site_config.get('base_url', '')
         self.search_strategy = site_config.get('search_strategy', 'search')
@@ -65,7 +64,7 @@ class GenericScraper(BaseScraper):
                 if not html:
                     continue
                 
-                soup = BeautifulSoup(html, 'lxml')
+                soup = self.make_soup(html, 'lxml')
                 
                 # Look for product links (common patterns)
                 link_patterns = [
@@ -110,7 +109,7 @@ class GenericScraper(BaseScraper):
             if not html:
                 return product_urls
             
-            soup = BeautifulSoup(html, 'lxml')
+            soup = self.make_soup(html, 'lxml')
             
             # Find product links
             links = soup.find_all('a', href=re.compile(r'/(oem-parts|parts|product)/'))
@@ -141,7 +140,7 @@ class GenericScraper(BaseScraper):
         if not html:
             return None
         
-        soup = BeautifulSoup(html, 'lxml')
+        soup = self.make_soup(html, 'lxml')
         
         # Initialize product data
         product_data = {
@@ -164,10 +163,10 @@ class GenericScraper(BaseScraper):
         try:
             # Extract title - try multiple selectors
             title_selectors = [
-                ('h1', {'class_': re.compile(r'product.*title', re.I)}),
-                ('h1', {'class_': 'title'}),
+                ('h1', {'class': re.compile(r'product.*title', re.I)}),
+                ('h1', {'class': 'title'}),
                 ('h1', {}),
-                ('div', {'class_': re.compile(r'product.*name', re.I)}),
+                ('div', {'class': re.compile(r'product.*name', re.I)}),
             ]
             
             for tag, attrs in title_selectors:
@@ -183,8 +182,8 @@ class GenericScraper(BaseScraper):
             
             # Extract SKU/Part Number - try multiple selectors
             sku_selectors = [
-                ('span', {'class_': re.compile(r'sku', re.I)}),
-                ('div', {'class_': re.compile(r'part.*number', re.I)}),
+                ('span', {'class': re.compile(r'sku', re.I)}),
+                ('div', {'class': re.compile(r'part.*number', re.I)}),
                 ('span', {'itemprop': 'sku'}),
             ]
             
@@ -197,9 +196,9 @@ class GenericScraper(BaseScraper):
             
             # Extract sale price
             price_selectors = [
-                ('strong', {'class_': re.compile(r'sale.*price', re.I)}),
-                ('span', {'class_': re.compile(r'price.*sale', re.I)}),
-                ('div', {'class_': re.compile(r'price', re.I)}),
+                ('strong', {'class': re.compile(r'sale.*price', re.I)}),
+                ('span', {'class': re.compile(r'price.*sale', re.I)}),
+                ('div', {'class': re.compile(r'price', re.I)}),
             ]
             
             for tag, attrs in price_selectors:
@@ -210,8 +209,8 @@ class GenericScraper(BaseScraper):
             
             # Extract MSRP
             msrp_selectors = [
-                ('span', {'class_': re.compile(r'list.*price|msrp', re.I)}),
-                ('div', {'class_': re.compile(r'retail.*price', re.I)}),
+                ('span', {'class': re.compile(r'list.*price|msrp', re.I)}),
+                ('div', {'class': re.compile(r'retail.*price', re.I)}),
             ]
             
             for tag, attrs in msrp_selectors:
@@ -222,7 +221,7 @@ class GenericScraper(BaseScraper):
             
             # Extract image
             img_selectors = [
-                ('img', {'class_': re.compile(r'product.*image|main.*image', re.I)}),
+                ('img', {'class': re.compile(r'product.*image|main.*image', re.I)}),
                 ('img', {'itemprop': 'image'}),
             ]
             
@@ -235,9 +234,9 @@ class GenericScraper(BaseScraper):
             
             # Extract description
             desc_selectors = [
-                ('div', {'class_': re.compile(r'description', re.I)}),
-                ('span', {'class_': re.compile(r'description', re.I)}),
-                ('p', {'class_': re.compile(r'description', re.I)}),
+                ('div', {'class': re.compile(r'description', re.I)}),
+                ('span', {'class': re.compile(r'description', re.I)}),
+                ('p', {'class': re.compile(r'description', re.I)}),
             ]
             
             for tag, attrs in desc_selectors:
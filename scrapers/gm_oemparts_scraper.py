@@ -1,10 +1,8 @@
 """Scraper for g.oempartsonline.com (GM OEM parts)"""
 from scrapers.base_scraper import BaseScraper
-from bs4 import BeautifulSoup
 import json
 import re
 from datetime import datetime
-import time
 import traceback
 import random
 from selenium.webdriver.common.by import By
@@ -15,8 +13,8 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException
 class GMOemPartsScraper(BaseScraper):
     """Scraper for g.oempartsonline.com"""
     
-    def __init__(self):
-        super().__init__('gm_oemparts', use_selenium=True)
+    def __init__(self, clock=None):
+        super().__init__('gm_oemparts', use_selenium=True, clock=clock)
         self.base_url = 'https://g.oempartsonline.com'
         
     def get_product_urls(self):
@@ -32,7 +30,6 @@ class GMOemPartsScraper(BaseScraper):
             
         except Exception as e:
             self.logger.error(f"Error getting product URLs: {str(e)}")
-            import traceback
             self.logger.debug(f"Traceback: {traceback.format_exc()}")
         
         return product_urls
@@ -74,8 +71,8 @@ class GMOemPartsScraper(BaseScraper):
                 pass
             
             self._scroll_to_load_content()
-            html = self.driver.page_source
-            soup = BeautifulSoup(html, 'lxml')
+            html = self.get_page_source()
+            soup = self.make_soup(html, 'lxml')
             
             # Find product links - try multiple patterns
             product_links = (soup.find_all('a', href=re.compile(r'/product/')) +
@@ -134,8 +131,8 @@ class GMOemPartsScraper(BaseScraper):
                                 self.driver.set_page_load_timeout(60)
                                 
                                 # Load the page directly
-                                self.driver.get(pag_url)
-                                time.sleep(2)  # Wait for page to load
+                                self.driver_get(pag_url)
+                                self.clock.sleep(2)  # Wait for page to load
                                 
                                 # Wait for product links to appear
                                 try:
@@ -186,7 +183,7 @@ class GMOemPartsScraper(BaseScraper):
                         while scroll_attempts < 30:  # Limit per page
                             try:
                                 self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                                time.sleep(1)
+                                self.clock.sleep(1)
                                 new_height = self.driver.execute_script("return document.body.scrollHeight")
                                 
                                 if new_height == last_height:
@@ -205,7 +202,7 @@ class GMOemPartsScraper(BaseScraper):
                     
                     # Extract product links from this page - with timeout protection
                     try:
-                        html = self.driver.page_source
+                        html = self.get_page_source()
                     except Exception as page_source_error:
                         self.logger.warning(f"Error accessing page_source on page {page_num}: {str(page_source_error)}")
                         # Try to get HTML via get_page() as fallback
@@ -215,7 +212,7 @@ class GMOemPartsScraper(BaseScraper):
                             page_num += 1
                             continue
                     
-                    soup = BeautifulSoup(html, 'lxml')
+                    soup = self.make_soup(html, 'lxml')
                     page_links = (soup.find_all('a', href=re.compile(r'/product/')) +
                                  soup.find_all('a', href=re.compile(r'/parts/')) +
                                  soup.find_all('a', href=re.compile(r'/oem-parts/')))
@@ -260,7 +257,7 @@ class GMOemPartsScraper(BaseScraper):
                     page_num += 1
                     
                     # Add delay between pages to avoid being blocked
-                    time.sleep(random.uniform(2, 4))
+                    self.polite_sleep(2, 4)
                     
                 except Exception as e:
                     self.logger.error(f"Error processing page {page_num}: {str(e)}")
@@ -275,7 +272,6 @@ class GMOemPartsScraper(BaseScraper):
             
         except Exception as e:
             self.logger.error(f"Error searching for wheels: {str(e)}")
-            import traceback
             self.logger.debug(f"Traceback: {traceback.format_exc()}")
         
         return product_urls
@@ -291,7 +287,7 @@ class GMOemPartsScraper(BaseScraper):
             while scroll_attempts < max_scrolls:
                 try:
                     self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                    time.sleep(1.5)
+                    self.clock.sleep(1.5)
                     new_height = self.driver.execute_script("return document.body.scrollHeight")
                     if new_height == last_height:
                         no_change_count += 1
@@ -327,7 +323,7 @@ class GMOemPartsScraper(BaseScraper):
                     if recovery['should_retry'] and retry_count < max_retries - 1:
                         wait_time = recovery['wait_time']
                         delay = random.uniform(wait_time[0], wait_time[1])
-                        time.sleep(delay)
+                        self.polite_sleep(delay, phase='retry_backoff')
                         retry_count += 1
                         continue
                     else:
@@ -336,22 +332,22 @@ class GMOemPartsScraper(BaseScraper):
                 try:
                     self.page_load_timeout = 60
                     self.driver.set_page_load_timeout(60)
-                    self.driver.get(url)
-                    time.sleep(random.uniform(0.5, 1.5))
+                    self.driver_get(url)
+                    self.polite_sleep(0.5, 1.5)
                     
                     if self.has_cloudflare_challenge():
                         cloudflare_bypassed = self.wait_for_cloudflare(timeout=30, target_url=url, max_retries=1)
                         if not cloudflare_bypassed:
                             retry_count += 1
                             if retry_count < max_retries:
-                                time.sleep(random.uniform(10, 15))
+                                self.polite_sleep(10, 15, phase='retry_backoff')
                                 continue
                             else:
                                 return None
                     
-                    time.sleep(random.uniform(1.5, 3.0))
-                    html = self.driver.page_source
-                    soup = BeautifulSoup(html, 'lxml')
+                    self.polite_sleep(1.5, 3.0)
+                    html = self.get_page_source()
+                    soup = self.make_soup(html, 'lxml')
                     
                     title_text = ''
                     title_elem = soup.find('h1')
@@ -368,7 +364,7 @@ class GMOemPartsScraper(BaseScraper):
                     if not title_text or len(title_text) < 3:
                         retry_count += 1
                         if retry_count < max_retries:
-                            time.sleep(random.uniform(10, 15))
+                            self.polite_sleep(10, 15, phase='retry_backoff')
                             continue
                         else:
                             return None
@@ -382,7 +378,7 @@ class GMOemPartsScraper(BaseScraper):
                     self.driver.set_page_load_timeout(original_timeout)
                     retry_count += 1
                     if retry_count < max_retries:
-                        time.sleep(random.uniform(5, 8))
+                        self.polite_sleep(5, 8, phase='retry_backoff')
                         continue
                     else:
                         return None
@@ -393,7 +389,7 @@ class GMOemPartsScraper(BaseScraper):
                     if any(err in error_str for err in ['connection', 'network', 'dns', 'err_', 'timeout']):
                         retry_count += 1
                         if retry_count < max_retries:
-                            time.sleep(random.uniform(5, 8))
+                            self.polite_sleep(5, 8, phase='retry_backoff')
                             continue
                         else:
                             return None
@@ -412,7 +408,7 @@ class GMOemPartsScraper(BaseScraper):
                 if retry_count < max_retries - 1:
                     wait_time = recovery['wait_time']
                     delay = random.uniform(wait_time[0], wait_time[1])
-                    time.sleep(delay)
+                    self.polite_sleep(delay, phase='retry_backoff')
                     retry_count += 1
                     continue
                 else:
@@ -421,7 +417,7 @@ class GMOemPartsScraper(BaseScraper):
         if not html:
             return None
         
-        soup = BeautifulSoup(html, 'lxml')
+        soup = self.make_soup(html, 'lxml')
         
         product_data = {
             'url': url,
@@ -696,7 +692,6 @@ class GMOemPartsScraper(BaseScraper):
             
         except Exception as e:
             self.logger.error(f"❌ Error scraping product {url}: {self.safe_str(e)}")
-            import traceback
             self.logger.debug(f"Traceback: {traceback.format_exc()}")
             return None
 
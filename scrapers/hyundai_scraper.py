@@ -1,10 +1,8 @@
 """Scraper for hyundai.oempartsonline.com (Hyundai parts)"""
 from scrapers.base_scraper import BaseScraper
-from bs4 import BeautifulSoup
 import json
 import re
 from datetime import datetime
-import time
 import traceback
 import random
 from selenium.webdriver.common.by import By
@@ -15,8 +13,8 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException
 class HyundaiScraper(BaseScraper):
     """Scraper for hyundai.oempartsonline.com"""
     
-    def __init__(self):
-        super().__init__('hyundai', use_selenium=True)
+    def __init__(self, clock=None):
+        super().__init__('hyundai', use_selenium=True, clock=clock)
         self.base_url = 'https://hyundai.oempartsonline.com'
         
     def get_product_urls(self):
@@ -32,7 +30,6 @@ class HyundaiScraper(BaseScraper):
             
         except Exception as e:
             self.logger.error(f"Error getting product URLs: {str(e)}")
-            import traceback
             self.logger.debug(f"Traceback: {traceback.format_exc()}")
         
         return product_urls
@@ -74,8 +71,8 @@ class HyundaiScraper(BaseScraper):
                 pass
             
             self._scroll_to_load_content()
-            html = self.driver.page_source
-            soup = BeautifulSoup(html, 'lxml')
+            html = self.get_page_source()
+            soup = self.make_soup(html, 'lxml')
             
             # Find product links - try multiple patterns
             product_links = (soup.find_all('a', href=re.compile(r'/product/')) +
@@ -133,8 +130,8 @@ class HyundaiScraper(BaseScraper):
                                 self.driver.set_page_load_timeout(60)
                                 
                                 # Load the page directly
-                                self.driver.get(pag_url)
-                                time.sleep(2)  # Wait for page to load
+                                self.driver_get(pag_url)
+                                self.clock.sleep(2)  # Wait for page to load
                                 
                                 # Wait for product links to appear
                                 try:
@@ -185,7 +182,7 @@ class HyundaiScraper(BaseScraper):
                         while scroll_attempts < 30:  # Limit per page
                             try:
                                 self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                                time.sleep(1)
+                                self.clock.sleep(1)
                                 new_height = self.driver.execute_script("return document.body.scrollHeight")
                                 
                                 if new_height == last_height:
@@ -204,7 +201,7 @@ class HyundaiScraper(BaseScraper):
                     
                     # Extract product links from this page
                     try:
-                        html = self.driver.page_source
+                        html = self.get_page_source()
                     except Exception as page_source_error:
                         self.logger.warning(f"Error accessing page_source on page {page_num}: {str(page_source_error)}")
                         # Try to get HTML via get_page() as fallback
@@ -214,7 +211,7 @@ class HyundaiScraper(BaseScraper):
                             page_num += 1
                             continue
                     
-                    soup = BeautifulSoup(html, 'lxml')
+                    soup = self.make_soup(html, 'lxml')
                     page_links = (soup.find_all('a', href=re.compile(r'/product/')) +
                                  soup.find_all('a', href=re.compile(r'/parts/')) +
                                  soup.find_all('a', href=re.compile(r'/oem-parts/')) +
@@ -257,7 +254,7 @@ class HyundaiScraper(BaseScraper):
                         consecutive_empty_pages = 0  # Reset counter if we found new products
                     
                     # Add delay between pages
-                    time.sleep(random.uniform(2, 4))
+                    self.polite_sleep(2, 4)
                     page_num += 1
                     
                 except Exception as page_error:
@@ -271,7 +268,6 @@ class HyundaiScraper(BaseScraper):
             
         except Exception as e:
             self.logger.error(f"Error searching for wheels: {str(e)}")
-            import traceback
             self.logger.debug(f"Traceback: {traceback.format_exc()}")
         
         return product_urls
@@ -287,7 +283,7 @@ class HyundaiScraper(BaseScraper):
             while scroll_attempts < max_scrolls:
                 try:
                     self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                    time.sleep(1.5)
+                    self.clock.sleep(1.5)
                     new_height = self.driver.execute_script("return document.body.scrollHeight")
                     if new_height == last_height:
                         no_change_count += 1
@@ -323,7 +319,7 @@ class HyundaiScraper(BaseScraper):
                     if recovery['should_retry'] and retry_count < max_retries - 1:
                         wait_time = recovery['wait_time']
                         delay = random.uniform(wait_time[0], wait_time[1])
-                        time.sleep(delay)
+                        self.polite_sleep(delay, phase='retry_backoff')
                         retry_count += 1
                         continue
                     else:
@@ -332,22 +328,22 @@ class HyundaiScraper(BaseScraper):
                 try:
                     self.page_load_timeout = 60
                     self.driver.set_page_load_timeout(60)
-                    self.driver.get(url)
-                    time.sleep(random.uniform(0.5, 1.5))
+                    self.driver_get(url)
+                    self.polite_sleep(0.5, 1.5)
                     
                     if self.has_cloudflare_challenge():
                         cloudflare_bypassed = self.wait_for_cloudflare(timeout=30, target_url=url, max_retries=1)
                         if not cloudflare_bypassed:
                             retry_count += 1
                             if retry_count < max_retries:
-                                time.sleep(random.uniform(10, 15))
+                                self.polite_sleep(10, 15, phase='retry_backoff')
                                 continue
                             else:
                                 return None
                     
-                    time.sleep(random.uniform(1.5, 3.0))
-                    html = self.driver.page_source
-                    soup = BeautifulSoup(html, 'lxml')
+                    self.polite_sleep(1.5, 3.0)
+                    html = self.get_page_source()
+                    soup = self.make_soup(html, 'lxml')
                     
                     title_text = ''
                     title_elem = soup.find('h1')
@@ -364,7 +360,7 @@ class HyundaiScraper(BaseScraper):
                     if not title_text or len(title_text) < 3:
                         retry_count += 1
                         if retry_count < max_retries:
-                            time.sleep(random.uniform(10, 15))
+                            self.polite_sleep(10, 15, phase='retry_backoff')
                             continue
                         else:
                             return None
@@ -378,7 +374,7 @@ class HyundaiScraper(BaseScraper):
                     self.driver.set_page_load_timeout(original_timeout)
                     retry_count += 1
                     if retry_count < max_retries:
-                        time.sleep(random.uniform(5, 8))
+                        self.polite_sleep(5, 8, phase='retry_backoff')
                         continue
                     else:
                         return None
@@ -389,7 +385,7 @@ class HyundaiScraper(BaseScraper):
                     if any(err in error_str for err in ['connection', 'network', 'dns', 'err_', 'timeout']):
                         retry_count += 1
                         if retry_count < max_retries:
-                            time.sleep(random.uniform(5, 8))
+                            self.polite_sleep(5, 8, phase='retry_backoff')
                             continue
                         else:
                             return None
@@ -408,7 +404,7 @@ class HyundaiScraper(BaseScraper):
                 if retry_count < max_retries - 1:
                     wait_time = recovery['wait_time']
                     delay = random.uniform(wait_time[0], wait_time[1])
-                    time.sleep(delay)
+                    self.polite_sleep(delay, phase='retry_backoff')
                     retry_count += 1
                     continue
                 else:
@@ -417,7 +413,7 @@ class HyundaiScraper(BaseScraper):
         if not html:
             return None
         
-        soup = BeautifulSoup(html, 'lxml')
+        soup = self.make_soup(html, 'lxml')
         
         product_data = {
             'url': url,
@@ -693,6 +689,5 @@ class HyundaiScraper(BaseScraper):
             
         except Exception as e:
             self.logger.error(f"❌ Error scraping product {url}: {self.safe_str(e)}")
-            import traceback
             self.logger.debug(f"Traceback: {traceback.format_exc()}")
             return None
@@ -1,10 +1,8 @@
 """Scraper for www.infinitipartsdeal.com (Infiniti parts)"""
 from scrapers.base_scraper import BaseScraper
-from bs4 import BeautifulSoup
 import json
 import re
 from datetime import datetime
-import time
 import traceback
 import random
 from selenium.webdriver.common.by import By
@@ -15,8 +13,8 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException
 class InfinitiScraper(BaseScraper):
     """Scraper for www.infinitipartsdeal.com"""
     
-    def __init__(self):
-        super().__init__('infiniti', use_selenium=True)
+    def __init__(self, clock=None):
+        super().__init__('infiniti', use_selenium=True, clock=clock)
         self.base_url = 'https://www.infinitipartsdeal.com'
         
     def get_product_urls(self):
@@ -32,7 +30,6 @@ class InfinitiScraper(BaseScraper):
             
         except Exception as e:
             self.logger.error(f"Error getting product URLs: {str(e)}")
-            import traceback
             self.logger.debug(f"Traceback: {traceback.format_exc()}")
         
         return product_urls
@@ -70,10 +67,9 @@ class InfinitiScraper(BaseScraper):
                     
                     # Delay between categories
                     if idx < len(category_urls):
-                        time.sleep(random.uniform(1, 2))
+                        self.polite_sleep(1, 2)
                 except Exception as e:
                     self.logger.error(f"Error processing category {idx}/{len(category_urls)} ({category_url}): {str(e)}")
-                    import traceback
                     self.logger.debug(f"Traceback: {traceback.format_exc()}")
                     continue
             
@@ -124,8 +120,8 @@ class InfinitiScraper(BaseScraper):
             self._scroll_to_load_content()
             
             # Get updated HTML after scrolling
-            html = self.driver.page_source
-            soup = BeautifulSoup(html, 'lxml')
+            html = self.get_page_source()
+            soup = self.make_soup(html, 'lxml')
             
             # Extract individual product links from the first page
             self.logger.info(f"Extracting products from {category_url} page 1...")
@@ -260,7 +256,7 @@ class InfinitiScraper(BaseScraper):
                             if not pag_html or len(pag_html) < 5000:
                                 continue
                             
-                            pag_soup = BeautifulSoup(pag_html, 'lxml')
+                            pag_soup = self.make_soup(pag_html, 'lxml')
                             
                             # Scroll to load all products on this page (if lazy loading)
                             try:
@@ -268,7 +264,7 @@ class InfinitiScraper(BaseScraper):
                                 scroll_attempts = 0
                                 while scroll_attempts < 20:
                                     self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                                    time.sleep(1)
+                                    self.clock.sleep(1)
                                     new_height = self.driver.execute_script("return document.body.scrollHeight")
                                     if new_height == last_height:
                                         break
@@ -276,8 +272,8 @@ class InfinitiScraper(BaseScraper):
                                     scroll_attempts += 1
                                 
                                 # Get updated HTML after scrolling
-                                pag_html = self.driver.page_source
-                                pag_soup = BeautifulSoup(pag_html, 'lxml')
+                                pag_html = self.get_page_source()
+                                pag_soup = self.make_soup(pag_html, 'lxml')
                             except:
                                 pass
                             
@@ -348,11 +344,10 @@ class InfinitiScraper(BaseScraper):
                     
                     # Delay between pages
                     if page_num < total_pages:
-                        time.sleep(random.uniform(1, 2))
+                        self.polite_sleep(1, 2)
             
         except Exception as e:
             self.logger.error(f"Error extracting products from category {category_url}: {str(e)}")
-            import traceback
             self.logger.debug(f"Traceback: {traceback.format_exc()}")
         
         return new_urls
@@ -368,7 +363,7 @@ class InfinitiScraper(BaseScraper):
             while scroll_attempts < max_scrolls:
                 try:
                     self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                    time.sleep(1.5)
+                    self.clock.sleep(1.5)
                     new_height = self.driver.execute_script("return document.body.scrollHeight")
                     if new_height == last_height:
                         no_change_count += 1
@@ -435,7 +430,7 @@ class InfinitiScraper(BaseScraper):
                     if recovery['should_retry'] and retry_count < max_retries - 1:
                         wait_time = recovery['wait_time']
                         delay = random.uniform(wait_time[0], wait_time[1])
-                        time.sleep(delay)
+                        self.polite_sleep(delay, phase='retry_backoff')
                         retry_count += 1
                         continue
                     else:
@@ -444,22 +439,22 @@ class InfinitiScraper(BaseScraper):
                 try:
                     self.page_load_timeout = 60
                     self.driver.set_page_load_timeout(60)
-                    self.driver.get(url)
-                    time.sleep(random.uniform(0.5, 1.5))
+                    self.driver_get(url)
+                    self.polite_sleep(0.5, 1.5)
                     
                     if self.has_cloudflare_challenge():
                         cloudflare_bypassed = self.wait_for_cloudflare(timeout=30, target_url=url, max_retries=1)
                         if not cloudflare_bypassed:
                             retry_count += 1
                             if retry_count < max_retries:
-                                time.sleep(random.uniform(10, 15))
+                                self.polite_sleep(10, 15, phase='retry_backoff')
                                 continue
                             else:
                                 return None
                     
-                    time.sleep(random.uniform(1.5, 3.0))
-                    html = self.driver.page_source
-                    soup = BeautifulSoup(html, 'lxml')
+                    self.polite_sleep(1.5, 3.0)
+                    html = self.get_page_source()
+                    soup = self.make_soup(html, 'lxml')
                     
                     title_text = ''
                     title_elem = soup.find('h1')
@@ -476,7 +471,7 @@ class InfinitiScraper(BaseScraper):
                     if not title_text or len(title_text) < 3:
                         retry_count += 1
                         if retry_count < max_retries:
-                            time.sleep(random.uniform(10, 15))
+                            self.polite_sleep(10, 15, phase='retry_backoff')
                             continue
                         else:
                             return None
@@ -490,7 +485,7 @@ class InfinitiScraper(BaseScraper):
                     self.driver.set_page_load_timeout(original_timeout)
                     retry_count += 1
                     if retry_count < max_retries:
-                        time.sleep(random.uniform(5, 8))
+                        self.polite_sleep(5, 8, phase='retry_backoff')
                         continue
                     else:
                         return None
@@ -501,7 +496,7 @@ class InfinitiScraper(BaseScraper):
                     if any(err in error_str for err in ['connection', 'network', 'dns', 'err_', 'timeout']):
                         retry_count += 1
                         if retry_count < max_retries:
-                            time.sleep(random.uniform(5, 8))
+                            self.polite_sleep(5, 8, phase='retry_backoff')
                             continue
                         else:
                             return None
@@ -520,7 +515,7 @@ class InfinitiScraper(BaseScraper):
                 if retry_count < max_retries - 1:
                     wait_time = recovery['wait_time']
                     delay = random.uniform(wait_time[0], wait_time[1])
-                    time.sleep(delay)
+                    self.polite_sleep(delay, phase='retry_backoff')
                     retry_count += 1
                     continue
                 else:
@@ -529,7 +524,7 @@ class InfinitiScraper(BaseScraper):
         if not html:
             return None
         
-        soup = BeautifulSoup(html, 'lxml')
+        soup = self.make_soup(html, 'lxml')
         
         product_data = {
             'url': url,
@@ -872,7 +867,6 @@ class InfinitiScraper(BaseScraper):
             
         except Exception as e:
             self.logger.error(f"❌ Error scraping product {url}: {self.safe_str(e)}")
-            import traceback
             self.logger.debug(f"Traceback: {traceback.format_exc()}")
             return None
 
@@ -1,10 +1,7 @@
 """Scraper for parts.jaguarpalmbeach.com (Jaguar parts) - SimplePart platform"""
 from scrapers.base_scraper_with_extension import BaseScraperWithExtension
-from bs4 import BeautifulSoup
-import json
 import re
 from datetime import datetime
-import time
 import traceback
 import random
 from selenium.webdriver.common.by import By
@@ -15,8 +12,8 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException
 class JaguarScraper(BaseScraperWithExtension):
     """Scraper for parts.jaguarpalmbeach.com - Uses SimplePart platform (same as Audi USA)"""
     
-    def __init__(self):
-        super().__init__('jaguar', use_selenium=True)
+    def __init__(self, clock=None):
+        super().__init__('jaguar', use_selenium=True, clock=clock)
         self.base_url = 'https://parts.jaguarpalmbeach.com'
         
     def get_product_urls(self):
@@ -97,8 +94,8 @@ class JaguarScraper(BaseScraperWithExtension):
             self._scroll_to_load_content()
             
             # Get updated HTML after scrolling
-            html = self.driver.page_source
-            soup = BeautifulSoup(html, 'lxml')
+            html = self.get_page_source()
+            soup = self.make_soup(html, 'lxml')
             
             # Extract all product links matching the pattern /p/Jaguar__/Product-Name/ID/PartNumber.html
             product_links = soup.find_all('a', href=re.compile(r'/p/Jaguar__/[^/]+/\d+/[^/]+\.html', re.I))
@@ -169,8 +166,8 @@ class JaguarScraper(BaseScraperWithExtension):
                     pass
             
             self._scroll_to_load_content()
-            html = self.driver.page_source
-            soup = BeautifulSoup(html, 'lxml')
+            html = self.get_page_source()
+            soup = self.make_soup(html, 'lxml')
             
             product_links = soup.find_all('a', href=re.compile(r'/p/Jaguar__/'))
             for link in product_links:
@@ -201,7 +198,7 @@ class JaguarScraper(BaseScraperWithExtension):
             while scroll_attempts < max_scrolls:
                 try:
                     self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                    time.sleep(1.5)
+                    self.clock.sleep(1.5)
                     new_height = self.driver.execute_script("return document.body.scrollHeight")
                     if new_height == last_height:
                         no_change_count += 1
@@ -243,7 +240,7 @@ class JaguarScraper(BaseScraperWithExtension):
                 # Step 2: Wait for loading indicators to disappear
                 self.logger.debug("Waiting for loading indicators to disappear...")
                 for _ in range(20):  # Wait up to 4 seconds for loading to complete
-                    time.sleep(0.2)
+                    self.clock.sleep(0.2)
                     try:
                         loading_indicators = self.driver.find_elements(By.CSS_SELECTOR, 
                             'div.loading, div.spinner, div[class*="loading"], div[class*="spinner"], '
@@ -261,7 +258,7 @@ class JaguarScraper(BaseScraperWithExtension):
                 last_content_length = 0
                 
                 for check_round in range(15):  # Check for up to 3 seconds
-                    time.sleep(0.2)
+                    self.clock.sleep(0.2)
                     try:
                         current_inner_html = element.get_attribute('innerHTML') or ''
                         current_length = len(current_inner_html.strip())
@@ -330,7 +327,7 @@ class JaguarScraper(BaseScraperWithExtension):
                     pass
                 
                 # Step 6: Final wait for any remaining async operations
-                time.sleep(1)
+                self.clock.sleep(1)
                 
                 # Step 7: Final verification
                 final_inner_html = element.get_attribute('innerHTML') or ''
@@ -369,7 +366,7 @@ class JaguarScraper(BaseScraperWithExtension):
         for attempt in range(max_attempts):
             try:
                 if attempt > 0:
-                    time.sleep(wait_between_attempts)
+                    self.clock.sleep(wait_between_attempts)
                 
                 try:
                     show_more_exists = self.driver.execute_script("""
@@ -404,12 +401,12 @@ class JaguarScraper(BaseScraperWithExtension):
                                     continue
                                 
                                 self.driver.execute_script("arguments[0].scrollIntoView({block: 'center', behavior: 'smooth'});", element)
-                                time.sleep(0.5)
+                                self.clock.sleep(0.5)
                                 
                                 element = wait.until(EC.element_to_be_clickable((selector_type, selector_value)))
                                 element.click()
                                 self.logger.info(f"✓ Clicked 'Show More' button (attempt {attempt + 1})")
-                                time.sleep(1)
+                                self.clock.sleep(1)
                                 return True
                             except Exception as e:
                                 continue
@@ -442,7 +439,7 @@ class JaguarScraper(BaseScraperWithExtension):
         for check_round in range(5):
             try:
                 if check_round > 0:
-                    time.sleep(2)
+                    self.clock.sleep(2)
                 
                 for selector in selectors:
                     try:
@@ -462,7 +459,7 @@ class JaguarScraper(BaseScraperWithExtension):
                             
                             if valid_count > 0:
                                 self.logger.info(f"✓ Fitment data loaded: found {len(elements)} elements ({valid_count} with content) via {selector}")
-                                time.sleep(2)
+                                self.clock.sleep(2)
                                 return True
                     except Exception as e:
                         continue
@@ -486,7 +483,7 @@ class JaguarScraper(BaseScraperWithExtension):
                     
                     if row_count >= min_rows:
                         self.logger.info(f"✓ Fitment data loaded: found {row_count} rows via JavaScript")
-                        time.sleep(2)
+                        self.clock.sleep(2)
                         return True
                 except:
                     pass
@@ -518,7 +515,7 @@ class JaguarScraper(BaseScraperWithExtension):
                     if recovery['should_retry'] and retry_count < max_retries - 1:
                         wait_time = recovery['wait_time']
                         delay = random.uniform(wait_time[0], wait_time[1])
-                        time.sleep(delay)
+                        self.polite_sleep(delay, phase='retry_backoff')
                         retry_count += 1
                         continue
                     else:
@@ -527,22 +524,22 @@ class JaguarScraper(BaseScraperWithExtension):
                 try:
                     self.page_load_timeout = 60
                     self.driver.set_page_load_timeout(60)
-                    self.driver.get(url)
-                    time.sleep(random.uniform(0.5, 1.5))
+                    self.driver_get(url)
+                    self.polite_sleep(0.5, 1.5)
                     
                     if self.has_cloudflare_challenge():
                         cloudflare_bypassed = self.wait_for_cloudflare(timeout=30, target_url=url, max_retries=1)
                         if not cloudflare_bypassed:
                             retry_count += 1
                             if retry_count < max_retries:
-                                time.sleep(random.uniform(10, 15))
+                                self.polite_sleep(10, 15, phase='retry_backoff')
                                 continue
                             else:
                                 return None
                     
-                    time.sleep(random.uniform(1.5, 3.0))
-                    html = self.driver.page_source
-                    soup = BeautifulSoup(html, 'lxml')
+                    self.polite_sleep(1.5, 3.0)
+                    html = self.get_page_source()
+                    soup = self.make_soup(html, 'lxml')
                     
                     title_text = ''
                     title_elem = soup.find('h1')
@@ -559,7 +556,7 @@ class JaguarScraper(BaseScraperWithExtension):
                     if not title_text or len(title_text) < 3:
                         retry_count += 1
                         if retry_count < max_retries:
-                            time.sleep(random.uniform(10, 15))
+                            self.polite_sleep(10, 15, phase='retry_backoff')
                             continue
                         else:
                             return None
@@ -573,7 +570,7 @@ class JaguarScraper(BaseScraperWithExtension):
                     self.driver.set_page_load_timeout(original_timeout)
                     retry_count += 1
                     if retry_count < max_retries:
-                        time.sleep(random.uniform(5, 8))
+                        self.polite_sleep(5, 8, phase='retry_backoff')
                         continue
                     else:
                         return None
@@ -584,7 +581,7 @@ class JaguarScraper(BaseScraperWithExtension):
                     if any(err in error_str for err in ['connection', 'network', 'dns', 'err_', 'timeout']):
                         retry_count += 1
                         if retry_count < max_retries:
-                            time.sleep(random.uniform(5, 8))
+                            self.polite_sleep(5, 8, phase='retry_backoff')
                             continue
                         else:
                             return None
@@ -603,7 +600,7 @@ class JaguarScraper(BaseScraperWithExtension):
                 if retry_count < max_retries - 1:
                     wait_time = recovery['wait_time']
                     delay = random.uniform(wait_time[0], wait_time[1])
-                    time.sleep(delay)
+                    self.polite_sleep(delay, phase='retry_backoff')
                     retry_count += 1
                     continue
                 else:
@@ -612,7 +609,7 @@ class JaguarScraper(BaseScraperWithExtension):
         if not html:
             return None
         
-        soup = BeautifulSoup(html, 'lxml')
+        soup = self.make_soup(html, 'lxml')
         
         product_data = {
             'url': url,
@@ -797,7 +794,7 @@ class JaguarScraper(BaseScraperWithExtension):
                         try:
                             tab_element = wait.until(EC.element_to_be_clickable((selector_type, selector_value)))
                             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", tab_element)
-                            time.sleep(0.5)
+                            self.clock.sleep(0.5)
                             tab_element.click()
                             tab_clicked = True
                             self.logger.info("✓ Clicked 'What This Fits' tab")
@@ -828,11 +825,11 @@ class JaguarScraper(BaseScraperWithExtension):
                         if not fitment_loaded:
                             # Try one more time after additional wait
                             self.logger.info("🔍 Retrying fitment data load check after additional wait...")
-                            time.sleep(5)
+                            self.clock.sleep(5)
                             fitment_loaded = self._wait_for_fitment_data_loaded(timeout=20, min_rows=1)
                         
                         # Additional wait to ensure everything is stable
-                        time.sleep(1)
+                        self.clock.sleep(1)
                         
                         # Step 5: Extract fitment data directly using Selenium (more reliable for dynamic content)
                         # Use Selenium to find elements directly instead of BeautifulSoup
@@ -903,7 +900,7 @@ class JaguarScraper(BaseScraperWithExtension):
                         if not row_html:
                             continue
                         
-                        row_soup = BeautifulSoup(row_html, 'lxml')
+                        row_soup = self.make_soup(row_html, 'lxml')
                         
                         # Handle both table rows (tr) and div structures
                         vehicle_text = ''
@@ -1,10 +1,7 @@
 """Scraper for www.kiapartsnow.com (Kia parts) - Auto Parts Prime platform"""
 from scrapers.base_scraper import BaseScraper
-from bs4 import BeautifulSoup
-import json
 import re
 from datetime import datetime
-import time
 import traceback
 import random
 from selenium.webdriver.common.by import By
@@ -15,8 +12,8 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException
 class KiaScraper(BaseScraper):
     """Scraper for www.kiapartsnow.com - Uses Auto Parts Prime platform (similar to AcuraPartsWarehouse)"""
     
-    def __init__(self):
-        super().__init__('kia', use_selenium=True)
+    def __init__(self, clock=None):
+        super().__init__('kia', use_selenium=True, clock=clock)
         self.base_url = 'https://www.kiapartsnow.com'
         
     def get_product_urls(self):
@@ -44,7 +41,6 @@ class KiaScraper(BaseScraper):
             
         except Exception as e:
             self.logger.error(f"Error getting product URLs: {str(e)}")
-            import traceback
             self.logger.debug(f"Traceback: {traceback.format_exc()}")
         
         return product_urls
@@ -81,10 +77,9 @@ class KiaScraper(BaseScraper):
                     
                     # Delay between categories
                     if idx < len(category_urls):
-                        time.sleep(random.uniform(1, 2))
+                        self.polite_sleep(1, 2)
                 except Exception as e:
                     self.logger.error(f"Error processing category {idx}/{len(category_urls)} ({category_url}): {str(e)}")
-                    import traceback
                     self.logger.debug(f"Traceback: {traceback.format_exc()}")
                     continue
             
@@ -135,8 +130,8 @@ class KiaScraper(BaseScraper):
             self._scroll_to_load_content()
             
             # Get updated HTML after scrolling
-            html = self.driver.page_source
-            soup = BeautifulSoup(html, 'lxml')
+            html = self.get_page_source()
+            soup = self.make_soup(html, 'lxml')
             
             # Extract total page count from "Page 1 of X" pattern
             total_pages = 1
@@ -169,8 +164,8 @@ class KiaScraper(BaseScraper):
                             
                             # Scroll to load all products on this page
                             self._scroll_to_load_content()
-                            pag_html = self.driver.page_source
-                            soup = BeautifulSoup(pag_html, 'lxml')
+                            pag_html = self.get_page_source()
+                            soup = self.make_soup(pag_html, 'lxml')
                         except Exception as e:
                             self.logger.warning(f"Error loading page {page_num}: {str(e)}")
                             continue
@@ -214,7 +209,7 @@ class KiaScraper(BaseScraper):
                     
                     # Small delay between pages
                     if page_num < total_pages:
-                        time.sleep(random.uniform(1, 2))
+                        self.polite_sleep(1, 2)
                         
                 except Exception as e:
                     self.logger.error(f"Error processing page {page_num}: {str(e)}")
@@ -224,7 +219,6 @@ class KiaScraper(BaseScraper):
             
         except Exception as e:
             self.logger.error(f"Error extracting products from category {category_url}: {str(e)}")
-            import traceback
             self.logger.debug(f"Traceback: {traceback.format_exc()}")
         
         return new_urls
@@ -241,7 +235,7 @@ class KiaScraper(BaseScraper):
             while scroll_attempts < max_scrolls:
                 try:
                     self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                    time.sleep(1.5)
+                    self.clock.sleep(1.5)
                     new_height = self.driver.execute_script("return document.body.scrollHeight")
                     if new_height == last_height:
                         no_change_count += 1
@@ -277,7 +271,7 @@ class KiaScraper(BaseScraper):
                     if recovery['should_retry'] and retry_count < max_retries - 1:
                         wait_time = recovery['wait_time']
                         delay = random.uniform(wait_time[0], wait_time[1])
-                        time.sleep(delay)
+                        self.polite_sleep(delay, phase='retry_backoff')
                         retry_count += 1
                         continue
                     else:
@@ -286,22 +280,22 @@ class KiaScraper(BaseScraper):
                 try:
                     self.page_load_timeout = 60
                     self.driver.set_page_load_timeout(60)
-                    self.driver.get(url)
-                    time.sleep(random.uniform(0.5, 1.5))
+                    self.driver_get(url)
+                    self.polite_sleep(0.5, 1.5)
                     
                     if self.has_cloudflare_challenge():
                         cloudflare_bypassed = self.wait_for_cloudflare(timeout=30, target_url=url, max_retries=1)
                         if not cloudflare_bypassed:
                             retry_count += 1
                             if retry_count < max_retries:
-                                time.sleep(random.uniform(10, 15))
+                                self.polite_sleep(10, 15, phase='retry_backoff')
                                 continue
                             else:
                                 return None
                     
-                    time.sleep(random.uniform(1.5, 3.0))
-                    html = self.driver.page_source
-                    soup = BeautifulSoup(html, 'lxml')
+                    self.polite_sleep(1.5, 3.0)
+                    html = self.get_page_source()
+                    soup = self.make_soup(html, 'lxml')
                     
                     title_text = ''
                     title_elem = soup.find('h1')
@@ -318,7 +312,7 @@ class KiaScraper(BaseScraper):
                     if not title_text or len(title_text) < 3:
                         retry_count += 1
                         if retry_count < max_retries:
-                            time.sleep(random.uniform(10, 15))
+                            self.polite_sleep(10, 15, phase='retry_backoff')
                             continue
                         else:
                             return None
@@ -332,7 +326,7 @@ class KiaScraper(BaseScraper):
                     self.driver.set_page_load_timeout(original_timeout)
                     retry_count += 1
                     if retry_count < max_retries:
-                        time.sleep(random.uniform(5, 8))
+                        self.polite_sleep(5, 8, phase='retry_backoff')
                         continue
                     else:
                         return None
@@ -343,7 +337,7 @@ class KiaScraper(BaseScraper):
                     if any(err in error_str for err in ['connection', 'network', 'dns', 'err_', 'timeout']):
                         retry_count += 1
                         if retry_count < max_retries:
-                            time.sleep(random.uniform(5, 8))
+                            self.polite_sleep(5, 8, phase='retry_backoff')
                             continue
                         else:
                             return None
@@ -362,7 +356,7 @@ class KiaScraper(BaseScraper):
                 if retry_count < max_retries - 1:
                     wait_time = recovery['wait_time']
                     delay = random.uniform(wait_time[0], wait_time[1])
-                    time.sleep(delay)
+                    self.polite_sleep(delay, phase='retry_backoff')
                     retry_count += 1
                     continue
                 else:
@@ -371,7 +365,7 @@ class KiaScraper(BaseScraper):
         if not html:
             return None
         
-        soup = BeautifulSoup(html, 'lxml')
+        soup = self.make_soup(html, 'lxml')
         
         product_data = {
             'url': url,
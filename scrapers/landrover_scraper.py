@@ -1,10 +1,8 @@
 """Scraper for parts.landroverparamus.com (Land Rover parts) - RevolutionParts platform"""
 from scrapers.base_scraper import BaseScraper
-from bs4 import BeautifulSoup
 import json
 import re
 from datetime import datetime
-import time
 import traceback
 import random
 from selenium.webdriver.common.by import By
@@ -15,8 +13,8 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException
 class LandRoverScraper(BaseScraper):
     """Scraper for parts.landroverparamus.com - Uses RevolutionParts platform"""
     
-    def __init__(self):
-        super().__init__('landrover', use_selenium=True)
+    def __init__(self, clock=None):
+        super().__init__('landrover', use_selenium=True, clock=clock)
         self.base_url = 'https://parts.landroverparamus.com'
         
     def get_product_urls(self):
@@ -47,7 +45,6 @@ class LandRoverScraper(BaseScraper):
             
         except Exception as e:
             self.logger.error(f"Error getting product URLs: {str(e)}")
-            import traceback
             self.logger.debug(f"Traceback: {traceback.format_exc()}")
         
         return product_urls
@@ -91,8 +88,8 @@ class LandRoverScraper(BaseScraper):
             
             # Scroll to load all products on the first page
             self._scroll_to_load_content()
-            html = self.driver.page_source
-            soup = BeautifulSoup(html, 'lxml')
+            html = self.get_page_source()
+            soup = self.make_soup(html, 'lxml')
             
             # Extract total number of pages from pagination
             total_pages = 1
@@ -173,8 +170,8 @@ class LandRoverScraper(BaseScraper):
                             
                             # Scroll to load all products on this page
                             self._scroll_to_load_content()
-                            pag_html = self.driver.page_source
-                            soup = BeautifulSoup(pag_html, 'lxml')
+                            pag_html = self.get_page_source()
+                            soup = self.make_soup(pag_html, 'lxml')
                         except Exception as e:
                             self.logger.warning(f"Error loading page {page_num}: {str(e)}")
                             continue
@@ -219,7 +216,6 @@ class LandRoverScraper(BaseScraper):
                     
                 except Exception as e:
                     self.logger.error(f"Error processing page {page_num}: {str(e)}")
-                    import traceback
                     self.logger.debug(f"Traceback: {traceback.format_exc()}")
                     continue
             
@@ -243,7 +239,7 @@ class LandRoverScraper(BaseScraper):
             while scroll_attempts < max_scrolls:
                 try:
                     self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                    time.sleep(1.5)
+                    self.clock.sleep(1.5)
                     new_height = self.driver.execute_script("return document.body.scrollHeight")
                     if new_height == last_height:
                         no_change_count += 1
@@ -279,7 +275,7 @@ class LandRoverScraper(BaseScraper):
                     if recovery['should_retry'] and retry_count < max_retries - 1:
                         wait_time = recovery['wait_time']
                         delay = random.uniform(wait_time[0], wait_time[1])
-                        time.sleep(delay)
+                        self.polite_sleep(delay, phase='retry_backoff')
                         retry_count += 1
                         continue
                     else:
@@ -288,22 +284,22 @@ class LandRoverScraper(BaseScraper):
                 try:
                     self.page_load_timeout = 60
                     self.driver.set_page_load_timeout(60)
-                    self.driver.get(url)
-                    time.sleep(random.uniform(0.5, 1.5))
+                    self.driver_get(url)
+                    self.polite_sleep(0.5, 1.5)
                     
                     if self.has_cloudflare_challenge():
                         cloudflare_bypassed = self.wait_for_cloudflare(timeout=30, target_url=url, max_retries=1)
                         if not cloudflare_bypassed:
                             retry_count += 1
                             if retry_count < max_retries:
-                                time.sleep(random.uniform(10, 15))
+                                self.polite_sleep(10, 15, phase='retry_backoff')
                                 continue
                             else:
                                 return None
                     
-                    time.sleep(random.uniform(1.5, 3.0))
-                    html = self.driver.page_source
-                    soup = BeautifulSoup(html, 'lxml')
+                    self.polite_sleep(1.5, 3.0)
+                    html = self.get_page_source()
+                    soup = self.make_soup(html, 'lxml')
                     
                     title_text = ''
                     title_elem = soup.find('h1')
@@ -320,7 +316,7 @@ class LandRoverScraper(BaseScraper):
                     if not title_text or len(title_text) < 3:
                         retry_count += 1
                         if retry_count < max_retries:
-                            time.sleep(random.uniform(10, 15))
+                            self.polite_sleep(10, 15, phase='retry_backoff')
                             continue
                         else:
                             return None
@@ -334,7 +330,7 @@ class LandRoverScraper(BaseScraper):
                     self.driver.set_page_load_timeout(original_timeout)
                     retry_count += 1
                     if retry_count < max_retries:
-                        time.sleep(random.uniform(5, 8))
+                        self.polite_sleep(5, 8, phase='retry_backoff')
                         continue
                     else:
                         return None
@@ -345,7 +341,7 @@ class LandRoverScraper(BaseScraper):
                     if any(err in error_str for err in ['connection', 'network', 'dns', 'err_', 'timeout']):
                         retry_count += 1
                         if retry_count < max_retries:
-                            time.sleep(random.uniform(5, 8))
+                            self.polite_sleep(5, 8, phase='retry_backoff')
                             continue
                         else:
                             return None
@@ -364,7 +360,7 @@ class LandRoverScraper(BaseScraper):
                 if retry_count < max_retries - 1:
                     wait_time = recovery['wait_time']
                     delay = random.uniform(wait_time[0], wait_time[1])
-                    time.sleep(delay)
+                    self.polite_sleep(delay, phase='retry_backoff')
                     retry_count += 1
                     continue
                 else:
@@ -373,7 +369,7 @@ class LandRoverScraper(BaseScraper):
         if not html:
             return None
         
-        soup = BeautifulSoup(html, 'lxml')
+        soup = self.make_soup(html, 'lxml')
         
         product_data = {
             'url': url,
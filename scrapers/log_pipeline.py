@@ -0,0 +1,207 @@
+"""Queue-based, non-blocking logging for scraper loggers"""
+import atexit
+import logging
+import logging.handlers
+import queue
+import threading
+from collections import Counter
+
+# Console fallbacks for terminals that can't encode emojis (cp1252 Windows consoles).
+# A single str.translate() pass instead of a chain of replace() calls; the emoji
+# variation selector (U+FE0F, as in '⚠️') is dropped.
+EMOJI_TO_ASCII = str.maketrans({
+    '🔍': '[SEARCH]',
+    '✅': '[OK]',
+    '❌': '[X]',
+    '💰': '[PRICE]',
+    '🛡': '[SHIELD]',
+    '⏳': '[WAIT]',
+    '🔄': '[RETRY]',
+    '📝': '[NOTE]',
+    '📦': '[BOX]',
+    '⚠': '[WARN]',
+    '✓': '[OK]',
+    '✗': '[X]',
+    '⏭': '[SKIP]',
+    '\ufe0f': None,
+})
+
+# Debug categories (logger.debug(..., extra={'category': ...})): the first `burst`
+# records of a category pass, then one in `every`
+DEBUG_SAMPLING = {
+    'wheel_check': {'burst': 20, 'every': 100},
+}
+DEFAULT_SAMPLING = {'burst': 50, 'every': 10}
+
+
+def to_ascii_safe(message):
+    """Replace known emojis with ASCII tags"""
+    return message.translate(EMOJI_TO_ASCII)
+
+
+class SafeUnicodeHandler(logging.StreamHandler):
+    """StreamHandler that safely handles Unicode encoding errors"""
+
+    def emit(self, record):
+        try:
+            msg = self.format(record)
+            stream = self.stream
+            try:
+                stream.write(msg + self.terminator)
+            except UnicodeEncodeError:
+                safe_msg = to_ascii_safe(msg)
+                try:
+                    stream.write(safe_msg + self.terminator)
+                except UnicodeEncodeError:
+                    # Last resort: let the stream's codec replace what's left
+                    encoding = getattr(stream, 'encoding', 'utf-8') or 'utf-8'
+                    stream.write(safe_msg.encode(encoding, errors='replace').decode(encoding, errors='replace')
+                                 + self.terminator)
+            self.flush()
+        except Exception:
+            # Silently ignore logging errors to prevent crashes
+            self.handleError(record)
+
+
+class CategorySampler(logging.Filter):
+    """
+    Rate-limit records tagged with a 'category' attribute
+
+    Untagged records always pass. Suppressed counts are kept per category and
+    reported when the pipeline shuts down.
+    """
+
+    def __init__(self, policies=None):
+        super().__init__()
+        self.policies = policies if policies is not None else DEBUG_SAMPLING
+        self.seen = Counter()
+        self.suppressed = Counter()
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        category = getattr(record, 'category', None)
+        if category is None:
+            return True
+        policy = self.policies.get(category, DEFAULT_SAMPLING)
+        with self._lock:
+            self.seen[category] += 1
+            count = self.seen[category]
+            if count <= policy['burst'] or (count - policy['burst']) % policy['every'] == 0:
+                return True
+            self.suppressed[category] += 1
+            return False
+
+
+class _PassThroughQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that enqueues records as they are (the writer thread's handlers format them)"""
+
+    def prepare(self, record):
+        # The stock prepare() formats the message (and traceback) on the logging thread
+        return record
+
+
+class _DispatchHandler(logging.Handler):
+    """Runs on the writer thread: hands each record to its logger's real handlers"""
+
+    def __init__(self, pipeline):
+        super().__init__()
+        self.pipeline = pipeline
+
+    def handle(self, record):
+        flush_event = getattr(record, 'flush_event', None)
+        if flush_event is not None:
+            flush_event.set()
+            return True
+        for handler in self.pipeline.handlers_for(record.name):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+        return True
+
+    def emit(self, record):
+        self.handle(record)
+
+
+class LogPipeline:
+    """
+    One background writer thread for all scraper loggers
+
+    Loggers get a QueueHandler (the hot path only enqueues the unformatted
+    record); the writer thread formats it and writes to the logger's
+    file/console handlers.
+    """
+
+    def __init__(self):
+        self._queue = queue.SimpleQueue()
+        self._handlers = {}
+        self._lock = threading.Lock()
+        self._listener = None
+        self._atexit_registered = False
+        self.sampler = CategorySampler()
+
+    def handlers_for(self, logger_name):
+        with self._lock:
+            return self._handlers.get(logger_name, ())
+
+    def attach(self, logger, handlers):
+        """
+        Route a logger's records through the writer thread
+
+        Args:
+            logger: Logger to attach (its existing handlers are replaced)
+            handlers: Handlers that do the actual writing
+        """
+        queue_handler = _PassThroughQueueHandler(self._queue)
+        queue_handler.addFilter(self.sampler)
+        with self._lock:
+            previous = self._handlers.get(logger.name, ())
+            self._handlers[logger.name] = tuple(handlers)
+            if self._listener is None:
+                self._listener = logging.handlers.QueueListener(self._queue, _DispatchHandler(self))
+                self._listener.start()
+                if not self._atexit_registered:
+                    atexit.register(self.stop)
+                    self._atexit_registered = True
+        logger.handlers = [queue_handler]
+        for handler in previous:
+            handler.close()
+
+    def detach(self, logger):
+        """Flush pending records and close the logger's handlers"""
+        self.flush()
+        with self._lock:
+            handlers = self._handlers.pop(logger.name, ())
+        logger.handlers = []
+        for handler in handlers:
+            handler.close()
+
+    def flush(self, timeout=5.0):
+        """Block until every record queued so far has been written"""
+        if self._listener is None:
+            return
+        done = threading.Event()
+        record = logging.makeLogRecord({'name': '', 'levelno': 0, 'msg': ''})
+        record.flush_event = done
+        self._queue.put(record)
+        done.wait(timeout)
+
+    def stop(self):
+        """Drain the queue and stop the writer thread"""
+        with self._lock:
+            listener, self._listener = self._listener, None
+        if listener is not None:
+            listener.stop()
+        for category, count in self.sampler.suppressed.items():
+            logging.getLogger('log_pipeline').info(f"Sampled out {count} '{category}' debug records")
+
+
+_pipeline = None
+_pipeline_lock = threading.Lock()
+
+
+def get_log_pipeline():
+    """Return the process-wide LogPipeline"""
+    global _pipeline
+    with _pipeline_lock:
+        if _pipeline is None:
+            _pipeline = LogPipeline()
+        return _pipeline
@@ -1,10 +1,7 @@
 """Scraper for www.jimellismazdaparts.com (Mazda parts) - SimplePart platform"""
 from scrapers.base_scraper_with_extension import BaseScraperWithExtension
-from bs4 import BeautifulSoup
-import json
 import re
 from datetime import datetime
-import time
 import traceback
 import random
 from selenium.webdriver.common.by import By
@@ -15,8 +12,8 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException
 class MazdaScraper(BaseScraperWithExtension):
     """Scraper for www.jimellismazdaparts.com - Uses SimplePart platform"""
     
-    def __init__(self):
-        super().__init__('mazda', use_selenium=True)
+    def __init__(self, clock=None):
+        super().__init__('mazda', use_selenium=True, clock=clock)
         self.base_url = 'https://www.jimellismazdaparts.com'
         
     def get_product_urls(self):
@@ -47,7 +44,6 @@ class MazdaScraper(BaseScraperWithExtension):
             
         except Exception as e:
             self.logger.error(f"Error getting product URLs: {str(e)}")
-            import traceback
             self.logger.debug(f"Traceback: {traceback.format_exc()}")
         
         return product_urls
@@ -72,8 +68,8 @@ class MazdaScraper(BaseScraperWithExtension):
             try:
                 self.page_load_timeout = 60
                 self.driver.set_page_load_timeout(60)
-                self.driver.get(search_url)
-                time.sleep(3)
+                self.driver_get(search_url)
+                self.clock.sleep(3)
             except Exception as e:
                 self.logger.error(f"Error loading search page: {str(e)}")
                 return product_urls
@@ -98,7 +94,7 @@ class MazdaScraper(BaseScraperWithExtension):
             self._scroll_to_load_content()
             
             # Wait a bit more for any dynamic content
-            time.sleep(3)
+            self.clock.sleep(3)
             
             # Priority 1: Find "View Product" buttons with class="btn btn-primary" and href="/products/Mazda/..."
             try:
@@ -191,8 +187,8 @@ class MazdaScraper(BaseScraperWithExtension):
                     self.logger.debug(f"Error finding links via JavaScript: {str(e)}")
             
             # Priority 4: BeautifulSoup parsing as final fallback
-            html = self.driver.page_source
-            soup = BeautifulSoup(html, 'lxml')
+            html = self.get_page_source()
+            soup = self.make_soup(html, 'lxml')
             
             # Look for links with href="/products/Mazda/..."
             product_links = soup.find_all('a', href=re.compile(r'/products/Mazda/', re.I))
@@ -228,7 +224,6 @@ class MazdaScraper(BaseScraperWithExtension):
             
         except Exception as e:
             self.logger.error(f"Error searching for wheels: {str(e)}")
-            import traceback
             self.logger.debug(f"Traceback: {traceback.format_exc()}")
         
         return product_urls
@@ -271,8 +266,8 @@ class MazdaScraper(BaseScraperWithExtension):
             
             # Scroll to load all products
             self._scroll_to_load_content()
-            html = self.driver.page_source
-            soup = BeautifulSoup(html, 'lxml')
+            html = self.get_page_source()
+            soup = self.make_soup(html, 'lxml')
             
             # Extract total pages if pagination exists
             total_pages = 1
@@ -323,8 +318,8 @@ class MazdaScraper(BaseScraperWithExtension):
                                 pass
                             
                             self._scroll_to_load_content()
-                            pag_html = self.driver.page_source
-                            soup = BeautifulSoup(pag_html, 'lxml')
+                            pag_html = self.get_page_source()
+                            soup = self.make_soup(pag_html, 'lxml')
                         except Exception as e:
                             self.logger.warning(f"Error loading category page {page_num}: {str(e)}")
                             continue
@@ -363,7 +358,6 @@ class MazdaScraper(BaseScraperWithExtension):
                     
                 except Exception as e:
                     self.logger.error(f"Error processing category page {page_num}: {str(e)}")
-                    import traceback
                     self.logger.debug(f"Traceback: {traceback.format_exc()}")
                     continue
             
@@ -387,7 +381,7 @@ class MazdaScraper(BaseScraperWithExtension):
             while scroll_attempts < max_scrolls:
                 try:
                     self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                    time.sleep(1.5)
+                    self.clock.sleep(1.5)
                     new_height = self.driver.execute_script("return document.body.scrollHeight")
                     if new_height == last_height:
                         no_change_count += 1
@@ -413,7 +407,7 @@ class MazdaScraper(BaseScraperWithExtension):
                 stable_count = 0
                 last_html = element.get_attribute('outerHTML')
                 for _ in range(10):  # Check for up to 1 second
-                    time.sleep(0.1)
+                    self.clock.sleep(0.1)
                     current_html = element.get_attribute('outerHTML')
                     if current_html == last_html:
                         stable_count += 1
@@ -424,7 +418,7 @@ class MazdaScraper(BaseScraperWithExtension):
                         last_html = current_html
             
             # Additional wait for any JavaScript to finish
-            time.sleep(0.5)
+            self.clock.sleep(0.5)
             return element
         except TimeoutException:
             return None
@@ -455,7 +449,7 @@ class MazdaScraper(BaseScraperWithExtension):
                 # Step 2: Wait for loading indicators to disappear
                 self.logger.debug("Waiting for loading indicators to disappear...")
                 for _ in range(20):  # Wait up to 4 seconds for loading to complete
-                    time.sleep(0.2)
+                    self.clock.sleep(0.2)
                     try:
                         loading_indicators = self.driver.find_elements(By.CSS_SELECTOR, 
                             'div.loading, div.spinner, div[class*="loading"], div[class*="spinner"], '
@@ -473,7 +467,7 @@ class MazdaScraper(BaseScraperWithExtension):
                 last_content_length = 0
                 
                 for check_round in range(15):  # Check for up to 3 seconds
-                    time.sleep(0.2)
+                    self.clock.sleep(0.2)
                     try:
                         current_inner_html = element.get_attribute('innerHTML') or ''
                         current_length = len(current_inner_html.strip())
@@ -542,7 +536,7 @@ class MazdaScraper(BaseScraperWithExtension):
                     pass
                 
                 # Step 6: Final wait for any remaining async operations
-                time.sleep(1)
+                self.clock.sleep(1)
                 
                 # Step 7: Final verification
                 final_inner_html = element.get_attribute('innerHTML') or ''
@@ -581,7 +575,7 @@ class MazdaScraper(BaseScraperWithExtension):
         for attempt in range(max_attempts):
             try:
                 if attempt > 0:
-                    time.sleep(wait_between_attempts)
+                    self.clock.sleep(wait_between_attempts)
                 
                 try:
                     show_more_exists = self.driver.execute_script("""
@@ -616,12 +610,12 @@ class MazdaScraper(BaseScraperWithExtension):
                                     continue
                                 
                                 self.driver.execute_script("arguments[0].scrollIntoView({block: 'center', behavior: 'smooth'});", element)
-                                time.sleep(0.5)
+                                self.clock.sleep(0.5)
                                 
                                 element = wait.until(EC.element_to_be_clickable((selector_type, selector_value)))
                                 element.click()
                                 self.logger.info(f"✓ Clicked 'Show More' button (attempt {attempt + 1})")
-                                time.sleep(1)
+                                self.clock.sleep(1)
                                 return True
                             except Exception as e:
                                 continue
@@ -654,7 +648,7 @@ class MazdaScraper(BaseScraperWithExtension):
         for check_round in range(5):
             try:
                 if check_round > 0:
-                    time.sleep(2)
+                    self.clock.sleep(2)
                 
                 for selector in selectors:
                     try:
@@ -674,7 +668,7 @@ class MazdaScraper(BaseScraperWithExtension):
                             
                             if valid_count > 0:
                                 self.logger.info(f"✓ Fitment data loaded: found {len(elements)} elements ({valid_count} with content) via {selector}")
-                                time.sleep(2)
+                                self.clock.sleep(2)
                                 return True
                     except Exception as e:
                         continue
@@ -698,7 +692,7 @@ class MazdaScraper(BaseScraperWithExtension):
                     
                     if row_count >= min_rows:
                         self.logger.info(f"✓ Fitment data loaded: found {row_count} rows via JavaScript")
-                        time.sleep(2)
+                        self.clock.sleep(2)
                         return True
                 except:
                     pass
@@ -730,7 +724,7 @@ class MazdaScraper(BaseScraperWithExtension):
                     if recovery['should_retry'] and retry_count < max_retries - 1:
                         wait_time = recovery['wait_time']
                         delay = random.uniform(wait_time[0], wait_time[1])
-                        time.sleep(delay)
+                        self.polite_sleep(delay, phase='retry_backoff')
                         retry_count += 1
                         continue
                     else:
@@ -739,23 +733,23 @@ class MazdaScraper(BaseScraperWithExtension):
                 try:
                     self.page_load_timeout = 60
                     self.driver.set_page_load_timeout(60)
-                    self.driver.get(url)
-                    time.sleep(random.uniform(1.0, 2.0))
+                    self.driver_get(url)
+                    self.polite_sleep(1.0, 2.0)
                     
                     if self.has_cloudflare_challenge():
                         cloudflare_bypassed = self.wait_for_cloudflare(timeout=30, target_url=url, max_retries=1)
                         if not cloudflare_bypassed:
                             retry_count += 1
                             if retry_count < max_retries:
-                                time.sleep(random.uniform(10, 15))
+                                self.polite_sleep(10, 15, phase='retry_backoff')
                                 continue
                             else:
                                 return None
                     
                     # Wait for page to be fully loaded
-                    time.sleep(random.uniform(2.0, 3.0))
-                    html = self.driver.page_source
-                    soup = BeautifulSoup(html, 'lxml')
+                    self.polite_sleep(2.0, 3.0)
+                    html = self.get_page_source()
+                    soup = self.make_soup(html, 'lxml')
                     
                     # Check if page loaded correctly
                     title_elem = soup.find('span', class_='prodDescriptH2')
@@ -775,7 +769,7 @@ class MazdaScraper(BaseScraperWithExtension):
                     if not title_text or len(title_text) < 3:
                         retry_count += 1
                         if retry_count < max_retries:
-                            time.sleep(random.uniform(10, 15))
+                            self.polite_sleep(10, 15, phase='retry_backoff')
                             continue
                         else:
                             return None
@@ -789,7 +783,7 @@ class MazdaScraper(BaseScraperWithExtension):
                     self.driver.set_page_load_timeout(original_timeout)
                     retry_count += 1
                     if retry_count < max_retries:
-                        time.sleep(random.uniform(5, 8))
+                        self.polite_sleep(5, 8, phase='retry_backoff')
                         continue
                     else:
                         return None
@@ -800,7 +794,7 @@ class MazdaScraper(BaseScraperWithExtension):
                     if any(err in error_str for err in ['connection', 'network', 'dns', 'err_', 'timeout']):
                         retry_count += 1
                         if retry_count < max_retries:
-                            time.sleep(random.uniform(5, 8))
+                            self.polite_sleep(5, 8, phase='retry_backoff')
                             continue
                         else:
                             return None
@@ -819,7 +813,7 @@ class MazdaScraper(BaseScraperWithExtension):
                 if retry_count < max_retries - 1:
                     wait_time = recovery['wait_time']
                     delay = random.uniform(wait_time[0], wait_time[1])
-                    time.sleep(delay)
+                    self.polite_sleep(delay, phase='retry_backoff')
                     retry_count += 1
                     continue
                 else:
@@ -829,8 +823,8 @@ class MazdaScraper(BaseScraperWithExtension):
             return None
         
         # Re-parse HTML after all interactions
-        html = self.driver.page_source
-        soup = BeautifulSoup(html, 'lxml')
+        html = self.get_page_source()
+        soup = self.make_soup(html, 'lxml')
         
         product_data = {
             'url': url,
@@ -996,7 +990,7 @@ class MazdaScraper(BaseScraperWithExtension):
                         try:
                             tab_element = wait.until(EC.element_to_be_clickable((selector_type, selector_value)))
                             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", tab_element)
-                            time.sleep(0.5)
+                            self.clock.sleep(0.5)
                             tab_element.click()
                             tab_clicked = True
                             self.logger.info("✓ Clicked 'What This Fits' tab")
@@ -1027,19 +1021,19 @@ class MazdaScraper(BaseScraperWithExtension):
                         if not fitment_loaded:
                             # Try one more time after additional wait
                             self.logger.info("🔍 Retrying fitment data load check after additional wait...")
-                            time.sleep(5)
+                            self.clock.sleep(5)
                             fitment_loaded = self._wait_for_fitment_data_loaded(timeout=20, min_rows=1)
                         
                         # Additional wait to ensure everything is stable
-                        time.sleep(1)
+                        self.clock.sleep(1)
                         
                         # Step 5: Extract fitment data from fully loaded page
                         self.logger.info("🔍 Step 5: Extracting fitment data...")
                         
                         try:
                             # Get updated HTML after all interactions
-                            html = self.driver.page_source
-                            soup = BeautifulSoup(html, 'lxml')
+                            html = self.get_page_source()
+                            soup = self.make_soup(html, 'lxml')
                             
                             # Find all fitment rows using Selenium (more reliable for dynamic content)
                             fitment_row_elements = []
@@ -1094,7 +1088,7 @@ class MazdaScraper(BaseScraperWithExtension):
                         if not row_html:
                             continue
                         
-                        row_soup = BeautifulSoup(row_html, 'lxml')
+                        row_soup = self.make_soup(row_html, 'lxml')
                         
                         # Handle table structure
                         if row_soup.name == 'tr' or row_soup.find('tr'):
@@ -1237,7 +1231,6 @@ class MazdaScraper(BaseScraperWithExtension):
             
         except Exception as e:
             self.logger.error(f"❌ Error scraping product {url}: {self.safe_str(e)}")
-            import traceback
             self.logger.debug(f"Traceback: {traceback.format_exc()}")
             return None
 
@@ -1,10 +1,8 @@
 """Scraper for www.mitsubishipartswarehouse.com (Mitsubishi parts) - Auto Parts Prime platform"""
 from scrapers.base_scraper import BaseScraper
-from bs4 import BeautifulSoup
 import json
 import re
 from datetime import datetime
-import time
 import traceback
 import random
 from selenium.webdriver.common.by import By
@@ -15,8 +13,8 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException
 class MitsubishiScraper(BaseScraper):
     """Scraper for www.mitsubishipartswarehouse.com - Uses Auto Parts Prime platform"""
     
-    def __init__(self):
-        super().__init__('mitsubishi', use_selenium=True)
+    def __init__(self, clock=None):
+        super().__init__('mitsubishi', use_selenium=True, clock=clock)
         self.base_url = 'https://www.mitsubishipartswarehouse.com'
         
     def get_product_urls(self):
@@ -49,7 +47,6 @@ class MitsubishiScraper(BaseScraper):
             
         except Exception as e:
             self.logger.error(f"Error getting product URLs: {str(e)}")
-            import traceback
             self.logger.debug(f"Traceback: {traceback.format_exc()}")
         
         return product_urls
@@ -93,8 +90,8 @@ class MitsubishiScraper(BaseScraper):
             
             # Scroll to load all products on the first page
             self._scroll_to_load_content()
-            html = self.driver.page_source
-            soup = BeautifulSoup(html, 'lxml')
+            html = self.get_page_source()
+            soup = self.make_soup(html, 'lxml')
             
             # Extract products from first page
             page_count = self._extract_products_from_page(soup, product_urls)
@@ -133,8 +130,8 @@ class MitsubishiScraper(BaseScraper):
                         
                         # Scroll to load all products on this page
                         self._scroll_to_load_content()
-                        pag_html = self.driver.page_source
-                        soup = BeautifulSoup(pag_html, 'lxml')
+                        pag_html = self.get_page_source()
+                        soup = self.make_soup(pag_html, 'lxml')
                     except Exception as e:
                         self.logger.warning(f"Error loading page {page_num}: {str(e)}")
                         consecutive_empty_pages += 1
@@ -176,7 +173,6 @@ class MitsubishiScraper(BaseScraper):
             
         except Exception as e:
             self.logger.error(f"Error searching for wheels: {str(e)}")
-            import traceback
             self.logger.debug(f"Traceback: {traceback.format_exc()}")
         
         return product_urls
@@ -257,8 +253,8 @@ class MitsubishiScraper(BaseScraper):
                     pass
             
             self._scroll_to_load_content()
-            html = self.driver.page_source
-            soup = BeautifulSoup(html, 'lxml')
+            html = self.get_page_source()
+            soup = self.make_soup(html, 'lxml')
             
             product_links = soup.find_all('a', href=re.compile(r'/genuine/mitsubishi-.*~.*\.html'))
             for link in product_links:
@@ -289,7 +285,7 @@ class MitsubishiScraper(BaseScraper):
             while scroll_attempts < max_scrolls:
                 try:
                     self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                    time.sleep(1.5)
+                    self.clock.sleep(1.5)
                     new_height = self.driver.execute_script("return document.body.scrollHeight")
                     if new_height == last_height:
                         no_change_count += 1
@@ -325,7 +321,7 @@ class MitsubishiScraper(BaseScraper):
                     if recovery['should_retry'] and retry_count < max_retries - 1:
                         wait_time = recovery['wait_time']
                         delay = random.uniform(wait_time[0], wait_time[1])
-                        time.sleep(delay)
+                        self.polite_sleep(delay, phase='retry_backoff')
                         retry_count += 1
                         continue
                     else:
@@ -334,22 +330,22 @@ class MitsubishiScraper(BaseScraper):
                 try:
                     self.page_load_timeout = 60
                     self.driver.set_page_load_timeout(60)
-                    self.driver.get(url)
-                    time.sleep(random.uniform(0.5, 1.5))
+                    self.driver_get(url)
+                    self.polite_sleep(0.5, 1.5)
                     
                     if self.has_cloudflare_challenge():
                         cloudflare_bypassed = self.wait_for_cloudflare(timeout=30, target_url=url, max_retries=1)
                         if not cloudflare_bypassed:
                             retry_count += 1
                             if retry_count < max_retries:
-                                time.sleep(random.uniform(10, 15))
+                                self.polite_sleep(10, 15, phase='retry_backoff')
                                 continue
                             else:
                                 return None
                     
-                    time.sleep(random.uniform(1.5, 3.0))
-                    html = self.driver.page_source
-                    soup = BeautifulSoup(html, 'lxml')
+                    self.polite_sleep(1.5, 3.0)
+                    html = self.get_page_source()
+                    soup = self.make_soup(html, 'lxml')
                     
                     title_text = ''
                     title_elem = soup.find('h1')
@@ -366,7 +362,7 @@ class MitsubishiScraper(BaseScraper):
                     if not title_text or len(title_text) < 3:
                         retry_count += 1
                         if retry_count < max_retries:
-                            time.sleep(random.uniform(10, 15))
+                            self.polite_sleep(10, 15, phase='retry_backoff')
                             continue
                         else:
                             return None
@@ -380,7 +376,7 @@ class MitsubishiScraper(BaseScraper):
                     self.driver.set_page_load_timeout(original_timeout)
                     retry_count += 1
                     if retry_count < max_retries:
-                        time.sleep(random.uniform(5, 8))
+                        self.polite_sleep(5, 8, phase='retry_backoff')
                         continue
                     else:
                         return None
@@ -391,7 +387,7 @@ class MitsubishiScraper(BaseScraper):
                     if any(err in error_str for err in ['connection', 'network', 'dns', 'err_', 'timeout']):
                         retry_count += 1
                         if retry_count < max_retries:
-                            time.sleep(random.uniform(5, 8))
+                            self.polite_sleep(5, 8, phase='retry_backoff')
                             continue
                         else:
                             return None
@@ -410,7 +406,7 @@ class MitsubishiScraper(BaseScraper):
                 if retry_count < max_retries - 1:
                     wait_time = recovery['wait_time']
                     delay = random.uniform(wait_time[0], wait_time[1])
-                    time.sleep(delay)
+                    self.polite_sleep(delay, phase='retry_backoff')
                     retry_count += 1
                     continue
                 else:
@@ -419,7 +415,7 @@ class MitsubishiScraper(BaseScraper):
         if not html:
             return None
         
-        soup = BeautifulSoup(html, 'lxml')
+        soup = self.make_soup(html, 'lxml')
         
         product_data = {
             'url': url,
@@ -1,10 +1,9 @@
 """Scraper for parts.moparonlineparts.com (Mopar parts)"""
 from scrapers.base_scraper import BaseScraper
-from bs4 import BeautifulSoup
+from scrapers.cloudflare_detector import challenge_pending
 import json
 import re
 from datetime import datetime
-import time
 import traceback
 import random
 from selenium.webdriver.common.by import By
@@ -16,8 +15,8 @@ from selenium.common.exceptions import TimeoutException
 class MoparOnlinePartsScraper(BaseScraper):
     """Scraper for parts.moparonlineparts.com"""
     
-    def __init__(self):
-        super().__init__('moparonlineparts', use_selenium=True)
+    def __init__(self, clock=None):
+        super().__init__('moparonlineparts', use_selenium=True, clock=clock)
         self.base_url = 'https://parts.moparonlineparts.com'
         
     def get_product_urls(self):
@@ -109,7 +108,6 @@ class MoparOnlinePartsScraper(BaseScraper):
             
         except Exception as e:
             self.logger.error(f"Error getting product URLs: {str(e)}")
-            import traceback
             self.logger.debug(f"Traceback: {traceback.format_exc()}")
         
         return product_urls
@@ -160,8 +158,8 @@ class MoparOnlinePartsScraper(BaseScraper):
             self._scroll_to_load_content()
             
             # Get updated HTML after scrolling
-            html = self.driver.page_source
-            soup = BeautifulSoup(html, 'lxml')
+            html = self.get_page_source()
+            soup = self.make_soup(html, 'lxml')
             
             # Find product links
             product_links = soup.find_all('a', href=re.compile(r'/oem-parts/|/parts/[^/]+/[^/]+'))
@@ -212,7 +210,7 @@ class MoparOnlinePartsScraper(BaseScraper):
                                 html = self.get_page(pag_url, use_selenium=True, wait_time=2)
                                 if html and len(html) > 5000:
                                     # Check if page has product links
-                                    soup_check = BeautifulSoup(html, 'lxml')
+                                    soup_check = self.make_soup(html, 'lxml')
                                     page_links = soup_check.find_all('a', href=re.compile(r'/oem-parts/|/parts/[^/]+/[^/]+'))
                                     if len(page_links) > 0:
                                         page_loaded = True
@@ -243,8 +241,8 @@ class MoparOnlinePartsScraper(BaseScraper):
                     
                     # Scroll and extract products
                     self._scroll_to_load_content()
-                    html = self.driver.page_source
-                    soup = BeautifulSoup(html, 'lxml')
+                    html = self.get_page_source()
+                    soup = self.make_soup(html, 'lxml')
                     page_links = soup.find_all('a', href=re.compile(r'/oem-parts/|/parts/[^/]+/[^/]+'))
                     
                     page_urls_count = 0
@@ -272,7 +270,7 @@ class MoparOnlinePartsScraper(BaseScraper):
                         consecutive_empty_pages = 0
                     
                     page_num += 1
-                    time.sleep(random.uniform(2, 4))
+                    self.polite_sleep(2, 4)
                     
                 except Exception as e:
                     self.logger.error(f"Error processing page {page_num}: {str(e)}")
@@ -284,7 +282,6 @@ class MoparOnlinePartsScraper(BaseScraper):
             
         except Exception as e:
             self.logger.error(f"Error searching for wheels: {str(e)}")
-            import traceback
             self.logger.debug(f"Traceback: {traceback.format_exc()}")
         
         return product_urls
@@ -337,8 +334,8 @@ class MoparOnlinePartsScraper(BaseScraper):
                     self._scroll_to_load_content()
                     
                     # Get updated HTML
-                    html = self.driver.page_source
-                    soup = BeautifulSoup(html, 'lxml')
+                    html = self.get_page_source()
+                    soup = self.make_soup(html, 'lxml')
                     
                     # Extract product links
                     product_links = soup.find_all('a', href=re.compile(r'/oem-parts/|/parts/[^/]+/[^/]+'))
@@ -382,7 +379,7 @@ class MoparOnlinePartsScraper(BaseScraper):
                                         
                                         html = self.get_page(pag_url, use_selenium=True, wait_time=1)
                                         if html and len(html) > 5000:
-                                            soup_check = BeautifulSoup(html, 'lxml')
+                                            soup_check = self.make_soup(html, 'lxml')
                                             if soup_check.find_all('a', href=re.compile(r'/oem-parts/|/parts/[^/]+/[^/]+')):
                                                 page_loaded = True
                                                 break
@@ -409,8 +406,8 @@ class MoparOnlinePartsScraper(BaseScraper):
                                 continue
                             
                             self._scroll_to_load_content()
-                            html = self.driver.page_source
-                            soup = BeautifulSoup(html, 'lxml')
+                            html = self.get_page_source()
+                            soup = self.make_soup(html, 'lxml')
                             page_links = soup.find_all('a', href=re.compile(r'/oem-parts/|/parts/[^/]+/[^/]+'))
                             
                             new_count = 0
@@ -436,7 +433,7 @@ class MoparOnlinePartsScraper(BaseScraper):
                                 consecutive_empty = 0
                             
                             page_num += 1
-                            time.sleep(random.uniform(1, 2))
+                            self.polite_sleep(1, 2)
                             
                         except Exception as e:
                             self.logger.debug(f"Error on category page {page_num}: {str(e)}")
@@ -466,7 +463,7 @@ class MoparOnlinePartsScraper(BaseScraper):
             while scroll_attempts < max_scrolls:
                 try:
                     self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                    time.sleep(1.5)
+                    self.clock.sleep(1.5)
                     
                     new_height = self.driver.execute_script("return document.body.scrollHeight")
                     if new_height == last_height:
@@ -509,7 +506,7 @@ class MoparOnlinePartsScraper(BaseScraper):
                         wait_time = recovery['wait_time']
                         delay = random.uniform(wait_time[0], wait_time[1])
                         self.logger.warning(f"Driver error, retrying in {delay:.1f}s...")
-                        time.sleep(delay)
+                        self.polite_sleep(delay, phase='retry_backoff')
                         retry_count += 1
                         continue
                     else:
@@ -521,29 +518,17 @@ class MoparOnlinePartsScraper(BaseScraper):
                     self.page_load_timeout = 60  # Increase to 60 seconds for product pages
                     self.driver.set_page_load_timeout(60)
                     
-                    self.driver.get(url)
+                    self.driver_get(url)
                     
                     # Wait a bit before accessing page_source (more human-like)
-                    time.sleep(random.uniform(0.5, 1.5))  # Added delay to avoid immediate page_source access
-                    
-                    # Quick Cloudflare check - only if on challenge URL or page is very small
-                    current_url_check = self.driver.current_url.lower()
-                    page_preview = self.driver.page_source[:6000]
+                    self.polite_sleep(0.5, 1.5)  # Added delay to avoid immediate page_source access
                     
                     # undetected_chromedriver handles Cloudflare automatically
                     # Wait a bit longer to let it complete the challenge
-                    time.sleep(random.uniform(2, 4))  # Initial wait for page to start loading
-                    
-                    # Check if we're on a Cloudflare challenge page
-                    current_url_after_wait = self.driver.current_url.lower()
-                    page_preview_after_wait = self.driver.page_source[:10000] if len(self.driver.page_source) > 10000 else self.driver.page_source
+                    self.polite_sleep(2, 4)  # Initial wait for page to start loading
                     
-                    # Only check for Cloudflare if we're definitely on a challenge page
-                    is_challenge_page = (
-                        'challenges.cloudflare.com' in current_url_after_wait or 
-                        '/cdn-cgi/challenge' in current_url_after_wait or
-                        (len(page_preview_after_wait) < 5000 and self.has_cloudflare_challenge())
-                    )
+                    # Check if we're on a Cloudflare challenge page (one script call)
+                    is_challenge_page = self.has_cloudflare_challenge()
                     
                     if is_challenge_page:
                         self.logger.info("🛡️ Cloudflare challenge detected - waiting for undetected_chromedriver to handle it...")
@@ -555,41 +540,24 @@ class MoparOnlinePartsScraper(BaseScraper):
                         check_interval = 3
                         
                         while waited < max_wait_time:
-                            time.sleep(check_interval)
+                            self.clock.sleep(check_interval)
                             waited += check_interval
                             
                             # Check current state
-                            current_url_check = self.driver.current_url.lower()
-                            page_source_check = self.driver.page_source
-                            page_preview_check = page_source_check[:10000].lower() if len(page_source_check) > 10000 else page_source_check.lower()
+                            probe = self.probe_cloudflare()
                             
                             # Check if challenge is gone
-                            still_on_challenge = (
-                                'challenges.cloudflare.com' in current_url_check or
-                                '/cdn-cgi/challenge' in current_url_check or
-                                "verifying you are human" in page_preview_check or
-                                "review the security of your connection" in page_preview_check or
-                                "verifying..." in page_preview_check or
-                                (len(page_source_check) < 5000 and self.has_cloudflare_challenge())
-                            )
-                            
-                            if not still_on_challenge and len(page_source_check) > 8000:
+                            if not challenge_pending(probe) and probe.get('html_length', 0) > 8000:
                                 # Challenge passed!
                                 self.logger.info(f"✅ Cloudflare bypassed by undetected_chromedriver! (waited {waited}s)")
-                                time.sleep(random.uniform(1, 2))  # Brief stabilization
+                                self.polite_sleep(1, 2)  # Brief stabilization
                                 break
                             
                             if waited % 10 == 0:  # Log every 10 seconds
                                 self.logger.info(f"⏳ Still waiting for Cloudflare bypass... ({waited}s/{max_wait_time}s)")
                         
                         # Final check - if still on challenge, use manual bypass
-                        final_url = self.driver.current_url.lower()
-                        final_page = self.driver.page_source
-                        still_challenged = (
-                            'challenges.cloudflare.com' in final_url or
-                            '/cdn-cgi/challenge' in final_url or
-                            (len(final_page) < 5000 and self.has_cloudflare_challenge())
-                        )
+                        still_challenged = self.has_cloudflare_challenge()
                         
                         if still_challenged:
                             self.logger.warning("⚠️ Cloudflare still present after wait - using manual bypass...")
@@ -599,7 +567,7 @@ class MoparOnlinePartsScraper(BaseScraper):
                                 if retry_count < max_retries:
                                     wait_time = random.uniform(10, 15)
                                     self.logger.warning(f"Retrying page load in {wait_time:.1f}s...")
-                                    time.sleep(wait_time)
+                                    self.polite_sleep(wait_time, phase='retry_backoff')
                                     continue
                                 else:
                                     return None
@@ -609,20 +577,20 @@ class MoparOnlinePartsScraper(BaseScraper):
                         # Not on challenge page, continue normally
                         pass
                     
-                    time.sleep(random.uniform(0.5, 1.0))  # Increased delay for more human-like timing
+                    self.polite_sleep(0.5, 1.0)  # Increased delay for more human-like timing
                     
                     # Simulate human behavior - scroll and wait (more realistic)
                     self.simulate_human_behavior()
-                    time.sleep(random.uniform(0.5, 1.0))  # Increased delay for more human-like timing
+                    self.polite_sleep(0.5, 1.0)  # Increased delay for more human-like timing
                     
                     # Wait for page to fully load - realistic timing
-                    time.sleep(random.uniform(1.5, 3.0))  # Increased to 1.5-3s for more human-like behavior
+                    self.polite_sleep(1.5, 3.0)  # Increased to 1.5-3s for more human-like behavior
                     
                     # Wait for product title to load using WebDriverWait - realistic timeout
                     # Add delay before accessing page_source (more human-like)
-                    time.sleep(random.uniform(0.5, 1.0))
-                    html = self.driver.page_source  # Get HTML once for multiple checks
-                    soup = BeautifulSoup(html, 'lxml')
+                    self.polite_sleep(0.5, 1.0)
+                    html = self.get_page_source()  # Get HTML once for multiple checks
+                    soup = self.make_soup(html, 'lxml')
                     
                     # Check if this is actually a product page (not a category/listing page)
                     # Category pages typically have multiple product listings, not a single product
@@ -688,7 +656,7 @@ class MoparOnlinePartsScraper(BaseScraper):
                         retry_count += 1
                         if retry_count < max_retries:
                             wait_time = random.uniform(10, 15)
-                            time.sleep(wait_time)
+                            self.polite_sleep(wait_time, phase='retry_backoff')
                             continue
                         else:
                             return None
@@ -702,13 +670,13 @@ class MoparOnlinePartsScraper(BaseScraper):
                         retry_count += 1
                         if retry_count < max_retries:
                             wait_time = random.uniform(10, 15)
-                            time.sleep(wait_time)
+                            self.polite_sleep(wait_time, phase='retry_backoff')
                             continue
                         else:
                             return None
                     
                     # Success
-                    html = self.driver.page_source
+                    html = self.get_page_source()
                     safe_title_preview = self.safe_str(title_text[:50] if len(title_text) > 50 else title_text)
                     self.logger.info(f"✓ Page loaded successfully, title: {safe_title_preview}")
                     # Restore timeout
@@ -726,14 +694,14 @@ class MoparOnlinePartsScraper(BaseScraper):
                         content_ready = False
                         
                         while waited < wait_for_content:
-                            html = self.driver.page_source
+                            html = self.get_page_source()
                             current_url = self.driver.current_url.lower()
                             
                             if any(err in current_url for err in ['chrome-error://', 'err_', 'dns_probe']):
                                 raise Exception(f"Connection error: {current_url}")
                             
                             if html and len(html) > 8000:
-                                soup = BeautifulSoup(html, 'lxml')
+                                soup = self.make_soup(html, 'lxml')
                                 has_title = soup.find('h1')
                                 has_body = soup.find('body')
                                 body_text = has_body.get_text(strip=True) if has_body else ''
@@ -743,7 +711,7 @@ class MoparOnlinePartsScraper(BaseScraper):
                                     self.logger.info(f"✓ Full content loaded after {waited}s")
                                     break
                             
-                            time.sleep(0.5)
+                            self.clock.sleep(0.5)
                             waited += 0.5
                         
                         if not content_ready:
@@ -756,7 +724,7 @@ class MoparOnlinePartsScraper(BaseScraper):
                         retry_count += 1
                         if retry_count < max_retries:
                             wait_time = random.uniform(5, 8)
-                            time.sleep(wait_time)
+                            self.polite_sleep(wait_time, phase='retry_backoff')
                             continue
                         else:
                             # Restore timeout before returning
@@ -776,7 +744,7 @@ class MoparOnlinePartsScraper(BaseScraper):
                         retry_count += 1
                         if retry_count < max_retries:
                             wait_time = random.uniform(5, 8)
-                            time.sleep(wait_time)
+                            self.polite_sleep(wait_time, phase='retry_backoff')
                             continue
                         else:
                             return None
@@ -804,7 +772,7 @@ class MoparOnlinePartsScraper(BaseScraper):
                     wait_time = recovery['wait_time']
                     delay = random.uniform(wait_time[0], wait_time[1])
                     self.logger.warning(f"Retrying in {delay:.1f}s...")
-                    time.sleep(delay)
+                    self.polite_sleep(delay, phase='retry_backoff')
                     retry_count += 1
                     continue
                 else:
@@ -813,7 +781,7 @@ class MoparOnlinePartsScraper(BaseScraper):
         if not html:
             return None
         
-        soup = BeautifulSoup(html, 'lxml')
+        soup = self.make_soup(html, 'lxml')
         
         # Initialize product data
         product_data = {
@@ -1255,7 +1223,6 @@ class MoparOnlinePartsScraper(BaseScraper):
         except Exception as e:
             safe_error = self.safe_str(e)
             self.logger.error(f"❌ Error scraping product {url}: {safe_error}")
-            import traceback
             try:
                 tb_str = traceback.format_exc()
                 safe_tb = self.safe_str(tb_str)
@@ -0,0 +1,147 @@
+"""
+Page snapshots: one HTML transfer per page state
+
+Every driver.page_source call serializes the whole DOM and sends it over the
+WebDriver wire (1-3 MB on dealer pages). A PageSnapshot captures url,
+readyState and HTML with one script call and hands out cached, lazily built
+views (raw string, lxml tree, BeautifulSoup, Cloudflare probe).
+
+The capture script also installs a MutationObserver that counts DOM changes,
+so a cheap state check (url, readyState, document id and change counter, no
+HTML) tells whether a cached snapshot is still current.
+BaseScraper.page_snapshot() only transfers the HTML again after navigation or
+an actual DOM change.
+"""
+import time
+
+from scrapers.cloudflare_detector import detect_challenge_html
+
+# The leading comment lets test drivers recognise the script
+SNAPSHOT_SCRIPT = '''/* page-snapshot */
+const root = document.documentElement;
+if (root && !Object.getOwnPropertyDescriptor(window, '__pageState')) {
+    // Per-document id (a reload of the same URL is a new document) and DOM change counter
+    const pageState = {id: Math.random().toString(36).slice(2), version: 0};
+    Object.defineProperty(window, '__pageState', {value: pageState, enumerable: false, configurable: true});
+    new MutationObserver(() => { pageState.version++; }).observe(root, {subtree: true, childList: true,
+                                                                      attributes: true, characterData: true});
+}
+const pageState = window.__pageState;
+const state = {url: location.href, ready_state: document.readyState,
+               version: pageState ? pageState.id + ':' + pageState.version : null};
+if (arguments[0]) {
+    state.html = root ? root.outerHTML : '';
+}
+return state;
+'''
+
+
+class PageSnapshot:
+    """
+    The current page at one point in time.
+
+    Views are built on first use and cached: html (raw string), lower (for
+    marker searches), tree (lxml), soup(features) and cloudflare_probe. The
+    soup is shared, so callers must not modify it.
+    """
+
+    def __init__(self, url, html, ready_state='complete', version=None):
+        """
+        Args:
+            url: Page URL when captured
+            html: Serialized DOM
+            ready_state: document.readyState when captured
+            version: Document id and DOM change counter when captured (None if unknown)
+        """
+        self.url = url or ''
+        self.html = html or ''
+        self.ready_state = ready_state
+        self.version = version
+        self.captured_at = time.perf_counter()
+        self.parses = 0
+        self._lower = None
+        self._tree = None
+        self._soups = {}
+        self._probe = None
+
+    @classmethod
+    def capture(cls, driver):
+        """
+        Capture the driver's current page with one script call (falls back to
+        current_url + page_source when scripts can't run)
+        """
+        try:
+            state = driver.execute_script(SNAPSHOT_SCRIPT, True)
+            if isinstance(state, dict) and isinstance(state.get('html'), str):
+                return cls(state.get('url'), state['html'], state.get('ready_state', 'complete'), state.get('version'))
+        except Exception:
+            pass
+        return cls(driver.current_url, driver.page_source)
+
+    @staticmethod
+    def read_state(driver):
+        """
+        Cheap page state check (no HTML transfer)
+
+        Returns:
+            tuple: (url, ready_state, version), or None if it can't be read
+        """
+        try:
+            state = driver.execute_script(SNAPSHOT_SCRIPT, False)
+            if isinstance(state, dict):
+                return state.get('url'), state.get('ready_state'), state.get('version')
+        except Exception:
+            pass
+        return None
+
+    def matches(self, state):
+        """True if a read_state() result describes the page this snapshot captured"""
+        if state is None or self.version is None or state[2] is None:
+            return False
+        return state == (self.url, self.ready_state, self.version)
+
+    def __len__(self):
+        return len(self.html)
+
+    def __str__(self):
+        return self.html
+
+    @property
+    def lower(self):
+        """Lower-cased HTML (cached)"""
+        if self._lower is None:
+            self._lower = self.html.lower()
+        return self._lower
+
+    @property
+    def tree(self):
+        """lxml element tree (parsed on first use)"""
+        if self._tree is None:
+            from lxml import html as lxml_html
+            self.parses += 1
+            self._tree = lxml_html.fromstring(self.html or '<html></html>')
+        return self._tree
+
+    def soup(self, features='lxml', timer=None):
+        """
+        BeautifulSoup tree (parsed once per parser)
+
+        Args:
+            features: BeautifulSoup parser
+            timer: Optional PhaseTimer recording the parse as the 'soup' phase
+        """
+        if features not in self._soups:
+            from bs4 import BeautifulSoup
+            start = time.perf_counter()
+            self._soups[features] = BeautifulSoup(self.html, features)
+            self.parses += 1
+            if timer is not None:
+                timer.record('soup', time.perf_counter() - start)
+        return self._soups[features]
+
+    @property
+    def cloudflare_probe(self):
+        """Cloudflare challenge probe of this HTML (see cloudflare_detector)"""
+        if self._probe is None:
+            self._probe = detect_challenge_html(self.html, self.url)
+        return self._probe
@@ -0,0 +1,225 @@
+"""Per-phase timing instrumentation for page loads and product scrapes"""
+import functools
+import json
+import os
+import threading
+import time
+from collections import Counter, defaultdict, deque
+from contextlib import contextmanager
+from datetime import datetime
+
+
+class PhaseTimer:
+    """
+    Record timing spans per phase (driver.get, Cloudflare wait, sleeps, page_source,
+    soup construction, fitment interaction, ...) for each scraped URL.
+
+    Spans may nest (e.g. a politeness sleep inside the Cloudflare wait loop); each
+    phase is recorded on its own, so per-phase totals can add up to more than the
+    URL's total time.
+
+    If a TraceRecorder is attached (tracer), every recorded phase and per-URL
+    scrape is also emitted as a trace span.
+    """
+
+    def __init__(self, site_name, max_samples=5000, max_url_records=1000):
+        """
+        Args:
+            site_name: Name of the site being scraped
+            max_samples: Durations kept per phase for percentiles
+            max_url_records: Most recent per-URL records kept in memory
+        """
+        self.site_name = site_name
+        self.samples = defaultdict(lambda: deque(maxlen=max_samples))
+        self.totals = defaultdict(float)
+        self.counts = Counter()
+        self.outcomes = Counter()
+        self.url_records = deque(maxlen=max_url_records)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.tracer = None
+
+    def _current(self):
+        return getattr(self._local, 'record', None)
+
+    def begin_url(self, url):
+        """Start a per-URL record (nested calls for the same scrape are ignored)"""
+        depth = getattr(self._local, 'depth', 0)
+        self._local.depth = depth + 1
+        if depth == 0:
+            self._local.record = {
+                'url': url,
+                'site': self.site_name,
+                'start': time.perf_counter(),
+                'phases': defaultdict(float),
+                'outcome': None,
+            }
+
+    def set_outcome(self, outcome):
+        """Set the outcome of the current URL (e.g. 'fetch_failed', 'cloudflare_blocked')"""
+        record = self._current()
+        if record is not None and record['outcome'] is None:
+            record['outcome'] = outcome
+
+    def end_url(self, outcome):
+        """
+        Finish the current per-URL record
+
+        Args:
+            outcome: Default outcome ('scraped', 'skipped', 'error') if none was set
+        """
+        depth = getattr(self._local, 'depth', 1) - 1
+        self._local.depth = max(depth, 0)
+        if depth > 0:
+            return None
+
+        record = self._current()
+        self._local.record = None
+        if record is None:
+            return None
+
+        start = record.pop('start')
+        total = time.perf_counter() - start
+        record['outcome'] = record['outcome'] or outcome
+        record['total'] = round(total, 3)
+        record['phases'] = {phase: round(seconds, 3) for phase, seconds in record['phases'].items()}
+        record['time'] = datetime.now().isoformat(timespec='seconds')
+
+        with self._lock:
+            self.outcomes[record['outcome']] += 1
+            self.url_records.append(record)
+        self.record('product_total', total)
+        if self.tracer is not None:
+            self.tracer.complete('scrape_product', start, total, cat='product',
+                                 args={'url': record['url'], 'outcome': record['outcome']})
+        return record
+
+    def record(self, phase, duration):
+        """Record a duration (seconds) for a phase"""
+        with self._lock:
+            self.samples[phase].append(duration)
+            self.totals[phase] += duration
+            self.counts[phase] += 1
+
+        record = self._current()
+        if record is not None and phase != 'product_total':
+            record['phases'][phase] += duration
+
+        if self.tracer is not None and phase != 'product_total':
+            self.tracer.complete(phase, time.perf_counter() - duration, duration)
+
+    @contextmanager
+    def span(self, phase):
+        """Context manager timing a block as the given phase"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(phase, time.perf_counter() - start)
+
+    @staticmethod
+    def _percentile(sorted_values, pct):
+        if not sorted_values:
+            return 0.0
+        index = min(len(sorted_values) - 1, int(round(pct / 100.0 * (len(sorted_values) - 1))))
+        return sorted_values[index]
+
+    def get_breakdown(self):
+        """
+        Get per-phase latency breakdown
+
+        Returns:
+            dict: phase -> {'count', 'total', 'p50', 'p95', 'max'} (seconds)
+        """
+        breakdown = {}
+        with self._lock:
+            phases = {phase: sorted(values) for phase, values in self.samples.items()}
+            totals = dict(self.totals)
+            counts = dict(self.counts)
+
+        for phase, values in sorted(phases.items(), key=lambda item: -totals.get(item[0], 0)):
+            breakdown[phase] = {
+                'count': counts.get(phase, 0),
+                'total': round(totals.get(phase, 0.0), 3),
+                'p50': round(self._percentile(values, 50), 3),
+                'p95': round(self._percentile(values, 95), 3),
+                'max': round(values[-1], 3) if values else 0.0,
+            }
+        return breakdown
+
+    def get_totals(self):
+        """Get cumulative seconds per phase (for health_status)"""
+        with self._lock:
+            return {phase: round(seconds, 3) for phase, seconds in self.totals.items()}
+
+    def log_breakdown(self, logger):
+        """Log the per-phase latency breakdown"""
+        breakdown = self.get_breakdown()
+        if not breakdown:
+            return
+        logger.info(f"Latency breakdown for {self.site_name} (seconds):")
+        for phase, stats in breakdown.items():
+            logger.info(f"  {phase:<22} n={stats['count']:<6} p50={stats['p50']:<8} "
+                        f"p95={stats['p95']:<8} max={stats['max']:<8} total={stats['total']}")
+        if self.outcomes:
+            logger.info(f"  outcomes: {dict(self.outcomes)}")
+
+    def dump(self, filename):
+        """
+        Write the breakdown and recent per-URL records as JSON
+
+        Args:
+            filename: Output JSON filename
+        """
+        output_dir = os.path.dirname(filename)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+
+        with self._lock:
+            records = list(self.url_records)
+            outcomes = dict(self.outcomes)
+
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump({
+                'site': self.site_name,
+                'generated_at': datetime.now().isoformat(timespec='seconds'),
+                'outcomes': outcomes,
+                'phases': self.get_breakdown(),
+                'urls': records,
+            }, f, indent=2, ensure_ascii=False)
+
+
+def timed_scrape(func):
+    """Decorator for scrape_product(): opens a per-URL timing record with its outcome"""
+    @functools.wraps(func)
+    def wrapper(self, url, *args, **kwargs):
+        timer = getattr(self, 'phase_timer', None)
+        if timer is None:
+            return func(self, url, *args, **kwargs)
+
+        timer.begin_url(url)
+        outcome = 'error'
+        try:
+            result = func(self, url, *args, **kwargs)
+            outcome = 'scraped' if result else 'skipped'
+            return result
+        finally:
+            timer.end_url(outcome)
+            health_status = getattr(self, 'health_status', None)
+            if health_status is not None:
+                health_status['phase_timings'] = timer.get_totals()
+    return wrapper
+
+
+def timed_phase(phase):
+    """Decorator timing a scraper method as the given phase"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            timer = getattr(self, 'phase_timer', None)
+            if timer is None:
+                return func(self, *args, **kwargs)
+            with timer.span(phase):
+                return func(self, *args, **kwargs)
+        return wrapper
+    return decorator
@@ -1,10 +1,7 @@
 """Scraper for parts.byersporsche.com (Porsche parts) - SimplePart platform"""
 from scrapers.base_scraper_with_extension import BaseScraperWithExtension
-from bs4 import BeautifulSoup
-import json
 import re
 from datetime import datetime
-import time
 import traceback
 import random
 from selenium.webdriver.common.by import By
@@ -15,8 +12,8 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException
 class PorscheScraper(BaseScraperWithExtension):
     """Scraper for parts.byersporsche.com - Uses SimplePart platform"""
     
-    def __init__(self):
-        super().__init__('porsche', use_selenium=True)
+    def __init__(self, clock=None):
+        super().__init__('porsche', use_selenium=True, clock=clock)
         self.base_url = 'https://parts.byersporsche.com'
         
     def get_product_urls(self):
@@ -47,7 +44,6 @@ class PorscheScraper(BaseScraperWithExtension):
             
         except Exception as e:
             self.logger.error(f"Error getting product URLs: {str(e)}")
-            import traceback
             self.logger.debug(f"Traceback: {traceback.format_exc()}")
         
         return product_urls
@@ -68,8 +64,8 @@ class PorscheScraper(BaseScraperWithExtension):
             try:
                 self.page_load_timeout = 60
                 self.driver.set_page_load_timeout(60)
-                self.driver.get(search_url)
-                time.sleep(3)
+                self.driver_get(search_url)
+                self.clock.sleep(3)
             except Exception as e:
                 self.logger.error(f"Error loading search page: {str(e)}")
                 return product_urls
@@ -93,7 +89,7 @@ class PorscheScraper(BaseScraperWithExtension):
             self._scroll_to_load_content()
             
             # Wait a bit more for any dynamic content
-            time.sleep(3)
+            self.clock.sleep(3)
             
             # Try to find product links using Selenium first (more reliable for dynamic content)
             try:
@@ -125,8 +121,8 @@ class PorscheScraper(BaseScraperWithExtension):
                 self.logger.debug(f"Error finding links via Selenium: {str(e)}")
             
             # Also try BeautifulSoup parsing as fallback
-            html = self.driver.page_source
-            soup = BeautifulSoup(html, 'lxml')
+            html = self.get_page_source()
+            soup = self.make_soup(html, 'lxml')
             
             # Try multiple patterns to find product links (SimplePart platform)
             # Pattern 1: /p/Porsche__/Product-Name/ID/PartNumber.html
@@ -215,7 +211,6 @@ class PorscheScraper(BaseScraperWithExtension):
             
         except Exception as e:
             self.logger.error(f"Error searching for wheels: {str(e)}")
-            import traceback
             self.logger.debug(f"Traceback: {traceback.format_exc()}")
         
         return product_urls
@@ -243,8 +238,8 @@ class PorscheScraper(BaseScraperWithExtension):
                     pass
             
             self._scroll_to_load_content()
-            html = self.driver.page_source
-            soup = BeautifulSoup(html, 'lxml')
+            html = self.get_page_source()
+            soup = self.make_soup(html, 'lxml')
             
             product_links = soup.find_all('a', href=re.compile(r'/p/Porsche__/'))
             for link in product_links:
@@ -275,7 +270,7 @@ class PorscheScraper(BaseScraperWithExtension):
             while scroll_attempts < max_scrolls:
                 try:
                     self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                    time.sleep(1.5)
+                    self.clock.sleep(1.5)
                     new_height = self.driver.execute_script("return document.body.scrollHeight")
                     if new_height == last_height:
                         no_change_count += 1
@@ -301,7 +296,7 @@ class PorscheScraper(BaseScraperWithExtension):
                 stable_count = 0
                 last_html = element.get_attribute('outerHTML')
                 for _ in range(10):  # Check for up to 1 second
-                    time.sleep(0.1)
+                    self.clock.sleep(0.1)
                     current_html = element.get_attribute('outerHTML')
                     if current_html == last_html:
                         stable_count += 1
@@ -312,7 +307,7 @@ class PorscheScraper(BaseScraperWithExtension):
                         last_html = current_html
             
             # Additional wait for any JavaScript to finish
-            time.sleep(0.5)
+            self.clock.sleep(0.5)
             return element
         except TimeoutException:
             return None
@@ -344,7 +339,7 @@ class PorscheScraper(BaseScraperWithExtension):
                 # Step 2: Wait for loading indicators to disappear
                 self.logger.debug("Waiting for loading indicators to disappear...")
                 for _ in range(20):  # Wait up to 4 seconds for loading to complete
-                    time.sleep(0.2)
+                    self.clock.sleep(0.2)
                     try:
                         loading_indicators = self.driver.find_elements(By.CSS_SELECTOR, 
                             'div.loading, div.spinner, div[class*="loading"], div[class*="spinner"], '
@@ -362,7 +357,7 @@ class PorscheScraper(BaseScraperWithExtension):
                 last_content_length = 0
                 
                 for check_round in range(15):  # Check for up to 3 seconds
-                    time.sleep(0.2)
+                    self.clock.sleep(0.2)
                     try:
                         current_inner_html = element.get_attribute('innerHTML') or ''
                         current_length = len(current_inner_html.strip())
@@ -431,7 +426,7 @@ class PorscheScraper(BaseScraperWithExtension):
                     pass
                 
                 # Step 6: Final wait for any remaining async operations
-                time.sleep(1)
+                self.clock.sleep(1)
                 
                 # Step 7: Final verification
                 final_inner_html = element.get_attribute('innerHTML') or ''
@@ -470,7 +465,7 @@ class PorscheScraper(BaseScraperWithExtension):
         for attempt in range(max_attempts):
             try:
                 if attempt > 0:
-                    time.sleep(wait_between_attempts)
+                    self.clock.sleep(wait_between_attempts)
                 
                 try:
                     show_more_exists = self.driver.execute_script("""
@@ -505,12 +500,12 @@ class PorscheScraper(BaseScraperWithExtension):
                                     continue
                                 
                                 self.driver.execute_script("arguments[0].scrollIntoView({block: 'center', behavior: 'smooth'});", element)
-                                time.sleep(0.5)
+                                self.clock.sleep(0.5)
                                 
                                 element = wait.until(EC.element_to_be_clickable((selector_type, selector_value)))
                                 element.click()
                                 self.logger.info(f"✓ Clicked 'Show More' button (attempt {attempt + 1})")
-                                time.sleep(1)
+                                self.clock.sleep(1)
                                 return True
                             except Exception as e:
                                 continue
@@ -543,7 +538,7 @@ class PorscheScraper(BaseScraperWithExtension):
         for check_round in range(5):
             try:
                 if check_round > 0:
-                    time.sleep(2)
+                    self.clock.sleep(2)
                 
                 for selector in selectors:
                     try:
@@ -563,7 +558,7 @@ class PorscheScraper(BaseScraperWithExtension):
                             
                             if valid_count > 0:
                                 self.logger.info(f"✓ Fitment data loaded: found {len(elements)} elements ({valid_count} with content) via {selector}")
-                                time.sleep(2)
+                                self.clock.sleep(2)
                                 return True
                     except Exception as e:
                         continue
@@ -587,7 +582,7 @@ class PorscheScraper(BaseScraperWithExtension):
                     
                     if row_count >= min_rows:
                         self.logger.info(f"✓ Fitment data loaded: found {row_count} rows via JavaScript")
-                        time.sleep(2)
+                        self.clock.sleep(2)
                         return True
                 except:
                     pass
@@ -619,7 +614,7 @@ class PorscheScraper(BaseScraperWithExtension):
                     if recovery['should_retry'] and retry_count < max_retries - 1:
                         wait_time = recovery['wait_time']
                         delay = random.uniform(wait_time[0], wait_time[1])
-                        time.sleep(delay)
+                        self.polite_sleep(delay, phase='retry_backoff')
                         retry_count += 1
                         continue
                     else:
@@ -628,22 +623,22 @@ class PorscheScraper(BaseScraperWithExtension):
                 try:
                     self.page_load_timeout = 60
                     self.driver.set_page_load_timeout(60)
-                    self.driver.get(url)
-                    time.sleep(random.uniform(0.5, 1.5))
+                    self.driver_get(url)
+                    self.polite_sleep(0.5, 1.5)
                     
                     if self.has_cloudflare_challenge():
                         cloudflare_bypassed = self.wait_for_cloudflare(timeout=30, target_url=url, max_retries=1)
                         if not cloudflare_bypassed:
                             retry_count += 1
                             if retry_count < max_retries:
-                                time.sleep(random.uniform(10, 15))
+                                self.polite_sleep(10, 15, phase='retry_backoff')
                                 continue
                             else:
                                 return None
                     
-                    time.sleep(random.uniform(1.5, 3.0))
-                    html = self.driver.page_source
-                    soup = BeautifulSoup(html, 'lxml')
+                    self.polite_sleep(1.5, 3.0)
+                    html = self.get_page_source()
+                    soup = self.make_soup(html, 'lxml')
                     
                     title_text = ''
                     title_elem = soup.find('h1')
@@ -660,7 +655,7 @@ class PorscheScraper(BaseScraperWithExtension):
                     if not title_text or len(title_text) < 3:
                         retry_count += 1
                         if retry_count < max_retries:
-                            time.sleep(random.uniform(10, 15))
+                            self.polite_sleep(10, 15, phase='retry_backoff')
                             continue
                         else:
                             return None
@@ -674,7 +669,7 @@ class PorscheScraper(BaseScraperWithExtension):
                     self.driver.set_page_load_timeout(original_timeout)
                     retry_count += 1
                     if retry_count < max_retries:
-                        time.sleep(random.uniform(5, 8))
+                        self.polite_sleep(5, 8, phase='retry_backoff')
                         continue
                     else:
                         return None
@@ -685,7 +680,7 @@ class PorscheScraper(BaseScraperWithExtension):
                     if any(err in error_str for err in ['connection', 'network', 'dns', 'err_', 'timeout']):
                         retry_count += 1
                         if retry_count < max_retries:
-                            time.sleep(random.uniform(5, 8))
+                            self.polite_sleep(5, 8, phase='retry_backoff')
                             continue
                         else:
                             return None
@@ -704,7 +699,7 @@ class PorscheScraper(BaseScraperWithExtension):
                 if retry_count < max_retries - 1:
                     wait_time = recovery['wait_time']
                     delay = random.uniform(wait_time[0], wait_time[1])
-                    time.sleep(delay)
+                    self.polite_sleep(delay, phase='retry_backoff')
                     retry_count += 1
                     continue
                 else:
@@ -713,7 +708,7 @@ class PorscheScraper(BaseScraperWithExtension):
         if not html:
             return None
         
-        soup = BeautifulSoup(html, 'lxml')
+        soup = self.make_soup(html, 'lxml')
         
         product_data = {
             'url': url,
@@ -0,0 +1,280 @@
+"""
+Pre-initialized Chrome profile templates per extension set
+
+A Chrome started with unpacked extensions on a fresh profile installs every
+extension and lets each one build its state: filter lists compiled and stored
+by adblock / uBlock Origin / Privacy Badger, declarative rulesets indexed. That
+happens on every launch, because undetected_chromedriver gives each driver a
+new temporary profile. ProfileCache keeps one template user-data directory per
+extension set (keyed by the extensions' manifests and the Chrome major version):
+
+  - checkout() copies the template (when there is one) into a working
+    directory on tmpfs (/dev/shm) when available, and the driver is launched
+    with --user-data-dir pointing at it
+  - attach() makes driver.quit() wait for the browser process to exit (uc's
+    quit() only signals it), then delete the working copy; the first driver of
+    an extension set without a template seeds it from its profile first
+    (browsing state such as cookies, history, caches and site storage is left
+    out). A browser still running after EXIT_TIMEOUT never seeds a template,
+    and its copy is deleted at process exit instead.
+
+Templates live in data/chrome_profiles/<key>/ and are written atomically, so
+concurrent workers can share them. Set CHROME_PROFILE_CACHE=0 to disable.
+"""
+import atexit
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+CACHE_DIR = 'data/chrome_profiles'
+ENV_VAR = 'CHROME_PROFILE_CACHE'
+TMPFS_DIR = '/dev/shm'
+EXIT_TIMEOUT = 10  # Seconds quit() waits for the browser process before giving up on seeding
+
+# Browsing state and caches never copied into a template (matched by file/dir name at any depth)
+EXCLUDED_NAMES = {
+    'Cache', 'Code Cache', 'GPUCache', 'DawnCache', 'DawnGraphiteCache', 'DawnWebGPUCache', 'GrShaderCache',
+    'GraphiteDawnCache', 'ShaderCache', 'CacheStorage', 'Crashpad', 'BrowserMetrics', 'Crash Reports',
+    'Cookies', 'Cookies-journal', 'History', 'History-journal', 'Visited Links', 'Top Sites', 'Top Sites-journal',
+    'Favicons', 'Favicons-journal', 'Shortcuts', 'Shortcuts-journal', 'Network Action Predictor',
+    'Network Action Predictor-journal', 'Network Persistent State', 'TransportSecurity', 'Reporting and NEL',
+    'Sessions', 'Session Storage', 'Current Session', 'Current Tabs', 'Last Session', 'Last Tabs',
+    'Login Data', 'Login Data-journal', 'Web Data', 'Web Data-journal',
+    # Site storage (one store for every origin; extensions keep theirs in Local Extension Settings)
+    'Local Storage', 'Service Worker', 'WebStorage', 'SharedStorage', 'Shared Dictionary',
+    'SingletonLock', 'SingletonCookie', 'SingletonSocket',
+}
+# Per-origin storage directories: only the extensions' own origins are kept
+ORIGIN_STORAGE_DIRS = {'IndexedDB', 'File System', 'blob_storage'}
+EXTENSION_ORIGIN_PREFIX = 'chrome-extension_'
+
+
+def profile_key(extension_paths, chrome_major=None):
+    """
+    Template key for an extension set: changes when an extension is added,
+    removed or updated (manifest version/mtime) or Chrome's major version changes
+    """
+    parts = [f'chrome={chrome_major or "auto"}']
+    for ext_path in sorted(os.path.abspath(path) for path in extension_paths):
+        manifest_path = os.path.join(ext_path, 'manifest.json')
+        try:
+            with open(manifest_path, 'r', encoding='utf-8-sig') as f:
+                version = json.load(f).get('version', '')
+            mtime = os.path.getmtime(manifest_path)
+        except Exception:
+            version, mtime = '', 0
+        parts.append(f'{ext_path}|{version}|{mtime}')
+    return hashlib.sha1('\n'.join(parts).encode('utf-8')).hexdigest()[:16]
+
+
+def wait_for_exit(pid, timeout=EXIT_TIMEOUT):
+    """
+    Wait for a browser process to exit
+
+    Returns:
+        bool: True if it has exited; False if it is still running after timeout,
+              or there is no pid / psutil to check with
+    """
+    if not pid:
+        return False
+    try:
+        import psutil
+    except ImportError:
+        return False
+    try:
+        psutil.Process(pid).wait(timeout=timeout)
+    except psutil.NoSuchProcess:
+        pass
+    except psutil.TimeoutExpired:
+        return False
+    return True
+
+
+def _ignore_browsing_state(directory, names):
+    ignored = {name for name in names if name in EXCLUDED_NAMES}
+    if os.path.basename(directory) in ORIGIN_STORAGE_DIRS:
+        ignored.update(name for name in names if not name.startswith(EXTENSION_ORIGIN_PREFIX))
+    return ignored
+
+
+def _tree_size(path):
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                pass
+    return total
+
+
+class ProfileCache:
+    """
+    Template user-data directories per extension set, and the working copies
+    handed to drivers.
+    """
+
+    def __init__(self, cache_dir=CACHE_DIR, work_dir=None):
+        """
+        Args:
+            cache_dir: Where templates are kept (persistent, shared by workers)
+            work_dir: Where working copies are made (default: /dev/shm if usable, else the temp dir)
+        """
+        self.logger = logging.getLogger('profile_cache')
+        self.cache_dir = cache_dir
+        self.work_dir = work_dir
+        self.stats = {'warm': 0, 'cold': 0, 'seeded': 0, 'copy_seconds': 0.0}
+        self._checked_out = set()
+        self._lock = threading.Lock()
+        atexit.register(self.release_all)
+
+    def template_path(self, key):
+        return os.path.join(self.cache_dir, key)
+
+    def has_template(self, key):
+        return os.path.isdir(self.template_path(key))
+
+    def _work_root(self, needed_bytes):
+        if self.work_dir:
+            return self.work_dir
+        # tmpfs keeps Chrome's profile I/O off the disk; only used when the copy comfortably fits
+        if os.path.isdir(TMPFS_DIR) and os.access(TMPFS_DIR, os.W_OK):
+            try:
+                if shutil.disk_usage(TMPFS_DIR).free > 2 * needed_bytes + 256 * 1024 * 1024:
+                    return TMPFS_DIR
+            except OSError:
+                pass
+        return tempfile.gettempdir()
+
+    def checkout(self, key):
+        """
+        Create a working profile directory for a new driver
+
+        Returns:
+            str: Directory to pass as --user-data-dir (a copy of the template, or empty)
+        """
+        template = self.template_path(key)
+        warm = self.has_template(key)
+        work_dir = tempfile.mkdtemp(prefix=f'chrome_profile_{key}_',
+                                    dir=self._work_root(_tree_size(template) if warm else 0))
+        if warm:
+            start = time.perf_counter()
+            try:
+                shutil.copytree(template, work_dir, dirs_exist_ok=True)
+                self.stats['warm'] += 1
+                self.stats['copy_seconds'] += time.perf_counter() - start
+            except Exception as e:
+                self.logger.warning(f"Could not copy Chrome profile template {key}, starting cold: {str(e)}")
+                shutil.rmtree(work_dir, ignore_errors=True)
+                os.makedirs(work_dir, exist_ok=True)
+                warm = False
+        if not warm:
+            self.stats['cold'] += 1
+        with self._lock:
+            self._checked_out.add(work_dir)
+        return work_dir
+
+    def seed(self, key, profile_dir):
+        """
+        Save a (closed) profile as the template for key, unless one exists
+
+        Returns:
+            bool: True if this call created the template
+        """
+        if self.has_template(key) or not os.path.isdir(profile_dir):
+            return False
+        os.makedirs(self.cache_dir, exist_ok=True)
+        staging = tempfile.mkdtemp(prefix=f'.{key}_', dir=self.cache_dir)
+        try:
+            shutil.copytree(profile_dir, staging, ignore=_ignore_browsing_state, dirs_exist_ok=True)
+            os.rename(staging, self.template_path(key))
+        except OSError as e:
+            # Another worker seeded it first (rename onto a non-empty dir fails), or the copy failed
+            shutil.rmtree(staging, ignore_errors=True)
+            if not self.has_template(key):
+                self.logger.warning(f"Could not save Chrome profile template {key}: {str(e)}")
+            return False
+        self.stats['seeded'] += 1
+        self.logger.info(f"Saved Chrome profile template {key} ({_tree_size(self.template_path(key)) / 1048576:.1f} MB)")
+        return True
+
+    def release(self, work_dir):
+        """
+        Delete a working copy (after its Chrome has exited)
+
+        Returns:
+            bool: True if it is gone; False if files are still locked (retried at process exit)
+        """
+        shutil.rmtree(work_dir, ignore_errors=True)
+        if os.path.exists(work_dir):
+            return False
+        with self._lock:
+            self._checked_out.discard(work_dir)
+        return True
+
+    def release_all(self):
+        """Delete every working copy still checked out (process exit)"""
+        with self._lock:
+            work_dirs = list(self._checked_out)
+        for work_dir in work_dirs:
+            self.release(work_dir)
+
+    def attach(self, driver, key, work_dir):
+        """
+        Tie a working copy to a driver: once driver.quit() has stopped the
+        browser, the template is seeded from it (if there is none yet) and the
+        copy is deleted
+        """
+        original_quit = driver.quit
+        cache = self
+
+        def quit(*args, **kwargs):
+            try:
+                return original_quit(*args, **kwargs)
+            finally:
+                if work_dir in cache._checked_out:
+                    if wait_for_exit(getattr(driver, 'browser_pid', None)):
+                        try:
+                            cache.seed(key, work_dir)
+                        finally:
+                            cache.release(work_dir)
+                    else:
+                        # Files may still be open: no template from it, and deleting is left to release_all()
+                        cache.logger.debug(f"Browser for profile {key} not confirmed stopped, not seeding from it")
+
+        driver.quit = quit
+        return driver
+
+    def invalidate(self, key=None):
+        """Delete one template (or all of them) so the next driver seeds it again"""
+        if key is not None:
+            shutil.rmtree(self.template_path(key), ignore_errors=True)
+        elif os.path.isdir(self.cache_dir):
+            shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def summary(self):
+        """One-line cache statistics"""
+        warm = self.stats['warm']
+        average = self.stats['copy_seconds'] / warm if warm else 0.0
+        return (f"{warm} warm profile(s) (avg copy {average:.2f}s), {self.stats['cold']} cold, "
+                f"{self.stats['seeded']} template(s) saved")
+
+
+_profile_cache = None
+_profile_cache_lock = threading.Lock()
+
+
+def get_profile_cache():
+    """Return the process-wide ProfileCache (None if disabled with CHROME_PROFILE_CACHE=0)"""
+    global _profile_cache
+    if os.getenv(ENV_VAR, '1').strip().lower() in ('0', 'false', 'no', 'off'):
+        return None
+    with _profile_cache_lock:
+        if _profile_cache is None:
+            _profile_cache = ProfileCache()
+        return _profile_cache
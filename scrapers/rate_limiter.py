@@ -0,0 +1,68 @@
+"""Per-host rate limit for page loads (foreground navigations and prefetch tabs alike)"""
+import threading
+from urllib.parse import urlparse
+
+from scrapers.clock import get_clock
+
+
+def host_of(url):
+    """Host of a URL, lower-cased without 'www.' (empty for relative/odd URLs)"""
+    host = (urlparse(url).netloc or '').split('@')[-1].split(':')[0].lower()
+    return host[4:] if host.startswith('www.') else host
+
+
+class HostRateLimiter:
+    """
+    Minimum interval between page loads started on the same host.
+
+    acquire() sleeps (on the scraper's clock) until the host's next slot and
+    takes it; try_acquire() takes the slot only if it is already due, so
+    prefetching never blocks the page being parsed.
+    """
+
+    def __init__(self, min_interval, clock=None):
+        """
+        Args:
+            min_interval: Seconds between page loads on one host
+            clock: Clock used for time and sleeps (default: process-wide clock)
+        """
+        self.min_interval = max(0.0, float(min_interval))
+        self.clock = clock or get_clock()
+        self.waited = 0.0
+        self._next_slot = {}
+        self._lock = threading.Lock()
+
+    def delay(self, url):
+        """Seconds until a page load on url's host is allowed (0 if now)"""
+        with self._lock:
+            return max(0.0, self._next_slot.get(host_of(url), 0.0) - self.clock.monotonic())
+
+    def try_acquire(self, url):
+        """
+        Take the host's slot if it is due now
+
+        Returns:
+            bool: True if the load may start now
+        """
+        host = host_of(url)
+        with self._lock:
+            now = self.clock.monotonic()
+            if self._next_slot.get(host, 0.0) > now:
+                return False
+            self._next_slot[host] = now + self.min_interval
+            return True
+
+    def acquire(self, url):
+        """
+        Wait for the host's next slot and take it
+
+        Returns:
+            float: Seconds waited
+        """
+        waited = 0.0
+        while not self.try_acquire(url):
+            delay = self.delay(url)
+            self.clock.sleep(delay, reason='host_rate_limit')
+            waited += delay
+        self.waited += waited
+        return waited
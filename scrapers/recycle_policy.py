@@ -0,0 +1,115 @@
+"""Proactive driver recycling policy (page count, renderer memory, latency degradation)"""
+from collections import deque
+
+from utils.memory_watchdog import chrome_memory
+
+# Keys of a site's "driver_recycle" block in config/sites_config.json
+DEFAULT_RECYCLE_POLICY = {
+    'max_pages': None,                 # Replace the driver after this many page loads
+    'renderer_rss_mb': None,           # ... or when Chrome renderer RSS exceeds this (Linux /proc only)
+    'latency_degradation_pct': None,   # ... or when the moving-average page load is this % slower than the baseline
+    'latency_window': 20,              # Page loads in the baseline and moving-average windows
+    'memory_check_every': 10,          # Page loads between renderer RSS reads
+}
+
+
+class DriverRecyclePolicy:
+    """
+    Decide when a long-lived driver should be replaced before it fails.
+
+    The scraper reports every page load (record_page); between products the
+    caller asks check() whether the driver is due. The latency baseline is the
+    average of the first `latency_window` page loads after each (re)start, and
+    it is compared with the average of the most recent `latency_window` loads.
+    """
+
+    def __init__(self, max_pages=None, renderer_rss_mb=None, latency_degradation_pct=None,
+                 latency_window=20, memory_check_every=10):
+        """
+        Args:
+            max_pages: Page loads per driver (None = no limit)
+            renderer_rss_mb: Renderer RSS limit in MB (None = no limit)
+            latency_degradation_pct: Allowed slowdown of the moving average, in % (None = no limit)
+            latency_window: Page loads in each latency window
+            memory_check_every: Page loads between renderer RSS reads
+        """
+        self.max_pages = max_pages
+        self.renderer_rss_mb = renderer_rss_mb
+        self.latency_degradation_pct = latency_degradation_pct
+        self.latency_window = max(1, latency_window)
+        self.memory_check_every = max(1, memory_check_every)
+        self.recycles = 0
+        self.reasons = []
+        self.reset()
+
+    @classmethod
+    def from_config(cls, site_config, defaults=None):
+        """
+        Build the policy for a site: its "driver_recycle" block over the defaults
+
+        Args:
+            site_config: Site configuration dictionary
+            defaults: Optional dict overriding DEFAULT_RECYCLE_POLICY (e.g. from CLI flags)
+        """
+        settings = dict(DEFAULT_RECYCLE_POLICY)
+        settings.update({key: value for key, value in (defaults or {}).items() if value is not None})
+        settings.update((site_config or {}).get('driver_recycle') or {})
+        return cls(**{key: settings[key] for key in DEFAULT_RECYCLE_POLICY})
+
+    @property
+    def enabled(self):
+        return bool(self.max_pages or self.renderer_rss_mb or self.latency_degradation_pct)
+
+    def reset(self):
+        """Start counting for a fresh driver"""
+        self.pages = 0
+        self._last_memory_check = 0
+        self._baseline = []
+        self._recent = deque(maxlen=self.latency_window)
+
+    def record_page(self, seconds):
+        """Record one page load (driver.get duration in seconds)"""
+        self.pages += 1
+        if len(self._baseline) < self.latency_window:
+            self._baseline.append(seconds)
+        else:
+            self._recent.append(seconds)
+
+    def latency_change_pct(self):
+        """Moving-average page latency vs. the baseline, in % (None until both windows are full)"""
+        if len(self._baseline) < self.latency_window or len(self._recent) < self.latency_window:
+            return None
+        baseline = sum(self._baseline) / len(self._baseline)
+        if baseline <= 0:
+            return None
+        return (sum(self._recent) / len(self._recent) - baseline) / baseline * 100.0
+
+    def check(self, driver):
+        """
+        Check whether the driver is due for replacement
+
+        Args:
+            driver: Current WebDriver (its Chrome renderers are measured)
+
+        Returns:
+            str: Reason to recycle, or None
+        """
+        if self.max_pages and self.pages >= self.max_pages:
+            return f"{self.pages} pages loaded"
+
+        if self.renderer_rss_mb and self.pages - self._last_memory_check >= self.memory_check_every:
+            self._last_memory_check = self.pages
+            memory = chrome_memory(driver)
+            if memory and memory['renderer_mb'] > self.renderer_rss_mb:
+                return f"renderer RSS {memory['renderer_mb']:.0f} MB > {self.renderer_rss_mb} MB"
+
+        if self.latency_degradation_pct:
+            change = self.latency_change_pct()
+            if change is not None and change > self.latency_degradation_pct:
+                return f"page latency +{change:.0f}% over baseline (limit {self.latency_degradation_pct}%)"
+        return None
+
+    def recycled(self, reason):
+        """Count a replacement made because of this policy"""
+        self.recycles += 1
+        self.reasons.append(reason)
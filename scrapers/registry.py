@@ -0,0 +1,135 @@
+"""
+Scraper registry: site name -> scraper class, imported on demand
+
+Each site in config/sites_config.json names its scraper as "module:Class" in
+its "scraper" field; sites without one use GenericScraper. Scrapers packaged
+outside this repo can register under the 'wheel_scrapers' entry point group
+(name = site name, value = "module:Class"), which overrides the config.
+
+Only the module of the scraper actually created is imported, so CLI startup
+doesn't pay for every site's selenium/bs4 imports.
+"""
+import importlib
+import inspect
+import logging
+from collections.abc import Mapping
+
+from scrapers.site_config import CONFIG_FILE, get_config
+
+ENTRY_POINT_GROUP = 'wheel_scrapers'
+GENERIC_SCRAPER = 'scrapers.generic_scraper:GenericScraper'
+
+logger = logging.getLogger('scraper_registry')
+
+_entry_points = None
+_classes = {}
+
+
+def load_site_configs(config_file=CONFIG_FILE):
+    """
+    Load the site configurations (shared, validated and cached - see scrapers/site_config.py)
+
+    Returns:
+        list: Read-only SiteConfig mappings
+    """
+    try:
+        return list(get_config(config_file).sites)
+    except Exception as e:
+        logger.error(f"Error loading site configs: {str(e)}")
+        return []
+
+
+def load_config_section(key, default=None, config_file=CONFIG_FILE):
+    """
+    Return a top-level section of the config file other than "sites"
+    (e.g. "resource_blocking_profiles")
+
+    Returns:
+        The section, or default if the file or the section is missing
+    """
+    try:
+        return get_config(config_file).section(key, default)
+    except Exception as e:
+        logger.debug(f"Could not read '{key}' from {config_file}: {str(e)}")
+        return default
+
+
+def get_site_config(site_name, config_file=CONFIG_FILE):
+    """Return the configuration for a site, or None if it isn't configured"""
+    try:
+        return get_config(config_file).site(site_name)
+    except Exception as e:
+        logger.error(f"Error loading site configs: {str(e)}")
+        return None
+
+
+def _entry_point_specs():
+    """Scraper specs registered by installed packages ({site name: 'module:Class'})"""
+    global _entry_points
+    if _entry_points is None:
+        _entry_points = {}
+        try:
+            from importlib.metadata import entry_points
+            for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+                _entry_points[entry_point.name] = entry_point.value
+        except Exception as e:
+            logger.debug(f"Could not read '{ENTRY_POINT_GROUP}' entry points: {str(e)}")
+    return _entry_points
+
+
+def scraper_spec(site):
+    """
+    Resolve the "module:Class" spec for a site
+
+    Args:
+        site: Site configuration dictionary or site name
+
+    Returns:
+        str: Scraper spec (GenericScraper if nothing else is registered)
+    """
+    site_config = site if isinstance(site, Mapping) else (get_site_config(site) or {'name': site})
+    site_name = site_config.get('name', '')
+    return _entry_point_specs().get(site_name) or site_config.get('scraper') or GENERIC_SCRAPER
+
+
+def load_scraper_class(spec):
+    """Import and return the class for a "module:Class" spec (cached)"""
+    if spec not in _classes:
+        module_name, _, class_name = spec.partition(':')
+        _classes[spec] = getattr(importlib.import_module(module_name), class_name)
+    return _classes[spec]
+
+
+def scraper_class(site):
+    """Return the scraper class for a site configuration or name"""
+    return load_scraper_class(scraper_spec(site))
+
+
+def takes_site_config(cls):
+    """True if the scraper is constructed with the site configuration (like GenericScraper)"""
+    parameters = list(inspect.signature(cls.__init__).parameters.values())[1:]
+    return any(p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD) and p.default is p.empty
+               for p in parameters)
+
+
+def create_scraper(site_config, clock=None):
+    """
+    Create the scraper for a site
+
+    Args:
+        site_config: Site configuration dictionary
+        clock: Optional clock for the scraper's sleeps and timeouts (default: process-wide clock)
+
+    Returns:
+        Scraper instance
+    """
+    cls = scraper_class(site_config)
+    return cls(site_config, clock=clock) if takes_site_config(cls) else cls(clock=clock)
+
+
+def registered_sites(config_file=CONFIG_FILE):
+    """Return {site name: spec} for every configured or entry-point site"""
+    sites = {site.get('name'): scraper_spec(site) for site in load_site_configs(config_file) if site.get('name')}
+    for site_name, spec in _entry_point_specs().items():
+        sites[site_name] = spec
+    return sites
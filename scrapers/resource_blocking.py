@@ -0,0 +1,226 @@
+"""
+Per-site resource blocking through CDP (Network.setBlockedURLs)
+
+Chrome options leave images and CSS enabled because content-setting prefs are
+visible to Cloudflare's fingerprinting, so every product page also downloads
+full-size photos, fonts, analytics and ad scripts. Blocking through CDP is
+switched on only *after* Cloudflare clearance is obtained, and lifted again
+whenever a challenge shows up, so challenge pages always load every resource
+they ask for. CDP network settings are per tab, so blocking is tracked per
+window handle and applied to every tab a tab pipeline opens or switches to.
+
+Sites opt in with a "resource_blocking" entry in config/sites_config.json:
+
+    "resource_blocking": "lean"
+    "resource_blocking": {"profile": ["trackers", "fonts"], "block": ["*/reviews-widget/*"]}
+
+Named profiles come from the top-level "resource_blocking_profiles" section of
+the same file (falling back to DEFAULT_BLOCKING_PROFILES). A profile is a list
+of URL patterns ('*' wildcards) and/or names of other profiles.
+`python -m benchmarks.blocking_benchmark` measures a profile A/B against
+unblocked page loads before a site is switched over.
+"""
+import logging
+from collections.abc import Mapping
+
+from scrapers.registry import load_config_section
+
+PROFILES_SECTION = 'resource_blocking_profiles'
+
+# Used when sites_config.json has no "resource_blocking_profiles" section (or lacks a name)
+DEFAULT_BLOCKING_PROFILES = {
+    'none': [],
+    'trackers': [
+        '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*', '*googlesyndication.com*',
+        '*googleadservices.com*', '*connect.facebook.net*', '*bat.bing.com*', '*clarity.ms*', '*hotjar.com*',
+        '*criteo.com*', '*criteo.net*', '*adsrvr.org*', '*adroll.com*', '*quantserve.com*',
+        '*scorecardresearch.com*', '*nr-data.net*', '*analytics.tiktok.com*',
+    ],
+    'fonts': ['*.woff*', '*.ttf*', '*.otf*', '*.eot*', '*fonts.googleapis.com*', '*fonts.gstatic.com*', '*use.typekit.net*'],
+    'images': ['*.jpg*', '*.jpeg*', '*.png*', '*.gif*', '*.webp*', '*.avif*', '*.bmp*', '*.ico*'],
+    'media': ['*.mp4*', '*.webm*', '*.m3u8*', '*youtube.com/embed*', '*player.vimeo.com*'],
+    'lean': ['trackers', 'fonts', 'media'],
+    'aggressive': ['lean', 'images'],
+}
+
+
+def blocking_profiles():
+    """Named profiles: sites_config.json's section over the defaults"""
+    profiles = dict(DEFAULT_BLOCKING_PROFILES)
+    profiles.update(load_config_section(PROFILES_SECTION) or {})
+    return profiles
+
+
+def resolve_patterns(names, profiles=None):
+    """
+    Expand profile names (and literal patterns) into URL patterns
+
+    Args:
+        names: Profile name, URL pattern, or a list of either
+        profiles: Named profiles (default: blocking_profiles())
+
+    Returns:
+        list: URL patterns, in order, without duplicates
+
+    Raises:
+        ValueError: If a name is neither a profile nor a URL pattern
+    """
+    profiles = blocking_profiles() if profiles is None else profiles
+    patterns = []
+    seen = set()
+
+    def expand(item):
+        if item in profiles:
+            if item in seen:
+                return  # Profiles including each other
+            seen.add(item)
+            for entry in profiles[item]:
+                expand(entry)
+        elif '*' in item or '/' in item or '.' in item:
+            patterns.append(item)
+        else:
+            raise ValueError(f"Unknown resource blocking profile: {item}")
+
+    for name in [names] if isinstance(names, str) else (names or []):
+        expand(name)
+    return list(dict.fromkeys(patterns))
+
+
+class ResourceBlocker:
+    """
+    URL blocking for one scraper's driver.
+
+    Network.setBlockedURLs only affects the tab it is sent to, so the blocker
+    remembers which window handles have the patterns. apply() switches blocking
+    on for a driver (after clearance) and blocks its current tab; block_tab()
+    blocks further tabs (prefetch tabs, a tab the pipeline switched to) while it
+    is on; lift() clears the current tab and switches blocking off while a
+    challenge is being solved. A replaced driver starts unblocked (reset()).
+    """
+
+    def __init__(self, patterns, profile='custom'):
+        """
+        Args:
+            patterns: URL patterns for Network.setBlockedURLs ('*' wildcards)
+            profile: Profile description (logged and reported)
+        """
+        self.logger = logging.getLogger('resource_blocking')
+        self.patterns = list(dict.fromkeys(patterns))
+        self.profile = profile
+        self.stats = {'applied': 0, 'tabs': 0, 'lifted': 0, 'errors': 0}
+        self._driver = None  # Driver the blocked tabs belong to
+        self._enabled = False  # Blocking switched on for _driver (new tabs get it too)
+        self._tabs = set()  # Window handles of _driver that have the patterns
+
+    @classmethod
+    def from_config(cls, site_config, override=None, profiles=None):
+        """
+        Build the blocker for a site
+
+        Args:
+            site_config: Site configuration dictionary
+            override: Profile name(s) replacing the site's "resource_blocking" setting (e.g. from the CLI)
+            profiles: Named profiles (default: blocking_profiles())
+
+        Returns:
+            ResourceBlocker, or None if nothing is blocked for the site
+        """
+        setting = override if override is not None else (site_config or {}).get('resource_blocking')
+        if not setting:
+            return None
+        if isinstance(setting, Mapping):
+            names = setting.get('profile') or []
+            extra = setting.get('block') or []
+        else:
+            names, extra = setting, []
+        patterns = resolve_patterns(names, profiles) + list(extra)
+        if not patterns:
+            return None
+        label = names if isinstance(names, str) else '+'.join(names) or 'custom'
+        return cls(patterns, profile=label + ('+custom' if extra else ''))
+
+    @staticmethod
+    def _current_tab(driver):
+        try:
+            return driver.current_window_handle
+        except Exception:
+            return None
+
+    def is_enabled(self, driver):
+        """True if blocking is switched on for the driver (clearance obtained, no challenge since)"""
+        return driver is not None and driver is self._driver and self._enabled
+
+    def is_active(self, driver):
+        """True if the driver's current tab blocks the patterns"""
+        return driver is not None and driver is self._driver and self._current_tab(driver) in self._tabs
+
+    def _block(self, driver, urls):
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': urls})
+
+    def apply(self, driver):
+        """
+        Switch blocking on for a driver and block the patterns in its current tab
+
+        Returns:
+            bool: True if the current tab now blocks them
+        """
+        if driver is not self._driver:
+            self.reset()
+            self._driver = driver
+        if not self.is_active(driver):
+            try:
+                self._block(driver, self.patterns)
+            except Exception as e:
+                self.stats['errors'] += 1
+                self.logger.debug(f"Could not apply resource blocking: {str(e)}")
+                return False
+            self._tabs.add(self._current_tab(driver))
+        if not self._enabled:
+            self._enabled = True
+            self.stats['applied'] += 1
+        return True
+
+    def block_tab(self, driver):
+        """
+        Block the patterns in the driver's current tab too, if blocking is on
+        (used for prefetch tabs and for the tab a pipeline take() switched to)
+
+        Returns:
+            bool: True if the tab blocks them
+        """
+        if not self.is_enabled(driver):
+            return False
+        if self.is_active(driver):
+            return True
+        try:
+            self._block(driver, self.patterns)
+        except Exception as e:
+            self.stats['errors'] += 1
+            self.logger.debug(f"Could not apply resource blocking to tab: {str(e)}")
+            return False
+        self._tabs.add(self._current_tab(driver))
+        self.stats['tabs'] += 1
+        return True
+
+    def lift(self, driver):
+        """Stop blocking in the driver's current tab, and in new tabs (e.g. while a Cloudflare challenge is shown)"""
+        self._enabled = False
+        self._tabs.discard(self._current_tab(driver))
+        try:
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': []})
+            self.stats['lifted'] += 1
+        except Exception as e:
+            self.stats['errors'] += 1
+            self.logger.debug(f"Could not lift resource blocking: {str(e)}")
+
+    def reset(self):
+        """Forget the driver and its tabs (it was replaced; the new one starts unblocked)"""
+        self._driver = None
+        self._enabled = False
+        self._tabs.clear()
+
+    def summary(self):
+        """One-line blocking statistics"""
+        return (f"profile '{self.profile}' ({len(self.patterns)} patterns): applied {self.stats['applied']}x "
+                f"(+{self.stats['tabs']} tabs), lifted {self.stats['lifted']}x for challenges, {self.stats['errors']} CDP errors")
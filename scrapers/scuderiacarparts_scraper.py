@@ -1,10 +1,8 @@
 """Scraper for scuderiacarparts.com"""
 from scrapers.base_scraper import BaseScraper
-from bs4 import BeautifulSoup
 import json
 import re
 from datetime import datetime
-import time
 import traceback
 import random
 from selenium.webdriver.common.by import By
@@ -18,9 +16,10 @@ import os
 class ScuderiaCarPartsScraper(BaseScraper):
     """Scraper for scuderiacarparts.com"""
     
-    def __init__(self):
-        super().__init__('scuderiacarparts', use_selenium=True)
+    def __init__(self, clock=None):
+        super().__init__('scuderiacarparts', use_selenium=True, clock=clock)
         self.base_url = 'https://www.scuderiacarparts.com'
+        self.batch_output_dir = 'data/processed'  # Where the per-batch Excel files of the search walk go
         
     def get_product_urls(self):
         """
@@ -71,7 +70,7 @@ class ScuderiaCarPartsScraper(BaseScraper):
                 # Polite delay between products
                 if idx < len(urls):
                     delay = random.uniform(3, 5)
-                    time.sleep(delay)
+                    self.polite_sleep(delay)
             except Exception as e:
                 self.logger.error(f"❌ Error scraping {url}: {str(e)}")
                 continue
@@ -87,7 +86,7 @@ class ScuderiaCarPartsScraper(BaseScraper):
                 df = processor.clean_data(df)
                 
                 timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                output_dir = "data/processed"
+                output_dir = self.batch_output_dir
                 os.makedirs(output_dir, exist_ok=True)
                 output_file = f"{output_dir}/scuderiacarparts_load_{batch_number}_{timestamp}.xlsx"
                 
@@ -135,8 +134,8 @@ class ScuderiaCarPartsScraper(BaseScraper):
                     self.driver.set_page_load_timeout(90)
                     
                     self.logger.info(f"Attempting to load search page (attempt {retry_count + 1}/{max_retries})...")
-                    self.driver.get(search_url)
-                    time.sleep(3)  # Wait for initial page load
+                    self.driver_get(search_url)
+                    self.clock.sleep(3)  # Wait for initial page load
                     page_loaded = True
                     self.logger.info("✓ Search page loaded successfully")
                     
@@ -150,7 +149,7 @@ class ScuderiaCarPartsScraper(BaseScraper):
                         
                         # Try to get page source anyway - sometimes page loads partially
                         try:
-                            page_source = self.driver.page_source
+                            page_source = self.get_page_source()
                             if page_source and len(page_source) > 5000:
                                 self.logger.info("✓ Page partially loaded, continuing with available content...")
                                 page_loaded = True
@@ -161,12 +160,12 @@ class ScuderiaCarPartsScraper(BaseScraper):
                         if retry_count < max_retries:
                             wait_time = 5 + (retry_count * 2)  # Progressive wait: 5s, 7s, 9s
                             self.logger.info(f"Retrying in {wait_time} seconds...")
-                            time.sleep(wait_time)
+                            self.clock.sleep(wait_time)
                         else:
                             self.logger.error("❌ Failed to load search page after all retries")
                             # Try one last time to get page source even if timeout
                             try:
-                                page_source = self.driver.page_source
+                                page_source = self.get_page_source()
                                 if page_source and len(page_source) > 1000:
                                     self.logger.warning("⚠️ Using partial page content despite timeout...")
                                     page_loaded = True
@@ -178,7 +177,7 @@ class ScuderiaCarPartsScraper(BaseScraper):
                         if retry_count < max_retries:
                             wait_time = 3 + retry_count
                             self.logger.info(f"Retrying in {wait_time} seconds...")
-                            time.sleep(wait_time)
+                            self.clock.sleep(wait_time)
                         else:
                             self.logger.error("❌ Failed to load search page after all retries")
                 finally:
@@ -223,10 +222,10 @@ class ScuderiaCarPartsScraper(BaseScraper):
                 if not found:
                     self.logger.warning("Product containers not found with standard selectors, continuing anyway...")
                     # Wait a bit more for page to fully load
-                    time.sleep(3)
+                    self.clock.sleep(3)
             except Exception as e:
                 self.logger.warning(f"Error waiting for product containers: {str(e)}, continuing anyway...")
-                time.sleep(3)
+                self.clock.sleep(3)
             
             # Helper function to wait for loading overlay to disappear
             def wait_for_loading_overlay_to_disappear(timeout=10):
@@ -240,8 +239,8 @@ class ScuderiaCarPartsScraper(BaseScraper):
                         "div[style*='loading']",
                     ]
                     
-                    start_time = time.time()
-                    while time.time() - start_time < timeout:
+                    start_time = self.clock.time()
+                    while self.clock.time() - start_time < timeout:
                         overlay_found = False
                         for selector in overlay_selectors:
                             try:
@@ -267,7 +266,7 @@ class ScuderiaCarPartsScraper(BaseScraper):
                             # No visible overlay found
                             return True
                         
-                        time.sleep(0.3)  # Check every 300ms
+                        self.clock.sleep(0.3)  # Check every 300ms
                     
                     return False  # Timeout
                 except:
@@ -305,13 +304,13 @@ class ScuderiaCarPartsScraper(BaseScraper):
                         
                         # For Windows, we can't use signal, so we'll use a different approach
                         # Just try to get page_source with a warning if it takes too long
-                        start_time = time.time()
-                        html = self.driver.page_source
-                        elapsed = time.time() - start_time
+                        start_time = self.clock.time()
+                        html = self.get_page_source()
+                        elapsed = self.clock.time() - start_time
                         if elapsed > 5:
                             self.logger.warning(f"⚠️ Getting page_source took {elapsed:.1f}s - page may be very large")
                         
-                        soup = BeautifulSoup(html, 'lxml')
+                        soup = self.make_soup(html, 'lxml')
                         product_containers_bs = soup.find_all('div', class_=re.compile(r'searchresult', re.I))
                         if not product_containers_bs:
                             product_containers_bs = soup.find_all(['div', 'article', 'li'], class_=re.compile(r'product|item', re.I))
@@ -335,13 +334,13 @@ class ScuderiaCarPartsScraper(BaseScraper):
                 current_urls = []
                 try:
                     # Wait for loading overlay to disappear (with timeout)
-                    overlay_start = time.time()
+                    overlay_start = self.clock.time()
                     wait_for_loading_overlay_to_disappear(timeout=5)
-                    overlay_elapsed = time.time() - overlay_start
+                    overlay_elapsed = self.clock.time() - overlay_start
                     if overlay_elapsed > 3:
                         self.logger.debug(f"Waiting for overlay took {overlay_elapsed:.1f}s")
                     
-                    time.sleep(0.5)  # Brief wait for content to stabilize (reduced from 1s)
+                    self.clock.sleep(0.5)  # Brief wait for content to stabilize (reduced from 1s)
                     
                     # Find product containers using Selenium first
                     product_container_selectors = [
@@ -352,13 +351,13 @@ class ScuderiaCarPartsScraper(BaseScraper):
                     ]
                     
                     containers_found = False
-                    extraction_start = time.time()
+                    extraction_start = self.clock.time()
                     
                     for container_selector in product_container_selectors:
                         try:
-                            selector_start = time.time()
+                            selector_start = self.clock.time()
                             containers = self.driver.find_elements(By.CSS_SELECTOR, container_selector)
-                            selector_elapsed = time.time() - selector_start
+                            selector_elapsed = self.clock.time() - selector_start
                             
                             if containers and len(containers) > 0:
                                 containers_found = True
@@ -421,7 +420,7 @@ class ScuderiaCarPartsScraper(BaseScraper):
                                     try:
                                         # Log progress for large batches
                                         if num_to_process > 100 and (idx + 1) % batch_size == 0:
-                                            elapsed = time.time() - extraction_start
+                                            elapsed = self.clock.time() - extraction_start
                                             rate = (idx + 1) / elapsed if elapsed > 0 else 0
                                             remaining = (num_to_process - (idx + 1)) / rate if rate > 0 else 0
                                             self.logger.info(f"  Processing container {idx + 1}/{num_to_process} ({((idx + 1) / num_to_process * 100):.1f}%) - ETA: {remaining:.1f}s")
@@ -470,7 +469,7 @@ class ScuderiaCarPartsScraper(BaseScraper):
                                                 try:
                                                     container_html = container.get_attribute('outerHTML')
                                                     if container_html:
-                                                        container_soup = BeautifulSoup(container_html, 'lxml')
+                                                        container_soup = self.make_soup(container_html, 'lxml')
                                                         link = container_soup.find('a', href=True)
                                                         if link:
                                                             href = link.get('href', '')
@@ -572,7 +571,7 @@ class ScuderiaCarPartsScraper(BaseScraper):
                                             self.logger.debug(f"Traceback: {traceback.format_exc()}")
                                         continue
                                 
-                                extraction_elapsed = time.time() - extraction_start
+                                extraction_elapsed = self.clock.time() - extraction_start
                                 if extraction_elapsed > 5 or num_to_process > 0:
                                     self.logger.info(f"✓ Processed {num_to_process} containers in {extraction_elapsed:.1f}s, found {len(current_urls)} wheel product URLs")
                                 
@@ -588,13 +587,13 @@ class ScuderiaCarPartsScraper(BaseScraper):
                         self.logger.debug("Using BeautifulSoup fallback for URL extraction...")
                         try:
                             # Get page_source with timeout protection
-                            page_source_start = time.time()
-                            html = self.driver.page_source
-                            page_source_elapsed = time.time() - page_source_start
+                            page_source_start = self.clock.time()
+                            html = self.get_page_source()
+                            page_source_elapsed = self.clock.time() - page_source_start
                             if page_source_elapsed > 10:
                                 self.logger.warning(f"⚠️ Getting page_source took {page_source_elapsed:.1f}s - page is very large, consider stopping URL collection")
                             
-                            soup = BeautifulSoup(html, 'lxml')
+                            soup = self.make_soup(html, 'lxml')
                             product_containers_bs = soup.find_all('div', class_=re.compile(r'searchresult', re.I))
                             if not product_containers_bs:
                                 product_containers_bs = soup.find_all(['div', 'article', 'li'], class_=re.compile(r'product|item', re.I))
@@ -784,7 +783,7 @@ class ScuderiaCarPartsScraper(BaseScraper):
             self.logger.info("COUNTING CURRENT CONTAINERS (after 10 clicks)...")
             self.logger.info("="*70)
             wait_for_loading_overlay_to_disappear(timeout=5)
-            time.sleep(2)  # Wait for page to stabilize
+            self.clock.sleep(2)  # Wait for page to stabilize
             last_container_count = count_product_containers()
             self.logger.info(f"✓ Current container count (after 10 clicks): {last_container_count}")
             self.logger.info("="*70)
@@ -878,7 +877,7 @@ class ScuderiaCarPartsScraper(BaseScraper):
                             if load_more_button.is_displayed() and load_more_button.is_enabled():
                                 # Scroll to button to ensure it's in view
                                 self.driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", load_more_button)
-                                time.sleep(0.5)  # Wait for scroll
+                                self.clock.sleep(0.5)  # Wait for scroll
                                 
                                 # CRITICAL: Wait for loading overlay to disappear before clicking
                                 wait_for_loading_overlay_to_disappear(timeout=5)
@@ -896,7 +895,7 @@ class ScuderiaCarPartsScraper(BaseScraper):
                                         break
                                     
                                     # Wait for loading overlay to appear and then disappear (content is loading)
-                                    time.sleep(1)  # Brief wait for overlay to appear
+                                    self.clock.sleep(1)  # Brief wait for overlay to appear
                                     wait_for_loading_overlay_to_disappear(timeout=10)  # Wait for content to load
                                     
                                     # Wait for new product containers to appear in DOM
@@ -908,11 +907,11 @@ class ScuderiaCarPartsScraper(BaseScraper):
                                         pass  # Products might already be there
                                     
                                     # Additional wait for new products to fully render
-                                    time.sleep(2)
+                                    self.clock.sleep(2)
                                     
                                     # Scroll down a bit to trigger lazy loading if any
                                     self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                                    time.sleep(1)
+                                    self.clock.sleep(1)
                                 
                                 except Exception as click_error:
                                     error_str = str(click_error).lower()
@@ -929,9 +928,9 @@ class ScuderiaCarPartsScraper(BaseScraper):
                                             if clicks_this_batch >= max_clicks_this_batch:
                                                 self.logger.info(f"✓ Reached click limit for batch #{batch_number} ({max_clicks_this_batch} clicks), proceeding to extract new products...")
                                                 break
-                                            time.sleep(1)
+                                            self.clock.sleep(1)
                                             wait_for_loading_overlay_to_disappear(timeout=10)
-                                            time.sleep(2)
+                                            self.clock.sleep(2)
                                         except:
                                             # If still fails, try JavaScript click
                                             try:
@@ -942,9 +941,9 @@ class ScuderiaCarPartsScraper(BaseScraper):
                                                 if clicks_this_batch >= max_clicks_this_batch:
                                                     self.logger.info(f"✓ Reached click limit for batch #{batch_number} ({max_clicks_this_batch} clicks), proceeding to extract new products...")
                                                     break
-                                                time.sleep(1)
+                                                self.clock.sleep(1)
                                                 wait_for_loading_overlay_to_disappear(timeout=10)
-                                                time.sleep(2)
+                                                self.clock.sleep(2)
                                             except Exception as js_click_error:
                                                 self.logger.warning(f"JavaScript click also failed: {str(js_click_error)}")
                                                 consecutive_no_button += 1
@@ -962,9 +961,9 @@ class ScuderiaCarPartsScraper(BaseScraper):
                                             if clicks_this_batch >= max_clicks_this_batch:
                                                 self.logger.info(f"✓ Reached click limit for batch #{batch_number} ({max_clicks_this_batch} clicks), proceeding to extract new products...")
                                                 break
-                                            time.sleep(1)
+                                            self.clock.sleep(1)
                                             wait_for_loading_overlay_to_disappear(timeout=10)
-                                            time.sleep(2)
+                                            self.clock.sleep(2)
                                         except Exception as js_click_error:
                                             self.logger.warning(f"JavaScript click also failed: {str(js_click_error)}")
                                             consecutive_no_button += 1
@@ -985,20 +984,20 @@ class ScuderiaCarPartsScraper(BaseScraper):
                                 break
                             else:
                                 self.logger.debug(f"Button not found (attempt {consecutive_no_button}/{max_consecutive_no_button})")
-                                time.sleep(1)  # Brief wait before checking again
+                                self.clock.sleep(1)  # Brief wait before checking again
                     
                     except Exception as e:
                         self.logger.warning(f"Error while handling 'Load more results' button: {str(e)}")
                         consecutive_no_button += 1
                         if consecutive_no_button >= max_consecutive_no_button:
                             break
-                        time.sleep(1)
+                        self.clock.sleep(1)
                     
                 self.logger.info(f"✓ Finished clicking 'Load more results' button for batch #{batch_number} ({clicks_this_batch} clicks)")
                 
                 # Step 3: Wait for loading to complete and count new containers
                 wait_for_loading_overlay_to_disappear(timeout=5)
-                time.sleep(2)  # Brief wait for page to stabilize
+                self.clock.sleep(2)  # Brief wait for page to stabilize
                 
                 new_container_count = count_product_containers()
                 self.logger.info(f"Container count after batch #{batch_number}: {new_container_count} (was {last_container_count})")
@@ -1035,7 +1034,7 @@ class ScuderiaCarPartsScraper(BaseScraper):
                                 # Polite delay between products
                                 if idx < len(new_product_urls):
                                     delay = random.uniform(3, 5)
-                                    time.sleep(delay)
+                                    self.polite_sleep(delay)
                             except Exception as e:
                                 self.logger.error(f"❌ Error scraping {url}: {str(e)}")
                                 continue
@@ -1051,7 +1050,7 @@ class ScuderiaCarPartsScraper(BaseScraper):
                                 df = processor.clean_data(df)
                                 
                                 timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                                output_dir = "data/processed"
+                                output_dir = self.batch_output_dir
                                 os.makedirs(output_dir, exist_ok=True)
                                 output_file = f"{output_dir}/scuderiacarparts_batch_{batch_number}_products_{product_range_start}-{product_range_end}_{timestamp}.xlsx"
                                 
@@ -1173,7 +1172,7 @@ class ScuderiaCarPartsScraper(BaseScraper):
                         wait_time = recovery['wait_time']
                         delay = random.uniform(wait_time[0], wait_time[1])
                         self.logger.warning(f"Driver error, retrying in {delay:.1f}s...")
-                        time.sleep(delay)
+                        self.polite_sleep(delay, phase='retry_backoff')
                         retry_count += 1
                         continue
                     else:
@@ -1181,47 +1180,45 @@ class ScuderiaCarPartsScraper(BaseScraper):
                 
                 # Load the page with timeout protection
                 try:
-                    self.driver.get(url)
+                    self.driver_get(url)
                     
                     # Wait a bit before accessing page_source (more human-like)
-                    time.sleep(random.uniform(0.5, 1.5))  # Added delay to avoid immediate page_source access
+                    self.polite_sleep(0.5, 1.5)  # Added delay to avoid immediate page_source access
                     
-                    # Quick Cloudflare check - only if on challenge URL or page is very small
-                    current_url_check = self.driver.current_url.lower()
-                    page_preview = self.driver.page_source[:6000]
-                    
-                    if ('challenges.cloudflare.com' in current_url_check or '/cdn-cgi/challenge' in current_url_check or len(page_preview) < 5000) and self.has_cloudflare_challenge():
+                    # Quick Cloudflare check (one script call: challenge URL or small page with challenge markers)
+                    if self.has_cloudflare_challenge():
                         self.logger.info("🛡️ Cloudflare challenge detected - waiting for bypass...")
                         cloudflare_bypassed = self.wait_for_cloudflare(timeout=30, target_url=url, max_retries=1)
                         if not cloudflare_bypassed:
                             # Quick final check - if page has content, continue anyway
-                            if len(self.driver.page_source) > 5000 and 'challenges.cloudflare.com' not in self.driver.current_url.lower():
+                            snapshot = self.page_snapshot()
+                            if len(snapshot) > 5000 and 'challenges.cloudflare.com' not in snapshot.url.lower():
                                 self.logger.info("✓ Page accessible despite Cloudflare warning - continuing...")
                             else:
                                 retry_count += 1
                                 if retry_count < max_retries:
                                     wait_time = random.uniform(10, 15)
                                     self.logger.warning(f"Retrying page load in {wait_time:.1f}s...")
-                                    time.sleep(wait_time)
+                                    self.polite_sleep(wait_time, phase='retry_backoff')
                                     continue
                                 else:
                                     return None
-                        time.sleep(1)  # Brief wait after bypass
+                        self.clock.sleep(1)  # Brief wait after bypass
                     
-                    time.sleep(random.uniform(0.5, 1.0))  # Increased delay for more human-like timing
+                    self.polite_sleep(0.5, 1.0)  # Increased delay for more human-like timing
                     
                     # Simulate human behavior - scroll and wait (more realistic)
                     self.simulate_human_behavior()
-                    time.sleep(random.uniform(0.5, 1.0))  # Increased delay for more human-like timing
+                    self.polite_sleep(0.5, 1.0)  # Increased delay for more human-like timing
                     
                     # Wait for page to fully load - realistic timing
-                    time.sleep(random.uniform(1.5, 3.0))  # Increased to 1.5-3s for more human-like behavior
+                    self.polite_sleep(1.5, 3.0)  # Increased to 1.5-3s for more human-like behavior
                     
                     # Wait for product title to load using WebDriverWait - realistic timeout
                     # Add delay before accessing page_source (more human-like)
-                    time.sleep(random.uniform(0.5, 1.0))
-                    html = self.driver.page_source  # Get HTML once for multiple checks
-                    soup = BeautifulSoup(html, 'lxml')
+                    self.polite_sleep(0.5, 1.0)
+                    html = self.get_page_source()  # Get HTML once for multiple checks
+                    soup = self.make_soup(html, 'lxml')
                     
                     # Try multiple selectors for title extraction
                     title_text = ''
@@ -1283,7 +1280,7 @@ class ScuderiaCarPartsScraper(BaseScraper):
                         retry_count += 1
                         if retry_count < max_retries:
                             wait_time = random.uniform(10, 15)
-                            time.sleep(wait_time)
+                            self.polite_sleep(wait_time, phase='retry_backoff')
                             continue
                         else:
                             return None
@@ -1362,12 +1359,12 @@ class ScuderiaCarPartsScraper(BaseScraper):
                                 wait_time = random.uniform(10, 15)
                                 self.logger.info(f"Waiting {wait_time:.1f} seconds before retry...")
                             
-                            time.sleep(wait_time)
+                            self.polite_sleep(wait_time, phase='retry_backoff')
                             
                             # If blocked multiple times, add extra human-like behavior
                             if error_type == "blocked" and retry_count >= 2:
                                 self.logger.info("Simulating extended human behavior after blocking...")
-                                time.sleep(random.uniform(10, 20))  # Increased for anti-blocking
+                                self.polite_sleep(10, 20, phase='retry_backoff')  # Increased for anti-blocking
                                 self.simulate_human_behavior()
                             
                             continue
@@ -1376,7 +1373,7 @@ class ScuderiaCarPartsScraper(BaseScraper):
                             return None
                     
                     # Success! Got real product page
-                    html = self.driver.page_source
+                    html = self.get_page_source()
                     self.logger.info(f"✓ Page loaded successfully, title: {title_text[:50]}")
                     break
                     
@@ -1396,7 +1393,7 @@ class ScuderiaCarPartsScraper(BaseScraper):
                         content_ready = False
                         
                         while waited < wait_for_content:
-                            html = self.driver.page_source
+                            html = self.get_page_source()
                             current_url = self.driver.current_url.lower()
                             
                             # Check if we got an error page
@@ -1406,7 +1403,7 @@ class ScuderiaCarPartsScraper(BaseScraper):
                             # Require substantial content (not just partial) - reduced threshold
                             if html and len(html) > 8000:  # Reduced from 10KB to 8KB for faster detection
                                 # Check for key product elements to ensure content is complete
-                                soup = BeautifulSoup(html, 'lxml')
+                                soup = self.make_soup(html, 'lxml')
                                 has_title = soup.find('h1', class_='product-title') or soup.find('h1')
                                 has_body = soup.find('body')
                                 body_text = has_body.get_text(strip=True) if has_body else ''
@@ -1420,7 +1417,7 @@ class ScuderiaCarPartsScraper(BaseScraper):
                             if waited % 2 == 0:  # Log every 2s instead of 3s
                                 self.logger.info(f"Waiting for full content... ({waited}s/{wait_for_content}s)")
                             
-                            time.sleep(0.5)  # Check every 0.5s instead of 1s for faster response
+                            self.clock.sleep(0.5)  # Check every 0.5s instead of 1s for faster response
                             waited += 0.5
                         
                         if not content_ready:
@@ -1435,7 +1432,7 @@ class ScuderiaCarPartsScraper(BaseScraper):
                         if retry_count < max_retries:
                             wait_time = random.uniform(5, 8)
                             self.logger.info(f"Retrying in {wait_time:.1f} seconds...")
-                            time.sleep(wait_time)
+                            self.polite_sleep(wait_time, phase='retry_backoff')
                             continue
                         else:
                             self.logger.error(f"❌ Failed after {max_retries} timeout attempts")
@@ -1453,7 +1450,7 @@ class ScuderiaCarPartsScraper(BaseScraper):
                         if retry_count < max_retries:
                             wait_time = random.uniform(5, 8)  # Optimized: reduced from 12-18s
                             self.logger.info(f"Waiting {wait_time:.1f} seconds before retry...")
-                            time.sleep(wait_time)
+                            self.polite_sleep(wait_time, phase='retry_backoff')
                             continue
                         else:
                             self.logger.error(f"❌ Failed after {max_retries} attempts - connection error")
@@ -1470,7 +1467,7 @@ class ScuderiaCarPartsScraper(BaseScraper):
                     wait_time = recovery['wait_time']
                     delay = random.uniform(wait_time[0], wait_time[1])
                     self.logger.warning(f"Timeout error, retrying in {delay:.1f}s...")
-                    time.sleep(delay)
+                    self.polite_sleep(delay, phase='retry_backoff')
                     retry_count += 1
                     continue
                 else:
@@ -1501,7 +1498,7 @@ class ScuderiaCarPartsScraper(BaseScraper):
                     delay = random.uniform(wait_time[0], wait_time[1])
                     error_msg = recovery.get('message', recovery.get('reason', 'Unknown error'))
                     self.logger.warning(f"{error_msg}, retrying in {delay:.1f}s...")
-                    time.sleep(delay)
+                    self.polite_sleep(delay, phase='retry_backoff')
                     retry_count += 1
                     continue
                 else:
@@ -1512,7 +1509,7 @@ class ScuderiaCarPartsScraper(BaseScraper):
         if not html:
             return None
         
-        soup = BeautifulSoup(html, 'lxml')
+        soup = self.make_soup(html, 'lxml')
         
         # Initialize product data structure
         product_data = {
@@ -1596,7 +1593,7 @@ class ScuderiaCarPartsScraper(BaseScraper):
                     html_lower = html.lower()
                     page_is_small = len(html) < 8000
                     # Check for product elements
-                    soup_check = BeautifulSoup(html, 'lxml')
+                    soup_check = self.make_soup(html, 'lxml')
                     has_product_elements = any([
                         soup_check.find('span', class_=re.compile(r'sku|part.*number', re.I)),
                         soup_check.find('div', class_=re.compile(r'product.*price|price.*product', re.I)),
@@ -1907,7 +1904,7 @@ class ScuderiaCarPartsScraper(BaseScraper):
                         if tab_element and tab_element.is_displayed():
                             # Scroll to tab
                             self.driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", tab_element)
-                            time.sleep(0.5)
+                            self.clock.sleep(0.5)
                             
                             # Click the tab
                             try:
@@ -1917,7 +1914,7 @@ class ScuderiaCarPartsScraper(BaseScraper):
                             
                             spec_tab_clicked = True
                             self.logger.info("✓ Clicked 'Specifications' tab")
-                            time.sleep(2)  # Wait for tab content to load
+                            self.clock.sleep(2)  # Wait for tab content to load
                             break
                     except NoSuchElementException:
                         continue
@@ -1927,8 +1924,8 @@ class ScuderiaCarPartsScraper(BaseScraper):
                 
                 if spec_tab_clicked:
                     # Get updated HTML after clicking Specifications tab
-                    html = self.driver.page_source
-                    soup = BeautifulSoup(html, 'lxml')
+                    html = self.get_page_source()
+                    soup = self.make_soup(html, 'lxml')
                     
                     # Extract description from Specifications tab
                     # Based on user's HTML structure: description is in p > strong.custom-blacktext followed by text
@@ -2139,7 +2136,7 @@ class ScuderiaCarPartsScraper(BaseScraper):
                         
                         if tab_element and tab_element.is_displayed():
                             self.driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", tab_element)
-                            time.sleep(0.5)
+                            self.clock.sleep(0.5)
                             
                             try:
                                 tab_element.click()
@@ -2148,7 +2145,7 @@ class ScuderiaCarPartsScraper(BaseScraper):
                             
                             fitment_tab_clicked = True
                             self.logger.info("✓ Clicked 'Fitment Details' tab")
-                            time.sleep(2)  # Wait for tab content to load
+                            self.clock.sleep(2)  # Wait for tab content to load
                             break
                     except NoSuchElementException:
                         continue
@@ -2158,8 +2155,8 @@ class ScuderiaCarPartsScraper(BaseScraper):
                 
                 if fitment_tab_clicked:
                     # Get updated HTML after clicking Fitment Details tab
-                    html = self.driver.page_source
-                    soup = BeautifulSoup(html, 'lxml')
+                    html = self.get_page_source()
+                    soup = self.make_soup(html, 'lxml')
                     
                     # Based on user's HTML structure: fitments are in div#fitment tab's table
                     # Format: "Range Rover Evoque (2012-2018) [2.0 Turbo Diesel]"
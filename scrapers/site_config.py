@@ -0,0 +1,332 @@
+"""
+Process-wide, validated, immutable site configuration
+
+config/sites_config.json used to be opened and parsed by every consumer:
+the registry, main.py, and every BaseScraperWithExtension construction. Each
+construction also re-checked the extension manifests and listed the
+extensions/ directory. get_config() loads the file once per process and
+validates it. Each site becomes a read-only SiteConfig whose extension paths
+are resolved (and missing ones warned about) the first time a scraper asks for
+them, so only sites that actually start an extension scraper check their
+directories. The file is reloaded only when its mtime changes (one
+os.stat per lookup), so a long-running orchestrator still picks up edits.
+
+    config = get_config()
+    site = config.site('honda')          # SiteConfig (read-only Mapping) or None
+    site.get('base_url')
+    config.extension_paths('audiusa')    # tuple of extension directories to load
+    config.section('resource_blocking_profiles')
+"""
+import json
+import logging
+import os
+import threading
+from collections.abc import Mapping
+from types import MappingProxyType
+
+CONFIG_FILE = 'config/sites_config.json'
+EXTENSIONS_DIR = 'extensions'
+EXTENSION_ENV_VAR = 'CHROME_EXTENSION_PATH'
+
+# Optional per-site tuning fields and the types they accept
+TUNING_FIELDS = {
+    'use_selenium': (bool,),
+    'tab_depth': (int,),
+    'driver_recycle': (Mapping,),
+    'resource_blocking': (str, list, Mapping),
+}
+
+logger = logging.getLogger('site_config')
+_reported_extension_paths = set()  # Invalid extension paths already warned about in this process
+
+
+class ConfigError(ValueError):
+    """The config file is readable but invalid"""
+
+
+def freeze(value):
+    """Return a read-only copy (dicts -> mappingproxy, lists -> tuples)"""
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def thaw(value):
+    """Return a plain, mutable (and JSON-serializable) copy of a frozen value"""
+    if isinstance(value, Mapping):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(item) for item in value]
+    return value
+
+
+def resolve_extension_paths(entries, base_dir=None, source='config'):
+    """
+    Resolve extension directories and keep the ones containing a manifest.json
+
+    Args:
+        entries: Paths (relative paths are resolved against base_dir)
+        base_dir: Base directory (default: current directory)
+        source: Where the paths came from (for warnings; each invalid path is warned about once per process)
+
+    Returns:
+        list: Absolute paths of valid unpacked extensions
+    """
+    base_dir = base_dir or os.getcwd()
+    extension_paths = []
+    for ext_path in entries:
+        if not os.path.isabs(ext_path):
+            ext_path = os.path.join(base_dir, ext_path)
+        if not os.path.exists(ext_path):
+            _report_extension_path(ext_path, f"Extension path from {source} not found: {ext_path}")
+        elif not os.path.exists(os.path.join(ext_path, 'manifest.json')):
+            _report_extension_path(ext_path, f"Extension path does not contain manifest.json: {ext_path}")
+        else:
+            extension_paths.append(ext_path)
+    return extension_paths
+
+
+def _report_extension_path(ext_path, message):
+    """Warn about an invalid extension path the first time it is seen, debug-log it after that"""
+    if ext_path in _reported_extension_paths:
+        logger.debug(message)
+    else:
+        _reported_extension_paths.add(ext_path)
+        logger.warning(message)
+
+
+def default_extension_paths(base_dir=None):
+    """
+    Extensions for sites without (valid) configured ones: CHROME_EXTENSION_PATH
+    (comma-separated), else every folder in extensions/ with a manifest.json
+    """
+    base_dir = base_dir or os.getcwd()
+    env_path = os.getenv(EXTENSION_ENV_VAR)
+    if env_path:
+        extension_paths = resolve_extension_paths([p.strip() for p in env_path.split(',') if p.strip()],
+                                                  base_dir, source='environment variable')
+        if extension_paths:
+            return extension_paths
+
+    extensions_dir = os.path.join(base_dir, EXTENSIONS_DIR)
+    if not os.path.isdir(extensions_dir):
+        return []
+    extension_paths = []
+    for item in sorted(os.listdir(extensions_dir)):
+        ext_path = os.path.join(extensions_dir, item)
+        if os.path.isdir(ext_path) and os.path.exists(os.path.join(ext_path, 'manifest.json')):
+            extension_paths.append(ext_path)
+    return extension_paths
+
+
+def validate(document):
+    """
+    Check a parsed config document
+
+    Returns:
+        list: Problem descriptions (empty if valid)
+    """
+    if not isinstance(document, Mapping) or not isinstance(document.get('sites'), list):
+        return ['top level must be an object with a "sites" list']
+
+    from scrapers.recycle_policy import DEFAULT_RECYCLE_POLICY
+    from scrapers.resource_blocking import DEFAULT_BLOCKING_PROFILES, PROFILES_SECTION, resolve_patterns
+
+    profiles = dict(DEFAULT_BLOCKING_PROFILES)
+    profiles.update(document.get(PROFILES_SECTION) or {})
+    problems = []
+    seen = set()
+    for index, site in enumerate(document['sites']):
+        if not isinstance(site, Mapping):
+            problems.append(f"sites[{index}] is not an object")
+            continue
+        name = site.get('name')
+        label = f"site '{name}'" if name else f"sites[{index}]"
+        if not isinstance(name, str) or not name:
+            problems.append(f"{label}: missing name")
+        elif name in seen:
+            problems.append(f"{label}: duplicate name")
+        seen.add(name)
+
+        scraper = site.get('scraper')
+        if scraper is not None and (not isinstance(scraper, str) or ':' not in scraper):
+            problems.append(f"{label}: scraper must be 'module:Class'")
+        extensions = site.get('extension_path') or site.get('extension_paths')
+        if extensions is not None and not isinstance(extensions, str) and \
+                not (isinstance(extensions, list) and all(isinstance(p, str) for p in extensions)):
+            problems.append(f"{label}: extension_path(s) must be a path or a list of paths")
+
+        for field, types in TUNING_FIELDS.items():
+            value = site.get(field)
+            if value is None:
+                continue
+            if not isinstance(value, types) or (field == 'tab_depth' and (isinstance(value, bool) or value < 0)):
+                problems.append(f"{label}: invalid {field}: {value!r}")
+            elif field == 'driver_recycle':
+                unknown = set(value) - set(DEFAULT_RECYCLE_POLICY)
+                if unknown:
+                    problems.append(f"{label}: unknown driver_recycle keys: {', '.join(sorted(unknown))}")
+            elif field == 'resource_blocking':
+                try:
+                    resolve_patterns(value.get('profile') if isinstance(value, Mapping) else value, profiles)
+                except (ValueError, TypeError) as e:
+                    problems.append(f"{label}: {str(e)}")
+    return problems
+
+
+class SiteConfig(Mapping):
+    """
+    One site's sites_config.json entry: a read-only Mapping (so existing
+    site_config.get(...) callers work unchanged) plus the extension
+    directories configured for it, resolved on first use
+    """
+
+    __slots__ = ('_data', '_base_dir', '_extension_paths')
+
+    def __init__(self, data, base_dir=None):
+        self._data = freeze(data)
+        self._base_dir = base_dir
+        self._extension_paths = None
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __repr__(self):
+        return f"SiteConfig({dict(self._data)!r})"
+
+    @property
+    def name(self):
+        return self._data.get('name')
+
+    @property
+    def extension_paths(self):
+        """Valid extension directories from the site's extension_path(s) (empty if none), checked once"""
+        if self._extension_paths is None:
+            entries = self._data.get('extension_path') or self._data.get('extension_paths')
+            if not entries:
+                self._extension_paths = ()
+            else:
+                self._extension_paths = tuple(resolve_extension_paths(
+                    [entries] if isinstance(entries, str) else entries, self._base_dir))
+        return self._extension_paths
+
+    def to_dict(self):
+        """Plain mutable copy"""
+        return thaw(self._data)
+
+
+class SitesConfig:
+    """One loaded, validated version of the config file"""
+
+    def __init__(self, path, document, mtime=None, base_dir=None):
+        """
+        Args:
+            path: Config file path
+            document: Parsed JSON document (validated here)
+            mtime: File mtime it was read at
+            base_dir: Directory relative extension paths are resolved against (default: cwd)
+
+        Raises:
+            ConfigError: If the document is invalid
+        """
+        problems = validate(document)
+        if problems:
+            raise ConfigError(f"Invalid {path}: " + '; '.join(problems))
+        self.path = path
+        self.mtime = mtime
+        self.base_dir = base_dir or os.getcwd()
+        self.sites = tuple(SiteConfig(site, self.base_dir) for site in document['sites'])
+        self._by_name = {site.name: site for site in self.sites}
+        self._sections = freeze({key: value for key, value in document.items() if key != 'sites'})
+        self._default_extensions = None
+
+    def site(self, site_name):
+        """Return a site's SiteConfig, or None if it isn't configured"""
+        return self._by_name.get(site_name)
+
+    def section(self, key, default=None):
+        """Return a (read-only) top-level section other than "sites" """
+        return self._sections.get(key, default)
+
+    def extension_paths(self, site_name):
+        """
+        Extension directories for a site: its configured ones, else the defaults
+        (CHROME_EXTENSION_PATH, else everything in extensions/), discovered once per load
+        """
+        site = self.site(site_name)
+        if site is not None and site.extension_paths:
+            return site.extension_paths
+        if self._default_extensions is None:
+            self._default_extensions = tuple(default_extension_paths(self.base_dir))
+        return self._default_extensions
+
+
+class ConfigStore:
+    """
+    Loaded config files by path, reloaded when the file's mtime changes.
+    If an edit breaks a file that loaded fine before, the last good version
+    keeps being served (the error is logged once per mtime).
+    """
+
+    def __init__(self):
+        self._configs = {}
+        self._failed_mtimes = {}
+        self._lock = threading.Lock()
+
+    def get(self, config_file=CONFIG_FILE):
+        """
+        Return the current SitesConfig for a file
+
+        Raises:
+            OSError: If the file can't be read
+            ValueError: If it isn't valid JSON (json.JSONDecodeError) or fails validation (ConfigError)
+        """
+        mtime = os.path.getmtime(config_file)
+        with self._lock:
+            config = self._configs.get(config_file)
+            if config is None or (config.mtime != mtime and self._failed_mtimes.get(config_file) != mtime):
+                try:
+                    with open(config_file, 'r', encoding='utf-8') as f:
+                        document = json.load(f)
+                    loaded = SitesConfig(config_file, document, mtime)
+                except (OSError, ValueError) as e:
+                    if config is None:
+                        raise
+                    self._failed_mtimes[config_file] = mtime
+                    logger.error(f"Keeping the previous site configuration, {config_file} failed to reload: {str(e)}")
+                    return config
+                if config is not None:
+                    logger.info(f"{config_file} changed, reloaded site configuration")
+                self._configs[config_file] = config = loaded
+            return config
+
+    def invalidate(self, config_file=None):
+        """Drop cached configs (all, or one file) so the next get() reloads"""
+        with self._lock:
+            if config_file is None:
+                self._configs.clear()
+                self._failed_mtimes.clear()
+            else:
+                self._configs.pop(config_file, None)
+                self._failed_mtimes.pop(config_file, None)
+
+
+_store = ConfigStore()
+
+
+def get_config(config_file=CONFIG_FILE):
+    """Return the process-wide SitesConfig for a config file (see ConfigStore.get)"""
+    return _store.get(config_file)
+
+
+def invalidate_config(config_file=None):
+    """Force the next get_config() to reload"""
+    _store.invalidate(config_file)
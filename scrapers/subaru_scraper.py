@@ -1,10 +1,8 @@
 """Scraper for parts.subaru.com (Subaru parts)"""
 from scrapers.base_scraper_with_extension import BaseScraperWithExtension
-from bs4 import BeautifulSoup
 import json
 import re
 from datetime import datetime
-import time
 import traceback
 import random
 from selenium.webdriver.common.by import By
@@ -15,8 +13,8 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException
 class SubaruScraper(BaseScraperWithExtension):
     """Scraper for parts.subaru.com"""
     
-    def __init__(self):
-        super().__init__('subaru', use_selenium=True)
+    def __init__(self, clock=None):
+        super().__init__('subaru', use_selenium=True, clock=clock)
         self.base_url = 'https://parts.subaru.com'
         
     def get_product_urls(self):
@@ -47,7 +45,6 @@ class SubaruScraper(BaseScraperWithExtension):
             
         except Exception as e:
             self.logger.error(f"Error getting product URLs: {str(e)}")
-            import traceback
             self.logger.debug(f"Traceback: {traceback.format_exc()}")
         
         return product_urls
@@ -68,8 +65,8 @@ class SubaruScraper(BaseScraperWithExtension):
             try:
                 self.page_load_timeout = 60
                 self.driver.set_page_load_timeout(60)
-                self.driver.get(search_url)
-                time.sleep(3)
+                self.driver_get(search_url)
+                self.clock.sleep(3)
             except Exception as e:
                 self.logger.error(f"Error loading search page: {str(e)}")
                 return product_urls
@@ -93,7 +90,7 @@ class SubaruScraper(BaseScraperWithExtension):
             self._scroll_to_load_content()
             
             # Wait a bit more for any dynamic content
-            time.sleep(3)
+            self.clock.sleep(3)
             
             # Try to find product links using Selenium first (more reliable for dynamic content)
             try:
@@ -125,8 +122,8 @@ class SubaruScraper(BaseScraperWithExtension):
                 self.logger.debug(f"Error finding links via Selenium: {str(e)}")
             
             # Also try BeautifulSoup parsing as fallback
-            html = self.driver.page_source
-            soup = BeautifulSoup(html, 'lxml')
+            html = self.get_page_source()
+            soup = self.make_soup(html, 'lxml')
             
             # Try multiple patterns to find product links (SimplePart platform)
             # Pattern 1: /p/Subaru__/Product-Name/ID/PartNumber.html
@@ -215,7 +212,6 @@ class SubaruScraper(BaseScraperWithExtension):
             
         except Exception as e:
             self.logger.error(f"Error searching for wheels: {str(e)}")
-            import traceback
             self.logger.debug(f"Traceback: {traceback.format_exc()}")
         
         return product_urls
@@ -342,7 +338,7 @@ class SubaruScraper(BaseScraperWithExtension):
             while scroll_attempts < max_scrolls:
                 try:
                     self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                    time.sleep(1.5)
+                    self.clock.sleep(1.5)
                     new_height = self.driver.execute_script("return document.body.scrollHeight")
                     if new_height == last_height:
                         no_change_count += 1
@@ -368,7 +364,7 @@ class SubaruScraper(BaseScraperWithExtension):
                 stable_count = 0
                 last_html = element.get_attribute('outerHTML')
                 for _ in range(10):  # Check for up to 1 second
-                    time.sleep(0.1)
+                    self.clock.sleep(0.1)
                     current_html = element.get_attribute('outerHTML')
                     if current_html == last_html:
                         stable_count += 1
@@ -379,7 +375,7 @@ class SubaruScraper(BaseScraperWithExtension):
                         last_html = current_html
             
             # Additional wait for any JavaScript to finish
-            time.sleep(0.5)
+            self.clock.sleep(0.5)
             return element
         except TimeoutException:
             return None
@@ -411,7 +407,7 @@ class SubaruScraper(BaseScraperWithExtension):
                 # Step 2: Wait for loading indicators to disappear
                 self.logger.debug("Waiting for loading indicators to disappear...")
                 for _ in range(20):  # Wait up to 4 seconds for loading to complete
-                    time.sleep(0.2)
+                    self.clock.sleep(0.2)
                     try:
                         loading_indicators = self.driver.find_elements(By.CSS_SELECTOR, 
                             'div.loading, div.spinner, div[class*="loading"], div[class*="spinner"], '
@@ -429,7 +425,7 @@ class SubaruScraper(BaseScraperWithExtension):
                 last_content_length = 0
                 
                 for check_round in range(15):  # Check for up to 3 seconds
-                    time.sleep(0.2)
+                    self.clock.sleep(0.2)
                     try:
                         current_inner_html = element.get_attribute('innerHTML') or ''
                         current_length = len(current_inner_html.strip())
@@ -498,7 +494,7 @@ class SubaruScraper(BaseScraperWithExtension):
                     pass
                 
                 # Step 6: Final wait for any remaining async operations
-                time.sleep(1)
+                self.clock.sleep(1)
                 
                 # Step 7: Final verification
                 final_inner_html = element.get_attribute('innerHTML') or ''
@@ -537,7 +533,7 @@ class SubaruScraper(BaseScraperWithExtension):
         for attempt in range(max_attempts):
             try:
                 if attempt > 0:
-                    time.sleep(wait_between_attempts)
+                    self.clock.sleep(wait_between_attempts)
                 
                 try:
                     show_more_exists = self.driver.execute_script("""
@@ -572,12 +568,12 @@ class SubaruScraper(BaseScraperWithExtension):
                                     continue
                                 
                                 self.driver.execute_script("arguments[0].scrollIntoView({block: 'center', behavior: 'smooth'});", element)
-                                time.sleep(0.5)
+                                self.clock.sleep(0.5)
                                 
                                 element = wait.until(EC.element_to_be_clickable((selector_type, selector_value)))
                                 element.click()
                                 self.logger.info(f"✓ Clicked 'Show More' button (attempt {attempt + 1})")
-                                time.sleep(1)
+                                self.clock.sleep(1)
                                 return True
                             except Exception as e:
                                 continue
@@ -610,7 +606,7 @@ class SubaruScraper(BaseScraperWithExtension):
         for check_round in range(5):
             try:
                 if check_round > 0:
-                    time.sleep(2)
+                    self.clock.sleep(2)
                 
                 for selector in selectors:
                     try:
@@ -630,7 +626,7 @@ class SubaruScraper(BaseScraperWithExtension):
                             
                             if valid_count > 0:
                                 self.logger.info(f"✓ Fitment data loaded: found {len(elements)} elements ({valid_count} with content) via {selector}")
-                                time.sleep(2)
+                                self.clock.sleep(2)
                                 return True
                     except Exception as e:
                         continue
@@ -654,7 +650,7 @@ class SubaruScraper(BaseScraperWithExtension):
                     
                     if row_count >= min_rows:
                         self.logger.info(f"✓ Fitment data loaded: found {row_count} rows via JavaScript")
-                        time.sleep(2)
+                        self.clock.sleep(2)
                         return True
                 except:
                     pass
@@ -686,7 +682,7 @@ class SubaruScraper(BaseScraperWithExtension):
                     if recovery['should_retry'] and retry_count < max_retries - 1:
                         wait_time = recovery['wait_time']
                         delay = random.uniform(wait_time[0], wait_time[1])
-                        time.sleep(delay)
+                        self.polite_sleep(delay, phase='retry_backoff')
                         retry_count += 1
                         continue
                     else:
@@ -695,22 +691,22 @@ class SubaruScraper(BaseScraperWithExtension):
                 try:
                     self.page_load_timeout = 60
                     self.driver.set_page_load_timeout(60)
-                    self.driver.get(url)
-                    time.sleep(random.uniform(0.5, 1.5))
+                    self.driver_get(url)
+                    self.polite_sleep(0.5, 1.5)
                     
                     if self.has_cloudflare_challenge():
                         cloudflare_bypassed = self.wait_for_cloudflare(timeout=30, target_url=url, max_retries=1)
                         if not cloudflare_bypassed:
                             retry_count += 1
                             if retry_count < max_retries:
-                                time.sleep(random.uniform(10, 15))
+                                self.polite_sleep(10, 15, phase='retry_backoff')
                                 continue
                             else:
                                 return None
                     
-                    time.sleep(random.uniform(1.5, 3.0))
-                    html = self.driver.page_source
-                    soup = BeautifulSoup(html, 'lxml')
+                    self.polite_sleep(1.5, 3.0)
+                    html = self.get_page_source()
+                    soup = self.make_soup(html, 'lxml')
                     
                     title_text = ''
                     title_elem = soup.find('h1')
@@ -727,7 +723,7 @@ class SubaruScraper(BaseScraperWithExtension):
                     if not title_text or len(title_text) < 3:
                         retry_count += 1
                         if retry_count < max_retries:
-                            time.sleep(random.uniform(10, 15))
+                            self.polite_sleep(10, 15, phase='retry_backoff')
                             continue
                         else:
                             return None
@@ -741,7 +737,7 @@ class SubaruScraper(BaseScraperWithExtension):
                     self.driver.set_page_load_timeout(original_timeout)
                     retry_count += 1
                     if retry_count < max_retries:
-                        time.sleep(random.uniform(5, 8))
+                        self.polite_sleep(5, 8, phase='retry_backoff')
                         continue
                     else:
                         return None
@@ -752,7 +748,7 @@ class SubaruScraper(BaseScraperWithExtension):
                     if any(err in error_str for err in ['connection', 'network', 'dns', 'err_', 'timeout']):
                         retry_count += 1
                         if retry_count < max_retries:
-                            time.sleep(random.uniform(5, 8))
+                            self.polite_sleep(5, 8, phase='retry_backoff')
                             continue
                         else:
                             return None
@@ -771,7 +767,7 @@ class SubaruScraper(BaseScraperWithExtension):
                 if retry_count < max_retries - 1:
                     wait_time = recovery['wait_time']
                     delay = random.uniform(wait_time[0], wait_time[1])
-                    time.sleep(delay)
+                    self.polite_sleep(delay, phase='retry_backoff')
                     retry_count += 1
                     continue
                 else:
@@ -780,7 +776,7 @@ class SubaruScraper(BaseScraperWithExtension):
         if not html:
             return None
         
-        soup = BeautifulSoup(html, 'lxml')
+        soup = self.make_soup(html, 'lxml')
         
         product_data = {
             'url': url,
@@ -1039,7 +1035,7 @@ class SubaruScraper(BaseScraperWithExtension):
                         try:
                             tab_element = wait.until(EC.element_to_be_clickable((selector_type, selector_value)))
                             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", tab_element)
-                            time.sleep(0.5)
+                            self.clock.sleep(0.5)
                             tab_element.click()
                             tab_clicked = True
                             self.logger.info("✓ Clicked 'What This Fits' tab")
@@ -1070,19 +1066,19 @@ class SubaruScraper(BaseScraperWithExtension):
                         if not fitment_loaded:
                             # Try one more time after additional wait
                             self.logger.info("🔍 Retrying fitment data load check after additional wait...")
-                            time.sleep(5)
+                            self.clock.sleep(5)
                             fitment_loaded = self._wait_for_fitment_data_loaded(timeout=20, min_rows=1)
                         
                         # Additional wait to ensure everything is stable
-                        time.sleep(1)
+                        self.clock.sleep(1)
                         
                         # Step 5: Extract fitment data from fully loaded page
                         self.logger.info("🔍 Step 5: Extracting fitment data...")
                         
                         try:
                             # Get updated HTML after all interactions
-                            html = self.driver.page_source
-                            soup = BeautifulSoup(html, 'lxml')
+                            html = self.get_page_source()
+                            soup = self.make_soup(html, 'lxml')
                             
                             # Find all fitment rows using Selenium (more reliable for dynamic content)
                             fitment_row_elements = []
@@ -1137,7 +1133,7 @@ class SubaruScraper(BaseScraperWithExtension):
                         if not row_html:
                             continue
                         
-                        row_soup = BeautifulSoup(row_html, 'lxml')
+                        row_soup = self.make_soup(row_html, 'lxml')
                         
                         # Handle table structure
                         if row_soup.name == 'tr' or row_soup.find('tr'):
@@ -0,0 +1,229 @@
+"""
+Multi-tab pipelining within one Chrome instance
+
+Each scraper drives one tab and every driver.get() waits for the page to
+load. With a TabPipeline the caller queues the upcoming product URLs, and up
+to `depth` background tabs start loading them while the current page is being
+parsed and clicked through. When the scraper later navigates to a queued URL,
+driver_get() switches to its tab (usually already loaded) instead of loading
+the page again. Extra tabs cost a renderer each, far less than the extra Chrome
+processes of a browser pool.
+
+Prefetch tabs are opened with CDP Target.createTarget (in the background) and
+navigated with a script, so opening one never blocks. Every tab start takes a
+slot from the per-host rate limiter, so pipelining never raises the request
+rate on a site. That also bounds how far ahead the tabs get: a tab can only be
+opened once the host's next slot is due, which is never right after a page
+load took one. The scraper refills between products (refill_tab_pipeline waits
+for the slot), so with a host interval the pipeline keeps about one page ahead
+in steady state, and `depth` only fills up when parsing takes longer than the
+interval.
+"""
+import logging
+from collections import OrderedDict, deque
+
+from scrapers.clock import get_clock
+
+# A new tab reports 'complete' for about:blank until its navigation commits
+READY_STATE_SCRIPT = "return location.href === 'about:blank' ? 'pending' : document.readyState;"
+NAVIGATE_SCRIPT = 'window.location.href = arguments[0];'
+# Navigation start to load event end of the current page, in seconds (null before the load event)
+LOAD_TIME_SCRIPT = ("const nav = performance.getEntriesByType('navigation')[0];"
+                    "return nav && nav.loadEventEnd > 0 ? nav.loadEventEnd / 1000 : null;")
+
+
+class TabPipeline:
+    """
+    Background tabs preloading the next queued URLs on one driver.
+
+    extend() queues URLs in the order they will be scraped; fill() tops the
+    open prefetch tabs up to `depth`; take() makes a URL's tab the driver's
+    current tab. Tabs passed over (their URL was never requested) are closed
+    by the next take().
+    """
+
+    def __init__(self, depth=2, rate_limiter=None, prepare_tab=None, clock=None, load_timeout=60):
+        """
+        Args:
+            depth: Prefetch tabs kept open besides the current one
+            rate_limiter: Optional HostRateLimiter every tab start must get a slot from
+            prepare_tab: Optional callable(driver) run in a new tab before it navigates
+                         (anti-detection scripts, resource blocking)
+            clock: Clock used for the load wait (default: process-wide clock)
+            load_timeout: Seconds take() waits for a prefetched page to finish loading
+        """
+        self.logger = logging.getLogger('tab_pipeline')
+        self.depth = max(1, depth)
+        self.rate_limiter = rate_limiter
+        self.prepare_tab = prepare_tab
+        self.clock = clock or get_clock()
+        self.load_timeout = load_timeout
+        self.stats = {'opened': 0, 'hits': 0, 'misses': 0, 'wasted': 0, 'errors': 0, 'load_wait': 0.0}
+        self.last_load_seconds = None  # Page load time of the tab the last successful take() switched to
+        self._queue = deque()
+        self._tabs = OrderedDict()  # url -> window handle, in the order they were opened
+
+    def extend(self, urls):
+        """Queue URLs in the order the scraper will request them"""
+        self._queue.extend(urls)
+
+    def is_queued(self, url):
+        """True if url is queued or preloading (one of the pages the pipeline keeps ahead of)"""
+        return url in self._tabs or url in self._queue
+
+    def pending(self):
+        """URLs loading or loaded in prefetch tabs"""
+        return list(self._tabs)
+
+    def fill(self, driver):
+        """
+        Open prefetch tabs for the next queued URLs until `depth` are open (never waits
+        for the rate limiter: a host that isn't due yet is tried again on the next call)
+
+        Returns:
+            int: Tabs opened
+        """
+        opened = 0
+        while driver is not None and self._queue and len(self._tabs) < self.depth:
+            url = self._queue[0]
+            if url in self._tabs:
+                self._queue.popleft()
+                continue
+            if self.rate_limiter is not None and not self.rate_limiter.try_acquire(url):
+                break
+            self._queue.popleft()
+            handle = self._open_tab(driver, url)
+            if handle is None:
+                break
+            self._tabs[url] = handle
+            opened += 1
+        return opened
+
+    def next_slot_delay(self):
+        """
+        Seconds until fill() can open the next tab (0 if it can now)
+
+        Returns:
+            float: Delay, or None if there is nothing to open (queue empty or `depth` tabs open)
+        """
+        if len(self._tabs) >= self.depth:
+            return None
+        url = next((url for url in self._queue if url not in self._tabs), None)
+        if url is None:
+            return None
+        return self.rate_limiter.delay(url) if self.rate_limiter is not None else 0.0
+
+    def _open_tab(self, driver, url):
+        try:
+            current = driver.current_window_handle
+            before = set(driver.window_handles)
+            driver.execute_cdp_cmd('Target.createTarget', {'url': 'about:blank', 'background': True})
+            new_handles = [handle for handle in driver.window_handles if handle not in before]
+            if not new_handles:
+                raise RuntimeError('new tab did not appear in window_handles')
+            handle = new_handles[0]
+            driver.switch_to.window(handle)
+            try:
+                if self.prepare_tab is not None:
+                    self.prepare_tab(driver)
+                driver.execute_script(NAVIGATE_SCRIPT, url)
+            finally:
+                driver.switch_to.window(current)
+        except Exception as e:
+            self.stats['errors'] += 1
+            self.logger.debug(f"Could not open prefetch tab for {url}: {str(e)}")
+            return None
+        self.stats['opened'] += 1
+        return handle
+
+    def take(self, driver, url):
+        """
+        Switch the driver to url's prefetch tab (closing the previous current tab)
+        and wait for the page to finish loading
+
+        Returns:
+            bool: True if the driver is now on url; False if url has no usable
+                  tab (the caller navigates normally)
+        """
+        if url not in self._tabs:
+            if url in self._queue:
+                # Requested before its tab was opened: loaded normally, never prefetch it now
+                self._queue.remove(url)
+                self.stats['misses'] += 1
+            return False
+        # Tabs opened before this one belong to URLs the scraper skipped
+        for stale_url in list(self._tabs):
+            if stale_url == url:
+                break
+            self.stats['wasted'] += 1
+            self._close_tab(driver, self._tabs.pop(stale_url))
+        handle = self._tabs.pop(url)
+        try:
+            previous = driver.current_window_handle
+            driver.switch_to.window(handle)
+            if previous != handle:
+                self._close_tab(driver, previous, switch_back=handle)
+            waited = self._wait_loaded(driver)
+            self.last_load_seconds = self._load_time(driver, waited)
+        except Exception as e:
+            self.stats['errors'] += 1
+            self.logger.debug(f"Prefetch tab for {url} unusable: {str(e)}")
+            self._recover(driver)
+            return False
+        self.stats['hits'] += 1
+        return True
+
+    def _wait_loaded(self, driver):
+        start = self.clock.monotonic()
+        while driver.execute_script(READY_STATE_SCRIPT) != 'complete':
+            if self.clock.monotonic() - start > self.load_timeout:
+                raise TimeoutError(f"page still loading after {self.load_timeout}s")
+            self.clock.sleep(0.1, reason='prefetch_load')
+        waited = self.clock.monotonic() - start
+        self.stats['load_wait'] += waited
+        return waited
+
+    def _load_time(self, driver, waited):
+        """How long the prefetched page took to load (falls back to the time take() waited for it)"""
+        try:
+            seconds = driver.execute_script(LOAD_TIME_SCRIPT)
+        except Exception:
+            seconds = None
+        return float(seconds) if seconds else waited
+
+    def _close_tab(self, driver, handle, switch_back=None):
+        try:
+            current = switch_back or driver.current_window_handle
+            driver.switch_to.window(handle)
+            driver.close()
+            driver.switch_to.window(current)
+        except Exception as e:
+            self.logger.debug(f"Error closing tab: {str(e)}")
+
+    def _recover(self, driver):
+        """After a failed take(): make sure the driver has a current tab that isn't a prefetch tab"""
+        try:
+            prefetch = set(self._tabs.values())
+            handles = [handle for handle in driver.window_handles if handle not in prefetch]
+            if handles:
+                driver.switch_to.window(handles[0])
+        except Exception:
+            pass
+
+    def close(self, driver):
+        """Close every prefetch tab (their URLs are queued again)"""
+        for url, handle in list(self._tabs.items()):
+            self._close_tab(driver, handle)
+        self.reset()
+
+    def reset(self):
+        """Forget the prefetch tabs (the driver was replaced) and queue their URLs again"""
+        self._queue.extendleft(reversed(list(self._tabs)))
+        self._tabs.clear()
+
+    def summary(self):
+        """One-line pipeline statistics"""
+        requested = self.stats['hits'] + self.stats['misses']
+        return (f"depth {self.depth}: {self.stats['hits']}/{requested} navigations served from prefetch tabs, "
+                f"{self.stats['opened']} tabs opened, {self.stats['wasted']} wasted, {self.stats['errors']} errors, "
+                f"{self.stats['load_wait']:.1f}s waiting on prefetched loads")
@@ -1,12 +1,9 @@
 """Scraper for tascaparts.com (GM parts)"""
 from scrapers.base_scraper import BaseScraper
-from bs4 import BeautifulSoup
 import json
 import re
 from datetime import datetime
-import time
 import traceback
-import random
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -15,8 +12,8 @@ from selenium.common.exceptions import TimeoutException  # ← ADD THIS LINE!
 class TascaPartsScraper(BaseScraper):
     """Scraper for tascaparts.com"""
     
-    def __init__(self):
-        super().__init__('tascaparts', use_selenium=True)
+    def __init__(self, clock=None):
+        super().__init__('tascaparts', use_selenium=True, clock=clock)
         self.base_url = 'https://www.tascaparts.com'
         
     def get_product_urls(self):
@@ -43,7 +40,7 @@ class TascaPartsScraper(BaseScraper):
                 
                 html = self.get_page(category_url, use_selenium=True, wait_time=1)
                 if html:
-                    soup = BeautifulSoup(html, 'lxml')
+                    soup = self.make_soup(html, 'lxml')
                     product_links = soup.find_all('a', href=re.compile(r'/oem-parts/'))
                     
                     for link in product_links:
@@ -96,12 +93,7 @@ class TascaPartsScraper(BaseScraper):
                 except:
                     pass
             
-            # Wait for search results to load
-            from selenium.webdriver.support.ui import WebDriverWait
-            from selenium.webdriver.support import expected_conditions as EC
-            from selenium.webdriver.common.by import By
-            
-            # Wait for product links to appear (with shorter timeout)
+            # Wait for search results (product links) to appear (with shorter timeout)
             try:
                 WebDriverWait(self.driver, 10).until(
                     EC.presence_of_element_located((By.CSS_SELECTOR, "a[href*='/oem-parts/']"))
@@ -121,7 +113,7 @@ class TascaPartsScraper(BaseScraper):
                     try:
                         # Scroll down
                         self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                        time.sleep(1.5)  # Wait for content to load
+                        self.clock.sleep(1.5)  # Wait for content to load
                         
                         # Check if new content loaded (with timeout protection)
                         try:
@@ -146,7 +138,7 @@ class TascaPartsScraper(BaseScraper):
             
             # Get page source after scrolling - with timeout protection
             try:
-                html = self.driver.page_source
+                html = self.get_page_source()
             except Exception as page_source_error:
                 self.logger.error(f"Error accessing page_source: {str(page_source_error)}")
                 # Try to get HTML via get_page() as fallback
@@ -155,7 +147,7 @@ class TascaPartsScraper(BaseScraper):
                     self.logger.error("Could not retrieve page source")
                     return product_urls
             
-            soup = BeautifulSoup(html, 'lxml')
+            soup = self.make_soup(html, 'lxml')
             
             # Find ALL product links (not just those with 'wheel' in URL)
             # The is_wheel_product() method will filter later
@@ -220,8 +212,8 @@ class TascaPartsScraper(BaseScraper):
                                 self.driver.set_page_load_timeout(60)
                                 
                                 # Load the page directly
-                                self.driver.get(pag_url)
-                                time.sleep(2)  # Wait for page to load
+                                self.driver_get(pag_url)
+                                self.clock.sleep(2)  # Wait for page to load
                                 
                                 # Wait for product links to appear
                                 try:
@@ -275,7 +267,7 @@ class TascaPartsScraper(BaseScraper):
                         while scroll_attempts < 30:  # Limit per page
                             try:
                                 self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                                time.sleep(1)
+                                self.clock.sleep(1)
                                 new_height = self.driver.execute_script("return document.body.scrollHeight")
                                 
                                 if new_height == last_height:
@@ -294,7 +286,7 @@ class TascaPartsScraper(BaseScraper):
                     
                     # Extract product links from this page - with timeout protection
                     try:
-                        html = self.driver.page_source
+                        html = self.get_page_source()
                     except Exception as page_source_error:
                         self.logger.warning(f"Error accessing page_source on page {page_num}: {str(page_source_error)}")
                         # Try to get HTML via get_page() as fallback
@@ -304,7 +296,7 @@ class TascaPartsScraper(BaseScraper):
                             page_num += 1
                             continue
                     
-                    soup = BeautifulSoup(html, 'lxml')
+                    soup = self.make_soup(html, 'lxml')
                     page_links = soup.find_all('a', href=re.compile(r'/oem-parts/'))
                     
                     page_urls_count = 0
@@ -347,7 +339,7 @@ class TascaPartsScraper(BaseScraper):
                     page_num += 1
                     
                     # Add delay between pages to avoid being blocked
-                    time.sleep(random.uniform(2, 4))
+                    self.polite_sleep(2, 4)
                     
                 except Exception as e:
                     self.logger.error(f"Error processing page {page_num}: {str(e)}")
@@ -371,9 +363,6 @@ class TascaPartsScraper(BaseScraper):
         Scrape single product from TascaParts with retry logic
         """
         import random
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
-        from selenium.webdriver.common.by import By
         
         # Import TimeoutException - try to import it
         try:
@@ -404,7 +393,7 @@ class TascaPartsScraper(BaseScraper):
                         wait_time = recovery['wait_time']
                         delay = random.uniform(wait_time[0], wait_time[1])
                         self.logger.warning(f"Driver error, retrying in {delay:.1f}s...")
-                        time.sleep(delay)
+                        self.polite_sleep(delay, phase='retry_backoff')
                         retry_count += 1
                         continue
                     else:
@@ -412,47 +401,45 @@ class TascaPartsScraper(BaseScraper):
                 
                 # Load the page with timeout protection
                 try:
-                    self.driver.get(url)
+                    self.driver_get(url)
                     
                     # Wait a bit before accessing page_source (more human-like)
-                    time.sleep(random.uniform(0.5, 1.5))  # Added delay to avoid immediate page_source access
-                    
-                    # Quick Cloudflare check - only if on challenge URL or page is very small
-                    current_url_check = self.driver.current_url.lower()
-                    page_preview = self.driver.page_source[:6000]
+                    self.polite_sleep(0.5, 1.5)  # Added delay to avoid immediate page_source access
                     
-                    if ('challenges.cloudflare.com' in current_url_check or '/cdn-cgi/challenge' in current_url_check or len(page_preview) < 5000) and self.has_cloudflare_challenge():
+                    # Quick Cloudflare check (one script call: challenge URL or small page with challenge markers)
+                    if self.has_cloudflare_challenge():
                         self.logger.info("🛡️ Cloudflare challenge detected - waiting for bypass...")
                         cloudflare_bypassed = self.wait_for_cloudflare(timeout=30, target_url=url, max_retries=1)
                         if not cloudflare_bypassed:
                             # Quick final check - if page has content, continue anyway
-                            if len(self.driver.page_source) > 5000 and 'challenges.cloudflare.com' not in self.driver.current_url.lower():
+                            snapshot = self.page_snapshot()
+                            if len(snapshot) > 5000 and 'challenges.cloudflare.com' not in snapshot.url.lower():
                                 self.logger.info("✓ Page accessible despite Cloudflare warning - continuing...")
                             else:
                                 retry_count += 1
                                 if retry_count < max_retries:
                                     wait_time = random.uniform(10, 15)
                                     self.logger.warning(f"Retrying page load in {wait_time:.1f}s...")
-                                    time.sleep(wait_time)
+                                    self.polite_sleep(wait_time, phase='retry_backoff')
                                     continue
                                 else:
                                     return None
-                        time.sleep(1)  # Brief wait after bypass
+                        self.clock.sleep(1)  # Brief wait after bypass
                     
-                    time.sleep(random.uniform(0.5, 1.0))  # Increased delay for more human-like timing
+                    self.polite_sleep(0.5, 1.0)  # Increased delay for more human-like timing
                     
                     # Simulate human behavior - scroll and wait (more realistic)
                     self.simulate_human_behavior()
-                    time.sleep(random.uniform(0.5, 1.0))  # Increased delay for more human-like timing
+                    self.polite_sleep(0.5, 1.0)  # Increased delay for more human-like timing
                     
                     # Wait for page to fully load - realistic timing
-                    time.sleep(random.uniform(1.5, 3.0))  # Increased to 1.5-3s for more human-like behavior
+                    self.polite_sleep(1.5, 3.0)  # Increased to 1.5-3s for more human-like behavior
                     
                     # Wait for product title to load using WebDriverWait - realistic timeout
                     # Add delay before accessing page_source (more human-like)
-                    time.sleep(random.uniform(0.5, 1.0))
-                    html = self.driver.page_source  # Get HTML once for multiple checks
-                    soup = BeautifulSoup(html, 'lxml')
+                    self.polite_sleep(0.5, 1.0)
+                    html = self.get_page_source()  # Get HTML once for multiple checks
+                    soup = self.make_soup(html, 'lxml')
                     
                     # Try multiple selectors for title extraction
                     title_text = ''
@@ -514,7 +501,7 @@ class TascaPartsScraper(BaseScraper):
                         retry_count += 1
                         if retry_count < max_retries:
                             wait_time = random.uniform(10, 15)
-                            time.sleep(wait_time)
+                            self.polite_sleep(wait_time, phase='retry_backoff')
                             continue
                         else:
                             return None
@@ -592,12 +579,12 @@ class TascaPartsScraper(BaseScraper):
                                 wait_time = random.uniform(10, 15)
                                 self.logger.info(f"Waiting {wait_time:.1f} seconds before retry...")
                             
-                            time.sleep(wait_time)
+                            self.polite_sleep(wait_time, phase='retry_backoff')
                             
                             # If blocked multiple times, add extra human-like behavior
                             if error_type == "blocked" and retry_count >= 2:
                                 self.logger.info("Simulating extended human behavior after blocking...")
-                                time.sleep(random.uniform(10, 20))  # Increased for anti-blocking
+                                self.polite_sleep(10, 20, phase='retry_backoff')  # Increased for anti-blocking
                                 self.simulate_human_behavior()
                             
                             continue
@@ -606,7 +593,7 @@ class TascaPartsScraper(BaseScraper):
                             return None
                     
                     # Success! Got real product page
-                    html = self.driver.page_source
+                    html = self.get_page_source()
                     self.logger.info(f"✓ Page loaded successfully, title: {title_text[:50]}")
                     break
                     
@@ -626,7 +613,7 @@ class TascaPartsScraper(BaseScraper):
                         content_ready = False
                         
                         while waited < wait_for_content:
-                            html = self.driver.page_source
+                            html = self.get_page_source()
                             current_url = self.driver.current_url.lower()
                             
                             # Check if we got an error page
@@ -636,7 +623,7 @@ class TascaPartsScraper(BaseScraper):
                             # Require substantial content (not just partial) - reduced threshold
                             if html and len(html) > 8000:  # Reduced from 10KB to 8KB for faster detection
                                 # Check for key product elements to ensure content is complete
-                                soup = BeautifulSoup(html, 'lxml')
+                                soup = self.make_soup(html, 'lxml')
                                 has_title = soup.find('h1', class_='product-title') or soup.find('h1')
                                 has_body = soup.find('body')
                                 body_text = has_body.get_text(strip=True) if has_body else ''
@@ -650,7 +637,7 @@ class TascaPartsScraper(BaseScraper):
                             if waited % 2 == 0:  # Log every 2s instead of 3s
                                 self.logger.info(f"Waiting for full content... ({waited}s/{wait_for_content}s)")
                             
-                            time.sleep(0.5)  # Check every 0.5s instead of 1s for faster response
+                            self.clock.sleep(0.5)  # Check every 0.5s instead of 1s for faster response
                             waited += 0.5
                         
                         if not content_ready:
@@ -665,7 +652,7 @@ class TascaPartsScraper(BaseScraper):
                         if retry_count < max_retries:
                             wait_time = random.uniform(5, 8)
                             self.logger.info(f"Retrying in {wait_time:.1f} seconds...")
-                            time.sleep(wait_time)
+                            self.polite_sleep(wait_time, phase='retry_backoff')
                             continue
                         else:
                             self.logger.error(f"❌ Failed after {max_retries} timeout attempts")
@@ -683,7 +670,7 @@ class TascaPartsScraper(BaseScraper):
                         if retry_count < max_retries:
                             wait_time = random.uniform(5, 8)  # Optimized: reduced from 12-18s
                             self.logger.info(f"Waiting {wait_time:.1f} seconds before retry...")
-                            time.sleep(wait_time)
+                            self.polite_sleep(wait_time, phase='retry_backoff')
                             continue
                         else:
                             self.logger.error(f"❌ Failed after {max_retries} attempts - connection error")
@@ -700,7 +687,7 @@ class TascaPartsScraper(BaseScraper):
                     wait_time = recovery['wait_time']
                     delay = random.uniform(wait_time[0], wait_time[1])
                     self.logger.warning(f"Timeout error, retrying in {delay:.1f}s...")
-                    time.sleep(delay)
+                    self.polite_sleep(delay, phase='retry_backoff')
                     retry_count += 1
                     continue
                 else:
@@ -731,7 +718,7 @@ class TascaPartsScraper(BaseScraper):
                     delay = random.uniform(wait_time[0], wait_time[1])
                     error_msg = recovery.get('message', recovery.get('reason', 'Unknown error'))
                     self.logger.warning(f"{error_msg}, retrying in {delay:.1f}s...")
-                    time.sleep(delay)
+                    self.polite_sleep(delay, phase='retry_backoff')
                     retry_count += 1
                     continue
                 else:
@@ -742,7 +729,7 @@ class TascaPartsScraper(BaseScraper):
         if not html:
             return None
         
-        soup = BeautifulSoup(html, 'lxml')
+        soup = self.make_soup(html, 'lxml')
         
         # Initialize product data structure
         product_data = {
@@ -799,7 +786,7 @@ class TascaPartsScraper(BaseScraper):
                     html_lower = html.lower()
                     page_is_small = len(html) < 8000
                     # Check for product elements
-                    soup_check = BeautifulSoup(html, 'lxml')
+                    soup_check = self.make_soup(html, 'lxml')
                     has_product_elements = any([
                         soup_check.find('span', class_=re.compile(r'sku|part.*number', re.I)),
                         soup_check.find('div', class_=re.compile(r'product.*price|price.*product', re.I)),
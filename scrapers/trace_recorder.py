@@ -0,0 +1,108 @@
+"""Chrome trace-event recording of scrape spans (open in chrome://tracing or Perfetto)"""
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+
+class TraceRecorder:
+    """
+    Collect nested timing spans as Chrome trace events.
+
+    Spans are complete ('X') events with process and thread ids, so a product
+    scrape shows up as a timeline of navigation, Cloudflare checks, waits,
+    WebDriver calls and parsing per thread. Attach a recorder to a scraper's
+    PhaseTimer (phase_timer.tracer) to get every phase span; use span() for
+    anything else. Safe to share between threads (e.g. load-test workers).
+    """
+
+    def __init__(self, name, max_events=500000):
+        """
+        Args:
+            name: Trace name (site or run), stored in the file metadata
+            max_events: Events kept before further spans are dropped
+        """
+        self.name = name
+        self.max_events = max_events
+        self.pid = os.getpid()
+        self.origin = time.perf_counter()
+        self.started_at = datetime.now().isoformat(timespec='seconds')
+        self.dropped = 0
+        self._events = []
+        self._threads = set()
+        self._lock = threading.Lock()
+
+    def _us(self, perf_seconds):
+        return round((perf_seconds - self.origin) * 1e6, 1)
+
+    def _add(self, event):
+        tid = event['tid']
+        with self._lock:
+            if tid not in self._threads:
+                self._threads.add(tid)
+                self._events.append({'name': 'thread_name', 'ph': 'M', 'pid': self.pid, 'tid': tid,
+                                     'args': {'name': threading.current_thread().name}})
+            if len(self._events) >= self.max_events:
+                self.dropped += 1
+                return
+            self._events.append(event)
+
+    def complete(self, name, start, duration, cat='phase', args=None):
+        """
+        Record a finished span
+
+        Args:
+            name: Span name
+            start: Start time (time.perf_counter() seconds)
+            duration: Duration in seconds
+            cat: Trace category
+            args: Optional dict shown in the span details
+        """
+        event = {'name': name, 'cat': cat, 'ph': 'X', 'ts': self._us(start), 'dur': round(duration * 1e6, 1),
+                 'pid': self.pid, 'tid': threading.get_native_id()}
+        if args:
+            event['args'] = args
+        self._add(event)
+
+    def instant(self, name, cat='event', args=None):
+        """Record a point-in-time event (e.g. a driver restart)"""
+        event = {'name': name, 'cat': cat, 'ph': 'i', 's': 't', 'ts': self._us(time.perf_counter()),
+                 'pid': self.pid, 'tid': threading.get_native_id()}
+        if args:
+            event['args'] = args
+        self._add(event)
+
+    @contextmanager
+    def span(self, name, cat='span', **args):
+        """Context manager recording a block as a span"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.complete(name, start, time.perf_counter() - start, cat=cat, args=args or None)
+
+    def dump(self, filename):
+        """
+        Write the trace as Chrome trace-event JSON
+
+        Args:
+            filename: Output JSON filename
+        """
+        output_dir = os.path.dirname(filename)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+
+        with self._lock:
+            events = list(self._events)
+        events.insert(0, {'name': 'process_name', 'ph': 'M', 'pid': self.pid, 'tid': 0,
+                          'args': {'name': f"scraper: {self.name}"}})
+
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump({
+                'traceEvents': events,
+                'displayTimeUnit': 'ms',
+                'otherData': {'name': self.name, 'started_at': self.started_at, 'dropped_events': self.dropped},
+            }, f, ensure_ascii=False)
+        return filename
@@ -0,0 +1,173 @@
+"""Export data to columnar (Parquet) and compressed CSV formats"""
+import gzip
+import logging
+import os
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow is optional - Parquet export is skipped without it
+    pa = None
+    pq = None
+
+from utils.data_processor import DataProcessor
+
+
+class ColumnarExporter:
+    """Export scraped data as partitioned Parquet and gzip CSV for analytics jobs"""
+
+    def __init__(self, chunk_size=50000):
+        self.logger = logging.getLogger('columnar_exporter')
+        self.chunk_size = chunk_size
+
+        # Same 34-column schema as the Excel export (plus the source columns of a deduplicated export)
+        processor = DataProcessor()
+        self.headers = processor.excel_headers
+        self.source_columns = processor.source_columns
+
+    def _iter_chunks(self, data):
+        """
+        Yield DataFrame chunks from a DataFrame or an iterable of DataFrames
+
+        Args:
+            data: pandas DataFrame or iterable of DataFrames
+        """
+        if isinstance(data, pd.DataFrame):
+            for start in range(0, len(data), self.chunk_size):
+                yield data.iloc[start:start + self.chunk_size]
+        else:
+            for chunk in data:
+                if chunk is not None and len(chunk) > 0:
+                    yield chunk
+
+    def _columns(self, chunk):
+        """Export columns for a chunk: the fixed headers, then any source columns it has"""
+        return self.headers + [column for column in self.source_columns if column in chunk.columns]
+
+    def _normalize_chunk(self, chunk):
+        """Return chunk with exactly the export columns, all as strings"""
+        chunk = chunk.reindex(columns=self._columns(chunk), fill_value='')
+        return chunk.fillna('').astype(str)
+
+    @staticmethod
+    def _site_from_url(url):
+        """Extract site host from product URL (same rule as ExcelExporter.split_by_site)"""
+        if isinstance(url, str) and len(url.split('/')) > 2:
+            return url.split('/')[2]
+        return 'unknown'
+
+    def export_to_csv_gz(self, data, filename):
+        """
+        Export data to a gzip-compressed CSV file, written chunk by chunk
+
+        Args:
+            data: pandas DataFrame or iterable of DataFrame chunks
+            filename: Output filename (e.g. data/processed/wheels_data.csv.gz)
+
+        Returns:
+            int: Number of rows written
+        """
+        try:
+            self.logger.info(f"Exporting data to {filename}...")
+
+            output_dir = os.path.dirname(filename)
+            if output_dir:
+                os.makedirs(output_dir, exist_ok=True)
+
+            rows_written = 0
+            with gzip.open(filename, 'wt', encoding='utf-8', newline='') as f:
+                for chunk in self._iter_chunks(data):
+                    chunk = self._normalize_chunk(chunk)
+                    chunk.to_csv(f, index=False, header=(rows_written == 0))
+                    rows_written += len(chunk)
+
+                # Always write a header, even for empty output
+                if rows_written == 0:
+                    pd.DataFrame(columns=self.headers).to_csv(f, index=False)
+
+            file_size = os.path.getsize(filename) / (1024 * 1024)
+            self.logger.info(f"✓ Successfully exported {rows_written} rows to {filename} ({file_size:.2f} MB)")
+            return rows_written
+
+        except Exception as e:
+            self.logger.error(f"Error exporting to CSV: {str(e)}")
+            raise
+
+    def export_to_parquet(self, data, output_dir, partition_cols=('site', 'make')):
+        """
+        Export data to a Hive-partitioned Parquet dataset, written chunk by chunk
+
+        Partition values live only in the directory path, so a data column
+        (e.g. 'make') is partitioned through a '<column>_partition' copy with
+        'unknown' for empty values; the column itself keeps the original values.
+
+        Args:
+            data: pandas DataFrame or iterable of DataFrame chunks
+            output_dir: Root directory of the Parquet dataset
+            partition_cols: Columns to partition by ('site' is derived from the URL)
+
+        Returns:
+            int: Number of rows written (0 if pyarrow is not installed)
+        """
+        if pq is None:
+            self.logger.warning("pyarrow is not installed - skipping Parquet export")
+            return 0
+
+        try:
+            self.logger.info(f"Exporting data to Parquet dataset {output_dir}...")
+            os.makedirs(output_dir, exist_ok=True)
+
+            rows_written = 0
+            for chunk_idx, chunk in enumerate(self._iter_chunks(data)):
+                chunk = self._normalize_chunk(chunk)
+                chunk['site'] = chunk['url'].map(self._site_from_url)
+
+                # Empty values would end up in the null partition: use the placeholder in the path only
+                partition_keys = []
+                for column in partition_cols:
+                    key = column if column == 'site' else f"{column}_partition"
+                    chunk[key] = chunk[column].replace('', 'unknown')
+                    partition_keys.append(key)
+
+                schema = pa.schema([(column, pa.string()) for column in chunk.columns])
+                table = pa.Table.from_pandas(chunk, schema=schema, preserve_index=False)
+                pq.write_to_dataset(
+                    table,
+                    root_path=output_dir,
+                    partition_cols=partition_keys,
+                    basename_template=f"part-{chunk_idx:05d}-{{i}}.parquet",
+                    existing_data_behavior='overwrite_or_ignore'
+                )
+                rows_written += len(chunk)
+
+            self.logger.info(f"✓ Successfully exported {rows_written} rows to {output_dir}")
+            return rows_written
+
+        except Exception as e:
+            self.logger.error(f"Error exporting to Parquet: {str(e)}")
+            raise
+
+    def export_all(self, df, base_filename):
+        """
+        Export DataFrame as both gzip CSV and partitioned Parquet
+
+        Args:
+            df: pandas DataFrame
+            base_filename: Output path without extension (e.g. data/processed/wheels_data_20250101)
+
+        Returns:
+            dict: Paths of the written outputs
+        """
+        outputs = {}
+
+        csv_file = f"{base_filename}.csv.gz"
+        self.export_to_csv_gz(df, csv_file)
+        outputs['csv'] = csv_file
+
+        parquet_dir = f"{base_filename}_parquet"
+        if self.export_to_parquet(df, parquet_dir):
+            outputs['parquet'] = parquet_dir
+
+        return outputs
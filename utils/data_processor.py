@@ -3,6 +3,8 @@ import pandas as pd
 from datetime import datetime
 import logging
 
+from utils.part_index import PartNumberIndex
+
 
 class DataProcessor:
     """Process scraped data and convert to desired format"""
@@ -60,26 +62,60 @@ class DataProcessor:
         
         # Column mapping: internal_name -> excel_header
         self.column_mapping = dict(zip(self.internal_columns, self.excel_headers))
+        
+        # Appended after the fixed columns (AI, AJ) when products are deduplicated across sites
+        self.source_columns = ['source_sites', 'source_urls']
+    
+    def deduplicate_products(self, products_list, merge_policy=None):
+        """
+        Collapse products with the same part number across sites
+        
+        Args:
+            products_list: List of product dictionaries
+            merge_policy: Optional PartNumberIndex merge policy overrides
+        
+        Returns:
+            list: Deduplicated product dictionaries (with 'source_sites' and 'source_urls')
+        """
+        index = PartNumberIndex(merge_policy)
+        index.add_many(product for product in products_list if product)
+        
+        stats = index.get_statistics()
+        self.logger.info(f"Deduplicated {stats['products_added']} products into {len(index)} "
+                         f"({stats['duplicates_merged']} duplicates merged, "
+                         f"{stats['multi_site_parts']} part numbers found on multiple sites)")
+        
+        return index.products()
     
-    def process_products(self, products_list):
+    def process_products(self, products_list, deduplicate=False, merge_policy=None, aggregator=None):
         """
         Convert list of product dictionaries to DataFrame
         Creates multiple rows for each fitment combination
         
         Args:
             products_list: List of product dictionaries
+            deduplicate: Collapse duplicate part numbers across sites before fitment expansion
+                         (adds the 'source_sites' and 'source_urls' columns)
+            merge_policy: Optional PartNumberIndex merge policy overrides (used with deduplicate)
+            aggregator: Optional StatsAggregator updated with each product as rows are built
         
         Returns:
             pandas.DataFrame: Processed data
         """
         rows = []
         
+        if deduplicate:
+            products_list = self.deduplicate_products(products_list, merge_policy)
+        
         self.logger.info(f"Processing {len(products_list)} products...")
         
         for product in products_list:
             if not product:
                 continue
             
+            if aggregator is not None:
+                aggregator.add_product(product)
+            
             try:
                 # Base product data (same for all rows)
                 base_data = {
@@ -104,6 +140,9 @@ class DataProcessor:
                     'applications': product.get('applications', ''),
                     'replaces': product.get('replaces', ''),
                 }
+                if deduplicate:
+                    base_data['source_sites'] = '; '.join(product.get('source_sites') or [])
+                    base_data['source_urls'] = '; '.join(url for url in product.get('source_urls') or [] if url)
                 
                 # Create a row for each fitment
                 # This means multiple rows for each part number
@@ -149,10 +188,11 @@ class DataProcessor:
                 continue
         
         # Create DataFrame with internal column names first
-        df = pd.DataFrame(rows, columns=self.internal_columns)
+        extra_columns = self.source_columns if deduplicate else []
+        df = pd.DataFrame(rows, columns=self.internal_columns + extra_columns)
         
         # Rename columns to Excel headers
-        df.columns = self.excel_headers
+        df.columns = self.excel_headers + extra_columns
         
         self.logger.info(f"Processed {len(df)} rows from {len(products_list)} products")
         self.logger.info(f"Unique part numbers: {df['PN'].nunique()}")  # Using Excel header 'PN'
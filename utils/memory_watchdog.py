@@ -0,0 +1,277 @@
+"""tracemalloc-based memory profiler and leak watchdog for long scraping runs"""
+import gc
+import json
+import logging
+import os
+import tracemalloc
+from datetime import datetime
+
+# Frames that belong to the profiler / import machinery rather than the scraper
+IGNORED_TRACE_FILES = ('<frozen importlib._bootstrap>', '<frozen importlib._bootstrap_external>',
+                       '<unknown>', tracemalloc.__file__, __file__)
+
+
+def read_rss_mb(pid='self'):
+    """
+    Read a process' resident set size from /proc (Linux only)
+
+    Returns:
+        float: RSS in MB, or None if unavailable
+    """
+    try:
+        with open(f'/proc/{pid}/status', 'r') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) / 1024.0
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def _child_map():
+    """Map parent pid -> child pids for every process in /proc"""
+    children = {}
+    try:
+        pids = [name for name in os.listdir('/proc') if name.isdigit()]
+    except OSError:
+        return children
+    for pid in pids:
+        try:
+            with open(f'/proc/{pid}/stat', 'r') as f:
+                # The command name may contain spaces; fields after ')' are fixed
+                ppid = int(f.read().rsplit(')', 1)[1].split()[1])
+            children.setdefault(ppid, []).append(int(pid))
+        except (OSError, ValueError, IndexError):
+            continue
+    return children
+
+
+def _cmdline(pid):
+    try:
+        with open(f'/proc/{pid}/cmdline', 'rb') as f:
+            return f.read().replace(b'\0', b' ').decode('utf-8', errors='ignore')
+    except OSError:
+        return ''
+
+
+def driver_root_pids(driver):
+    """Return the chromedriver/browser pids owned by a WebDriver (if it exposes them)"""
+    pids = []
+    browser_pid = getattr(driver, 'browser_pid', None)
+    if browser_pid:
+        pids.append(browser_pid)
+    service = getattr(driver, 'service', None)
+    process = getattr(service, 'process', None)
+    if process is not None and getattr(process, 'pid', None):
+        pids.append(process.pid)
+    return pids
+
+
+def chrome_memory(driver):
+    """
+    Sum the RSS of the Chrome processes behind a driver
+
+    Returns:
+        dict: {'processes', 'total_mb', 'renderer_mb', 'renderers'}, or None if
+              the process tree can't be read (no /proc, no pids on the driver)
+    """
+    roots = driver_root_pids(driver) if driver is not None else []
+    if not roots or not os.path.isdir('/proc'):
+        return None
+
+    children = _child_map()
+    seen = set()
+    stack = list(roots)
+    while stack:
+        pid = stack.pop()
+        if pid in seen:
+            continue
+        seen.add(pid)
+        stack.extend(children.get(pid, []))
+
+    total = renderer = 0.0
+    renderers = 0
+    for pid in seen:
+        rss = read_rss_mb(pid)
+        if rss is None:
+            continue
+        total += rss
+        if '--type=renderer' in _cmdline(pid):
+            renderer += rss
+            renderers += 1
+    return {'processes': len(seen), 'total_mb': round(total, 1),
+            'renderer_mb': round(renderer, 1), 'renderers': renderers}
+
+
+class MemoryWatchdog:
+    """
+    Snapshot Python allocations every N products and watch for leaks.
+
+    Each check compares a tracemalloc snapshot with the one taken when the site
+    started, logs the top growing allocation sites, and records process RSS and
+    the Chrome process tree's RSS (from /proc). Records are appended to a JSON
+    lines report under logs/.
+
+    Thresholds (MB, optional):
+        growth_limit_mb: Python traced memory growth since the site started
+        chrome_rss_limit_mb: RSS of the driver's Chrome processes
+    Crossing one logs a warning; with recycle=True, a Chrome threshold also
+    restarts the scraper's driver (scraper.restart_driver).
+    """
+
+    def __init__(self, snapshot_every=50, top_n=10, growth_limit_mb=None, chrome_rss_limit_mb=None,
+                 recycle=False, frames=1, report_path=None):
+        """
+        Args:
+            snapshot_every: Products between checks
+            top_n: Allocation sites reported per check
+            growth_limit_mb: Alert threshold for Python memory growth per site
+            chrome_rss_limit_mb: Alert/recycle threshold for Chrome RSS
+            recycle: Restart the driver when the Chrome threshold is crossed
+            frames: Traceback depth stored by tracemalloc (1 = allocation line only)
+            report_path: JSON lines report (default: logs/memory_<timestamp>.jsonl)
+        """
+        self.logger = logging.getLogger('memory_watchdog')
+        self.snapshot_every = max(1, snapshot_every)
+        self.top_n = top_n
+        self.growth_limit_mb = growth_limit_mb
+        self.chrome_rss_limit_mb = chrome_rss_limit_mb
+        self.recycle = recycle
+        self.frames = frames
+        self.report_path = report_path or f'logs/memory_{datetime.now().strftime("%Y%m%d_%H%M%S")}.jsonl'
+        self.alerts = 0
+        self.recycles = 0
+        self.site_growth = {}
+        self._baselines = {}
+        self._started_tracing = False
+
+    def start(self):
+        """Start tracemalloc (if it isn't already tracing)"""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._started_tracing = True
+        self.logger.info(f"Memory profiling every {self.snapshot_every} products (report: {self.report_path})")
+
+    def _snapshot(self):
+        gc.collect()
+        snapshot = tracemalloc.take_snapshot()
+        return snapshot.filter_traces([tracemalloc.Filter(False, name) for name in IGNORED_TRACE_FILES])
+
+    def begin_site(self, site_name):
+        """Take the baseline snapshot for a site"""
+        if not tracemalloc.is_tracing():
+            return
+        self._baselines[site_name] = {'snapshot': self._snapshot(), 'traced': tracemalloc.get_traced_memory()[0],
+                                      'rss_mb': read_rss_mb()}
+
+    def top_allocations(self, snapshot, baseline):
+        """Return the top allocation sites by growth since the baseline snapshot"""
+        sites = []
+        for stat in snapshot.compare_to(baseline, 'lineno')[:self.top_n]:
+            frame = stat.traceback[0]
+            sites.append({
+                'location': f"{frame.filename}:{frame.lineno}",
+                'size_kib': round(stat.size / 1024.0, 1),
+                'growth_kib': round(stat.size_diff / 1024.0, 1),
+                'count_diff': stat.count_diff,
+            })
+        return sites
+
+    def check(self, site_name, scraper, products_done, force=False):
+        """
+        Check memory after a product (only does work every snapshot_every products)
+
+        Args:
+            site_name: Site being scraped
+            scraper: Scraper instance (its driver's Chrome processes are measured)
+            products_done: Products processed so far for the site
+            force: Check regardless of snapshot_every
+
+        Returns:
+            dict: The check record, or None if no check was due
+        """
+        if not tracemalloc.is_tracing() or (not force and products_done % self.snapshot_every):
+            return None
+        if site_name not in self._baselines:
+            self.begin_site(site_name)
+            return None
+
+        baseline = self._baselines[site_name]
+        snapshot = self._snapshot()
+        traced, peak = tracemalloc.get_traced_memory()
+        growth_mb = (traced - baseline['traced']) / (1024.0 * 1024.0)
+        self.site_growth[site_name] = round(growth_mb, 2)
+
+        record = {
+            'time': datetime.now().isoformat(timespec='seconds'),
+            'site': site_name,
+            'products': products_done,
+            'traced_mb': round(traced / (1024.0 * 1024.0), 2),
+            'peak_traced_mb': round(peak / (1024.0 * 1024.0), 2),
+            'growth_mb': round(growth_mb, 2),
+            'rss_mb': read_rss_mb(),
+            'chrome': chrome_memory(getattr(scraper, 'driver', None)),
+            'top_allocations': self.top_allocations(snapshot, baseline['snapshot']),
+            'alerts': [],
+        }
+
+        chrome_mb = record['chrome']['total_mb'] if record['chrome'] else None
+        self.logger.info(f"Memory [{site_name} @ {products_done}]: traced {record['traced_mb']:.1f} MB "
+                         f"({growth_mb:+.1f} MB since site start), RSS {record['rss_mb'] or 0:.0f} MB, "
+                         f"Chrome {chrome_mb if chrome_mb is not None else 'n/a'} MB")
+        for site in record['top_allocations'][:3]:
+            self.logger.info(f"  {site['growth_kib']:+.0f} KiB ({site['count_diff']:+d} blocks) {site['location']}")
+
+        if self.growth_limit_mb and growth_mb > self.growth_limit_mb:
+            record['alerts'].append('python_growth')
+            self.logger.warning(f"⚠️ {site_name}: Python memory grew {growth_mb:.1f} MB since site start "
+                                f"(limit {self.growth_limit_mb} MB); top site: "
+                                f"{record['top_allocations'][0]['location'] if record['top_allocations'] else 'n/a'}")
+
+        if self.chrome_rss_limit_mb and chrome_mb is not None and chrome_mb > self.chrome_rss_limit_mb:
+            record['alerts'].append('chrome_rss')
+            self.logger.warning(f"⚠️ {site_name}: Chrome RSS {chrome_mb:.0f} MB exceeds {self.chrome_rss_limit_mb} MB")
+            if self.recycle and hasattr(scraper, 'restart_driver'):
+                try:
+                    scraper.restart_driver(reason=f"Chrome RSS {chrome_mb:.0f} MB")
+                    self.recycles += 1
+                    record['alerts'].append('driver_recycled')
+                except Exception as e:
+                    self.logger.error(f"Error recycling driver for {site_name}: {str(e)}")
+
+        self.alerts += len([alert for alert in record['alerts'] if alert != 'driver_recycled'])
+        self._write(record)
+        return record
+
+    def end_site(self, site_name, scraper=None, products_done=0):
+        """Final check for a site, then drop its baseline"""
+        record = None
+        if site_name in self._baselines:
+            record = self.check(site_name, scraper, products_done, force=True)
+            self._baselines.pop(site_name, None)
+        return record
+
+    def _write(self, record):
+        try:
+            report_dir = os.path.dirname(self.report_path)
+            if report_dir:
+                os.makedirs(report_dir, exist_ok=True)
+            with open(self.report_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+        except Exception as e:
+            self.logger.error(f"Error writing memory report: {str(e)}")
+
+    def log_summary(self, logger=None):
+        """Log per-site Python memory growth and alert counts"""
+        logger = logger or self.logger
+        logger.info(f"Memory watchdog: {self.alerts} alerts, {self.recycles} driver recycles "
+                    f"(report: {self.report_path})")
+        for site_name, growth in sorted(self.site_growth.items(), key=lambda item: -item[1]):
+            logger.info(f"  {site_name}: {growth:+.1f} MB")
+
+    def stop(self):
+        """Stop tracemalloc if this watchdog started it"""
+        if self._started_tracing and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self._started_tracing = False
+        self._baselines.clear()
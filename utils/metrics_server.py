@@ -0,0 +1,223 @@
+"""Live Prometheus-format metrics endpoint for long-running scrapes"""
+import logging
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class ScrapeMetrics:
+    """
+    Registry of live per-site scrape metrics.
+
+    Counters kept by the scraper itself (health_status, ErrorHandler.error_counts,
+    PhaseTimer counts) are read when the endpoint is scraped; products, rows and
+    queue depth are pushed by the run loop.
+    """
+
+    RATE_WINDOW = 300  # seconds used for the per-minute rates
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.sites = {}
+
+    def _site(self, site):
+        if site not in self.sites:
+            self.sites[site] = {
+                'scraper': None,
+                'products': 0,
+                'rows': 0,
+                'skipped': 0,
+                'errors': 0,
+                'queue_depth': 0,
+                'started': time.time(),
+                'samples': deque([(time.time(), 0, 0)], maxlen=2000),
+            }
+        return self.sites[site]
+
+    def register_scraper(self, site, scraper):
+        """Attach a scraper whose internal counters are exported for this site"""
+        with self._lock:
+            self._site(site)['scraper'] = scraper
+
+    def set_queue_depth(self, site, depth):
+        """Set the number of product URLs still queued for a site"""
+        with self._lock:
+            self._site(site)['queue_depth'] = depth
+
+    def record_product(self, site, product_data):
+        """
+        Record the outcome of one scrape_product() call
+
+        Args:
+            site: Site name
+            product_data: Result of scrape_product() (dict, list of rows or None)
+        """
+        with self._lock:
+            state = self._site(site)
+            if product_data:
+                state['products'] += 1
+                if isinstance(product_data, list):
+                    state['rows'] += len(product_data)
+                else:
+                    state['rows'] += max(len(product_data.get('fitments') or []), 1)
+            else:
+                state['skipped'] += 1
+            if state['queue_depth'] > 0:
+                state['queue_depth'] -= 1
+            state['samples'].append((time.time(), self._pages(state), state['products']))
+
+    def record_error(self, site):
+        """Record a product that failed with an exception"""
+        with self._lock:
+            state = self._site(site)
+            state['errors'] += 1
+            if state['queue_depth'] > 0:
+                state['queue_depth'] -= 1
+
+    @staticmethod
+    def _pages(state):
+        """Pages loaded by the scraper (driver navigations plus plain HTTP fetches)"""
+        scraper = state['scraper']
+        timer = getattr(scraper, 'phase_timer', None)
+        if timer is None:
+            return 0
+        return timer.counts.get('driver_get', 0) + timer.counts.get('http_get', 0)
+
+    def _rates(self, state):
+        """Return (pages/min, products/min) over the rate window"""
+        now = time.time()
+        pages_now = self._pages(state)
+        samples = [sample for sample in state['samples'] if now - sample[0] <= self.RATE_WINDOW]
+        if samples:
+            t0, pages0, products0 = samples[0]
+        else:
+            t0, pages0, products0 = state['started'], 0, 0
+        elapsed = max(now - t0, 1.0)
+        return (pages_now - pages0) * 60.0 / elapsed, (state['products'] - products0) * 60.0 / elapsed
+
+    @staticmethod
+    def _escape(value):
+        return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+    def render(self):
+        """Render all metrics in Prometheus text exposition format"""
+        lines = []
+
+        def metric(name, metric_type, help_text, samples):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            for labels, value in samples:
+                label_str = ','.join(f'{key}="{self._escape(val)}"' for key, val in labels.items())
+                lines.append(f"{name}{{{label_str}}} {value}")
+
+        with self._lock:
+            sites = {site: dict(state) for site, state in self.sites.items()}
+            rates = {site: self._rates(state) for site, state in self.sites.items()}
+
+        pages, products, rows, skipped, errors, queue = [], [], [], [], [], []
+        pages_rate, products_rate = [], []
+        error_types, cloudflare_waits, restarts, requests, success = [], [], [], [], []
+
+        for site, state in sites.items():
+            labels = {'site': site}
+            pages.append((labels, self._pages(state)))
+            products.append((labels, state['products']))
+            rows.append((labels, state['rows']))
+            skipped.append((labels, state['skipped']))
+            errors.append((labels, state['errors']))
+            queue.append((labels, state['queue_depth']))
+            pages_rate.append((labels, round(rates[site][0], 3)))
+            products_rate.append((labels, round(rates[site][1], 3)))
+
+            scraper = state['scraper']
+            if scraper is None:
+                continue
+
+            error_handler = getattr(scraper, 'error_handler', None)
+            if error_handler is not None:
+                for error_type, count in list(error_handler.error_counts.items()):
+                    error_types.append(({'site': site, 'type': error_type.value}, count))
+
+            timer = getattr(scraper, 'phase_timer', None)
+            if timer is not None:
+                cloudflare_waits.append((labels, timer.counts.get('cloudflare_wait', 0)))
+
+            health = getattr(scraper, 'health_status', {})
+            restarts.append((labels, health.get('driver_restarts', 0)))
+            requests.append((labels, health.get('total_requests', 0)))
+            success.append((labels, health.get('successful_requests', 0)))
+
+        metric('scraper_pages_total', 'counter', 'Pages loaded (driver navigations and HTTP fetches)', pages)
+        metric('scraper_pages_per_minute', 'gauge', f'Pages loaded per minute over the last {self.RATE_WINDOW}s', pages_rate)
+        metric('scraper_products_total', 'counter', 'Wheel products scraped', products)
+        metric('scraper_products_per_minute', 'gauge', f'Products scraped per minute over the last {self.RATE_WINDOW}s', products_rate)
+        metric('scraper_rows_emitted_total', 'counter', 'Output rows emitted (one per fitment)', rows)
+        metric('scraper_products_skipped_total', 'counter', 'Product URLs skipped (not a wheel or fetch failed)', skipped)
+        metric('scraper_product_errors_total', 'counter', 'Product URLs that raised an exception', errors)
+        metric('scraper_queue_depth', 'gauge', 'Product URLs still queued', queue)
+        metric('scraper_errors_total', 'counter', 'Errors by ErrorHandler classification', error_types)
+        metric('scraper_cloudflare_waits_total', 'counter', 'Cloudflare challenge waits', cloudflare_waits)
+        metric('scraper_driver_restarts_total', 'counter', 'WebDriver reinitializations', restarts)
+        metric('scraper_requests_total', 'counter', 'get_page() attempts', requests)
+        metric('scraper_requests_successful_total', 'counter', 'Successful get_page() calls', success)
+
+        return '\n'.join(lines) + '\n'
+
+
+class MetricsServer:
+    """Serve ScrapeMetrics on a local HTTP endpoint (/metrics) from a daemon thread"""
+
+    def __init__(self, metrics, port, host='127.0.0.1'):
+        """
+        Args:
+            metrics: ScrapeMetrics instance
+            port: Port to listen on
+            host: Interface to bind (local only by default)
+        """
+        self.logger = logging.getLogger('metrics_server')
+        self.metrics = metrics
+        self.host = host
+        self.port = port
+        self._server = None
+        self._thread = None
+
+    def start(self):
+        """Start serving in a background thread"""
+        metrics = self.metrics
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] not in ('/metrics', '/'):
+                    self.send_error(404)
+                    return
+                body = metrics.render().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                # Keep scrape logs clean
+                pass
+
+        try:
+            self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+            self._server.daemon_threads = True
+            self._thread = threading.Thread(target=self._server.serve_forever, name='metrics-server', daemon=True)
+            self._thread.start()
+            self.logger.info(f"Metrics endpoint: http://{self.host}:{self.port}/metrics")
+        except Exception as e:
+            self.logger.error(f"Could not start metrics endpoint on port {self.port}: {str(e)}")
+            self._server = None
+
+    def stop(self):
+        """Stop the server"""
+        if self._server:
+            try:
+                self._server.shutdown()
+                self._server.server_close()
+            except Exception:
+                pass
+            self._server = None
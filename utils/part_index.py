@@ -0,0 +1,175 @@
+"""Cross-site part number index and deduplication"""
+import logging
+
+
+class PartNumberIndex:
+    """
+    Hashed index of products by normalized part number across all sites.
+
+    The same OEM part number is often sold by several dealer sites (Acura/Honda,
+    Lexus/Toyota, Infiniti/Nissan, Jaguar/Land Rover). Products are merged into
+    one entry per part number according to a merge policy before fitment expansion.
+
+    Merge policy keys:
+        price:    'cheapest' - keep the record with the lowest actual price (default)
+                  'first'    - keep the first record seen
+                  'latest'   - keep the last record seen
+        fitments: 'union'    - union of all fitments, in first-seen order (default)
+                  'keep'     - fitments of the kept record only
+    """
+
+    DEFAULT_POLICY = {
+        'price': 'cheapest',
+        'fitments': 'union',
+    }
+
+    FITMENT_FIELDS = ('year', 'make', 'model', 'trim', 'engine')
+
+    def __init__(self, merge_policy=None):
+        self.logger = logging.getLogger('part_index')
+        self.policy = {**self.DEFAULT_POLICY, **(merge_policy or {})}
+        self._index = {}        # normalized pn -> merged entry
+        self._unkeyed = []      # products without a part number (never merged)
+        self.total_added = 0
+        self.duplicates = 0
+
+    @staticmethod
+    def normalize_pn(pn):
+        """Normalize part number for cross-site matching"""
+        if not pn:
+            return ''
+        return ''.join(c for c in str(pn) if c.isalnum()).upper()
+
+    @staticmethod
+    def site_from_url(url):
+        """Extract site host from product URL"""
+        if isinstance(url, str) and len(url.split('/')) > 2:
+            return url.split('/')[2]
+        return 'unknown'
+
+    @staticmethod
+    def _price(product):
+        """Return actual price as float, or None if missing/invalid"""
+        try:
+            price = str(product.get('actual_price', '')).strip()
+            return float(price) if price else None
+        except (TypeError, ValueError):
+            return None
+
+    def _fitments_of(self, product):
+        """Return product fitments (handles the flattened one-row-per-fitment format)"""
+        fitments = product.get('fitments')
+        if fitments:
+            return fitments
+        if 'year' in product or 'make' in product:
+            return [{field: product.get(field, '') for field in self.FITMENT_FIELDS}]
+        return []
+
+    def _fitment_key(self, fitment):
+        return tuple(str(fitment.get(field, '') or '').strip().lower() for field in self.FITMENT_FIELDS)
+
+    def _add_fitments(self, entry, fitments):
+        for fitment in fitments:
+            key = self._fitment_key(fitment)
+            if key not in entry['fitment_keys']:
+                entry['fitment_keys'].add(key)
+                entry['fitments'].append(fitment)
+
+    def add(self, product, site=None):
+        """
+        Add a product (dict as returned by scrape_product) to the index
+
+        Args:
+            product: Product dictionary
+            site: Source site name (defaults to the URL host)
+        """
+        if not product:
+            return
+
+        self.total_added += 1
+        site = site or self.site_from_url(product.get('url', ''))
+        key = self.normalize_pn(product.get('pn') or product.get('sku'))
+
+        if not key:
+            self._unkeyed.append(product)
+            return
+
+        fitments = self._fitments_of(product)
+        entry = self._index.get(key)
+
+        if entry is None:
+            entry = {
+                'product': product,
+                'fitments': [],
+                'fitment_keys': set(),
+                'source_sites': [site],
+                'source_urls': [product.get('url', '')],
+            }
+            self._add_fitments(entry, fitments)
+            self._index[key] = entry
+            return
+
+        # Same part number seen again
+        self.duplicates += 1
+        if site not in entry['source_sites']:
+            entry['source_sites'].append(site)
+        url = product.get('url', '')
+        if url and url not in entry['source_urls']:
+            entry['source_urls'].append(url)
+
+        replace = False
+        if self.policy['price'] == 'latest':
+            replace = True
+        elif self.policy['price'] == 'cheapest':
+            new_price = self._price(product)
+            kept_price = self._price(entry['product'])
+            replace = new_price is not None and (kept_price is None or new_price < kept_price)
+
+        if self.policy['fitments'] == 'union':
+            self._add_fitments(entry, fitments)
+            if replace:
+                entry['product'] = product
+        elif replace:
+            entry['product'] = product
+            entry['fitments'] = []
+            entry['fitment_keys'] = set()
+            self._add_fitments(entry, fitments)
+
+    def add_many(self, products, site=None):
+        """Add a list of products to the index"""
+        for product in products:
+            self.add(product, site=site)
+
+    def get(self, pn):
+        """Return the merged product for a part number, or None"""
+        entry = self._index.get(self.normalize_pn(pn))
+        return self._merged(entry) if entry else None
+
+    def _merged(self, entry):
+        merged = {key: value for key, value in entry['product'].items() if key not in self.FITMENT_FIELDS}
+        merged['fitments'] = list(entry['fitments'])
+        merged['source_sites'] = list(entry['source_sites'])
+        merged['source_urls'] = list(entry['source_urls'])
+        return merged
+
+    def products(self):
+        """
+        Return deduplicated products, one per part number (plus unkeyed products)
+
+        Returns:
+            list: Product dictionaries with merged 'fitments', 'source_sites' and 'source_urls'
+        """
+        return [self._merged(entry) for entry in self._index.values()] + list(self._unkeyed)
+
+    def __len__(self):
+        return len(self._index) + len(self._unkeyed)
+
+    def get_statistics(self):
+        """Return index statistics"""
+        return {
+            'products_added': self.total_added,
+            'unique_parts': len(self._index),
+            'duplicates_merged': self.duplicates,
+            'multi_site_parts': sum(1 for entry in self._index.values() if len(entry['source_sites']) > 1),
+            'without_part_number': len(self._unkeyed),
+        }
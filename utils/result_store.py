@@ -0,0 +1,195 @@
+"""Local SQLite store for scraped products, fitments and crawl state"""
+import logging
+import os
+import sqlite3
+import threading
+from datetime import datetime
+
+
+class ResultStore:
+    """
+    SQLite (WAL-mode) result store with per-record upserts.
+
+    Products are keyed on (site, pn), fitments on (site, pn, year, make, model, trim, engine)
+    and crawl state on (site, url). Writes are grouped into batched transactions.
+    """
+
+    PRODUCT_FIELDS = [
+        'url', 'image_url', 'date', 'sku', 'actual_price', 'msrp', 'title',
+        'also_known_as', 'positions', 'description', 'applications', 'replaces'
+    ]
+
+    FITMENT_FIELDS = ['year', 'make', 'model', 'trim', 'engine']
+
+    def __init__(self, db_path='data/results.db', batch_size=50):
+        """
+        Open (or create) the result store
+
+        Args:
+            db_path: Path to the SQLite database file
+            batch_size: Number of upserted records per transaction
+        """
+        self.logger = logging.getLogger('result_store')
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self._pending = 0
+        self._lock = threading.Lock()
+
+        db_dir = os.path.dirname(db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self._create_tables()
+
+    def _create_tables(self):
+        """Create tables if they don't exist"""
+        product_columns = ', '.join(f"{field} TEXT DEFAULT ''" for field in self.PRODUCT_FIELDS)
+        fitment_columns = ', '.join(f"{field} TEXT NOT NULL DEFAULT ''" for field in self.FITMENT_FIELDS)
+
+        with self.conn:
+            self.conn.execute(f"""
+                CREATE TABLE IF NOT EXISTS products (
+                    site TEXT NOT NULL,
+                    pn TEXT NOT NULL,
+                    {product_columns},
+                    updated_at TEXT,
+                    PRIMARY KEY (site, pn)
+                )
+            """)
+            self.conn.execute(f"""
+                CREATE TABLE IF NOT EXISTS fitments (
+                    site TEXT NOT NULL,
+                    pn TEXT NOT NULL,
+                    {fitment_columns},
+                    PRIMARY KEY (site, pn, {', '.join(self.FITMENT_FIELDS)})
+                )
+            """)
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS crawl_state (
+                    site TEXT NOT NULL,
+                    url TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    updated_at TEXT,
+                    PRIMARY KEY (site, url)
+                )
+            """)
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_products_pn ON products (pn)")
+
+    @staticmethod
+    def _product_key(product):
+        """Return the part number used as key (falls back to SKU, then URL)"""
+        return str(product.get('pn') or product.get('sku') or product.get('url') or '')
+
+    def _upsert_row(self, site, product, fitments):
+        """Upsert one product and its fitments (caller holds the lock)"""
+        pn = self._product_key(product)
+        if not pn:
+            return
+
+        now = datetime.now().isoformat(timespec='seconds')
+        values = [str(product.get(field, '') or '') for field in self.PRODUCT_FIELDS]
+        updates = ', '.join(f"{field}=excluded.{field}" for field in self.PRODUCT_FIELDS)
+
+        self.conn.execute(
+            f"INSERT INTO products (site, pn, {', '.join(self.PRODUCT_FIELDS)}, updated_at) "
+            f"VALUES (?, ?, {', '.join('?' * len(self.PRODUCT_FIELDS))}, ?) "
+            f"ON CONFLICT(site, pn) DO UPDATE SET {updates}, updated_at=excluded.updated_at",
+            [site, pn] + values + [now]
+        )
+
+        fitment_rows = [
+            [site, pn] + [str(fitment.get(field, '') or '') for field in self.FITMENT_FIELDS]
+            for fitment in fitments
+        ]
+        if fitment_rows:
+            self.conn.executemany(
+                f"INSERT INTO fitments (site, pn, {', '.join(self.FITMENT_FIELDS)}) "
+                f"VALUES (?, ?, {', '.join('?' * len(self.FITMENT_FIELDS))}) "
+                f"ON CONFLICT DO NOTHING",
+                fitment_rows
+            )
+
+    def upsert_product(self, site, product_data):
+        """
+        Upsert the result of scrape_product()
+
+        Args:
+            site: Site name
+            product_data: Product dict (with 'fitments' list) or list of flattened
+                          product/fitment rows, as returned by scrape_product()
+        """
+        if not product_data:
+            return
+
+        rows = product_data if isinstance(product_data, list) else [product_data]
+
+        with self._lock:
+            try:
+                for row in rows:
+                    if not row:
+                        continue
+                    if row.get('fitments'):
+                        fitments = row['fitments']
+                    elif 'year' in row or 'make' in row:
+                        # Fitment data already flattened in product (new format)
+                        fitments = [row]
+                    else:
+                        fitments = []
+                    self._upsert_row(site, row, fitments)
+                    self._pending += 1
+
+                if self._pending >= self.batch_size:
+                    self._commit()
+            except Exception as e:
+                self.logger.error(f"Error upserting product for {site}: {str(e)}")
+
+    def mark_url(self, site, url, status):
+        """
+        Record crawl state for a URL
+
+        Args:
+            site: Site name
+            url: Product URL
+            status: 'done', 'skipped' or 'error'
+        """
+        with self._lock:
+            try:
+                self.conn.execute(
+                    "INSERT INTO crawl_state (site, url, status, updated_at) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT(site, url) DO UPDATE SET status=excluded.status, updated_at=excluded.updated_at",
+                    (site, url, status, datetime.now().isoformat(timespec='seconds'))
+                )
+                self._pending += 1
+                if self._pending >= self.batch_size:
+                    self._commit()
+            except Exception as e:
+                self.logger.error(f"Error recording crawl state for {url}: {str(e)}")
+
+    def _commit(self):
+        """Commit the current batch (caller holds the lock)"""
+        self.conn.commit()
+        self._pending = 0
+
+    def commit(self):
+        """Commit any pending writes"""
+        with self._lock:
+            self._commit()
+
+    def count_products(self, site=None):
+        """Return the number of stored products (optionally for one site)"""
+        with self._lock:
+            if site:
+                return self.conn.execute("SELECT COUNT(*) FROM products WHERE site = ?", (site,)).fetchone()[0]
+            return self.conn.execute("SELECT COUNT(*) FROM products").fetchone()[0]
+
+    def close(self):
+        """Commit pending writes and close the database"""
+        with self._lock:
+            try:
+                self._commit()
+                self.conn.close()
+            except Exception as e:
+                self.logger.error(f"Error closing result store: {str(e)}")
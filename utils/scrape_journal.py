@@ -0,0 +1,168 @@
+"""Crash-safe append-only journal of scraped products"""
+import gzip
+import json
+import logging
+import os
+import time
+from datetime import datetime
+
+
+class ScrapeJournal:
+    """
+    Append-only JSONL journal written after every product.
+
+    Each line is one event: a scraped/skipped/failed product URL or a completed site.
+    Writes are flushed to the OS immediately and fsync'ed in batches, so a crash
+    loses at most the last unsynced batch. Paths ending in '.gz' are gzip-compressed
+    (one gzip member per batch, so a truncated tail only loses that batch).
+    """
+
+    def __init__(self, path='data/journal/scrape_journal.jsonl', fsync_every=10, fsync_interval=5.0):
+        """
+        Args:
+            path: Journal file path ('.gz' suffix enables compression)
+            fsync_every: fsync after this many entries
+            fsync_interval: fsync at least this often (seconds) while entries are pending
+        """
+        self.logger = logging.getLogger('scrape_journal')
+        self.path = path
+        self.compress = path.endswith('.gz')
+        self.fsync_every = fsync_every
+        self.fsync_interval = fsync_interval
+        self._file = None
+        self._buffer = []
+        self._pending = 0
+        self._last_sync = time.time()
+
+        journal_dir = os.path.dirname(path)
+        if journal_dir:
+            os.makedirs(journal_dir, exist_ok=True)
+
+    def _open(self):
+        if self._file is None:
+            self._file = open(self.path, 'ab')
+        return self._file
+
+    def archive(self):
+        """Move an existing journal aside so a fresh run starts with an empty one"""
+        if os.path.exists(self.path):
+            base, ext = (self.path[:-len('.jsonl.gz')], '.jsonl.gz') if self.path.endswith('.jsonl.gz') \
+                else os.path.splitext(self.path)
+            archived = f"{base}_{datetime.now().strftime('%Y%m%d_%H%M%S')}{ext}"
+            os.replace(self.path, archived)
+            self.logger.info(f"Previous journal archived: {archived}")
+
+    def _append(self, entry):
+        """Append one entry and flush/fsync according to the batching policy"""
+        entry['ts'] = datetime.now().isoformat(timespec='seconds')
+        line = (json.dumps(entry, ensure_ascii=False) + '\n').encode('utf-8')
+
+        try:
+            if self.compress:
+                # Compressed lines are buffered and written as one gzip member per batch
+                self._buffer.append(line)
+            else:
+                f = self._open()
+                f.write(line)
+                f.flush()
+
+            self._pending += 1
+            if self._pending >= self.fsync_every or time.time() - self._last_sync >= self.fsync_interval:
+                self.sync()
+        except Exception as e:
+            self.logger.error(f"Error writing journal entry: {str(e)}")
+
+    def record_product(self, site, url, product_data, status='done'):
+        """
+        Record the outcome of scrape_product()
+
+        Args:
+            site: Site name
+            url: Product URL
+            product_data: Result of scrape_product() (dict, list of dicts or None)
+            status: 'done', 'skipped' or 'error'
+        """
+        self._append({'type': 'product', 'site': site, 'url': url, 'status': status, 'data': product_data})
+
+    def record_site_done(self, site):
+        """Record that a site was scraped completely"""
+        self._append({'type': 'site_done', 'site': site})
+        self.sync()
+
+    def sync(self):
+        """Write buffered entries and fsync the journal file"""
+        try:
+            f = self._open()
+            if self._buffer:
+                f.write(gzip.compress(b''.join(self._buffer)))
+                self._buffer = []
+            f.flush()
+            os.fsync(f.fileno())
+            self._pending = 0
+            self._last_sync = time.time()
+        except Exception as e:
+            self.logger.error(f"Error syncing journal: {str(e)}")
+
+    def close(self):
+        """Sync pending entries and close the file"""
+        if self._file is not None or self._buffer:
+            self.sync()
+        if self._file is not None:
+            try:
+                self._file.close()
+            except Exception:
+                pass
+            self._file = None
+
+    def _read_lines(self):
+        """Yield raw journal lines, tolerating a truncated tail after a crash"""
+        if self.compress:
+            try:
+                with gzip.open(self.path, 'rb') as f:
+                    for line in f:
+                        yield line
+            except (EOFError, gzip.BadGzipFile, OSError) as e:
+                self.logger.warning(f"Journal ends with an incomplete batch (ignored): {str(e)}")
+        else:
+            with open(self.path, 'rb') as f:
+                for line in f:
+                    yield line
+
+    def replay(self):
+        """
+        Replay the journal
+
+        Returns:
+            dict: site -> {'done_urls': set, 'products': list, 'completed': bool}
+                  'done_urls' holds scraped and skipped URLs (errors are retried);
+                  'products' holds the scraped product data in journal order.
+        """
+        state = {}
+        if not os.path.exists(self.path):
+            return state
+
+        entries = 0
+        for line in self._read_lines():
+            try:
+                entry = json.loads(line)
+            except (ValueError, UnicodeDecodeError):
+                # Partially written last line
+                continue
+
+            site = entry.get('site')
+            site_state = state.setdefault(site, {'done_urls': set(), 'products': [], 'completed': False})
+
+            if entry.get('type') == 'site_done':
+                site_state['completed'] = True
+            elif entry.get('type') == 'product' and entry.get('status') in ('done', 'skipped'):
+                site_state['done_urls'].add(entry.get('url'))
+                data = entry.get('data')
+                if data:
+                    if isinstance(data, list):
+                        site_state['products'].extend(data)
+                    else:
+                        site_state['products'].append(data)
+            entries += 1
+
+        self.logger.info(f"Replayed {entries} journal entries for {len(state)} site(s) from {self.path}")
+        return state
@@ -0,0 +1,188 @@
+"""Online validation and summary statistics aggregator"""
+import json
+import logging
+import math
+import os
+from collections import Counter
+
+
+class StatsAggregator:
+    """
+    Incrementally aggregate the validation report and summary statistics.
+
+    Counters are updated once per emitted product (one row per fitment, the same
+    expansion as DataProcessor.process_products), so the final report is ready
+    without extra passes over the DataFrame and a partial report is available
+    at any point during a long run. Rows that DataProcessor.clean_data would drop
+    (missing SKU or title) are counted in 'dropped_rows' and left out of every
+    other statistic, except 'missing_sku'.
+
+    missing_* counts come from the products, not the cleaned DataFrame: missing_sku
+    counts dropped rows, missing_price/msrp kept rows without a usable price/MSRP.
+
+    Distinct part numbers are tracked exactly (a dict of row counts per PN); at
+    the expected ~40k part numbers this is small enough that a sketch isn't needed.
+    """
+
+    def __init__(self):
+        self.logger = logging.getLogger('stats_aggregator')
+        self.products = 0
+        self.total_rows = 0
+        self.dropped_rows = 0
+        self.rows_per_pn = Counter()
+        self.make_counts = Counter()
+        self.missing = Counter()
+        self.price_count = 0
+        self.price_sum = 0.0
+        self.price_min = None
+        self.price_max = None
+
+    @staticmethod
+    def _text(value):
+        """Normalize a value the way clean_data does (strip + collapse whitespace)"""
+        if value is None:
+            return ''
+        return ' '.join(str(value).split())
+
+    @staticmethod
+    def _is_blank(value):
+        """Missing the way clean_data checks it (None, NaN or an empty string)"""
+        return value is None or value == '' or (isinstance(value, float) and math.isnan(value))
+
+    @staticmethod
+    def _to_float(value):
+        try:
+            value = str(value).strip()
+            return float(value) if value else None
+        except (TypeError, ValueError):
+            return None
+
+    def add_product(self, product):
+        """
+        Update statistics with one product (dict as returned by scrape_product)
+
+        Args:
+            product: Product dictionary
+        """
+        if not product:
+            return
+
+        self.products += 1
+
+        fitments = product.get('fitments')
+        if not fitments:
+            # Flattened format carries a single fitment on the product itself
+            fitments = [product] if ('year' in product or 'make' in product) else [{}]
+
+        missing_sku = self._is_blank(product.get('sku', ''))
+        if missing_sku or self._is_blank(product.get('title', '')):
+            if missing_sku:
+                self.missing['sku'] += len(fitments)
+            self.dropped_rows += len(fitments)
+            return
+
+        pn = str(product.get('pn', '') or '')
+        price = self._to_float(product.get('actual_price', ''))
+        has_msrp = str(product.get('msrp', '') or '').strip() != ''
+
+        for fitment in fitments:
+            self.total_rows += 1
+            self.rows_per_pn[pn] += 1
+
+            year = str(fitment.get('year', '') or '')
+            make = self._text(fitment.get('make', ''))
+            if make:
+                self.make_counts[make] += 1
+            if not year and not make:
+                self.missing['fitment'] += 1
+
+            if price is None:
+                self.missing['price'] += 1
+            else:
+                self.price_count += 1
+                self.price_sum += price
+                self.price_min = price if self.price_min is None else min(self.price_min, price)
+                self.price_max = price if self.price_max is None else max(self.price_max, price)
+
+            if not has_msrp:
+                self.missing['msrp'] += 1
+
+    def add_products(self, products):
+        """Update statistics with a list of products"""
+        for product in products:
+            self.add_product(product)
+
+    def get_validation_report(self):
+        """
+        Return the validation report (same keys as DataProcessor.validate_data;
+        see the class docstring for how the missing_* counts are defined)
+
+        Returns:
+            dict: Validation report
+        """
+        return {
+            'total_rows': self.total_rows,
+            'unique_parts': len(self.rows_per_pn),
+            'missing_sku': self.missing['sku'],
+            'missing_price': self.missing['price'],
+            'missing_msrp': self.missing['msrp'],
+            'missing_fitment': self.missing['fitment'],
+            'products_with_multiple_fitments': sum(1 for count in self.rows_per_pn.values() if count > 1)
+        }
+
+    def get_summary_statistics(self):
+        """
+        Return summary statistics (same keys as DataProcessor.get_summary_statistics)
+
+        Returns:
+            dict: Summary statistics
+        """
+        stats = {
+            'total_rows': self.total_rows,
+            'unique_parts': len(self.rows_per_pn),
+            'products_by_make': dict(self.make_counts.most_common()),
+            'average_price': 0,
+            'price_range': {'min': 0, 'max': 0}
+        }
+
+        if self.price_count > 0:
+            stats['average_price'] = round(self.price_sum / self.price_count, 2)
+            stats['price_range'] = {
+                'min': round(self.price_min, 2),
+                'max': round(self.price_max, 2)
+            }
+
+        return stats
+
+    def log_report(self, logger=None):
+        """Log the validation report"""
+        logger = logger or self.logger
+        logger.info("Data Validation Report:")
+        for key, value in self.get_validation_report().items():
+            logger.info(f"  {key}: {value}")
+
+    def write_report(self, filename):
+        """
+        Write a partial report as JSON (atomically, so it can be read during a run)
+
+        Args:
+            filename: Output JSON filename
+        """
+        try:
+            output_dir = os.path.dirname(filename)
+            if output_dir:
+                os.makedirs(output_dir, exist_ok=True)
+
+            report = {
+                'products': self.products,
+                'dropped_rows': self.dropped_rows,
+                'validation': self.get_validation_report(),
+                'summary': self.get_summary_statistics(),
+            }
+
+            tmp_file = f"{filename}.tmp"
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_file, filename)
+        except Exception as e:
+            self.logger.error(f"Error writing stats report: {str(e)}")